@@ -8,6 +8,7 @@ from .gateway_command import GatewayCommand
 from .help_command import HelpCommand
 from .history_command import HistoryCommand
 from .import_command import ImportCommand
+from .instrumentation_command import InstrumentationCommand
 from .order_book_command import OrderBookCommand
 from .pmm_script_command import PMMScriptCommand
 from .previous_strategy_command import PreviousCommand
@@ -29,6 +30,7 @@ __all__ = [
     HelpCommand,
     HistoryCommand,
     ImportCommand,
+    InstrumentationCommand,
     OrderBookCommand,
     PMMScriptCommand,
     PreviousCommand,
@@ -64,6 +64,11 @@ client_configs_to_display = ["autofill_import",
                              "commands_timeout",
                              "create_command_timeout",
                              "other_commands_timeout",
+                             "connections_pool",
+                             "connections_limit",
+                             "connections_limit_per_host",
+                             "connections_keepalive_timeout",
+                             "dns_cache_ttl",
                              "tables_format"]
 color_settings_to_display = ["top_pane",
                              "bottom_pane",
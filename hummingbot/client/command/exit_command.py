@@ -2,6 +2,7 @@
 
 import asyncio
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.connections.connections_manager import ConnectionsManager
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -30,8 +31,13 @@ class ExitCommand:
         if self._gateway_monitor is not None:
             self._gateway_monitor.stop()
 
+        if self.prometheus_endpoint is not None:
+            await self.prometheus_endpoint.stop()
+
         self.notify("Winding down notifiers...")
         for notifier in self.notifiers:
             notifier.stop()
 
+        await ConnectionsManager.get_instance().close()
+
         self.app.exit()
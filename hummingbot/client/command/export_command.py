@@ -1,5 +1,5 @@
 import os
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Iterator, List, Optional
 
 import pandas as pd
 from sqlalchemy.orm import Query, Session
@@ -62,10 +62,13 @@ class ExportCommand:
     async def export_trades(self,  # type: HummingbotApplication
                             ):
         with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(self.init_time * 1e3),
-                session=session)
-            if len(trades) == 0:
+            query: Query = (session
+                            .query(TradeFill)
+                            .filter(TradeFill.timestamp >= int(self.init_time * 1e3)))
+            # the trades are written to the file a page at a time, instead of all being loaded at once
+            pages: Iterator[List[TradeFill]] = TradeFill.iter_pages(query)
+            first_page: List[TradeFill] = next(pages, [])
+            if len(first_page) == 0:
                 self.notify("No past trades to export.")
                 return
             self.placeholder_mode = True
@@ -76,8 +79,10 @@ class ExportCommand:
             file_name = await self.prompt_new_export_file_name(path)
             file_path = os.path.join(path, file_name)
             try:
-                df: pd.DataFrame = TradeFill.to_pandas(trades)
+                df: pd.DataFrame = TradeFill.to_pandas(first_page)
                 df.to_csv(file_path, header=True)
+                for page in pages:
+                    TradeFill.to_pandas(page).to_csv(file_path, mode="a", header=False)
                 self.notify(f"Successfully exported trades to {file_path}")
             except Exception as e:
                 self.notify(f"Error exporting trades to {path}: {e}")
@@ -3,11 +3,12 @@ import threading
 import time
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, List, Optional, Set, Tuple
+from functools import partial
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import PerformanceAccumulator, PerformanceMetrics
 from hummingbot.client.settings import MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT, AllConnectorSettings
 from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -39,7 +40,18 @@ class HistoryCommand:
         if self.strategy_file_name is None:
             self.notify("\n  Please first import a strategy config file of which to show historical performance.")
             return
-        start_time = get_timestamp(days) if days > 0 else self.init_time
+        if days <= 0:
+            # The trades of the session are reported from their performance, kept up to date as they are recorded
+            if not self.trades_performance.get(self.strategy_file_name):
+                self.notify("\n  No past trades to report.")
+                return
+            if verbose:
+                self.list_trades(self.init_time)
+            if self.strategy_name != "celo_arb":
+                safe_ensure_future(self.session_history_report(precision))
+            return
+
+        start_time = get_timestamp(days)
         with self.trade_fill_db.get_new_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
@@ -59,11 +71,53 @@ class HistoryCommand:
                              precision: Optional[int] = None,
                              display_report: bool = True) -> Decimal:
         market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+        performance_calculators = {
+            (market, symbol): partial(PerformanceMetrics.create,
+                                      symbol,
+                                      [t for t in trades if t.market == market and t.symbol == symbol])
+            for market, symbol in market_info
+        }
+        return await self._performance_report(start_time, performance_calculators, precision, display_report)
+
+    async def session_history_report(self,  # type: HummingbotApplication
+                                     precision: Optional[int] = None,
+                                     display_report: bool = True) -> Decimal:
+        """
+        Reports the performance of the trades made with the current strategy config since the application started,
+        from the performance accumulated as the trades were recorded.
+        """
+        accumulators: Dict[Tuple[str, str], PerformanceAccumulator] = self.trades_performance.get(
+            self.strategy_file_name, {})
+        performance_calculators = {market_info: accumulator.metrics
+                                   for market_info, accumulator in accumulators.items()}
+        return await self._performance_report(self.init_time, performance_calculators, precision, display_report)
+
+    def add_trade_performance(self,  # type: HummingbotApplication
+                              trade: TradeFill):
+        accumulators: Dict[Tuple[str, str], PerformanceAccumulator] = self.trades_performance.setdefault(
+            trade.config_file_path, {})
+        accumulator: Optional[PerformanceAccumulator] = accumulators.get((trade.market, trade.symbol))
+        if accumulator is None:
+            accumulator = PerformanceAccumulator(trade.symbol)
+            accumulators[(trade.market, trade.symbol)] = accumulator
+        accumulator.add_trade(trade)
+
+    async def _performance_report(
+            self,  # type: HummingbotApplication
+            start_time: float,
+            performance_calculators: Dict[Tuple[str, str],
+                                          Callable[[Dict[str, Decimal]], Awaitable[PerformanceMetrics]]],
+            precision: Optional[int],
+            display_report: bool) -> Decimal:
+        """
+        :param performance_calculators: the functions calculating the performance metrics of every market and trading
+        pair from the current balances of the market
+        :return: the average return of the markets
+        """
         if display_report:
             self.report_header(start_time)
         return_pcts = []
-        for market, symbol in market_info:
-            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+        for (market, symbol), calculate_performance in performance_calculators.items():
             network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
             try:
                 cur_balances = await asyncio.wait_for(self.get_current_balances(market), network_timeout)
@@ -72,7 +126,7 @@ class HistoryCommand:
                     "\nA network error prevented the balances retrieval to complete. See logs for more details."
                 )
                 raise
-            perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+            perf = await calculate_performance(cur_balances)
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
@@ -189,16 +243,7 @@ class HistoryCommand:
             return s_decimal_0
         if any(not market.ready for market in self.markets.values()):
             return s_decimal_0
-
-        start_time = self.init_time
-
-        with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name)
-            avg_return = await self.history_report(start_time, trades, display_report=False)
-        return avg_return
+        return await self.session_history_report(display_report=False)
 
     def list_trades(self,  # type: HummingbotApplication
                     start_time: float):
@@ -0,0 +1,70 @@
+import threading
+from typing import TYPE_CHECKING, Optional
+
+import pandas as pd
+
+from hummingbot.client.ui.interface_utils import format_df_for_printout
+from hummingbot.core.instrumentation.instrumentation import REPORTED_PERCENTILES, Instrumentation
+from hummingbot.core.instrumentation.prometheus_endpoint import PrometheusEndpoint
+from hummingbot.core.utils.async_utils import safe_ensure_future
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication
+
+
+class InstrumentationCommand:
+    def instrumentation(self,  # type: HummingbotApplication
+                        reset: bool = False,
+                        prometheus_port: Optional[int] = None):
+        if threading.current_thread() != threading.main_thread():
+            self.ev_loop.call_soon_threadsafe(self.instrumentation, reset, prometheus_port)
+            return
+        if prometheus_port is not None:
+            safe_ensure_future(self.set_prometheus_endpoint(prometheus_port))
+        elif reset:
+            Instrumentation.get_instance().reset()
+            self.notify("The recorded latencies were cleared.")
+        else:
+            self.notify(self.instrumentation_report())
+
+    def instrumentation_report(self,  # type: HummingbotApplication
+                               ) -> str:
+        histograms = Instrumentation.get_instance().histograms()
+        if len(histograms) == 0:
+            return "No latency recorded yet."
+
+        columns = (["Metric", "Labels", "Count", "Mean (ms)"]
+                   + [f"p{percentile:g} (ms)" for percentile in REPORTED_PERCENTILES]
+                   + ["Max (ms)"])
+        rows = [[metric.name,
+                 ", ".join(f"{name}={value}" for name, value in zip(metric.label_names, label_values)),
+                 histogram.count,
+                 f"{histogram.mean * 1e3:.3f}"]
+                + [f"{histogram.percentile(percentile) * 1e3:.3f}" for percentile in REPORTED_PERCENTILES]
+                + [f"{histogram.max * 1e3:.3f}"]
+                for metric, label_values, histogram in histograms]
+        df = pd.DataFrame(data=rows, columns=columns)
+        lines = ["    " + line for line in format_df_for_printout(df, self.client_config_map.tables_format).split("\n")]
+        return "\n  Latencies:\n" + "\n".join(lines)
+
+    async def set_prometheus_endpoint(self,  # type: HummingbotApplication
+                                      port: int):
+        """
+        Serves the latencies in the Prometheus text format on the local port, replacing the endpoint served before if
+        any, or only stops serving them if the port is 0
+        """
+        if self.prometheus_endpoint is not None:
+            await self.prometheus_endpoint.stop()
+            self.prometheus_endpoint = None
+            if port == 0:
+                self.notify("Stopped serving the latencies in the Prometheus format.")
+        if port == 0:
+            return
+        endpoint = PrometheusEndpoint(Instrumentation.get_instance(), port=port)
+        try:
+            await endpoint.start()
+        except OSError as e:
+            self.notify(f"Could not serve the latencies on port {port}: {e}")
+            return
+        self.prometheus_endpoint = endpoint
+        self.notify(f"Serving the latencies in the Prometheus format at {endpoint.url}")
@@ -28,6 +28,7 @@ from hummingbot.connector.exchange.kucoin.kucoin_utils import KuCoinConfigMap
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle, RateOracleSource
 from hummingbot.core.utils.kill_switch import ActiveKillSwitch, KillSwitch, PassThroughKillSwitch
+from hummingbot.core.web_assistant.connections.connections_manager import ConnectionsManager
 from hummingbot.notifier.telegram_notifier import TelegramNotifier
 from hummingbot.pmm_script.pmm_script_iterator import PMMScriptIterator
 from hummingbot.strategy.strategy_base import StrategyBase
@@ -507,6 +508,47 @@ class CommandsTimeoutConfigMap(BaseClientModel):
         return super().validate_decimal(v, field)
 
 
+class ConnectionsPoolConfigMap(BaseClientModel):
+    connections_limit: int = Field(
+        default=ConnectionsManager.DEFAULT_LIMIT,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Most HTTP and websocket connections open at the same time, all exchanges included (0 for no limit)"
+            ),
+        ),
+    )
+    connections_limit_per_host: int = Field(
+        default=ConnectionsManager.DEFAULT_LIMIT_PER_HOST,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Most connections open at the same time to the same host (0 for no limit)",
+        ),
+    )
+    connections_keepalive_timeout: Decimal = Field(
+        default=Decimal(str(ConnectionsManager.DEFAULT_KEEPALIVE_TIMEOUT)),
+        gt=Decimal("0"),
+        client_data=ClientFieldData(
+            prompt=lambda cm: "How long to keep the idle connections open for the next requests (in seconds)",
+        ),
+    )
+    dns_cache_ttl: int = Field(
+        default=ConnectionsManager.DEFAULT_TTL_DNS_CACHE,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: "How long to cache the exchanges host names resolutions (in seconds, 0 for no cache)",
+        ),
+    )
+
+    class Config:
+        title = "connections_pool"
+
+    @validator("connections_keepalive_timeout", pre=True)
+    def validate_decimals(cls, v: str, field: Field):
+        """Used for client-friendly error output."""
+        return super().validate_decimal(v, field)
+
+
 class AnonymizedMetricsMode(BaseClientModel, ABC):
     @abstractmethod
     def get_collector(
@@ -720,6 +762,10 @@ class ClientConfigMap(BaseClientModel):
         ),
     )
     commands_timeout: CommandsTimeoutConfigMap = Field(default=CommandsTimeoutConfigMap())
+    connections_pool: ConnectionsPoolConfigMap = Field(
+        default=ConnectionsPoolConfigMap(),
+        description="Pool of HTTP connections shared by the exchanges, applied at the next start",
+    )
     tables_format: ClientConfigEnum(
         value="TabulateFormats",  # noqa: F821
         names={e: e for e in tabulate_formats},
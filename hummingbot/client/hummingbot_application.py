@@ -18,6 +18,7 @@ from hummingbot.client.config.config_helpers import (
     save_to_yml,
 )
 from hummingbot.client.config.security import Security
+from hummingbot.client.performance import PerformanceAccumulator
 from hummingbot.client.settings import CLIENT_CONFIG_PATH, AllConnectorSettings, ConnectorType
 from hummingbot.client.tab import __all__ as tab_classes
 from hummingbot.client.tab.data_types import CommandTab
@@ -30,8 +31,10 @@ from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.clock import Clock
 from hummingbot.core.gateway.status_monitor import StatusMonitor as GatewayStatusMonitor
+from hummingbot.core.instrumentation.prometheus_endpoint import PrometheusEndpoint
 from hummingbot.core.utils.kill_switch import KillSwitch
 from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
+from hummingbot.core.web_assistant.connections.connections_manager import ConnectionsManager
 from hummingbot.data_feed.data_feed_base import DataFeedBase
 from hummingbot.exceptions import ArgumentParserError
 from hummingbot.logger import HummingbotLogger
@@ -70,6 +73,8 @@ class HummingbotApplication(*commands):
             client_config_map or load_client_config_map_from_file()
         )
 
+        # The HTTP connections pool shared by the exchanges takes its settings from the client config
+        ConnectionsManager.get_instance(self.client_config_map)
         # This is to start fetching trading pairs for auto-complete
         TradingPairFetcher.get_instance(self.client_config_map)
         self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
@@ -99,6 +104,10 @@ class HummingbotApplication(*commands):
 
         self.trade_fill_db: Optional[SQLConnectionManager] = None
         self.markets_recorder: Optional[MarketsRecorder] = None
+        # Performance of the trades of the session by strategy config file, market and trading pair
+        self.trades_performance: Dict[str, Dict[Tuple[str, str], PerformanceAccumulator]] = {}
+        # Local endpoint serving the instrumentation latencies, started by the instrumentation command
+        self.prometheus_endpoint: Optional[PrometheusEndpoint] = None
         self._pmm_script_iterator = None
         self._binance_connector = None
         self._shared_client = None
@@ -300,6 +309,7 @@ class HummingbotApplication(*commands):
             list(self.markets.values()),
             self.strategy_file_name,
             self.strategy_name,
+            trade_fill_listener=self.add_trade_performance,
         )
         self.markets_recorder.start()
 
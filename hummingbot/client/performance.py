@@ -194,6 +194,11 @@ class PerformanceMetrics:
                 self.s_vol_base += Decimal(str(trade.amount)) * Decimal("-1")
                 self.s_vol_quote += Decimal(str(trade.amount)) * Decimal(str(trade.price))
 
+        self._calculate_average_prices()
+
+        return buys, sells
+
+    def _calculate_average_prices(self):
         self.tot_vol_base = self.b_vol_base + self.s_vol_base
         self.tot_vol_quote = self.b_vol_quote + self.s_vol_quote
 
@@ -204,8 +209,6 @@ class PerformanceMetrics:
         self.avg_b_price = abs(self.avg_b_price)
         self.avg_s_price = abs(self.avg_s_price)
 
-        return buys, sells
-
     async def _calculate_fees(self, quote: str, trades: List[Any]):
         for trade in trades:
             fee_percent = None
@@ -230,6 +233,9 @@ class PerformanceMetrics:
             for flat_fee in flat_fees:
                 self.fees[flat_fee.token] += flat_fee.amount
 
+        await self._calculate_fee_in_quote(quote)
+
+    async def _calculate_fee_in_quote(self, quote: str):
         for fee_token, fee_amount in self.fees.items():
             if fee_token == quote:
                 self.fee_in_quote += fee_amount
@@ -284,15 +290,31 @@ class PerformanceMetrics:
         self.num_sells = len(sells)
         self.num_trades = self.num_buys + self.num_sells
 
+        await self._calculate_portfolio_values(trading_pair,
+                                               current_balances,
+                                               Decimal(str(trades[0].price)),
+                                               Decimal(str(trades[-1].price)))
+        self._calculate_trade_pnl(buys, sells)
+
+        await self._calculate_fees(quote, trades)
+
+        self._calculate_return()
+
+    async def _calculate_portfolio_values(self,
+                                          trading_pair: str,
+                                          current_balances: Dict[str, Decimal],
+                                          start_price: Decimal,
+                                          last_trade_price: Decimal):
+        base, quote = split_hb_trading_pair(trading_pair)
         self.cur_base_bal = current_balances.get(base, 0)
         self.cur_quote_bal = current_balances.get(quote, 0)
         self.start_base_bal = self.cur_base_bal - self.tot_vol_base
         self.start_quote_bal = self.cur_quote_bal - self.tot_vol_quote
 
-        self.start_price = Decimal(str(trades[0].price))
+        self.start_price = start_price
         self.cur_price = await RateOracle.get_instance().stored_or_live_rate(trading_pair)
         if self.cur_price is None:
-            self.cur_price = Decimal(str(trades[-1].price))
+            self.cur_price = last_trade_price
         self.start_base_ratio_pct = self.divide(self.start_base_bal * self.start_price,
                                                 (self.start_base_bal * self.start_price) + self.start_quote_bal)
         self.cur_base_ratio_pct = self.divide(self.cur_base_bal * self.cur_price,
@@ -300,9 +322,178 @@ class PerformanceMetrics:
 
         self.hold_value = (self.start_base_bal * self.cur_price) + self.start_quote_bal
         self.cur_value = (self.cur_base_bal * self.cur_price) + self.cur_quote_bal
-        self._calculate_trade_pnl(buys, sells)
-
-        await self._calculate_fees(quote, trades)
 
+    def _calculate_return(self):
         self.total_pnl = self.trade_pnl - self.fee_in_quote
         self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+
+@dataclass
+class _AggregatedOrder:
+    """
+    The fills of an order, aggregated as PerformanceMetrics.aggregate_orders does: the order has the position of its
+    first fill, the average price of its fills and their total amount. An open or close position order has its index
+    among the orders of its trade type and position.
+    """
+    position: str
+    position_index: Optional[int] = None
+    prices_sum: Decimal = s_decimal_0
+    fills_count: int = 0
+    amount: Decimal = s_decimal_0
+
+    @property
+    def price(self) -> Decimal:
+        return self.prices_sum / self.fills_count
+
+
+class PerformanceAccumulator:
+    """
+    Keeps the performance of the trade fills of a market trading pair up to date as the fills are added: the trade
+    volumes, the fees paid per token and, for derivatives, the open and close position orders paired as
+    PerformanceMetrics pairs them along with the PnL of the closed positions.
+
+    Adding a fill and calculating the metrics both take a constant time, whatever the number of fills, and the metrics
+    are the ones PerformanceMetrics.create calculates from the same TradeFill list. The fills are read when added, no
+    reference to them is kept.
+    """
+
+    _position_actions = (PositionAction.OPEN.value, PositionAction.CLOSE.value)
+    _trade_types = (TradeType.BUY.name.upper(), TradeType.SELL.name.upper())
+
+    def __init__(self, trading_pair: str):
+        self._trading_pair: str = trading_pair
+        self._quote: str = split_hb_trading_pair(trading_pair)[1]
+
+        self._num_buys: int = 0
+        self._num_sells: int = 0
+        self._b_vol_base: Decimal = s_decimal_0
+        self._s_vol_base: Decimal = s_decimal_0
+        self._b_vol_quote: Decimal = s_decimal_0
+        self._s_vol_quote: Decimal = s_decimal_0
+        self._start_price: Optional[Decimal] = None
+        self._last_price: Optional[Decimal] = None
+        self._fees: Dict[str, Decimal] = defaultdict(lambda: s_decimal_0)
+
+        # Number of buy and sell fills without position, the fills of a trade type being derivative trades without any
+        self._nil_position_fills: Dict[str, int] = {trade_type: 0 for trade_type in self._trade_types}
+        # Orders by trade type and order id
+        self._orders: Dict[Tuple[str, str], _AggregatedOrder] = {}
+        # Open and close position orders by trade type and position, in the order of their first fill. The nth open
+        # long (short) position order is paired with the nth close long (short) position order.
+        self._position_orders: Dict[Tuple[str, str], List[_AggregatedOrder]] = {
+            (trade_type, position): [] for trade_type in self._trade_types for position in self._position_actions
+        }
+        # PnL of the paired long and short positions, and their sum
+        self._long_pnls: List[Decimal] = []
+        self._short_pnls: List[Decimal] = []
+        self._derivative_pnl: Decimal = s_decimal_0
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @property
+    def num_trades(self) -> int:
+        return self._num_buys + self._num_sells
+
+    def add_trade(self, trade: TradeFill):
+        price = Decimal(str(trade.price))
+        amount = Decimal(str(trade.amount))
+        trade_type = trade.trade_type.upper()
+        if self._start_price is None:
+            self._start_price = price
+        self._last_price = price
+
+        if trade_type in self._trade_types:
+            if trade_type == TradeType.BUY.name.upper():
+                self._num_buys += 1
+                self._b_vol_base += amount
+                self._b_vol_quote += amount * price * Decimal("-1")
+            else:
+                self._num_sells += 1
+                self._s_vol_base += amount * Decimal("-1")
+                self._s_vol_quote += amount * price
+            if trade.position == PositionAction.NIL.value:
+                self._nil_position_fills[trade_type] += 1
+            self._add_order_fill(trade_type, trade.order_id, trade.position, price, amount)
+
+        fee_percent = trade.trade_fee.get("percent")
+        if fee_percent is not None and Decimal(fee_percent) > 0:
+            self._fees[self._quote] += price * amount * Decimal(str(fee_percent))
+        for flat_fee in trade.trade_fee.get("flat_fees", []):
+            self._fees[flat_fee["token"]] += Decimal(flat_fee["amount"])
+
+    async def metrics(self, current_balances: Dict[str, Decimal]) -> PerformanceMetrics:
+        """
+        Calculates the performance metrics of the trades added so far.
+        :param current_balances: current user account balance
+        """
+        performance = PerformanceMetrics()
+        performance.num_buys = self._num_buys
+        performance.num_sells = self._num_sells
+        performance.num_trades = self.num_trades
+        performance.b_vol_base = self._b_vol_base
+        performance.s_vol_base = self._s_vol_base
+        performance.b_vol_quote = self._b_vol_quote
+        performance.s_vol_quote = self._s_vol_quote
+        performance._calculate_average_prices()
+
+        await performance._calculate_portfolio_values(
+            self._trading_pair, current_balances, self._start_price, self._last_price)
+        if self._are_derivatives():
+            performance.trade_pnl = self._derivative_pnl
+        else:
+            performance.trade_pnl = performance.cur_value - performance.hold_value
+
+        performance.fees.update(self._fees)
+        await performance._calculate_fee_in_quote(self._quote)
+
+        performance._calculate_return()
+        return performance
+
+    def _are_derivatives(self) -> bool:
+        return ((self._num_buys > 0 and self._nil_position_fills[TradeType.BUY.name.upper()] == 0)
+                or (self._num_sells > 0 and self._nil_position_fills[TradeType.SELL.name.upper()] == 0))
+
+    def _add_order_fill(self, trade_type: str, order_id: str, position: str, price: Decimal, amount: Decimal):
+        order = self._orders.get((trade_type, order_id))
+        if order is None:
+            order = _AggregatedOrder(position=position)
+            self._orders[(trade_type, order_id)] = order
+            position_orders = self._position_orders.get((trade_type, position))
+            if position_orders is not None:
+                order.position_index = len(position_orders)
+                position_orders.append(order)
+        order.prices_sum += price
+        order.fills_count += 1
+        order.amount += amount
+
+        if order.position_index is not None:
+            is_long = (trade_type == TradeType.BUY.name.upper()) == (order.position == PositionAction.OPEN.value)
+            self._update_position_pnl(is_long, order.position_index)
+
+    def _update_position_pnl(self, is_long: bool, index: int):
+        buy, sell = self._trade_types
+        open_position, close_position = self._position_actions
+        if is_long:
+            open_orders = self._position_orders[(buy, open_position)]
+            close_orders = self._position_orders[(sell, close_position)]
+            pnls = self._long_pnls
+        else:
+            open_orders = self._position_orders[(sell, open_position)]
+            close_orders = self._position_orders[(buy, close_position)]
+            pnls = self._short_pnls
+        if index >= min(len(open_orders), len(close_orders)):
+            return
+
+        open_order, close_order = open_orders[index], close_orders[index]
+        if is_long:
+            pnl = (close_order.price - open_order.price) * close_order.amount
+        else:
+            pnl = (open_order.price - close_order.price) * close_order.amount
+        if index < len(pnls):
+            self._derivative_pnl -= pnls[index]
+            pnls[index] = pnl
+        else:
+            pnls.append(pnl)
+        self._derivative_pnl += pnl
@@ -1,15 +1,17 @@
 import importlib
 import json
+import logging
+import os
 from decimal import Decimal
 from enum import Enum
 from os import DirEntry, scandir
 from os.path import exists, join, realpath
-from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Tuple, Union, cast
 
 from pydantic import SecretStr
 
-from hummingbot import get_strategy_list, root_path
-from hummingbot.core.data_type.trade_fee import TradeFeeSchema
+from hummingbot import data_path, get_strategy_list, root_path
+from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeSchema
 
 if TYPE_CHECKING:
     from hummingbot.client.config.config_data_types import BaseConnectorConfigMap
@@ -40,6 +42,8 @@ PMM_SCRIPTS_PATH = root_path() / "pmm_scripts"
 SCRIPT_STRATEGIES_MODULE = "scripts"
 SCRIPT_STRATEGIES_PATH = root_path() / SCRIPT_STRATEGIES_MODULE
 CERTS_PATH = root_path() / "certs"
+CONNECTOR_SETTINGS_MANIFEST_FILE_NAME = "connector_settings_manifest.json"
+CONNECTOR_SETTINGS_MANIFEST_VERSION = 1
 
 # Certificates for securely communicating with the gateway api
 GATEAWAY_CA_CERT_PATH = CERTS_PATH / "ca_cert.pem"
@@ -254,73 +258,109 @@ class ConnectorSetting(NamedTuple):
         return connector
 
 
+class ConnectorConfigKeysSource(NamedTuple):
+    """
+    Locates the config keys of a connector in its utils module: `KEYS`, or `OTHER_DOMAINS_KEYS[domain]` for the other
+    domains of the connector.
+    """
+    util_module_path: str
+    domain: Optional[str]
+
+
+class ManifestConnectorSetting(ConnectorSetting):
+    """
+    A connector setting loaded from the connector settings manifest. It holds the source of its config keys, and
+    imports the utils module of the connector when the config keys are first used.
+    """
+    __slots__ = ()
+
+    @property
+    def config_keys(self) -> Optional["BaseConnectorConfigMap"]:
+        source = self.config_keys_source()
+        if source is None:
+            return None
+        util_module = importlib.import_module(source.util_module_path)
+        if source.domain is None:
+            return getattr(util_module, "KEYS", None)
+        return getattr(util_module, "OTHER_DOMAINS_KEYS")[source.domain]
+
+    def config_keys_source(self) -> Optional[ConnectorConfigKeysSource]:
+        # The config_keys field holds the source of the config keys, and the property above shadows it
+        return tuple.__getitem__(self, self._fields.index("config_keys"))
+
+    def to_manifest_entry(self) -> Dict[str, Any]:
+        trade_fee_schema = self.trade_fee_schema
+        source = self.config_keys_source()
+        return {
+            "name": self.name,
+            "type": self.type.name,
+            "example_pair": self.example_pair,
+            "centralised": self.centralised,
+            "use_ethereum_wallet": self.use_ethereum_wallet,
+            "trade_fee_schema": {
+                "percent_fee_token": trade_fee_schema.percent_fee_token,
+                "maker_percent_fee_decimal": str(trade_fee_schema.maker_percent_fee_decimal),
+                "taker_percent_fee_decimal": str(trade_fee_schema.taker_percent_fee_decimal),
+                "buy_percent_fee_deducted_from_returns": trade_fee_schema.buy_percent_fee_deducted_from_returns,
+                "maker_fixed_fees": [fee.to_json() for fee in trade_fee_schema.maker_fixed_fees],
+                "taker_fixed_fees": [fee.to_json() for fee in trade_fee_schema.taker_fixed_fees],
+            },
+            "config_keys": source._asdict() if source is not None else None,
+            "is_sub_domain": self.is_sub_domain,
+            "parent_name": self.parent_name,
+            "domain_parameter": self.domain_parameter,
+            "use_eth_gas_lookup": self.use_eth_gas_lookup,
+        }
+
+    @classmethod
+    def from_manifest_entry(cls, entry: Dict[str, Any]) -> "ManifestConnectorSetting":
+        fee_schema = entry["trade_fee_schema"]
+        return cls(
+            name=entry["name"],
+            type=ConnectorType[entry["type"]],
+            example_pair=entry["example_pair"],
+            centralised=entry["centralised"],
+            use_ethereum_wallet=entry["use_ethereum_wallet"],
+            trade_fee_schema=TradeFeeSchema(
+                percent_fee_token=fee_schema["percent_fee_token"],
+                maker_percent_fee_decimal=Decimal(fee_schema["maker_percent_fee_decimal"]),
+                taker_percent_fee_decimal=Decimal(fee_schema["taker_percent_fee_decimal"]),
+                buy_percent_fee_deducted_from_returns=fee_schema["buy_percent_fee_deducted_from_returns"],
+                maker_fixed_fees=[TokenAmount.from_json(fee) for fee in fee_schema["maker_fixed_fees"]],
+                taker_fixed_fees=[TokenAmount.from_json(fee) for fee in fee_schema["taker_fixed_fees"]],
+            ),
+            config_keys=(ConnectorConfigKeysSource(**entry["config_keys"])
+                         if entry["config_keys"] is not None else None),
+            is_sub_domain=entry["is_sub_domain"],
+            parent_name=entry["parent_name"],
+            domain_parameter=entry["domain_parameter"],
+            use_eth_gas_lookup=entry["use_eth_gas_lookup"],
+        )
+
+
 class AllConnectorSettings:
     all_connector_settings: Dict[str, ConnectorSetting] = {}
 
     @classmethod
     def create_connector_settings(cls):
         """
-        Iterate over files in specific Python directories to create a dictionary of exchange names to ConnectorSetting.
+        Creates a dictionary of exchange names to ConnectorSetting, from the connector settings manifest.
+
+        The manifest holds the settings of the connectors found in the connector directories. It is rebuilt, by
+        importing the utils module of every connector, when it is missing or when the utils modules changed since it
+        was built. The connector modules are otherwise only imported when a connector is used.
         """
         cls.all_connector_settings = {}  # reset
-        connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
-
-        type_dirs: List[DirEntry] = [
-            cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
-            if f.is_dir()
-        ]
-        for type_dir in type_dirs:
-            connector_dirs: List[DirEntry] = [
-                cast(DirEntry, f) for f in scandir(type_dir.path)
-                if f.is_dir() and exists(join(f.path, "__init__.py"))
+        util_modules = cls._connector_util_modules()
+        fingerprint = cls._connector_util_modules_fingerprint(util_modules)
+        manifest_entries = cls._load_connector_settings_manifest(fingerprint)
+        if manifest_entries is None:
+            manifest_entries = [
+                setting.to_manifest_entry() for setting in cls._import_connector_settings(util_modules)
             ]
-            for connector_dir in connector_dirs:
-                if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
-                    continue
-                if connector_dir.name in cls.all_connector_settings:
-                    raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
-                try:
-                    util_module_path: str = f"hummingbot.connector.{type_dir.name}." \
-                                            f"{connector_dir.name}.{connector_dir.name}_utils"
-                    util_module = importlib.import_module(util_module_path)
-                except ModuleNotFoundError:
-                    continue
-                trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
-                trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
-                    connector_dir.name, trade_fee_settings
-                )
-                cls.all_connector_settings[connector_dir.name] = ConnectorSetting(
-                    name=connector_dir.name,
-                    type=ConnectorType[type_dir.name.capitalize()],
-                    centralised=getattr(util_module, "CENTRALIZED", True),
-                    example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
-                    use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
-                    trade_fee_schema=trade_fee_schema,
-                    config_keys=getattr(util_module, "KEYS", None),
-                    is_sub_domain=False,
-                    parent_name=None,
-                    domain_parameter=None,
-                    use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
-                )
-                # Adds other domains of connector
-                other_domains = getattr(util_module, "OTHER_DOMAINS", [])
-                for domain in other_domains:
-                    trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
-                    trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
-                    parent = cls.all_connector_settings[connector_dir.name]
-                    cls.all_connector_settings[domain] = ConnectorSetting(
-                        name=domain,
-                        type=parent.type,
-                        centralised=parent.centralised,
-                        example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
-                        use_ethereum_wallet=parent.use_ethereum_wallet,
-                        trade_fee_schema=trade_fee_schema,
-                        config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
-                        is_sub_domain=True,
-                        parent_name=parent.name,
-                        domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
-                        use_eth_gas_lookup=parent.use_eth_gas_lookup,
-                    )
+            cls._save_connector_settings_manifest(fingerprint, manifest_entries)
+        for entry in manifest_entries:
+            cls.all_connector_settings[entry["name"]] = ManifestConnectorSetting.from_manifest_entry(entry)
 
         # add gateway connectors
         gateway_connections_conf: List[Dict[str, str]] = GatewayConnectionSetting.load()
@@ -345,23 +385,145 @@ class AllConnectorSettings:
 
         return cls.all_connector_settings
 
+    @staticmethod
+    def connector_settings_manifest_path() -> str:
+        return join(data_path(), CONNECTOR_SETTINGS_MANIFEST_FILE_NAME)
+
+    @staticmethod
+    def _connector_util_modules() -> List[Tuple[str, str, str]]:
+        """
+        :return: the connector type directory name, connector name and utils module file path of every connector
+        directory, without importing them
+        """
+        connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
+        util_modules = []
+        type_dirs: List[DirEntry] = [
+            cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
+            if f.is_dir()
+        ]
+        for type_dir in sorted(type_dirs, key=lambda entry: entry.name):
+            connector_dirs: List[DirEntry] = [
+                cast(DirEntry, f) for f in scandir(type_dir.path)
+                if f.is_dir() and exists(join(f.path, "__init__.py"))
+            ]
+            for connector_dir in sorted(connector_dirs, key=lambda entry: entry.name):
+                if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
+                    continue
+                util_modules.append(
+                    (type_dir.name, connector_dir.name, join(connector_dir.path, f"{connector_dir.name}_utils.py"))
+                )
+        return util_modules
+
+    @staticmethod
+    def _connector_util_modules_fingerprint(util_modules: List[Tuple[str, str, str]]) -> List[List[Any]]:
+        fingerprint = []
+        for type_dir_name, connector_name, util_module_file in util_modules:
+            try:
+                util_module_stat = os.stat(util_module_file)
+                fingerprint.append([type_dir_name, connector_name, util_module_stat.st_mtime_ns,
+                                    util_module_stat.st_size])
+            except OSError:
+                fingerprint.append([type_dir_name, connector_name, None, None])
+        return fingerprint
+
+    @classmethod
+    def _load_connector_settings_manifest(cls, fingerprint: List[List[Any]]) -> Optional[List[Dict[str, Any]]]:
+        """
+        :return: the settings entries of the manifest, or None if there is no manifest for these utils modules
+        """
+        try:
+            with open(cls.connector_settings_manifest_path()) as manifest_file:
+                manifest = json.load(manifest_file)
+        except (OSError, ValueError):
+            return None
+        if (not isinstance(manifest, dict)
+                or manifest.get("version") != CONNECTOR_SETTINGS_MANIFEST_VERSION
+                or manifest.get("fingerprint") != fingerprint):
+            return None
+        return manifest.get("connector_settings")
+
+    @classmethod
+    def _save_connector_settings_manifest(cls, fingerprint: List[List[Any]], entries: List[Dict[str, Any]]):
+        manifest_path = cls.connector_settings_manifest_path()
+        temporary_path = f"{manifest_path}.{os.getpid()}.tmp"
+        try:
+            with open(temporary_path, "w") as manifest_file:
+                json.dump({
+                    "version": CONNECTOR_SETTINGS_MANIFEST_VERSION,
+                    "fingerprint": fingerprint,
+                    "connector_settings": entries,
+                }, manifest_file)
+            os.replace(temporary_path, manifest_path)
+        except OSError:
+            logging.getLogger(__name__).warning(
+                f"Could not save the connector settings manifest to {manifest_path}.", exc_info=True)
+
+    @classmethod
+    def _import_connector_settings(cls, util_modules: List[Tuple[str, str, str]]) -> List[ManifestConnectorSetting]:
+        """
+        Imports the utils module of every connector to create its settings.
+        """
+        connector_settings: Dict[str, ManifestConnectorSetting] = {}
+        for type_dir_name, connector_name, _ in util_modules:
+            if connector_name in connector_settings:
+                raise Exception(f"Multiple connectors with the same {connector_name} name.")
+            try:
+                util_module_path: str = f"hummingbot.connector.{type_dir_name}." \
+                                        f"{connector_name}.{connector_name}_utils"
+                util_module = importlib.import_module(util_module_path)
+            except ModuleNotFoundError:
+                continue
+            trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
+            trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
+                connector_name, trade_fee_settings
+            )
+            connector_settings[connector_name] = ManifestConnectorSetting(
+                name=connector_name,
+                type=ConnectorType[type_dir_name.capitalize()],
+                centralised=getattr(util_module, "CENTRALIZED", True),
+                example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
+                use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
+                trade_fee_schema=trade_fee_schema,
+                config_keys=(ConnectorConfigKeysSource(util_module_path, None)
+                             if getattr(util_module, "KEYS", None) is not None else None),
+                is_sub_domain=False,
+                parent_name=None,
+                domain_parameter=None,
+                use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
+            )
+            # Adds other domains of connector
+            other_domains = getattr(util_module, "OTHER_DOMAINS", [])
+            for domain in other_domains:
+                trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
+                trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
+                parent = connector_settings[connector_name]
+                connector_settings[domain] = ManifestConnectorSetting(
+                    name=domain,
+                    type=parent.type,
+                    centralised=parent.centralised,
+                    example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
+                    use_ethereum_wallet=parent.use_ethereum_wallet,
+                    trade_fee_schema=trade_fee_schema,
+                    config_keys=(ConnectorConfigKeysSource(util_module_path, domain)
+                                 if getattr(util_module, "OTHER_DOMAINS_KEYS")[domain] is not None else None),
+                    is_sub_domain=True,
+                    parent_name=parent.name,
+                    domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
+                    use_eth_gas_lookup=parent.use_eth_gas_lookup,
+                )
+        return list(connector_settings.values())
+
     @classmethod
     def initialize_paper_trade_settings(cls, paper_trade_exchanges: List[str]):
         for e in paper_trade_exchanges:
             base_connector_settings: Optional[ConnectorSetting] = cls.all_connector_settings.get(e, None)
             if base_connector_settings:
-                paper_trade_settings = ConnectorSetting(
+                # _replace keeps the config keys of settings from the manifest to be imported when used
+                paper_trade_settings = base_connector_settings._replace(
                     name=f"{e}_paper_trade",
-                    type=base_connector_settings.type,
-                    centralised=base_connector_settings.centralised,
-                    example_pair=base_connector_settings.example_pair,
-                    use_ethereum_wallet=base_connector_settings.use_ethereum_wallet,
-                    trade_fee_schema=base_connector_settings.trade_fee_schema,
-                    config_keys=base_connector_settings.config_keys,
                     is_sub_domain=False,
                     parent_name=base_connector_settings.name,
                     domain_parameter=None,
-                    use_eth_gas_lookup=base_connector_settings.use_eth_gas_lookup,
                 )
                 cls.all_connector_settings.update({f"{e}_paper_trade": paper_trade_settings})
 
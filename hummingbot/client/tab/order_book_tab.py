@@ -55,10 +55,9 @@ class OrderBookTab(TabBase):
             trading_pair, order_book = next(iter(market_connector.order_books.items()))
 
         def get_order_book_text(no_lines: int):
-            bids = order_book.snapshot[0][['price', 'amount']].head(no_lines)
-            bids.rename(columns={'price': 'bid_price', 'amount': 'bid_volume'}, inplace=True)
-            asks = order_book.snapshot[1][['price', 'amount']].head(no_lines)
-            asks.rename(columns={'price': 'ask_price', 'amount': 'ask_volume'}, inplace=True)
+            bids, asks = order_book.get_snapshot(no_lines)
+            bids = bids[['price', 'amount']].rename(columns={'price': 'bid_price', 'amount': 'bid_volume'})
+            asks = asks[['price', 'amount']].rename(columns={'price': 'ask_price', 'amount': 'ask_volume'})
             joined_df = pd.concat([bids, asks], axis=1)
             text_lines = ["" + line for line in joined_df.to_string(index=False).split("\n")]
             header = f"market: {market_connector.name} {trading_pair}\n"
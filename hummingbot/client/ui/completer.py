@@ -44,6 +44,7 @@ class HummingbotCompleter(Completer):
         self._export_completer = WordCompleter(["keys", "trades"], ignore_case=True)
         self._balance_completer = WordCompleter(["limit", "paper"], ignore_case=True)
         self._history_completer = WordCompleter(["--days", "--verbose", "--precision"], ignore_case=True)
+        self._instrumentation_completer = WordCompleter(["--reset", "--prometheus-port"], ignore_case=True)
         self._gateway_completer = WordCompleter(["create", "config", "connect", "connector-tokens", "generate-certs", "status", "test-connection", "start", "stop"], ignore_case=True)
         self._gateway_connect_completer = WordCompleter(GATEWAY_CONNECTORS, ignore_case=True)
         self._gateway_connector_tokens_completer = WordCompleter(sorted(AllConnectorSettings.get_gateway_evm_amm_connector_names()), ignore_case=True)
@@ -156,6 +157,10 @@ class HummingbotCompleter(Completer):
         text_before_cursor: str = document.text_before_cursor
         return text_before_cursor.startswith("history ")
 
+    def _complete_instrumentation_arguments(self, document: Document) -> bool:
+        text_before_cursor: str = document.text_before_cursor
+        return text_before_cursor.startswith("instrumentation ")
+
     def _complete_gateway_connect_arguments(self, document: Document) -> bool:
         text_before_cursor: str = document.text_before_cursor
         return text_before_cursor.startswith("gateway connect ")
@@ -284,6 +289,10 @@ class HummingbotCompleter(Completer):
             for c in self._history_completer.get_completions(document, complete_event):
                 yield c
 
+        elif self._complete_instrumentation_arguments(document):
+            for c in self._instrumentation_completer.get_completions(document, complete_event):
+                yield c
+
         elif self._complete_gateway_connect_arguments(document):
             for c in self._gateway_connect_completer.get_completions(document, complete_event):
                 yield c
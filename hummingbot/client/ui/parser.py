@@ -91,6 +91,15 @@ def load_parser(hummingbot: "HummingbotApplication", command_tabs) -> [ThrowingA
                                 dest="precision", help="Level of precions for values displayed")
     history_parser.set_defaults(func=hummingbot.history)
 
+    instrumentation_parser = subparsers.add_parser(
+        "instrumentation", help="Show the event loop lag, tick, order book, order and throttler latencies")
+    instrumentation_parser.add_argument("-r", "--reset", action="store_true", default=False,
+                                        dest="reset", help="Clear the recorded latencies")
+    instrumentation_parser.add_argument("--prometheus-port", type=int, default=None, dest="prometheus_port",
+                                        help="Serve the latencies in the Prometheus format on this local port "
+                                             "(0 to stop)")
+    instrumentation_parser.set_defaults(func=hummingbot.instrumentation)
+
     gateway_parser = subparsers.add_parser("gateway", help="Helper comands for Gateway server.")
     gateway_subparsers = gateway_parser.add_subparsers()
     gateway_create_parser = gateway_subparsers.add_parser("create", help="Create gateway docker container instance")
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import time
 from collections import defaultdict
 from decimal import Decimal
 from typing import Callable, Dict, Optional
@@ -20,6 +21,8 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.core.instrumentation.instrumentation import ORDER_ROUND_TRIP, Instrumentation
+from hummingbot.core.instrumentation.latency_histogram import LatencyHistogram
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger.logger import HummingbotLogger
 
@@ -57,6 +60,9 @@ class ClientOrderTracker:
         self._order_tracking_task: Optional[asyncio.Task] = None
         self._last_poll_timestamp: int = -1
         self._order_not_found_records: Dict[str, int] = defaultdict(lambda: 0)
+        # Time the tracking of each order pending creation started at, for its round trip latency
+        self._order_creation_start_times: Dict[str, float] = {}
+        self._order_round_trip_histogram: Optional[LatencyHistogram] = None
 
     @property
     def active_orders(self) -> Dict[str, InFlightOrder]:
@@ -88,8 +94,11 @@ class ClientOrderTracker:
 
     def start_tracking_order(self, order: InFlightOrder):
         self._in_flight_orders[order.client_order_id] = order
+        if order.current_state == OrderState.PENDING_CREATE:
+            self._order_creation_start_times[order.client_order_id] = time.perf_counter()
 
     def stop_tracking_order(self, client_order_id: str):
+        self._order_creation_start_times.pop(client_order_id, None)
         if client_order_id in self._in_flight_orders:
             self._cached_orders[client_order_id] = self._in_flight_orders[client_order_id]
             del self._in_flight_orders[client_order_id]
@@ -212,6 +221,19 @@ class ClientOrderTracker:
             )
             self._trigger_created_event(tracked_order)
 
+    def _record_order_round_trip(self, tracked_order: InFlightOrder):
+        """
+        Records the time from the start of the tracking of an order to the first update of its state by the exchange
+        """
+        if tracked_order.current_state == OrderState.PENDING_CREATE:
+            return
+        start_time: Optional[float] = self._order_creation_start_times.pop(tracked_order.client_order_id, None)
+        if start_time is not None:
+            if self._order_round_trip_histogram is None:
+                self._order_round_trip_histogram = Instrumentation.get_instance().histogram(
+                    ORDER_ROUND_TRIP, self._connector.name)
+            self._order_round_trip_histogram.record(time.perf_counter() - start_time)
+
     def _trigger_order_fills(self,
                              tracked_order: InFlightOrder,
                              prev_executed_amount_base: Decimal,
@@ -276,6 +298,7 @@ class ClientOrderTracker:
 
             updated: bool = tracked_order.update_with_order_update(order_update)
             if updated:
+                self._record_order_round_trip(tracked_order)
                 self._trigger_order_creation(tracked_order, previous_state, order_update.new_state)
                 self._trigger_order_completion(tracked_order, order_update)
 
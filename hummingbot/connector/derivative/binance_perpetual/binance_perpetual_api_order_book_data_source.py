@@ -27,6 +27,8 @@ from hummingbot.logger import HummingbotLogger
 
 
 class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
+    THROTTLED_SNAPSHOTS = True
+
     _bpobds_logger: Optional[HummingbotLogger] = None
     _trading_pair_symbol_map: Dict[str, Mapping[str, str]] = {}
     _mapping_initialization_lock = asyncio.Lock()
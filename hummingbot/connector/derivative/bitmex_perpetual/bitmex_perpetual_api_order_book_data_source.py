@@ -28,6 +28,7 @@ from hummingbot.logger import HummingbotLogger
 
 
 class BitmexPerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
+    THROTTLED_SNAPSHOTS = True
 
     _bpobds_logger: Optional[HummingbotLogger] = None
     _trading_pair_symbol_map: Dict[str, Mapping[str, str]] = {}
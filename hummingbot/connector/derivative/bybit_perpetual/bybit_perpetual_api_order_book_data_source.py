@@ -22,6 +22,7 @@ from hummingbot.logger import HummingbotLogger
 
 
 class BybitPerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
+    THROTTLED_SNAPSHOTS = True
     _ORDER_BOOK_SNAPSHOT_DELAY = 60 * 60
 
     _logger: Optional[HummingbotLogger] = None
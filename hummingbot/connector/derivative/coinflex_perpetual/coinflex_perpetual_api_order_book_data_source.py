@@ -25,6 +25,8 @@ from hummingbot.logger import HummingbotLogger
 
 
 class CoinflexPerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
+    THROTTLED_SNAPSHOTS = True
+
     _cfpobds_logger: Optional[HummingbotLogger] = None
     _trading_pair_symbol_map: Dict[str, Mapping[str, str]] = {}
     _mapping_initialization_lock = asyncio.Lock()
@@ -26,6 +26,8 @@ from .altmarkets_websocket import AltmarketsWebsocket
 
 
 class AltmarketsAPIOrderBookDataSource(OrderBookTrackerDataSource):
+    THROTTLED_SNAPSHOTS = True
+
     _logger: Optional[HummingbotLogger] = None
 
     @classmethod
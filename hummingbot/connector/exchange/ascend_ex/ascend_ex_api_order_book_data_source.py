@@ -22,6 +22,7 @@ from hummingbot.logger import HummingbotLogger
 
 
 class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
+    THROTTLED_SNAPSHOTS = True
     MAX_RETRIES = 20
     MESSAGE_TIMEOUT = 30.0
     SNAPSHOT_TIMEOUT = 10.0
@@ -20,6 +20,8 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
     TRADE_STREAM_ID = 1
     DIFF_STREAM_ID = 2
     ONE_HOUR = 60 * 60
+    SEQUENCED_DIFFS = True
+    THROTTLED_SNAPSHOTS = True
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -3,9 +3,9 @@ import hmac
 import json
 from collections import OrderedDict
 from typing import Any, Dict
-from urllib.parse import urlencode
 
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
+from hummingbot.connector.utils import urlencode_params
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, WSRequest
 
@@ -15,6 +15,8 @@ class BinanceAuth(AuthBase):
         self.api_key = api_key
         self.secret_key = secret_key
         self.time_provider = time_provider
+        # Keyed with the secret once, and copied for each signature
+        self._hmac = hmac.new(secret_key.encode("utf8"), digestmod=hashlib.sha256)
 
     async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
         """
@@ -59,6 +61,7 @@ class BinanceAuth(AuthBase):
 
     def _generate_signature(self, params: Dict[str, Any]) -> str:
 
-        encoded_params_str = urlencode(params)
-        digest = hmac.new(self.secret_key.encode("utf8"), encoded_params_str.encode("utf8"), hashlib.sha256).hexdigest()
-        return digest
+        encoded_params_str = urlencode_params(params)
+        signature = self._hmac.copy()
+        signature.update(encoded_params_str.encode("utf8"))
+        return signature.hexdigest()
@@ -174,10 +174,9 @@ class BinanceExchange(ExchangePyBase):
         if order_type == OrderType.LIMIT:
             api_params["timeInForce"] = CONSTANTS.TIME_IN_FORCE_GTC
 
-        order_result = await self._api_post(
-            path_url=CONSTANTS.ORDER_PATH_URL,
-            data=api_params,
-            is_auth_required=True)
+        order_result = await self._api_template_request(
+            self._request_template(path_url=CONSTANTS.ORDER_PATH_URL, method=RESTMethod.POST, is_auth_required=True),
+            data=api_params)
         o_id = str(order_result["orderId"])
         transact_time = order_result["transactTime"] * 1e-3
         return (o_id, transact_time)
@@ -188,10 +187,9 @@ class BinanceExchange(ExchangePyBase):
             "symbol": symbol,
             "origClientOrderId": order_id,
         }
-        cancel_result = await self._api_delete(
-            path_url=CONSTANTS.ORDER_PATH_URL,
-            params=api_params,
-            is_auth_required=True)
+        cancel_result = await self._api_template_request(
+            self._request_template(path_url=CONSTANTS.ORDER_PATH_URL, method=RESTMethod.DELETE, is_auth_required=True),
+            params=api_params)
         if cancel_result.get("status") == "CANCELED":
             return True
         return False
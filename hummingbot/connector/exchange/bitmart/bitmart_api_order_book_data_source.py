@@ -20,6 +20,7 @@ if TYPE_CHECKING:
 
 
 class BitmartAPIOrderBookDataSource(OrderBookTrackerDataSource):
+    THROTTLED_SNAPSHOTS = True
 
     _logger: Optional[HummingbotLogger] = None
 
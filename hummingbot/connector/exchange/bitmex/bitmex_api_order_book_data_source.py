@@ -24,6 +24,7 @@ from hummingbot.logger import HummingbotLogger
 
 
 class BitmexAPIOrderBookDataSource(OrderBookTrackerDataSource):
+    THROTTLED_SNAPSHOTS = True
 
     _bpobds_logger: Optional[HummingbotLogger] = None
     _trading_pair_symbol_map: Dict[str, Mapping[str, str]] = {}
@@ -23,6 +23,7 @@ from hummingbot.logger import HummingbotLogger
 
 
 class CoinflexAPIOrderBookDataSource(OrderBookTrackerDataSource):
+    THROTTLED_SNAPSHOTS = True
 
     HEARTBEAT_TIME_INTERVAL = 30.0
     TRADE_STREAM_ID = 1
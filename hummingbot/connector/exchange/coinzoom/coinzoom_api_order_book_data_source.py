@@ -25,6 +25,8 @@ from .coinzoom_websocket import CoinzoomWebsocket
 
 
 class CoinzoomAPIOrderBookDataSource(OrderBookTrackerDataSource):
+    THROTTLED_SNAPSHOTS = True
+
     _logger: Optional[HummingbotLogger] = None
 
     @classmethod
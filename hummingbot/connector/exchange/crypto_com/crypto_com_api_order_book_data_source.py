@@ -21,6 +21,7 @@ from hummingbot.logger import HummingbotLogger
 
 
 class CryptoComAPIOrderBookDataSource(OrderBookTrackerDataSource):
+    THROTTLED_SNAPSHOTS = True
     MAX_RETRIES = 20
     MESSAGE_TIMEOUT = 30.0
     SNAPSHOT_TIMEOUT = 10.0
@@ -17,6 +17,8 @@ if TYPE_CHECKING:
 
 
 class GateIoAPIOrderBookDataSource(OrderBookTrackerDataSource):
+    SEQUENCED_DIFFS = True
+    THROTTLED_SNAPSHOTS = True
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -26,6 +26,7 @@ from hummingbot.logger import HummingbotLogger
 
 
 class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
+    THROTTLED_SNAPSHOTS = True
     MESSAGE_TIMEOUT = 30.0
     PING_TIMEOUT = 10.0
 
@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 
 
 class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
+    SEQUENCED_DIFFS = True
+    THROTTLED_SNAPSHOTS = True
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -20,6 +20,8 @@ if TYPE_CHECKING:
 
 
 class LatokenAPIOrderBookDataSource(OrderBookTrackerDataSource):
+    THROTTLED_SNAPSHOTS = True
+
     def __init__(self,
                  trading_pairs: List[str],
                  connector: 'LatokenExchange',
@@ -30,6 +30,7 @@ from collections import defaultdict
 
 
 class MexcAPIOrderBookDataSource(OrderBookTrackerDataSource):
+    THROTTLED_SNAPSHOTS = True
     MESSAGE_TIMEOUT = 120.0
     PING_TIMEOUT = 10.0
 
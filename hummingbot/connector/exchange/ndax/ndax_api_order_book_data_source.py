@@ -23,6 +23,7 @@ from hummingbot.logger.logger import HummingbotLogger
 
 
 class NdaxAPIOrderBookDataSource(OrderBookTrackerDataSource):
+    THROTTLED_SNAPSHOTS = True
     _ORDER_BOOK_SNAPSHOT_DELAY = 60 * 60  # expressed in seconds
 
     _logger: Optional[HummingbotLogger] = None
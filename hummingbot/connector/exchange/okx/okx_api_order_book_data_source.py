@@ -15,6 +15,7 @@ if TYPE_CHECKING:
 
 
 class OkxAPIOrderBookDataSource(OrderBookTrackerDataSource):
+    THROTTLED_SNAPSHOTS = True
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -18,6 +18,8 @@ class OkxAuth(AuthBase):
         self.secret_key: str = secret_key
         self.passphrase: str = passphrase
         self.time_provider: TimeSynchronizer = time_provider
+        # Keyed with the secret once, and copied for each signature
+        self._hmac = hmac.new(secret_key.encode("utf-8"), digestmod=hashlib.sha256)
 
     async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
         """
@@ -53,12 +55,9 @@ class OkxAuth(AuthBase):
         if body is not None:
             unsigned_signature += body
 
-        signature = base64.b64encode(
-            hmac.new(
-                self.secret_key.encode("utf-8"),
-                unsigned_signature.encode("utf-8"),
-                hashlib.sha256).digest()).decode()
-        return signature
+        signature = self._hmac.copy()
+        signature.update(unsigned_signature.encode("utf-8"))
+        return base64.b64encode(signature.digest()).decode()
 
     def authentication_headers(self, request: RESTRequest) -> Dict[str, Any]:
         timestamp = datetime.utcfromtimestamp(self.time_provider.time()).isoformat(timespec="milliseconds") + "Z"
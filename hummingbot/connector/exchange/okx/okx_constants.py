@@ -22,6 +22,7 @@ OKX_ORDER_BOOK_PATH = '/api/v5/market/books'
 
 # Auth required
 OKX_PLACE_ORDER_PATH = "/api/v5/trade/order"
+OKX_BATCH_PLACE_ORDERS_PATH = "/api/v5/trade/batch-orders"
 OKX_ORDER_DETAILS_PATH = '/api/v5/trade/order'
 OKX_ORDER_CANCEL_PATH = '/api/v5/trade/cancel-order'
 OKX_BATCH_ORDER_CANCEL_PATH = '/api/v5/trade/cancel-batch-orders'
@@ -66,6 +67,7 @@ RATE_LIMITS = [
     RateLimit(limit_id=OKX_TICKER_PATH, limit=20, time_interval=2),
     RateLimit(limit_id=OKX_ORDER_BOOK_PATH, limit=20, time_interval=2),
     RateLimit(limit_id=OKX_PLACE_ORDER_PATH, limit=60, time_interval=2),
+    RateLimit(limit_id=OKX_BATCH_PLACE_ORDERS_PATH, limit=300, time_interval=2),
     RateLimit(limit_id=OKX_ORDER_DETAILS_PATH, limit=60, time_interval=2),
     RateLimit(limit_id=OKX_ORDER_CANCEL_PATH, limit=60, time_interval=2),
     RateLimit(limit_id=OKX_BATCH_ORDER_CANCEL_PATH, limit=300, time_interval=2),
@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from bidict import bidict
 
@@ -175,12 +175,14 @@ class OkxExchange(ExchangePyBase):
             "px": str(price)
         }
 
-        exchange_order_id = await self._api_request(
-            path_url=CONSTANTS.OKX_PLACE_ORDER_PATH,
-            method=RESTMethod.POST,
+        exchange_order_id = await self._api_template_request(
+            self._request_template(
+                path_url=CONSTANTS.OKX_PLACE_ORDER_PATH,
+                method=RESTMethod.POST,
+                is_auth_required=True,
+                limit_id=CONSTANTS.OKX_PLACE_ORDER_PATH,
+            ),
             data=data,
-            is_auth_required=True,
-            limit_id=CONSTANTS.OKX_PLACE_ORDER_PATH,
         )
         data = exchange_order_id["data"][0]
         if data["sCode"] != "0":
@@ -195,10 +197,13 @@ class OkxExchange(ExchangePyBase):
             "clOrdId": order_id,
             "instId": tracked_order.trading_pair
         }
-        cancel_result = await self._api_post(
-            path_url=CONSTANTS.OKX_ORDER_CANCEL_PATH,
+        cancel_result = await self._api_template_request(
+            self._request_template(
+                path_url=CONSTANTS.OKX_ORDER_CANCEL_PATH,
+                method=RESTMethod.POST,
+                is_auth_required=True,
+            ),
             data=params,
-            is_auth_required=True,
         )
         if cancel_result["data"][0]["sCode"] == "0":
             final_result = True
@@ -210,6 +215,65 @@ class OkxExchange(ExchangePyBase):
 
         return final_result
 
+    async def _place_orders_batch(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=orders[0].trading_pair)
+        data = [
+            {
+                "clOrdId": order.client_order_id,
+                "tdMode": "cash",
+                "ordType": "limit",
+                "side": order.trade_type.name.lower(),
+                "instId": symbol,
+                "sz": str(order.amount),
+                "px": str(order.price)
+            }
+            for order in orders
+        ]
+        response = await self._api_request(
+            path_url=CONSTANTS.OKX_BATCH_PLACE_ORDERS_PATH,
+            method=RESTMethod.POST,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.OKX_BATCH_PLACE_ORDERS_PATH,
+        )
+        orders_data = {order_data["clOrdId"]: order_data for order_data in response.get("data", [])}
+        results = []
+        for order in orders:
+            order_data = orders_data.get(order.client_order_id)
+            if order_data is None:
+                results.append(IOError(f"Error submitting order {order.client_order_id}: {response.get('msg')}"))
+            elif order_data["sCode"] != "0":
+                results.append(IOError(f"Error submitting order {order.client_order_id}: {order_data['sMsg']}"))
+            else:
+                results.append((str(order_data["ordId"]), self.current_timestamp))
+        return results
+
+    async def _place_cancels_batch(self, tracked_orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        data = [
+            {
+                "clOrdId": order.client_order_id,
+                "instId": order.trading_pair
+            }
+            for order in tracked_orders
+        ]
+        response = await self._api_post(
+            path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH,
+            data=data,
+            is_auth_required=True,
+        )
+        orders_data = {order_data["clOrdId"]: order_data for order_data in response.get("data", [])}
+        results = []
+        for order in tracked_orders:
+            order_data = orders_data.get(order.client_order_id)
+            if order_data is None:
+                results.append(IOError(response.get("msg")))
+            elif order_data["sCode"] in ("0", "5140"):
+                # 5140: the cancelation failed because the order does not exist anymore
+                results.append(True)
+            else:
+                results.append(IOError(order_data["sMsg"]))
+        return results
+
     async def _get_last_traded_price(self, trading_pair: str) -> float:
         params = {"instId": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)}
 
@@ -15,6 +15,8 @@ ctypedef pair[string, SingleTradingPairLimitOrders] LimitOrdersPair
 ctypedef unordered_map[string, SingleTradingPairLimitOrders] LimitOrders
 ctypedef cpp_set[CPPLimitOrder].iterator SingleTradingPairLimitOrdersIterator
 ctypedef cpp_set[CPPLimitOrder].reverse_iterator SingleTradingPairLimitOrdersRIterator
+ctypedef unordered_map[string, SingleTradingPairLimitOrdersIterator] LimitOrdersIndex
+ctypedef unordered_map[string, SingleTradingPairLimitOrdersIterator].iterator LimitOrdersIndexIterator
 ctypedef cpp_set[CPPOrderExpirationEntry] LimitOrderExpirationSet
 ctypedef cpp_set[CPPOrderExpirationEntry].iterator LimitOrderExpirationSetIterator
 
@@ -31,6 +33,8 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef:
         LimitOrders _bid_limit_orders
         LimitOrders _ask_limit_orders
+        LimitOrdersIndex _limit_orders_by_client_order_id
+        dict _on_hold_balances
         bint _paper_trade_market_initialized
         dict _trading_pairs
         object _queued_orders
@@ -53,6 +57,8 @@ cdef class PaperTradeExchange(ExchangeBase):
                           object amount,
                           object price,
                           object is_maker=*)
+    cdef c_insert_limit_order(self, LimitOrders *limit_orders_map_ptr, CPPLimitOrder limit_order)
+    cdef c_update_on_hold_balance(self, const CPPLimitOrder *cpp_limit_order_ptr, bint release)
     cdef c_delete_limit_order(self,
                               LimitOrders *limit_orders_map_ptr,
                               LimitOrdersIterator *map_it_ptr,
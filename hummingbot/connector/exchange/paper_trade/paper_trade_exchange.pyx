@@ -168,6 +168,7 @@ cdef class PaperTradeExchange(ExchangeBase):
         self._paper_trade_market_initialized = False
         self._trading_pairs = {}
         self._queued_orders = deque()
+        self._on_hold_balances = {}
         self._quantization_params = {}
         self._order_book_trade_listener = OrderBookTradeListener(self)
         self._target_market = target_market
@@ -272,19 +273,14 @@ cdef class PaperTradeExchange(ExchangeBase):
 
     @property
     def on_hold_balances(self) -> Dict[str, Decimal]:
-        _on_hold_balances = defaultdict(Decimal)
-        for limit_order in self.limit_orders:
-            if limit_order.is_buy:
-                _on_hold_balances[limit_order.quote_currency] += limit_order.quantity * limit_order.price
-            else:
-                _on_hold_balances[limit_order.base_currency] += limit_order.quantity
-        return _on_hold_balances
+        return defaultdict(Decimal, self._on_hold_balances)
 
     @property
     def available_balances(self) -> Dict[str, Decimal]:
         _available_balances = self._account_balances.copy()
-        for trading_pair_str, balance in _available_balances.items():
-            _available_balances[trading_pair_str] -= self.on_hold_balances[trading_pair_str]
+        for currency, on_hold_balance in self._on_hold_balances.items():
+            if currency in _available_balances:
+                _available_balances[currency] -= on_hold_balance
         return _available_balances
 
     # </editor-fold>
@@ -332,9 +328,6 @@ cdef class PaperTradeExchange(ExchangeBase):
             string cpp_trading_pair_str = trading_pair_str.encode("utf8")
             string cpp_base_asset = self._trading_pairs[trading_pair_str].base_asset.encode("utf8")
             string cpp_quote_asset = quote_asset.encode("utf8")
-            LimitOrdersIterator map_it
-            SingleTradingPairLimitOrders *limit_orders_collection_ptr = NULL
-            pair[LimitOrders.iterator, cppbool] insert_result
 
         quantized_price = (self.c_quantize_order_price(trading_pair_str, price)
                            if order_type is OrderType.LIMIT
@@ -344,15 +337,7 @@ cdef class PaperTradeExchange(ExchangeBase):
             self._queued_orders.append(QueuedOrder(self._current_timestamp, order_id, True, trading_pair_str,
                                                    quantized_amount))
         elif order_type is OrderType.LIMIT:
-
-            map_it = self._bid_limit_orders.find(cpp_trading_pair_str)
-
-            if map_it == self._bid_limit_orders.end():
-                insert_result = self._bid_limit_orders.insert(LimitOrdersPair(cpp_trading_pair_str,
-                                                                              SingleTradingPairLimitOrders()))
-                map_it = insert_result.first
-            limit_orders_collection_ptr = address(deref(map_it).second)
-            limit_orders_collection_ptr.insert(CPPLimitOrder(
+            self.c_insert_limit_order(address(self._bid_limit_orders), CPPLimitOrder(
                 cpp_order_id,
                 cpp_trading_pair_str,
                 True,
@@ -391,9 +376,6 @@ cdef class PaperTradeExchange(ExchangeBase):
             string cpp_trading_pair_str = trading_pair_str.encode("utf8")
             string cpp_base_asset = base_asset.encode("utf8")
             string cpp_quote_asset = self._trading_pairs[trading_pair_str].quote_asset.encode("utf8")
-            LimitOrdersIterator map_it
-            SingleTradingPairLimitOrders *limit_orders_collection_ptr = NULL
-            pair[LimitOrders.iterator, cppbool] insert_result
 
         quantized_price = (self.c_quantize_order_price(trading_pair_str, price)
                            if order_type is OrderType.LIMIT
@@ -403,14 +385,7 @@ cdef class PaperTradeExchange(ExchangeBase):
             self._queued_orders.append(QueuedOrder(self._current_timestamp, order_id, False, trading_pair_str,
                                                    quantized_amount))
         elif order_type is OrderType.LIMIT:
-            map_it = self._ask_limit_orders.find(cpp_trading_pair_str)
-
-            if map_it == self._ask_limit_orders.end():
-                insert_result = self._ask_limit_orders.insert(LimitOrdersPair(cpp_trading_pair_str,
-                                                                              SingleTradingPairLimitOrders()))
-                map_it = insert_result.first
-            limit_orders_collection_ptr = address(deref(map_it).second)
-            limit_orders_collection_ptr.insert(CPPLimitOrder(
+            self.c_insert_limit_order(address(self._ask_limit_orders), CPPLimitOrder(
                 cpp_order_id,
                 cpp_trading_pair_str,
                 False,
@@ -614,6 +589,47 @@ cdef class PaperTradeExchange(ExchangeBase):
             else:
                 return
 
+    cdef c_insert_limit_order(self, LimitOrders *limit_orders_map_ptr, CPPLimitOrder limit_order):
+        """
+        Adds a limit order to the price sorted orders of its trading pair, and indexes it by client order id.
+        """
+        cdef:
+            string cpp_trading_pair = limit_order.getTradingPair()
+            LimitOrdersIterator map_it = limit_orders_map_ptr.find(cpp_trading_pair)
+            pair[LimitOrders.iterator, cppbool] map_insert_result
+            pair[SingleTradingPairLimitOrdersIterator, bint] orders_insert_result
+
+        if map_it == limit_orders_map_ptr.end():
+            map_insert_result = limit_orders_map_ptr.insert(LimitOrdersPair(cpp_trading_pair,
+                                                                            SingleTradingPairLimitOrders()))
+            map_it = map_insert_result.first
+        orders_insert_result = deref(map_it).second.insert(limit_order)
+        self._limit_orders_by_client_order_id[limit_order.getClientOrderID()] = orders_insert_result.first
+        self.c_update_on_hold_balance(address(deref(orders_insert_result.first)), False)
+
+    cdef c_update_on_hold_balance(self, const CPPLimitOrder *cpp_limit_order_ptr, bint release):
+        """
+        Holds (or releases) the balance a resting limit order would spend: the quote amount of a bid, the base amount
+        of an ask. The balances on hold are kept up to date this way rather than summed over the limit orders whenever
+        the available balances are queried.
+        """
+        cdef:
+            str currency
+            object amount = <object> cpp_limit_order_ptr.getQuantity()
+
+        if cpp_limit_order_ptr.getIsBuy():
+            currency = cpp_limit_order_ptr.getQuoteCurrency().decode("utf8")
+            amount = amount * <object> cpp_limit_order_ptr.getPrice()
+        else:
+            currency = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
+        if release:
+            amount = -amount
+        on_hold_balance = self._on_hold_balances.get(currency, s_decimal_0) + amount
+        if on_hold_balance == s_decimal_0:
+            self._on_hold_balances.pop(currency, None)
+        else:
+            self._on_hold_balances[currency] = on_hold_balance
+
     cdef c_delete_limit_order(self,
                               LimitOrders *limit_orders_map_ptr,
                               LimitOrdersIterator *map_it_ptr,
@@ -621,6 +637,8 @@ cdef class PaperTradeExchange(ExchangeBase):
         cdef:
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
         try:
+            self._limit_orders_by_client_order_id.erase(deref(orders_it).getClientOrderID())
+            self.c_update_on_hold_balance(address(deref(orders_it)), True)
             orders_collection_ptr.erase(orders_it)
             if orders_collection_ptr.empty():
                 map_it_ptr[0] = limit_orders_map_ptr.erase(deref(map_it_ptr))
@@ -958,6 +976,7 @@ cdef class PaperTradeExchange(ExchangeBase):
         cdef:
             string cpp_trading_pair = trading_pair_str.encode("utf8")
             LimitOrdersIterator map_it = orders_map.find(cpp_trading_pair)
+            LimitOrdersIndexIterator index_it
             SingleTradingPairLimitOrders *limit_orders_collection_ptr = NULL
             SingleTradingPairLimitOrdersIterator orders_it
             vector[SingleTradingPairLimitOrdersIterator] process_order_its
@@ -968,14 +987,19 @@ cdef class PaperTradeExchange(ExchangeBase):
             if map_it == orders_map.end():
                 return []
 
-            limit_orders_collection_ptr = address(deref(map_it).second)
-            orders_it = limit_orders_collection_ptr.begin()
-            while orders_it != limit_orders_collection_ptr.end():
-                limit_order_ptr = address(deref(orders_it))
-                limit_order_cid = limit_order_ptr.getClientOrderID().decode("utf8")
-                if (not cancel_all and limit_order_cid == client_order_id) or cancel_all:
+            if cancel_all:
+                limit_orders_collection_ptr = address(deref(map_it).second)
+                orders_it = limit_orders_collection_ptr.begin()
+                while orders_it != limit_orders_collection_ptr.end():
                     process_order_its.push_back(orders_it)
-                inc(orders_it)
+                    inc(orders_it)
+            else:
+                index_it = self._limit_orders_by_client_order_id.find(client_order_id.encode("utf8"))
+                if index_it != self._limit_orders_by_client_order_id.end():
+                    limit_order_ptr = address(deref(deref(index_it).second))
+                    if (limit_order_ptr.getTradingPair() == cpp_trading_pair and
+                            limit_order_ptr.getIsBuy() == (orders_map == address(self._bid_limit_orders))):
+                        process_order_its.push_back(deref(index_it).second)
 
             for orders_it in process_order_its:
                 limit_order_ptr = address(deref(orders_it))
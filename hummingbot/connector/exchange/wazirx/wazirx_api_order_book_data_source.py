@@ -19,6 +19,7 @@ from .wazirx_utils import ms_timestamp_to_s
 
 
 class WazirxAPIOrderBookDataSource(OrderBookTrackerDataSource):
+    THROTTLED_SNAPSHOTS = True
     MESSAGE_TIMEOUT = 30.0
     PING_TIMEOUT = 10.0
 
@@ -2,8 +2,11 @@ import asyncio
 import copy
 import logging
 from abc import ABC, abstractmethod
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, Dict, List, Optional, Tuple, Union
 
 from async_timeout import timeout
 
@@ -14,6 +17,7 @@ from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import DEFAULT_PRIORITY, RequestPriority
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate
@@ -27,13 +31,31 @@ from hummingbot.core.data_type.user_stream_tracker_data_source import UserStream
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.web_assistant.auth import AuthBase
-from hummingbot.core.web_assistant.connections.data_types import RESTMethod
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequestTemplate
+from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.logger import HummingbotLogger
 
 if TYPE_CHECKING:
     from hummingbot.client.config.config_helpers import ClientConfigAdapter
 
+# Throttler lane of the API requests made by the current task, when they are not tagged explicitly
+_api_request_priority: ContextVar[int] = ContextVar("api_request_priority", default=DEFAULT_PRIORITY)
+
+
+@contextmanager
+def api_request_priority(priority: int):
+    """
+    Tags the API requests made within the context with a throttler RequestPriority lane, unless they are tagged
+    explicitly. Since the tag is bound to the current task, the connector specific implementations of the API calls
+    do not need to pass it along.
+    """
+    token = _api_request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _api_request_priority.reset(token)
+
 
 class ExchangePyBase(ExchangeBase, ABC):
     _logger = None
@@ -43,6 +65,10 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    # Maximum number of orders sent in a request by the connectors placing orders or cancels in batches
+    MAX_ORDERS_PER_BATCH = 20
+    # Number of connections to the exchange REST API opened when the network starts, ahead of the first requests
+    WARM_UP_CONNECTIONS = 2
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
@@ -57,11 +83,19 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._user_stream_event_listener_task = None
         self._trading_rules_polling_task = None
         self._trading_fees_polling_task = None
+        self._warm_up_connections_task = None
+        # Request templates of the endpoints called in the hot path, by path, method, authentication and limit id
+        self._request_templates: Dict[Tuple[str, RESTMethod, bool, Optional[str]], RESTRequestTemplate] = {}
 
         self._time_synchronizer = TimeSynchronizer()
         self._throttler = AsyncThrottler(self.rate_limits_rules)
         self._poll_notifier = asyncio.Event()
 
+        # Order creations and cancels issued during a tick, for the connectors placing them in batches
+        self._pending_order_creations: List[Dict[str, Any]] = []
+        self._pending_order_cancels: List[Tuple[str, str]] = []
+        self._pending_order_actions_task: Optional[asyncio.Task] = None
+
         # init Auth and Api factory
         self._auth: AuthBase = self.authenticator
         self._web_assistants_factory: WebAssistantsFactory = self._create_web_assistants_factory()
@@ -299,13 +333,13 @@ class ExchangePyBase(ExchangeBase, ABC):
             hbot_order_id_prefix=self.client_order_id_prefix,
             max_id_len=self.client_order_id_max_length
         )
-        safe_ensure_future(self._create_order(
+        self._schedule_order_creation(
             trade_type=TradeType.BUY,
             order_id=order_id,
             trading_pair=trading_pair,
             amount=amount,
             order_type=order_type,
-            price=price))
+            price=price)
         return order_id
 
     def sell(self,
@@ -328,13 +362,13 @@ class ExchangePyBase(ExchangeBase, ABC):
             hbot_order_id_prefix=self.client_order_id_prefix,
             max_id_len=self.client_order_id_max_length
         )
-        safe_ensure_future(self._create_order(
+        self._schedule_order_creation(
             trade_type=TradeType.SELL,
             order_id=order_id,
             trading_pair=trading_pair,
             amount=amount,
             order_type=order_type,
-            price=price))
+            price=price)
         return order_id
 
     def get_fee(self,
@@ -371,25 +405,30 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         :return: the client id of the order to cancel
         """
-        safe_ensure_future(self._execute_cancel(trading_pair, order_id))
+        if self._places_cancels_in_batches():
+            self._pending_order_cancels.append((trading_pair, order_id))
+            self._schedule_pending_order_actions()
+        else:
+            safe_ensure_future(self._execute_cancel(trading_pair, order_id))
         return order_id
 
     async def cancel_all(self, timeout_seconds: float) -> List[CancellationResult]:
         """
-        Cancels all currently active orders. The cancellations are performed in parallel tasks.
+        Cancels all currently active orders. The cancellations are performed in parallel tasks, or in batch requests
+        when the connector implements them.
 
         :param timeout_seconds: the maximum time (in seconds) the cancel logic should run
 
         :return: a list of CancellationResult instances, one for each of the orders to be cancelled
         """
         incomplete_orders = [o for o in self.in_flight_orders.values() if not o.is_done]
-        tasks = [self._execute_cancel(o.trading_pair, o.client_order_id) for o in incomplete_orders]
         order_id_set = set([o.client_order_id for o in incomplete_orders])
         successful_cancellations = []
 
         try:
             async with timeout(timeout_seconds):
-                cancellation_results = await safe_gather(*tasks, return_exceptions=True)
+                cancellation_results = await self._execute_cancels(
+                    [(o.trading_pair, o.client_order_id) for o in incomplete_orders])
                 for cr in cancellation_results:
                     if isinstance(cr, Exception):
                         continue
@@ -423,7 +462,39 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param order_type: the type of order to create (MARKET, LIMIT, LIMIT_MAKER)
         :param price: the order price
         """
-        exchange_order_id = ""
+        order = self._prepare_order(trade_type, order_id, trading_pair, amount, order_type, price)
+        if order is None:
+            return
+
+        try:
+            with api_request_priority(RequestPriority.CREATE):
+                placement_result = await self._place_order(
+                    order_id=order_id,
+                    trading_pair=trading_pair,
+                    amount=order.amount,
+                    trade_type=trade_type,
+                    order_type=order_type,
+                    price=order.price)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exception:
+            placement_result = exception
+        self._process_order_placement_result(order, placement_result)
+        exchange_order_id = "" if isinstance(placement_result, Exception) else placement_result[0]
+        return order_id, exchange_order_id
+
+    def _prepare_order(self,
+                       trade_type: TradeType,
+                       order_id: str,
+                       trading_pair: str,
+                       amount: Decimal,
+                       order_type: OrderType,
+                       price: Optional[Decimal] = None) -> Optional[InFlightOrder]:
+        """
+        Quantizes the order amount and price, starts tracking the order and checks it against the trading rules
+
+        :return: the tracked order, or None if it can not be placed (the order is then failed)
+        """
         trading_rule = self._trading_rules[trading_pair]
 
         if order_type in [OrderType.LIMIT, OrderType.LIMIT_MAKER]:
@@ -446,48 +517,51 @@ class ExchangePyBase(ExchangeBase, ABC):
         if order_type not in self.supported_order_types():
             self.logger().error(f"{order_type} is not in the list of supported order types")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            return None
 
         if amount < trading_rule.min_order_size:
             self.logger().warning(f"{trade_type.name.title()} order amount {amount} is lower than the minimum order"
                                   f" size {trading_rule.min_order_size}. The order will not be created.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            return None
         if price is not None and amount * price < trading_rule.min_notional_size:
             self.logger().warning(f"{trade_type.name.title()} order notional {amount * price} is lower than the "
                                   f"minimum notional size {trading_rule.min_notional_size}. "
                                   "The order will not be created.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
+            return None
 
-        try:
-            exchange_order_id, update_timestamp = await self._place_order(
-                order_id=order_id,
-                trading_pair=trading_pair,
-                amount=amount,
-                trade_type=trade_type,
-                order_type=order_type,
-                price=price)
+        return self._order_tracker.fetch_tracked_order(order_id)
 
-            order_update: OrderUpdate = OrderUpdate(
-                client_order_id=order_id,
-                exchange_order_id=exchange_order_id,
-                trading_pair=trading_pair,
-                update_timestamp=update_timestamp,
-                new_state=OrderState.OPEN,
-            )
-            self._order_tracker.process_order_update(order_update)
+    def _process_order_placement_result(self,
+                                        order: InFlightOrder,
+                                        placement_result: Union[Tuple[str, float], Exception]):
+        """
+        Opens the order once placed, or fails it
 
-        except asyncio.CancelledError:
-            raise
-        except Exception:
+        :param order: the order placed
+        :param placement_result: the exchange order id and the update timestamp of the order, or the exception raised
+        placing it
+        """
+        if isinstance(placement_result, Exception):
             self.logger().network(
-                f"Error submitting {trade_type.name.lower()} {order_type.name.upper()} order to {self.name_cap} for "
-                f"{amount} {trading_pair} {price}.",
-                exc_info=True,
+                f"Error submitting {order.trade_type.name.lower()} {order.order_type.name.upper()} order to "
+                f"{self.name_cap} for {order.amount} {order.trading_pair} {order.price}.",
+                exc_info=placement_result,
                 app_warning_msg=f"Failed to submit buy order to {self.name_cap}. Check API key and network connection."
             )
-            self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-        return order_id, exchange_order_id
+            self._update_order_after_failure(order_id=order.client_order_id, trading_pair=order.trading_pair)
+            return
+
+        exchange_order_id, update_timestamp = placement_result
+        order_update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id=exchange_order_id,
+            trading_pair=order.trading_pair,
+            update_timestamp=update_timestamp,
+            new_state=OrderState.OPEN,
+        )
+        self._order_tracker.process_order_update(order_update)
 
     def _update_order_after_failure(self, order_id: str, trading_pair: str):
         order_update: OrderUpdate = OrderUpdate(
@@ -506,32 +580,162 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param order_id: the client id of the order to cancel
         """
         tracked_order = self._order_tracker.fetch_tracked_order(order_id)
-        if tracked_order is not None:
+        if tracked_order is None:
+            return None
+        try:
+            with api_request_priority(RequestPriority.CANCEL):
+                cancel_result = await self._place_cancel(order_id, tracked_order)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exception:
+            cancel_result = exception
+        return await self._process_cancel_result(tracked_order, cancel_result)
+
+    async def _process_cancel_result(self,
+                                     tracked_order: InFlightOrder,
+                                     cancel_result: Union[bool, Exception]) -> Optional[str]:
+        """
+        Updates the order once its cancel request is answered
+
+        :param tracked_order: the order to cancel
+        :param cancel_result: True if the exchange accepted the cancel, or the exception raised requesting it
+
+        :return: the client id of the order if it was canceled, None otherwise
+        """
+        order_id = tracked_order.client_order_id
+        if isinstance(cancel_result, asyncio.TimeoutError):
+            # Binance does not allow cancels with the client/user order id
+            # so log a warning and wait for the creation of the order to complete
+            self.logger().warning(
+                f"Failed to cancel the order {order_id} because it does not have an exchange order id yet")
+            await self._order_tracker.process_order_not_found(order_id)
+        elif isinstance(cancel_result, Exception):
+            self.logger().error(f"Failed to cancel order {order_id}", exc_info=cancel_result)
+        elif cancel_result:
+            order_update: OrderUpdate = OrderUpdate(
+                client_order_id=order_id,
+                trading_pair=tracked_order.trading_pair,
+                update_timestamp=self.current_timestamp,
+                new_state=(OrderState.CANCELED
+                           if self.is_cancel_request_in_exchange_synchronous
+                           else OrderState.PENDING_CANCEL),
+            )
+            self._order_tracker.process_order_update(order_update)
+            return order_id
+        return None
+
+    # === Orders batches ===
+
+    def _places_orders_in_batches(self) -> bool:
+        return type(self)._place_orders_batch is not ExchangePyBase._place_orders_batch
+
+    def _places_cancels_in_batches(self) -> bool:
+        return type(self)._place_cancels_batch is not ExchangePyBase._place_cancels_batch
+
+    def _schedule_order_creation(self, **order_parameters):
+        """
+        Creates the order in a background task or, if the connector places orders in batches, queues it with the other
+        orders issued until the event loop runs the background tasks again (that is, within the current tick).
+        """
+        if self._places_orders_in_batches():
+            self._pending_order_creations.append(order_parameters)
+            self._schedule_pending_order_actions()
+        else:
+            safe_ensure_future(self._create_order(**order_parameters))
+
+    def _schedule_pending_order_actions(self):
+        if self._pending_order_actions_task is None:
+            self._pending_order_actions_task = safe_ensure_future(self._execute_pending_order_actions())
+
+    async def _execute_pending_order_actions(self):
+        order_creations, self._pending_order_creations = self._pending_order_creations, []
+        order_cancels, self._pending_order_cancels = self._pending_order_cancels, []
+        self._pending_order_actions_task = None
+        await safe_gather(self._create_orders(order_creations), self._execute_cancels(order_cancels))
+
+    def _group_in_batches(self, orders: List[InFlightOrder]) -> List[List[InFlightOrder]]:
+        """
+        Groups the orders per trading pair, in batches of MAX_ORDERS_PER_BATCH orders at most
+        """
+        orders_by_trading_pair = defaultdict(list)
+        for order in orders:
+            orders_by_trading_pair[order.trading_pair].append(order)
+        return [trading_pair_orders[index:index + self.MAX_ORDERS_PER_BATCH]
+                for trading_pair_orders in orders_by_trading_pair.values()
+                for index in range(0, len(trading_pair_orders), self.MAX_ORDERS_PER_BATCH)]
+
+    async def _create_orders(self, orders_parameters: List[Dict[str, Any]]):
+        """
+        Creates the orders in batch requests of the orders of a trading pair. The orders alone in their batch are
+        placed on their own.
+
+        :param orders_parameters: the parameters of _create_order of every order
+        """
+        orders = []
+        for order_parameters in orders_parameters:
             try:
-                cancelled = await self._place_cancel(order_id, tracked_order)
-                if cancelled:
-                    order_update: OrderUpdate = OrderUpdate(
-                        client_order_id=order_id,
-                        trading_pair=tracked_order.trading_pair,
-                        update_timestamp=self.current_timestamp,
-                        new_state=(OrderState.CANCELED
-                                   if self.is_cancel_request_in_exchange_synchronous
-                                   else OrderState.PENDING_CANCEL),
-                    )
-                    self._order_tracker.process_order_update(order_update)
-                    return order_id
-            except asyncio.CancelledError:
-                raise
-            except asyncio.TimeoutError:
-                # Binance does not allow cancels with the client/user order id
-                # so log a warning and wait for the creation of the order to complete
-                self.logger().warning(
-                    f"Failed to cancel the order {order_id} because it does not have an exchange order id yet")
-                await self._order_tracker.process_order_not_found(order_id)
+                order = self._prepare_order(**order_parameters)
             except Exception:
-                self.logger().error(
-                    f"Failed to cancel order {order_id}", exc_info=True)
-        return None
+                self.logger().error(f"Error creating order {order_parameters['order_id']}.", exc_info=True)
+                continue
+            if order is not None:
+                orders.append(order)
+        await safe_gather(*[self._create_orders_batch(batch) for batch in self._group_in_batches(orders)])
+
+    async def _create_orders_batch(self, orders: List[InFlightOrder]):
+        try:
+            with api_request_priority(RequestPriority.CREATE):
+                if len(orders) == 1:
+                    placement_results = [await self._place_order(
+                        order_id=orders[0].client_order_id,
+                        trading_pair=orders[0].trading_pair,
+                        amount=orders[0].amount,
+                        trade_type=orders[0].trade_type,
+                        order_type=orders[0].order_type,
+                        price=orders[0].price)]
+                else:
+                    placement_results = await self._place_orders_batch(orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exception:
+            placement_results = [exception] * len(orders)
+        for order, placement_result in zip(orders, placement_results):
+            self._process_order_placement_result(order, placement_result)
+
+    async def _execute_cancels(self, orders: List[Tuple[str, str]]) -> List[Optional[str]]:
+        """
+        Requests the exchange to cancel the orders, in batch requests of the orders of a trading pair if the connector
+        implements them
+
+        :param orders: the trading pair and the client id of every order to cancel
+
+        :return: for every order, its client id if it was canceled, None or the exception raised otherwise
+        """
+        if not self._places_cancels_in_batches():
+            return await safe_gather(*[self._execute_cancel(trading_pair, order_id) for trading_pair, order_id in orders],
+                                     return_exceptions=True)
+        tracked_orders = {}
+        for _, order_id in orders:
+            tracked_order = self._order_tracker.fetch_tracked_order(order_id)
+            if tracked_order is not None:
+                tracked_orders[order_id] = tracked_order
+        batches = self._group_in_batches(list(tracked_orders.values()))
+        batches_results = await safe_gather(*[self._execute_cancels_batch(batch) for batch in batches])
+        canceled_order_ids = {order_id for batch_results in batches_results for order_id in batch_results}
+        return [order_id if order_id in canceled_order_ids else None for _, order_id in orders]
+
+    async def _execute_cancels_batch(self, orders: List[InFlightOrder]) -> List[Optional[str]]:
+        if len(orders) == 1:
+            return [await self._execute_cancel(orders[0].trading_pair, orders[0].client_order_id)]
+        try:
+            with api_request_priority(RequestPriority.CANCEL):
+                cancel_results = await self._place_cancels_batch(orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exception:
+            cancel_results = [exception] * len(orders)
+        return [await self._process_cancel_result(order, cancel_result)
+                for order, cancel_result in zip(orders, cancel_results)]
 
     # === Order Tracking ===
 
@@ -608,6 +812,29 @@ class ExchangePyBase(ExchangeBase, ABC):
                            ) -> Tuple[str, float]:
         raise NotImplementedError
 
+    async def _place_orders_batch(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        """
+        Places several orders of a trading pair in one request. Optional: when a connector implements it, the orders
+        created within a tick are placed in batches rather than one by one with _place_order.
+
+        :param orders: the tracked orders to place, MAX_ORDERS_PER_BATCH at most
+
+        :return: for every order, its exchange order id and update timestamp, or the exception explaining why it
+        was not placed
+        """
+        raise NotImplementedError
+
+    async def _place_cancels_batch(self, tracked_orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        """
+        Cancels several orders of a trading pair in one request. Optional: when a connector implements it, the orders
+        canceled within a tick, and by cancel_all, are canceled in batches rather than one by one with _place_cancel.
+
+        :param tracked_orders: the orders to cancel, MAX_ORDERS_PER_BATCH at most
+
+        :return: for every order, True if the cancel was accepted, or the exception explaining why it was not
+        """
+        raise NotImplementedError
+
     def _get_fee(self,
                  base_currency: str,
                  quote_currency: str,
@@ -631,8 +858,10 @@ class ExchangePyBase(ExchangeBase, ABC):
         - The polling loops to update the trading rules and trading fees
         - The polling loop to update order status and balance status using REST API (backup for main update process)
         - The background task to process the events received through the user stream tracker (websocket connection)
+        - The warm up of the connections to the exchange REST API
         """
         self._stop_network()
+        self._warm_up_connections_task = safe_ensure_future(self._warm_up_connections())
         self.order_book_tracker.start()
         self._trading_rules_polling_task = safe_ensure_future(self._trading_rules_polling_loop())
         self._trading_fees_polling_task = safe_ensure_future(self._trading_fees_polling_loop())
@@ -653,7 +882,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         Checks connectivity with the exchange using the API
         """
         try:
-            await self._api_get(path_url=self.check_network_request_path)
+            await self._api_get(path_url=self.check_network_request_path, priority=RequestPriority.METADATA)
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -682,6 +911,23 @@ class ExchangePyBase(ExchangeBase, ABC):
         if self._user_stream_event_listener_task is not None:
             self._user_stream_event_listener_task.cancel()
             self._user_stream_event_listener_task = None
+        if self._warm_up_connections_task is not None:
+            self._warm_up_connections_task.cancel()
+            self._warm_up_connections_task = None
+
+    async def _warm_up_connections(self):
+        """
+        Opens WARM_UP_CONNECTIONS keep-alive connections to the exchange REST API with concurrent requests to the
+        network check endpoint, so that the TCP and TLS handshakes are done before the first requests that matter
+        """
+        try:
+            await safe_gather(*[
+                self._api_get(path_url=self.check_network_request_path, priority=RequestPriority.METADATA)
+                for _ in range(self.WARM_UP_CONNECTIONS)])
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().debug("Error warming up the connections to the exchange API.", exc_info=True)
 
     # === loops and sync related methods ===
     #
@@ -692,7 +938,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
-                await safe_gather(self._update_trading_rules())
+                with api_request_priority(RequestPriority.METADATA):
+                    await safe_gather(self._update_trading_rules())
                 await self._sleep(self.TRADING_RULES_INTERVAL)
             except asyncio.CancelledError:
                 raise
@@ -710,7 +957,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
-                await safe_gather(self._update_trading_fees())
+                with api_request_priority(RequestPriority.METADATA):
+                    await safe_gather(self._update_trading_fees())
                 await self._sleep(self.TRADING_FEES_INTERVAL)
             except NotImplementedError:
                 return
@@ -814,7 +1062,8 @@ class ExchangePyBase(ExchangeBase, ABC):
                            data: Optional[Dict[str, Any]] = None,
                            is_auth_required: bool = False,
                            return_err: bool = False,
-                           limit_id: Optional[str] = None) -> Dict[str, Any]:
+                           limit_id: Optional[str] = None,
+                           priority: Optional[RequestPriority] = None) -> Dict[str, Any]:
 
         rest_assistant = await self._web_assistants_factory.get_rest_assistant()
         if is_auth_required:
@@ -830,6 +1079,46 @@ class ExchangePyBase(ExchangeBase, ABC):
             is_auth_required=is_auth_required,
             return_err=return_err,
             throttler_limit_id=limit_id if limit_id else path_url,
+            throttler_priority=priority if priority is not None else _api_request_priority.get(),
+        )
+
+    def _request_template(self,
+                          path_url: str,
+                          method: RESTMethod = RESTMethod.GET,
+                          is_auth_required: bool = False,
+                          limit_id: Optional[str] = None) -> RESTRequestTemplate:
+        """
+        Returns the template of the requests to an endpoint, built the first time it is requested. Intended for the
+        endpoints called in the hot path (order creation and cancellation), through `_api_template_request`.
+        """
+        key = (path_url, method, is_auth_required, limit_id)
+        template = self._request_templates.get(key)
+        if template is None:
+            if is_auth_required:
+                url = self.web_utils.private_rest_url(path_url, domain=self.domain)
+            else:
+                url = self.web_utils.public_rest_url(path_url, domain=self.domain)
+            template = self._request_templates[key] = RESTAssistant.request_template(
+                url=url,
+                throttler_limit_id=limit_id if limit_id else path_url,
+                method=method,
+                is_auth_required=is_auth_required,
+            )
+        return template
+
+    async def _api_template_request(self,
+                                    template: RESTRequestTemplate,
+                                    params: Optional[Dict[str, Any]] = None,
+                                    data: Optional[Dict[str, Any]] = None,
+                                    return_err: bool = False,
+                                    priority: Optional[RequestPriority] = None) -> Dict[str, Any]:
+        rest_assistant = await self._web_assistants_factory.get_rest_assistant()
+        return await rest_assistant.execute_template_request(
+            template=template,
+            params=params,
+            data=data,
+            return_err=return_err,
+            throttler_priority=priority if priority is not None else _api_request_priority.get(),
         )
 
     async def _status_polling_loop_fetch_updates(self):
@@ -888,7 +1177,8 @@ class ExchangePyBase(ExchangeBase, ABC):
 
     async def _initialize_trading_pair_symbol_map(self):
         try:
-            exchange_info = await self._api_get(path_url=self.trading_pairs_request_path)
+            exchange_info = await self._api_get(path_url=self.trading_pairs_request_path,
+                                                priority=RequestPriority.METADATA)
             self._initialize_trading_pair_symbols_from_exchange_info(exchange_info=exchange_info)
         except Exception:
             self.logger().exception("There was an error requesting exchange info.")
@@ -455,7 +455,7 @@ class GatewayEVMAMM(ConnectorBase):
     ) -> Decimal:
 
         """
-        This is simply the quote price
+        This is simply the quote price, which shares its cache entries and in flight requests with get_quote_price
         """
         return await self.get_quote_price(trading_pair, is_buy, amount, ignore_shim=ignore_shim)
 
@@ -1,10 +1,15 @@
 import asyncio
+import csv
+import logging
 import os.path
+import queue
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from decimal import Decimal
 from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, TextIO, Tuple, Union
 
 import pandas as pd
 from sqlalchemy.orm import Query, Session
@@ -30,6 +35,7 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.logger import HummingbotLogger
 from hummingbot.model.funding_payment import FundingPayment
 from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
@@ -40,17 +46,79 @@ from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
 
 
+@dataclass
+class MarketsRecorderStats:
+    """
+    Activity of the writer thread of a MarketsRecorder.
+    :param queue_depth: Number of writes waiting for the writer thread
+    :param max_queue_depth: Largest number of writes that waited for the writer thread
+    :param writes: Number of events written to the database
+    :param batches: Number of transactions committed by the writer thread
+    :param market_states_saved: Number of market states written to the database
+    :param market_states_coalesced: Number of market state saves skipped in favour of a more recent state
+    :param overflowed_writes: Number of writes handed to the overflow thread because the queue was full
+    :param failed_writes: Number of events that could not be written
+    """
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    writes: int = 0
+    batches: int = 0
+    market_states_saved: int = 0
+    market_states_coalesced: int = 0
+    overflowed_writes: int = 0
+    failed_writes: int = 0
+
+
+class RecorderWrite(NamedTuple):
+    """
+    Database changes of a market event, applied by `write` in the writer thread session. The trade fill, if any, is
+    appended to the trades CSV file once the changes are committed.
+    """
+    write: Callable[[Session], None]
+    csv_trade: Optional[TradeFill] = None
+
+
+class MarketStatesSave(NamedTuple):
+    market_name: str
+    saved_state: Dict[str, Any]
+
+
 class MarketsRecorder:
+    """
+    Records the orders, trade fills and market states of the markets in the database.
+
+    Once started, the event handlers only queue the database changes, and a dedicated thread writes them in batched
+    transactions, so the event loop never waits for the database. When the queue is full, the writes are handed, in
+    order, to an overflow thread that waits for room in the queue instead of the event loop. The market states are
+    saved at most once per event loop iteration and per batch, whatever the number of events of the market. Stopping
+    the recorder waits for all the queued changes to be written.
+
+    The trade fills recorded are also passed to the `trade_fill_listener`, if any, as they are recorded, in the event
+    loop thread.
+    """
+    # Writes queued for the writer thread before the next ones are handed to the overflow thread
+    MAX_QUEUE_SIZE: int = 10000
+    # Most writes committed in a single transaction
+    MAX_BATCH_SIZE: int = 500
+
     market_event_tag_map: Dict[int, MarketEvent] = {
         event_obj.value: event_obj
         for event_obj in MarketEvent.__members__.values()
     }
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
 
     def __init__(self,
                  sql: SQLConnectionManager,
                  markets: List[ConnectorBase],
                  config_file_path: str,
-                 strategy_name: str):
+                 strategy_name: str,
+                 trade_fill_listener: Optional[Callable[[TradeFill], None]] = None):
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -59,6 +127,17 @@ class MarketsRecorder:
         self._markets: List[ConnectorBase] = markets
         self._config_file_path: str = config_file_path
         self._strategy_name: str = strategy_name
+        self._trade_fill_listener: Optional[Callable[[TradeFill], None]] = trade_fill_listener
+        self._write_queue: queue.Queue = queue.Queue(maxsize=self.MAX_QUEUE_SIZE)
+        self._writer_thread: Optional[threading.Thread] = None
+        # Puts the writes in the queue when it is full, in the order they were made, in a single thread
+        self._overflow_executor: Optional[ThreadPoolExecutor] = None
+        self._last_overflow_put: Optional[Future] = None
+        self._markets_with_unsaved_states: Dict[str, ConnectorBase] = {}
+        self._market_states_save_scheduled: bool = False
+        self._csv_files: Dict[str, TextIO] = {}
+        self._stats: MarketsRecorderStats = MarketsRecorderStats()
+        self._market_states_coalesced_before_queue: int = 0
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -114,7 +193,22 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def stats(self) -> MarketsRecorderStats:
+        return MarketsRecorderStats(
+            queue_depth=self._write_queue.qsize(),
+            max_queue_depth=self._stats.max_queue_depth,
+            writes=self._stats.writes,
+            batches=self._stats.batches,
+            market_states_saved=self._stats.market_states_saved,
+            market_states_coalesced=self._stats.market_states_coalesced + self._market_states_coalesced_before_queue,
+            overflowed_writes=self._stats.overflowed_writes,
+            failed_writes=self._stats.failed_writes)
+
     def start(self):
+        if self._writer_thread is None:
+            self._writer_thread = threading.Thread(target=self._write_batches, name="MarketsRecorder", daemon=True)
+            self._writer_thread.start()
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
@@ -123,6 +217,16 @@ class MarketsRecorder:
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
+        if self._writer_thread is not None:
+            self._queue_market_states()
+            if self._overflow_executor is not None:
+                self._overflow_executor.shutdown(wait=True)
+                self._overflow_executor = None
+                self._last_overflow_put = None
+            self._write_queue.put(None)
+            self._writer_thread.join()
+            self._writer_thread = None
+            self._close_csv_files()
 
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
@@ -153,17 +257,25 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
+        self._save_market_state(config_file_path, market.display_name, market.tracking_states, session=session)
+
+    def _save_market_state(self, config_file_path: str, market_name: str, saved_state: Dict[str, Any],
+                           session: Session):
+        market_states: Optional[MarketState] = (session
+                                                .query(MarketState)
+                                                .filter(MarketState.config_file_path == config_file_path,
+                                                        MarketState.market == market_name)
+                                                .one_or_none())
         timestamp: int = self.db_timestamp
 
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = saved_state
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
+                                        market=market_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=saved_state)
             session.add(market_states)
 
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
@@ -184,6 +296,131 @@ class MarketsRecorder:
         market_states: Optional[MarketState] = query.one_or_none()
         return market_states
 
+    def _record(self, write: Callable[[Session], None], market: Optional[ConnectorBase] = None,
+                csv_trade: Optional[TradeFill] = None):
+        """
+        Applies the database changes of a market event, along with the market states if `market` is given. Once the
+        recorder is started the changes are queued for the writer thread, otherwise they are written right away.
+        """
+        if self._writer_thread is None:
+            with self._sql_manager.get_new_session() as session:
+                with session.begin():
+                    write(session)
+                    if market is not None:
+                        self.save_market_states(self._config_file_path, market, session=session)
+                    csv_row: Optional[Tuple[str, tuple, tuple]] = (self._csv_row(csv_trade)
+                                                                   if csv_trade is not None else None)
+            if csv_row is not None:
+                self._append_csv_row(*csv_row, keep_open=False)
+            return
+
+        self._queue_write(RecorderWrite(write, csv_trade))
+        if market is not None:
+            self._save_market_states_later(market)
+
+    def _queue_write(self, item: Optional[Union[RecorderWrite, MarketStatesSave]]):
+        """
+        Queues a write for the writer thread without ever blocking. Once the queue is full, the write and the ones
+        after it are put in the queue by the overflow thread, until it has caught up.
+        """
+        if self._last_overflow_put is None or self._last_overflow_put.done():
+            try:
+                self._write_queue.put_nowait(item)
+                self._stats.max_queue_depth = max(self._stats.max_queue_depth, self._write_queue.qsize())
+                return
+            except queue.Full:
+                self.logger().warning(f"The database writes queue is full ({self._write_queue.maxsize} writes). The "
+                                      f"next writes are queued as the database catches up.")
+        if self._overflow_executor is None:
+            self._overflow_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="MarketsRecorderOverflow")
+        self._stats.overflowed_writes += 1
+        self._last_overflow_put = self._overflow_executor.submit(self._write_queue.put, item)
+
+    def _save_market_states_later(self, market: ConnectorBase):
+        if market.display_name in self._markets_with_unsaved_states:
+            self._market_states_coalesced_before_queue += 1
+        self._markets_with_unsaved_states[market.display_name] = market
+        if not self._market_states_save_scheduled:
+            self._market_states_save_scheduled = True
+            self._ev_loop.call_soon(self._queue_market_states)
+
+    def _queue_market_states(self):
+        """
+        Queues the market states of the markets that had events in this event loop iteration. The states are read
+        here, in the event loop thread, since the markets keep updating them.
+        """
+        self._market_states_save_scheduled = False
+        markets: List[ConnectorBase] = list(self._markets_with_unsaved_states.values())
+        self._markets_with_unsaved_states.clear()
+        for market in markets:
+            self._queue_write(MarketStatesSave(market.display_name, market.tracking_states))
+
+    def _write_batches(self):
+        while True:
+            items: List[Optional[Union[RecorderWrite, MarketStatesSave]]] = [self._write_queue.get()]
+            while len(items) < self.MAX_BATCH_SIZE:
+                try:
+                    items.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            stopping: bool = None in items
+            self._write_batch([item for item in items if item is not None])
+            if stopping:
+                return
+
+    def _write_batch(self, items: List[Union[RecorderWrite, MarketStatesSave]]):
+        writes: List[RecorderWrite] = [item for item in items if isinstance(item, RecorderWrite)]
+        market_states: Dict[str, Dict[str, Any]] = {}
+        for item in items:
+            if isinstance(item, MarketStatesSave):
+                if item.market_name in market_states:
+                    self._stats.market_states_coalesced += 1
+                market_states[item.market_name] = item.saved_state
+        if len(items) == 0:
+            return
+
+        try:
+            csv_rows: List[Tuple[str, tuple, tuple]] = self._commit(writes, market_states)
+        except Exception:
+            self.logger().error("Error writing a batch of market events. Writing them one by one.", exc_info=True)
+            csv_rows = []
+            for write in writes:
+                try:
+                    csv_rows.extend(self._commit([write], {}))
+                except Exception:
+                    self._stats.failed_writes += 1
+                    self.logger().error("Error writing a market event to the database.", exc_info=True)
+            try:
+                self._commit([], market_states)
+            except Exception:
+                self.logger().error("Error saving the market states.", exc_info=True)
+
+        for csv_row in csv_rows:
+            try:
+                self._append_csv_row(*csv_row, keep_open=True)
+            except Exception:
+                self.logger().error(f"Error appending a trade to {csv_row[0]}.", exc_info=True)
+
+    def _commit(self,
+                writes: List[RecorderWrite],
+                market_states: Dict[str, Dict[str, Any]]) -> List[Tuple[str, tuple, tuple]]:
+        """
+        Writes the changes in a single transaction.
+        :return: the CSV rows of the trade fills written
+        """
+        with self._sql_manager.get_new_session() as session:
+            with session.begin():
+                for write in writes:
+                    write.write(session)
+                for market_name, saved_state in market_states.items():
+                    self._save_market_state(self._config_file_path, market_name, saved_state, session=session)
+                csv_rows: List[Tuple[str, tuple, tuple]] = [self._csv_row(write.csv_trade) for write in writes
+                                                            if write.csv_trade is not None]
+        self._stats.writes += len(writes)
+        self._stats.batches += 1
+        self._stats.market_states_saved += len(market_states)
+        return csv_rows
+
     def _did_create_order(self,
                           event_tag: int,
                           market: ConnectorBase,
@@ -196,31 +433,32 @@ class MarketsRecorder:
         timestamp = int(evt.creation_timestamp * 1e3)
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Order = Order(id=evt.order_id,
-                                            config_file_path=self._config_file_path,
-                                            strategy=self._strategy_name,
-                                            market=market.display_name,
-                                            symbol=evt.trading_pair,
-                                            base_asset=base_asset,
-                                            quote_asset=quote_asset,
-                                            creation_timestamp=timestamp,
-                                            order_type=evt.type.name,
-                                            amount=Decimal(evt.amount),
-                                            leverage=evt.leverage if evt.leverage else 1,
-                                            price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
-                                            position=evt.position if evt.position else PositionAction.NIL.value,
-                                            last_status=event_type.name,
-                                            last_update_timestamp=timestamp,
-                                            exchange_order_id=evt.exchange_order_id)
-                order_status: OrderStatus = OrderStatus(order=order_record,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                session.add(order_record)
-                session.add(order_status)
-                market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+        order_record: Order = Order(id=evt.order_id,
+                                    config_file_path=self._config_file_path,
+                                    strategy=self._strategy_name,
+                                    market=market.display_name,
+                                    symbol=evt.trading_pair,
+                                    base_asset=base_asset,
+                                    quote_asset=quote_asset,
+                                    creation_timestamp=timestamp,
+                                    order_type=evt.type.name,
+                                    amount=Decimal(evt.amount),
+                                    leverage=evt.leverage if evt.leverage else 1,
+                                    price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
+                                    position=evt.position if evt.position else PositionAction.NIL.value,
+                                    last_status=event_type.name,
+                                    last_update_timestamp=timestamp,
+                                    exchange_order_id=evt.exchange_order_id)
+        order_status: OrderStatus = OrderStatus(order=order_record,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+        market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
+
+        def write(session: Session):
+            session.add(order_record)
+            session.add(order_status)
+
+        self._record(write, market)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -235,47 +473,47 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the order record, and update it if necessary.
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-
-                # Order status and trade fill record should be added even if the order record is not found, because it's
-                # possible for fill event to come in before the order created event for market orders.
-                order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-
-                trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    timestamp=timestamp,
-                    order_id=order_id,
-                    trade_type=evt.trade_type.name,
-                    order_type=evt.order_type.name,
-                    price=Decimal(
-                        evt.price) if evt.price == evt.price else Decimal(0),
-                    amount=Decimal(evt.amount),
-                    leverage=evt.leverage if evt.leverage else 1,
-                    trade_fee=evt.trade_fee.to_json(),
-                    exchange_trade_id=evt.exchange_trade_id,
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                )
-                session.add(order_status)
-                session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
-
-                market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
-                                                                                   trade_fill_record.exchange_trade_id,
-                                                                                   trade_fill_record.symbol)})
-                self.append_to_csv(trade_fill_record)
+        # Order status and trade fill record should be added even if the order record is not found, because it's
+        # possible for fill event to come in before the order created event for market orders.
+        order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+
+        trade_fill_record: TradeFill = TradeFill(
+            config_file_path=self.config_file_path,
+            strategy=self.strategy_name,
+            market=market.display_name,
+            symbol=evt.trading_pair,
+            base_asset=base_asset,
+            quote_asset=quote_asset,
+            timestamp=timestamp,
+            order_id=order_id,
+            trade_type=evt.trade_type.name,
+            order_type=evt.order_type.name,
+            price=Decimal(
+                evt.price) if evt.price == evt.price else Decimal(0),
+            amount=Decimal(evt.amount),
+            leverage=evt.leverage if evt.leverage else 1,
+            trade_fee=evt.trade_fee.to_json(),
+            exchange_trade_id=evt.exchange_trade_id,
+            position=evt.position if evt.position else PositionAction.NIL.value,
+        )
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
+                                                                           trade_fill_record.exchange_trade_id,
+                                                                           trade_fill_record.symbol)})
+        if self._trade_fill_listener is not None:
+            self._trade_fill_listener(trade_fill_record)
+
+        def write(session: Session):
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+            session.add(order_status)
+            session.add(trade_fill_record)
+
+        self._record(write, market, csv_trade=trade_fill_record)
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -286,27 +524,30 @@ class MarketsRecorder:
             return
 
         timestamp: float = evt.timestamp
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the funding payment has been recorded already.
-                payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-                    FundingPayment.timestamp == timestamp).one_or_none()
-                if payment_record is None:
-                    funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                            config_file_path=self.config_file_path,
-                                                                            market=market.display_name,
-                                                                            rate=evt.funding_rate,
-                                                                            symbol=evt.trading_pair,
-                                                                            amount=float(evt.amount))
-                    session.add(funding_payment_record)
+        market_name: str = market.display_name
+
+        def write(session: Session):
+            # Try to find the funding payment has been recorded already.
+            payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+                FundingPayment.timestamp == timestamp).one_or_none()
+            if payment_record is None:
+                funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                        config_file_path=self.config_file_path,
+                                                                        market=market_name,
+                                                                        rate=evt.funding_rate,
+                                                                        symbol=evt.trading_pair,
+                                                                        amount=float(evt.amount))
+                session.add(funding_payment_record)
+
+        self._record(write)
 
     @staticmethod
     def _csv_matches_header(file_path: str, header: tuple) -> bool:
         df = pd.read_csv(file_path, header=None)
         return tuple(df.iloc[0].values) == header
 
-    def append_to_csv(self, trade: TradeFill):
+    @staticmethod
+    def _csv_row(trade: TradeFill) -> Tuple[str, tuple, tuple]:
         csv_filename = "trades_" + trade.config_file_path[:-4] + ".csv"
         csv_path = os.path.join(data_path(), csv_filename)
 
@@ -319,15 +560,36 @@ class MarketsRecorder:
             '%H:%M:%S') if (trade.order is not None and "//" not in trade.order_id) else "n/a"
         field_names += ("age",)
         field_data += (age,)
+        return csv_path, field_names, field_data
 
-        if (os.path.exists(csv_path) and (not self._csv_matches_header(csv_path, field_names))):
-            move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
-
-        if not os.path.exists(csv_path):
-            df_header = pd.DataFrame([field_names])
-            df_header.to_csv(csv_path, mode='a', header=False, index=False)
-        df = pd.DataFrame([field_data])
-        df.to_csv(csv_path, mode='a', header=False, index=False)
+    def append_to_csv(self, trade: TradeFill):
+        self._append_csv_row(*self._csv_row(trade), keep_open=False)
+
+    def _append_csv_row(self, csv_path: str, field_names: tuple, field_data: tuple, keep_open: bool):
+        """
+        Appends a trade to its CSV file. The writer thread keeps the files open until the recorder is stopped, so the
+        header of a file is only checked the first time it is written to.
+        """
+        csv_file: Optional[TextIO] = self._csv_files.get(csv_path)
+        if csv_file is None:
+            if (os.path.exists(csv_path) and (not self._csv_matches_header(csv_path, field_names))):
+                move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
+            is_new_file: bool = not os.path.exists(csv_path)
+            csv_file = open(csv_path, mode="a", newline="")
+            if is_new_file:
+                csv.writer(csv_file, lineterminator=os.linesep).writerow(field_names)
+            if keep_open:
+                self._csv_files[csv_path] = csv_file
+        csv.writer(csv_file, lineterminator=os.linesep).writerow(field_data)
+        if not keep_open:
+            csv_file.close()
+
+    def _close_csv_files(self):
+        for csv_file in self._csv_files.values():
+            csv_file.flush()
+            os.fsync(csv_file.fileno())
+            csv_file.close()
+        self._csv_files.clear()
 
     def _update_order_status(self,
                              event_tag: int,
@@ -345,18 +607,18 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+        def write(session: Session):
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+                order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
 
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-                    order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                            timestamp=timestamp,
-                                                            status=event_type.name)
-                    session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+        self._record(write, market)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -391,16 +653,12 @@ class MarketsRecorder:
             return
 
         timestamp: int = self.db_timestamp
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
-                                                                     timestamp=timestamp,
-                                                                     tx_hash=evt.exchange_order_id,
-                                                                     token_id=evt.token_id,
-                                                                     trade_fee=evt.trade_fee.to_json())
-                session.add(rp_update)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
+                                                             timestamp=timestamp,
+                                                             tx_hash=evt.exchange_order_id,
+                                                             token_id=evt.token_id,
+                                                             trade_fee=evt.trade_fee.to_json())
+        self._record(lambda session: session.add(rp_update), connector)
 
     def _did_close_position(self,
                             event_tag: int,
@@ -410,14 +668,11 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_close_position, event_tag, connector, evt)
             return
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
-                                                                                 strategy=self._strategy_name,
-                                                                                 token_id=evt.token_id,
-                                                                                 token_0=evt.token_0,
-                                                                                 token_1=evt.token_1,
-                                                                                 claimed_fee_0=Decimal(evt.claimed_fee_0),
-                                                                                 claimed_fee_1=Decimal(evt.claimed_fee_1))
-                session.add(rp_fees)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
+                                                                         strategy=self._strategy_name,
+                                                                         token_id=evt.token_id,
+                                                                         token_0=evt.token_0,
+                                                                         token_1=evt.token_1,
+                                                                         claimed_fee_0=Decimal(evt.claimed_fee_0),
+                                                                         claimed_fee_1=Decimal(evt.claimed_fee_1))
+        self._record(lambda session: session.add(rp_fees), connector)
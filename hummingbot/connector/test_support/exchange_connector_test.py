@@ -12,6 +12,7 @@ from aioresponses.core import RequestCall
 from bidict import bidict
 
 from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.core.api_throttler.data_types import RequestPriority
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
@@ -27,6 +28,7 @@ from hummingbot.core.event.events import (
     SellOrderCreatedEvent,
 )
 from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 
 
 class AbstractExchangeConnectorTests:
@@ -545,6 +547,42 @@ class AbstractExchangeConnectorTests:
 
             self.assertRaises(asyncio.CancelledError, self.async_run_with_timeout, self.exchange.check_network())
 
+        @aioresponses()
+        def test_warm_up_connections_sends_concurrent_network_checks(self, mock_api):
+            url = self.network_status_url
+            response = self.network_status_request_successful_mock_response
+            mock_api.get(url, body=json.dumps(response), repeat=True)
+
+            self.async_run_with_timeout(coroutine=self.exchange._warm_up_connections())
+
+            self.assertEqual(self.exchange.WARM_UP_CONNECTIONS, len(self._all_executed_requests(mock_api, url)))
+
+        @aioresponses()
+        def test_warm_up_connections_ignores_errors(self, mock_api):
+            url = self.network_status_url
+            mock_api.get(url, status=500, repeat=True)
+
+            self.async_run_with_timeout(coroutine=self.exchange._warm_up_connections())
+
+            self.assertEqual(self.exchange.WARM_UP_CONNECTIONS, len(self._all_executed_requests(mock_api, url)))
+
+        def test_request_template_is_built_once_per_endpoint(self):
+            path_url = "/test"
+
+            template = self.exchange._request_template(path_url=path_url, method=RESTMethod.POST, is_auth_required=True)
+
+            self.assertIs(
+                template,
+                self.exchange._request_template(path_url=path_url, method=RESTMethod.POST, is_auth_required=True))
+            self.assertIsNot(
+                template,
+                self.exchange._request_template(path_url=path_url, method=RESTMethod.DELETE, is_auth_required=True))
+            self.assertEqual(self.exchange.web_utils.private_rest_url(path_url, domain=self.exchange.domain),
+                             template.url)
+            self.assertEqual(RESTMethod.POST, template.method)
+            self.assertEqual(path_url, template.throttler_limit_id)
+            self.assertTrue(template.is_auth_required)
+
         def test_initial_status_dict(self):
             self.exchange._set_trading_pair_symbol_map(None)
 
@@ -821,6 +859,38 @@ class AbstractExchangeConnectorTests:
                 self.assertIn(order.client_order_id, self.exchange.in_flight_orders)
                 self.assertTrue(order.is_pending_cancel_confirmation)
 
+        @aioresponses()
+        def test_order_requests_are_tagged_with_throttler_priority(self, mock_api):
+            self._simulate_trading_rules_initialized()
+            request_sent_event = asyncio.Event()
+            self.exchange._set_current_timestamp(1640780000)
+
+            mock_api.post(self.order_creation_url,
+                          body=json.dumps(self.order_creation_request_successful_mock_response),
+                          callback=lambda *args, **kwargs: request_sent_event.set())
+            order_id = self.exchange.buy(trading_pair=self.trading_pair,
+                                         amount=Decimal("100"),
+                                         order_type=OrderType.LIMIT,
+                                         price=Decimal("10000"))
+            self.async_run_with_timeout(request_sent_event.wait())
+
+            lane_metrics = self.exchange._throttler.lane_wait_metrics
+            self.assertEqual(1, lane_metrics[RequestPriority.CREATE].requests)
+            self.assertEqual(0, lane_metrics[RequestPriority.CANCEL].requests)
+
+            request_sent_event.clear()
+            order: InFlightOrder = self.exchange.in_flight_orders[order_id]
+            order.update_exchange_order_id(str(self.expected_exchange_order_id))
+            self.configure_successful_cancelation_response(
+                order=order,
+                mock_api=mock_api,
+                callback=lambda *args, **kwargs: request_sent_event.set())
+            self.exchange.cancel(trading_pair=order.trading_pair, order_id=order.client_order_id)
+            self.async_run_with_timeout(request_sent_event.wait())
+
+            self.assertEqual(1, lane_metrics[RequestPriority.CREATE].requests)
+            self.assertEqual(1, lane_metrics[RequestPriority.CANCEL].requests)
+
         @aioresponses()
         def test_cancel_order_raises_failure_event_when_request_fails(self, mock_api):
             request_sent_event = asyncio.Event()
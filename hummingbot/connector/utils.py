@@ -1,11 +1,11 @@
 import base64
 import os
+import re
 import socket
 from collections import namedtuple
 from hashlib import md5
-from typing import Callable, Dict, Optional, Tuple
-
-from zero_ex.order_utils import Order as ZeroExOrder
+from typing import TYPE_CHECKING, Any, Callable, Dict, Mapping, Optional, Tuple
+from urllib.parse import quote_plus
 
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
@@ -15,10 +15,16 @@ from hummingbot.core.web_assistant.connections.data_types import RESTRequest
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 
+if TYPE_CHECKING:  # zero_ex imports web3, which takes long to import for the few connectors using it
+    from zero_ex.order_utils import Order as ZeroExOrder
+
 TradeFillOrderDetails = namedtuple("TradeFillOrderDetails", "market exchange_trade_id symbol")
 
+# Characters `quote_plus` leaves as they are
+_URL_UNRESERVED_CHARACTERS = re.compile(r"[A-Za-z0-9_.\-~]*")
+
 
-def zrx_order_to_json(order: Optional[ZeroExOrder]) -> Optional[Dict[str, any]]:
+def zrx_order_to_json(order: Optional["ZeroExOrder"]) -> Optional[Dict[str, any]]:
     if order is None:
         return None
 
@@ -31,7 +37,9 @@ def zrx_order_to_json(order: Optional[ZeroExOrder]) -> Optional[Dict[str, any]]:
     return retval
 
 
-def json_to_zrx_order(data: Optional[Dict[str, any]]) -> Optional[ZeroExOrder]:
+def json_to_zrx_order(data: Optional[Dict[str, any]]) -> Optional["ZeroExOrder"]:
+    from zero_ex.order_utils import Order as ZeroExOrder
+
     if data is None:
         return None
 
@@ -61,6 +69,25 @@ def combine_to_hb_trading_pair(base: str, quote: str) -> str:
     return trading_pair
 
 
+def urlencode_params(params: Mapping[str, Any]) -> str:
+    """
+    Encodes the parameters of a request as `urllib.parse.urlencode` does, for the signatures of the authenticated
+    requests. Only the keys and values with characters to escape are quoted, most of them (symbols, amounts, prices,
+    order ids and timestamps) not having any.
+
+    :param params: the parameters to encode
+    :return: the URL encoded parameters
+    """
+    return "&".join([f"{_quote_plus(key)}={_quote_plus(value)}" for key, value in params.items()])
+
+
+def _quote_plus(value: Any) -> str:
+    if isinstance(value, bytes):
+        return quote_plus(value)
+    value = str(value)
+    return value if _URL_UNRESERVED_CHARACTERS.fullmatch(value) else quote_plus(value)
+
+
 def get_new_client_order_id(
     is_buy: bool, trading_pair: str, hbot_order_id_prefix: str = "", max_id_len: Optional[int] = None
 ) -> str:
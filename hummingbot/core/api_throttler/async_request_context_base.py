@@ -4,12 +4,17 @@ import time
 
 from abc import ABC, abstractmethod
 from typing import (
+    Dict,
     List,
+    Optional,
     Tuple,
 )
 
 from hummingbot.core.api_throttler.data_types import (
+    DEFAULT_PRIORITY,
+    LaneWaitMetrics,
     RateLimit,
+    RateLimitWindow,
     TaskLog,
 )
 from hummingbot.logger.logger import HummingbotLogger
@@ -34,27 +39,50 @@ class AsyncRequestContextBase(ABC):
         return arc_logger
 
     def __init__(self,
-                 task_logs: List[TaskLog],
+                 limit_windows: Dict[str, RateLimitWindow],
                  rate_limit: RateLimit,
                  related_limits: List[Tuple[RateLimit, int]],
                  lock: asyncio.Lock,
                  safety_margin_pct: float,
                  retry_interval: float = 0.1,
+                 priority: int = DEFAULT_PRIORITY,
+                 lane_metrics: Optional[LaneWaitMetrics] = None,
                  ):
         """
         Asynchronous context associated with each API request.
-        :param task_logs: Shared task logs associated with this API request
+        :param limit_windows: Shared task log windows of the rate limits, by limit id
         :param rate_limit: The RateLimit associated with this API Request
         :param rate_limits: List of linked rate limits with its corresponding weight associated with this API Request
         :param lock: A shared asyncio.Lock used between all instances of APIRequestContextBase
-        :param retry_interval: Time between each limit check
+        :param retry_interval: Time between limit checks for a task that is preempted by more urgent tasks, or that does
+        not fit within a limit even when it is unused
+        :param priority: The RequestPriority lane of this API Request, waiting requests of a more urgent lane get
+        capacity first
+        :param lane_metrics: Wait time metrics of the lane, updated when the capacity is acquired
         """
-        self._task_logs: List[TaskLog] = task_logs
+        self._limit_windows: Dict[str, RateLimitWindow] = limit_windows
         self._rate_limit: RateLimit = rate_limit
         self._related_limits: List[Tuple[RateLimit, int]] = related_limits
         self._lock: asyncio.Lock = lock
         self._safety_margin_pct: float = safety_margin_pct
         self._retry_interval: float = retry_interval
+        self._priority: int = priority
+        self._lane_metrics: LaneWaitMetrics = lane_metrics or LaneWaitMetrics()
+        self._wake_up: Optional[asyncio.Future] = None
+
+        self._related_windows: List[Tuple[RateLimitWindow, int]] = [
+            (self._limit_window(limit), weight) for limit, weight in related_limits
+        ]
+        self._rate_limit_window: Optional[RateLimitWindow] = (
+            None if rate_limit is None else self._limit_window(rate_limit)
+        )
+
+    def _limit_window(self, rate_limit: RateLimit) -> RateLimitWindow:
+        window: Optional[RateLimitWindow] = self._limit_windows.get(rate_limit.limit_id)
+        if window is None:
+            window = RateLimitWindow(rate_limit, self._safety_margin_pct)
+            self._limit_windows[rate_limit.limit_id] = window
+        return window
 
     def flush(self):
         """
@@ -62,33 +90,97 @@ class AsyncRequestContextBase(ABC):
         :return:
         """
         now: float = time.time()
-        for task in self._task_logs:
-            task_limit: RateLimit = task.rate_limit
-            elapsed: float = now - task.timestamp
-            if elapsed > task_limit.time_interval + (task_limit.time_interval * self._safety_margin_pct):
-                self._task_logs.remove(task)
+        for window, _ in self._related_windows:
+            window.flush(now)
 
     @abstractmethod
     def within_capacity(self) -> bool:
         raise NotImplementedError
 
+    def seconds_until_capacity(self) -> float:
+        """
+        :return: The time to wait until all the related rate limits have capacity for the task, assuming no other
+        task is acquired in the meantime
+        """
+        available_at: float = 0.0
+        for window, weight in self._related_windows:
+            window_available_at: Optional[float] = window.capacity_available_at(weight)
+            if window_available_at is None:
+                return self._retry_interval
+            available_at = max(available_at, window_available_at)
+        return max(0.0, available_at - time.time())
+
+    def preempted(self) -> bool:
+        """
+        :return: True if a more urgent request is waiting for capacity on one of the related limits
+        """
+        for window, _ in self._related_windows:
+            if window.has_waiter_before(self._priority):
+                return True
+        return False
+
     async def acquire(self):
-        while True:
-            async with self._lock:
-                self.flush()
-
-                if self.within_capacity():
-                    break
-            await asyncio.sleep(self._retry_interval)
-        async with self._lock:
-            now = time.time()
-            # Each related limit is represented as it own individual TaskLog
-            self._task_logs.append(TaskLog(timestamp=now,
-                                           rate_limit=self._rate_limit,
-                                           weight=self._rate_limit.weight))
-            for limit, weight in self._related_limits:
-                task = TaskLog(timestamp=now, rate_limit=limit, weight=weight)
-                self._task_logs.append(task)
+        start: float = time.time()
+        waiting: bool = False
+        try:
+            while True:
+                async with self._lock:
+                    preempted: bool = self.preempted()
+                    # within_capacity() flushes the expired task logs of the related limits
+                    if not preempted and self.within_capacity():
+                        now = time.time()
+                        # Each related limit is represented as it own individual TaskLog
+                        if self._rate_limit_window is not None:
+                            self._rate_limit_window.append(TaskLog(timestamp=now,
+                                                                   rate_limit=self._rate_limit,
+                                                                   weight=self._rate_limit.weight))
+                        for window, weight in self._related_windows:
+                            window.append(TaskLog(timestamp=now, rate_limit=window.rate_limit, weight=weight))
+                        break
+                    if not waiting:
+                        self._start_waiting()
+                        waiting = True
+                    # A preempted request is woken up when the more urgent requests stop waiting, and also checks
+                    # again after the retry interval in case it is not
+                    delay: float = self._retry_interval if preempted else self.seconds_until_capacity()
+                await self._wait(delay)
+        finally:
+            if waiting:
+                self._stop_waiting()
+        self._lane_metrics.record(time.time() - start if waiting else 0.0)
+
+    def _start_waiting(self):
+        for window, _ in self._related_windows:
+            window.waiters.setdefault(self._priority, set()).add(self)
+
+    def _stop_waiting(self):
+        for window, _ in self._related_windows:
+            lane_waiters = window.waiters.get(self._priority)
+            if lane_waiters is None:
+                continue
+            lane_waiters.discard(self)
+            if len(lane_waiters) == 0:
+                del window.waiters[self._priority]
+                # The less urgent requests are no longer preempted on this limit
+                for priority, waiters in window.waiters.items():
+                    if priority > self._priority:
+                        for waiter in waiters:
+                            waiter._wake()
+
+    async def _wait(self, delay: Optional[float]):
+        loop = asyncio.get_event_loop()
+        self._wake_up = loop.create_future()
+        timer: Optional[asyncio.TimerHandle] = None if delay is None else loop.call_later(delay, self._wake)
+        try:
+            await self._wake_up
+        finally:
+            if timer is not None:
+                timer.cancel()
+            self._wake_up = None
+
+    def _wake(self):
+        if self._wake_up is not None and not self._wake_up.done():
+            self._wake_up.set_result(None)
 
     async def __aenter__(self):
         await self.acquire()
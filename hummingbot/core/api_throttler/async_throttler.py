@@ -5,6 +5,7 @@ from hummingbot.core.api_throttler.async_request_context_base import (
     MAX_CAPACITY_REACHED_WARNING_INTERVAL,
 )
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import DEFAULT_PRIORITY
 
 
 class AsyncRequestContext(AsyncRequestContextBase):
@@ -16,22 +17,20 @@ class AsyncRequestContext(AsyncRequestContextBase):
     def within_capacity(self) -> bool:
         """
         Checks if an additional task within the defined RateLimit(s). Logs a warning message if the limit is about to be reached.
-        Note: A task can be associated to one or more RateLimit.
+        Note: A task can be associated to one or more RateLimit. The capacity used by each of them is kept up to
+        date by its RateLimitWindow, so the check does not depend on the number of tasks logged.
         :return: True if it is within capacity to add a new task
         """
-        if len(self._related_limits) > 0:
+        if len(self._related_windows) > 0:
             now: float = time.time()
-            for rate_limit, weight in self._related_limits:
-                capacity_used: int = sum([task.weight
-                                          for task in self._task_logs
-                                          if rate_limit.limit_id == task.rate_limit.limit_id and
-                                          now - task.timestamp - (task.rate_limit.time_interval * self._safety_margin_pct) <= task.rate_limit.time_interval])
-
-                if capacity_used + weight > rate_limit.limit:
+            for window, weight in self._related_windows:
+                window.flush(now)
+                if window.capacity_used + weight > window.rate_limit.limit:
                     if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+                        rate_limit = window.rate_limit
                         msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
                               f"{rate_limit.time_interval}s) has almost reached. Limits used " \
-                              f"is {capacity_used} in the last " \
+                              f"is {window.capacity_used} in the last " \
                               f"{rate_limit.time_interval} seconds"
                         self.logger().notify(msg)
                         AsyncRequestContextBase._last_max_cap_warning_ts = now
@@ -44,6 +43,9 @@ class AsyncThrottler(AsyncThrottlerBase):
     Handles call rate limits by providing async context (async with), it delays as needed to make sure calls stay
     within defined limits.
     A task can have multiple call rates (weight), though tasks are still ordered in sequence as they come (FIFO).
+    Tasks waiting for capacity sleep until the time their rate limits free enough of it, instead of polling.
+    Tasks are tagged with a RequestPriority lane, and a waiting task always gets capacity before the tasks of less
+    urgent lanes that share one of its rate limits (i.e. cancels before new orders before status polls).
     (i.e)
         Pool 0 - rate limit is 100 calls per second
         Pool 1 - rate limit is 10 calls per second
@@ -51,19 +53,25 @@ class AsyncThrottler(AsyncThrottlerBase):
         this (whether it belongs to Pool 0 or Pool 1) will have to wait for new capacity (some of the Task A flushed out).
     """
 
-    def execute_task(self, limit_id: str) -> AsyncRequestContext:
+    def execute_task(self, limit_id: str, priority: int = DEFAULT_PRIORITY) -> AsyncRequestContext:
         """
         Creates an async context where code within the context (a task) can be run only when all rate
         limits have capacity for the new task.
         :param limit_id: the limit_id associated with the APi request
+        :param priority: the RequestPriority lane of the API request
         :return: An async context (used with async with syntax)
         """
         rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
+        lane_metrics = self._lane_wait_metrics.get(priority)
+        if lane_metrics is None:
+            lane_metrics = self._lane_wait_metrics[priority] = self._create_lane_wait_metrics(priority)
         return AsyncRequestContext(
-            task_logs=self._task_logs,
+            limit_windows=self._limit_windows,
             rate_limit=rate_limit,
             related_limits=related_rate_limits,
             lock=self._lock,
             safety_margin_pct=self._safety_margin_pct,
             retry_interval=self._retry_interval,
+            priority=priority,
+            lane_metrics=lane_metrics,
         )
@@ -7,7 +7,14 @@ from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
-from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import (
+    DEFAULT_PRIORITY,
+    LaneWaitMetrics,
+    RateLimit,
+    RateLimitWindow,
+    RequestPriority,
+)
+from hummingbot.core.instrumentation.instrumentation import THROTTLER_WAIT, Instrumentation
 from hummingbot.logger.logger import HummingbotLogger
 
 
@@ -50,22 +57,65 @@ class AsyncThrottlerBase(ABC):
             limit.limit_id: limit
             for limit in self._rate_limits
         }
-
-        # List of TaskLog used to determine the API requests within a set time window.
-        self._task_logs: List[TaskLog] = []
+        self._cap_oversized_weights()
 
         # Throttler Parameters
         self._retry_interval: float = retry_interval
         self._safety_margin_pct: float = safety_margin_pct
 
-        # Shared asyncio.Lock instance to prevent multiple async ContextManager from accessing the _task_logs variable
+        # Dictionary of limit_id to the RateLimitWindow used to determine the API requests within its time window.
+        self._limit_windows: Dict[str, RateLimitWindow] = {
+            limit.limit_id: RateLimitWindow(limit, self._safety_margin_pct)
+            for limit in self._rate_limits
+        }
+
+        # Wait time metrics of the requests, by priority lane
+        self._lane_wait_metrics: Dict[int, LaneWaitMetrics] = {priority: self._create_lane_wait_metrics(priority)
+                                                               for priority in RequestPriority}
+
+        # Shared asyncio.Lock instance to prevent multiple async ContextManager from accessing the _limit_windows variable
         self._lock = asyncio.Lock()
 
+    def _cap_oversized_weights(self):
+        """
+        Caps the weights that exceed the limit they are counted against (e.g. after applying the rate limits share).
+        Such a request would never fit within the limit, so it would wait forever, and a waiting urgent request would
+        also hold back the less urgent requests sharing the limit. Once capped, it uses the whole limit instead.
+        """
+        for rate_limit in self._rate_limits:
+            if rate_limit.weight > rate_limit.limit:
+                self.logger().warning(f"The weight of {rate_limit.limit_id} ({rate_limit.weight}) exceeds its limit "
+                                      f"({rate_limit.limit}) and is capped to it.")
+                rate_limit.weight = int(rate_limit.limit)
+            for limit_weight_pair in rate_limit.linked_limits:
+                linked_limit: Optional[RateLimit] = self._id_to_limit_map.get(limit_weight_pair.limit_id)
+                if linked_limit is not None and limit_weight_pair.weight > linked_limit.limit:
+                    self.logger().warning(f"The weight of {rate_limit.limit_id} on {linked_limit.limit_id} "
+                                          f"({limit_weight_pair.weight}) exceeds the limit ({linked_limit.limit}) "
+                                          f"and is capped to it.")
+                    limit_weight_pair.weight = int(linked_limit.limit)
+
     def _client_config_map(self):
         from hummingbot.client.hummingbot_application import HummingbotApplication  # avoids circular import
 
         return HummingbotApplication.main_application().client_config_map
 
+    @property
+    def lane_wait_metrics(self) -> Dict[int, LaneWaitMetrics]:
+        return self._lane_wait_metrics
+
+    @staticmethod
+    def _create_lane_wait_metrics(priority: int) -> LaneWaitMetrics:
+        """
+        Creates the wait metrics of a lane, recording the waits in the throttler wait histogram of the lane, shared by
+        all the throttlers of the process
+        """
+        try:
+            lane = RequestPriority(priority).name
+        except ValueError:
+            lane = str(priority)
+        return LaneWaitMetrics(wait_histogram=Instrumentation.get_instance().histogram(THROTTLER_WAIT, lane))
+
     def get_related_limits(self, limit_id: str) -> Tuple[RateLimit, List[Tuple[RateLimit, int]]]:
         rate_limit: Optional[RateLimit] = self._id_to_limit_map.get(limit_id, None)
         linked_limits: List[RateLimit] = [] if rate_limit is None else rate_limit.linked_limits
@@ -80,5 +130,5 @@ class AsyncThrottlerBase(ABC):
         return rate_limit, related_limits
 
     @abstractmethod
-    def execute_task(self, limit_id: str) -> AsyncRequestContextBase:
+    def execute_task(self, limit_id: str, priority: int = DEFAULT_PRIORITY) -> AsyncRequestContextBase:
         raise NotImplementedError
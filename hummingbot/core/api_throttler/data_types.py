@@ -1,9 +1,17 @@
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
+from enum import IntEnum
 from typing import (
+    Any,
+    Deque,
+    Dict,
     List,
     Optional,
+    Set,
 )
 
+from hummingbot.core.instrumentation.latency_histogram import LatencyHistogram
+
 DEFAULT_PATH = ""
 DEFAULT_WEIGHT = 1
 
@@ -13,6 +21,20 @@ RequestWeight = int     # Integer representing the request weight of the path ur
 Seconds = float
 
 
+class RequestPriority(IntEnum):
+    """
+    Lanes of the API requests going through a throttler, from the most to the least urgent. When requests wait for
+    the same rate limit, its capacity is always granted to the most urgent one first.
+    """
+    CANCEL = 0
+    CREATE = 1
+    STATUS = 2
+    METADATA = 3
+
+
+DEFAULT_PRIORITY = RequestPriority.STATUS
+
+
 @dataclass
 class LinkedLimitWeightPair:
     limit_id: str
@@ -54,3 +76,88 @@ class TaskLog:
     timestamp: float
     rate_limit: RateLimit
     weight: int
+
+
+class RateLimitWindow:
+    """
+    Keeps the task logs of a single RateLimit in the order they were acquired, along with the total weight they use.
+    Since task logs expire in the same order, flushing only needs to look at the front of the window, and the capacity
+    used is kept up to date without scanning the whole window.
+    """
+
+    def __init__(self, rate_limit: RateLimit, safety_margin_pct: float):
+        """
+        :param rate_limit: The RateLimit whose task logs are kept
+        :param safety_margin_pct: Percentage of the time interval added to it before a task log expires
+        """
+        self.rate_limit: RateLimit = rate_limit
+        self.period: Seconds = rate_limit.time_interval * (1 + safety_margin_pct)
+        self.task_logs: Deque[TaskLog] = deque()
+        self.capacity_used: int = 0
+        # Request contexts waiting for capacity on this limit, by priority
+        self.waiters: Dict[int, Set[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self.task_logs)
+
+    def append(self, task_log: TaskLog):
+        self.task_logs.append(task_log)
+        self.capacity_used += task_log.weight
+
+    def flush(self, now: float):
+        """
+        Removes the task logs that have passed the rate limit period.
+        """
+        task_logs = self.task_logs
+        while len(task_logs) > 0 and now - task_logs[0].timestamp > self.period:
+            self.capacity_used -= task_logs.popleft().weight
+
+    def has_waiter_before(self, priority: int) -> bool:
+        """
+        :return: True if a request more urgent than the given priority is waiting for capacity on this limit
+        """
+        for waiting_priority in self.waiters:
+            if waiting_priority < priority:
+                return True
+        return False
+
+    def capacity_available_at(self, weight: int) -> Optional[float]:
+        """
+        :param weight: The weight of the task to fit in the window
+        :return: The timestamp after which enough task logs will have expired for the task to fit within the limit,
+        or None if the task does not fit even in an empty window
+        """
+        excess: int = self.capacity_used + weight - self.rate_limit.limit
+        if excess <= 0:
+            return 0.0
+        for task_log in self.task_logs:
+            excess -= task_log.weight
+            if excess <= 0:
+                return task_log.timestamp + self.period
+        return None
+
+
+@dataclass
+class LaneWaitMetrics:
+    """
+    Time the requests of a throttler lane waited for capacity. The waits are also recorded, the requests that did not
+    wait included, in the latency histogram of the lane when there is one.
+    """
+    requests: int = 0
+    delayed_requests: int = 0
+    total_wait: Seconds = 0.0
+    max_wait: Seconds = 0.0
+    wait_histogram: Optional[LatencyHistogram] = field(default=None, repr=False, compare=False)
+
+    @property
+    def mean_wait(self) -> Seconds:
+        return self.total_wait / self.requests if self.requests > 0 else 0.0
+
+    def record(self, wait: Seconds):
+        self.requests += 1
+        if self.wait_histogram is not None:
+            self.wait_histogram.record(wait)
+        if wait > 0:
+            self.delayed_requests += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
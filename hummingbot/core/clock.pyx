@@ -8,6 +8,7 @@ from typing import List
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.instrumentation.instrumentation import EVENT_LOOP_LAG, TICK_DURATION, Instrumentation
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
@@ -90,6 +91,12 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            double tick_start
+
+        instrumentation = Instrumentation.get_instance()
+        event_loop_lag = instrumentation.histogram(EVENT_LOOP_LAG)
+        # the tick duration histogram of each iterator type, resolved on its first tick
+        tick_durations = {}
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -111,10 +118,12 @@ cdef class Clock:
                 next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
                 await asyncio.sleep(next_tick_time - now)
                 self._current_tick = next_tick_time
+                event_loop_lag.record(time.time() - next_tick_time)
 
                 # Run through all the child iterators.
                 for ci in self._current_context:
                     child_iterator = ci
+                    tick_start = time.perf_counter()
                     try:
                         child_iterator.c_tick(self._current_tick)
                     except StopIteration:
@@ -122,6 +131,11 @@ cdef class Clock:
                         return
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                    tick_duration = tick_durations.get(type(ci))
+                    if tick_duration is None:
+                        tick_duration = tick_durations[type(ci)] = instrumentation.histogram(TICK_DURATION,
+                                                                                             type(ci).__name__)
+                    tick_duration.record(time.perf_counter() - tick_start)
         finally:
             for ci in self._current_context:
                 child_iterator = ci
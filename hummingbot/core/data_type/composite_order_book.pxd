@@ -1,8 +1,22 @@
 # distutils: language=c++
+cimport numpy as np
+from libcpp.vector cimport vector
+
 from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.data_type.order_book_query_result cimport OrderBookQueryResult
 
 cdef class CompositeOrderBook(OrderBook):
     cdef:
         OrderBook _traded_order_book
 
+    cdef np.ndarray c_entries_array(self, bint is_bid, Py_ssize_t depth, object out)
     cdef double c_get_price(self, bint is_buy) except? -1
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price)
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price)
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume)
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount)
+    cdef list c_get_price_for_volumes(self, bint is_buy, vector[double] volumes)
+    cdef list c_get_vwap_for_volumes(self, bint is_buy, vector[double] volumes)
+    cdef list c_get_volume_for_prices(self, bint is_buy, vector[double] prices)
@@ -1,21 +1,27 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
+from itertools import islice
 from typing import Iterator
 
+cimport numpy as np
 from cython.operator cimport address as ref, dereference as deref, postincrement as inc
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.order_book cimport c_entries_buffer
 from libcpp.set cimport set
 from libcpp.vector cimport vector
 
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
+NaN = float("nan")
+
 cdef class CompositeOrderBook(OrderBook):
     """
     Record orders that are bought during back testing and used to simulate order book consumption without modifying
     the actual order book.
-    Override the order book bid_entries, ask_entries methods to return the composite order book entries
+    Override the order book bid_entries, ask_entries methods to return the composite order book entries.
+    The depth queries are overridden as well, since the base class walks its raw C++ books directly.
     """
     def __init__(self, order_book: OrderBook = None):
         super().__init__()
@@ -175,6 +181,15 @@ cdef class CompositeOrderBook(OrderBook):
 
         self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
 
+    cdef np.ndarray c_entries_array(self, bint is_bid, Py_ssize_t depth, object out):
+        cdef:
+            object entries = self.bid_entries() if is_bid else self.ask_entries()
+            list rows = list(entries if depth < 0 else islice(entries, depth))
+            np.ndarray result = c_entries_buffer(len(rows), -1, out)
+        if len(rows) > 0:
+            result[:] = rows
+        return result
+
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
             set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
@@ -192,3 +207,101 @@ cdef class CompositeOrderBook(OrderBook):
                 return best_bid.price
         except Exception:
             raise
+
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        for order_book_row in (self.ask_entries() if is_buy else self.bid_entries()):
+            cumulative_volume += order_book_row.amount
+            if cumulative_volume >= volume:
+                result_price = order_book_row.price
+                break
+
+        return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
+
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
+        cdef:
+            double total_cost = 0
+            double total_volume = 0
+            double result_vwap = NaN
+
+        for order_book_row in (self.ask_entries() if is_buy else self.bid_entries()):
+            total_cost += order_book_row.amount * order_book_row.price
+            total_volume += order_book_row.amount
+            if total_volume >= volume:
+                total_cost -= order_book_row.amount * order_book_row.price
+                total_volume -= order_book_row.amount
+                incremental_amount = volume - total_volume
+                total_cost += incremental_amount * order_book_row.price
+                total_volume += incremental_amount
+                result_vwap = total_cost / total_volume
+                break
+
+        return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
+
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        for order_book_row in (self.ask_entries() if is_buy else self.bid_entries()):
+            cumulative_volume += order_book_row.amount * order_book_row.price
+            if cumulative_volume >= quote_volume:
+                result_price = order_book_row.price
+                break
+
+        return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
+        cdef:
+            double cumulative_volume = 0
+            double cumulative_base_amount = 0
+            double row_amount = 0
+
+        for order_book_row in (self.ask_entries() if is_buy else self.bid_entries()):
+            row_amount = order_book_row.amount
+            if row_amount + cumulative_base_amount >= base_amount:
+                row_amount = base_amount - cumulative_base_amount
+            cumulative_base_amount += row_amount
+            cumulative_volume += row_amount * order_book_row.price
+            if cumulative_base_amount >= base_amount:
+                break
+
+        return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        for order_book_row in (self.ask_entries() if is_buy else self.bid_entries()):
+            if (order_book_row.price > price) if is_buy else (order_book_row.price < price):
+                break
+            cumulative_volume += order_book_row.amount
+            result_price = order_book_row.price
+
+        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        for order_book_row in (self.ask_entries() if is_buy else self.bid_entries()):
+            if (order_book_row.price > price) if is_buy else (order_book_row.price < price):
+                break
+            cumulative_volume += order_book_row.amount * order_book_row.price
+            result_price = order_book_row.price
+
+        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+
+    cdef list c_get_price_for_volumes(self, bint is_buy, vector[double] volumes):
+        return [self.c_get_price_for_volume(is_buy, volume) for volume in volumes]
+
+    cdef list c_get_vwap_for_volumes(self, bint is_buy, vector[double] volumes):
+        return [self.c_get_vwap_for_volume(is_buy, volume) for volume in volumes]
+
+    cdef list c_get_volume_for_prices(self, bint is_buy, vector[double] prices):
+        return [self.c_get_volume_for_price(is_buy, price) for price in prices]
@@ -0,0 +1,392 @@
+# distutils: language=c++
+# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+
+from typing import Iterator
+
+cimport numpy as np
+from cython.operator cimport address as ref, dereference as deref
+from libc.stdint cimport int64_t
+from libcpp.utility cimport pair
+from libcpp.vector cimport vector
+
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.order_book cimport c_entries_buffer, c_sorted_queries
+from hummingbot.core.data_type.order_book_query_result cimport OrderBookQueryResult
+
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+NaN = float("nan")
+
+
+cdef extern from "<algorithm>" namespace "std" nogil:
+    void stable_sort[Iter](Iter first, Iter last)
+    void reverse[Iter](Iter first, Iter last)
+
+
+cdef inline size_t c_level_index(vector[OrderBookEntry] &levels, double price, bint descending):
+    """
+    Binary search for the first level whose price is not better-sorted than the given price, i.e. the position where
+    a level with that price is, or would be inserted.
+    """
+    cdef:
+        size_t low = 0
+        size_t high = levels.size()
+        size_t middle
+        double middle_price
+    while low < high:
+        middle = (low + high) // 2
+        middle_price = levels[middle].getPrice()
+        if (middle_price > price) if descending else (middle_price < price):
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+cdef inline c_apply_level_diff(vector[OrderBookEntry] &levels, OrderBookEntry &entry, bint descending):
+    cdef:
+        size_t index = c_level_index(levels, entry.getPrice(), descending)
+        bint found = index < levels.size() and levels[index].getPrice() == entry.getPrice()
+    if found:
+        if entry.getAmount() > 0:
+            levels[index] = entry
+        else:
+            levels.erase(levels.begin() + index)
+    elif entry.getAmount() > 0:
+        levels.insert(levels.begin() + index, entry)
+
+
+cdef inline c_load_levels(vector[OrderBookEntry] &levels, vector[OrderBookEntry] &entries, bint descending):
+    """
+    Replaces the levels with the given entries. As with the std::set books, the first entry wins when a price is
+    repeated.
+    """
+    cdef:
+        vector[OrderBookEntry] sorted_entries = entries
+        size_t i
+    stable_sort(sorted_entries.begin(), sorted_entries.end())
+    levels.clear()
+    levels.reserve(sorted_entries.size())
+    for i in range(sorted_entries.size()):
+        if levels.size() > 0 and levels.back().getPrice() == sorted_entries[i].getPrice():
+            continue
+        levels.push_back(sorted_entries[i])
+    if descending:
+        reverse(levels.begin(), levels.end())
+
+
+cdef class FlatOrderBook(OrderBook):
+    """
+    Order book backed by contiguous sorted arrays instead of std::set trees.
+
+    Each side is kept from the worst to the best price, so updates near the top of the book only move the few levels
+    above them, and depth walks read memory sequentially. It keeps the same public API as OrderBook, and is selected
+    through a data source's order_book_create_function.
+    """
+
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        # Apply the diffs. Diffs with 0 amounts mean deletion.
+        for bid in bids:
+            c_apply_level_diff(self._bid_levels, bid, False)
+        for ask in asks:
+            c_apply_level_diff(self._ask_levels, ask, True)
+
+        self.c_truncate_overlap_entries()
+        self.c_update_best_prices()
+
+        # Remember the last diff update ID.
+        self._last_diff_uid = update_id
+
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        c_load_levels(self._bid_levels, bids, False)
+        c_load_levels(self._ask_levels, asks, True)
+
+        if self._dex:
+            self.c_truncate_overlap_entries()
+        self._best_bid = self._bid_levels.back().getPrice() if self._bid_levels.size() > 0 else NaN
+        self._best_ask = self._ask_levels.back().getPrice() if self._ask_levels.size() > 0 else NaN
+
+        # Remember the last snapshot update ID.
+        self._snapshot_uid = update_id
+
+    cdef c_truncate_overlap_entries(self):
+        """
+        Same rules as truncateOverlapEntries() in OrderBookEntry.cpp: centralised books keep the newer entry, dex books
+        keep the entry with the larger notional.
+        """
+        cdef:
+            OrderBookEntry top_bid
+            OrderBookEntry top_ask
+            bint drop_ask
+        while self._bid_levels.size() > 0 and self._ask_levels.size() > 0:
+            top_bid = self._bid_levels.back()
+            top_ask = self._ask_levels.back()
+            if top_bid.getPrice() < top_ask.getPrice():
+                break
+            if self._dex:
+                drop_ask = top_bid.getAmount() * top_bid.getPrice() > top_ask.getAmount() * top_ask.getPrice()
+            else:
+                drop_ask = top_bid.getUpdateId() > top_ask.getUpdateId()
+            if drop_ask:
+                self._ask_levels.pop_back()
+            else:
+                self._bid_levels.pop_back()
+
+    cdef c_update_best_prices(self):
+        # Record the current best prices, for faster c_get_price() calls.
+        if self._bid_levels.size() > 0:
+            self._best_bid = self._bid_levels.back().getPrice()
+        if self._ask_levels.size() > 0:
+            self._best_ask = self._ask_levels.back().getPrice()
+
+    def bid_entries(self) -> Iterator[OrderBookRow]:
+        cdef:
+            size_t i = self._bid_levels.size()
+            OrderBookEntry entry
+        while i > 0:
+            i -= 1
+            entry = self._bid_levels[i]
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+
+    def ask_entries(self) -> Iterator[OrderBookRow]:
+        cdef:
+            size_t i = self._ask_levels.size()
+            OrderBookEntry entry
+        while i > 0:
+            i -= 1
+            entry = self._ask_levels[i]
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+
+    cdef np.ndarray c_entries_array(self, bint is_bid, Py_ssize_t depth, object out):
+        cdef:
+            vector[OrderBookEntry] *levels = ref(self._bid_levels) if is_bid else ref(self._ask_levels)
+            size_t size = deref(levels).size()
+            np.ndarray result = c_entries_buffer(size, depth, out)
+            double[:, ::1] buffer = result
+            Py_ssize_t i
+
+        for i in range(buffer.shape[0]):
+            buffer[i, 0] = deref(levels)[size - 1 - i].getPrice()
+            buffer[i, 1] = deref(levels)[size - 1 - i].getAmount()
+            buffer[i, 2] = deref(levels)[size - 1 - i].getUpdateId()
+        return result
+
+    cdef double c_get_price(self, bint is_buy) except? -1:
+        cdef:
+            vector[OrderBookEntry] *levels = ref(self._ask_levels) if is_buy else ref(self._bid_levels)
+        if deref(levels).size() < 1:
+            raise EnvironmentError("Order book is empty - no price quote is possible.")
+        return self._best_ask if is_buy else self._best_bid
+
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+        cdef:
+            vector[OrderBookEntry] *levels = ref(self._ask_levels) if is_buy else ref(self._bid_levels)
+            size_t i = deref(levels).size()
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        while i > 0:
+            i -= 1
+            cumulative_volume += deref(levels)[i].getAmount()
+            if cumulative_volume >= volume:
+                result_price = deref(levels)[i].getPrice()
+                break
+
+        return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
+
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
+        cdef:
+            vector[OrderBookEntry] *levels = ref(self._ask_levels) if is_buy else ref(self._bid_levels)
+            size_t i = deref(levels).size()
+            double total_cost = 0
+            double total_volume = 0
+            double result_vwap = NaN
+            double incremental_amount
+            OrderBookEntry entry
+
+        while i > 0:
+            i -= 1
+            entry = deref(levels)[i]
+            total_cost += entry.getAmount() * entry.getPrice()
+            total_volume += entry.getAmount()
+            if total_volume >= volume:
+                total_cost -= entry.getAmount() * entry.getPrice()
+                total_volume -= entry.getAmount()
+                incremental_amount = volume - total_volume
+                total_cost += incremental_amount * entry.getPrice()
+                total_volume += incremental_amount
+                result_vwap = total_cost / total_volume
+                break
+
+        return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
+
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
+        cdef:
+            vector[OrderBookEntry] *levels = ref(self._ask_levels) if is_buy else ref(self._bid_levels)
+            size_t i = deref(levels).size()
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        while i > 0:
+            i -= 1
+            cumulative_volume += deref(levels)[i].getAmount() * deref(levels)[i].getPrice()
+            if cumulative_volume >= quote_volume:
+                result_price = deref(levels)[i].getPrice()
+                break
+
+        return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
+        cdef:
+            vector[OrderBookEntry] *levels = ref(self._ask_levels) if is_buy else ref(self._bid_levels)
+            size_t i = deref(levels).size()
+            double cumulative_volume = 0
+            double cumulative_base_amount = 0
+            double row_amount = 0
+
+        while i > 0:
+            i -= 1
+            row_amount = deref(levels)[i].getAmount()
+            if row_amount + cumulative_base_amount >= base_amount:
+                row_amount = base_amount - cumulative_base_amount
+            cumulative_base_amount += row_amount
+            cumulative_volume += row_amount * deref(levels)[i].getPrice()
+            if cumulative_base_amount >= base_amount:
+                break
+
+        return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            vector[OrderBookEntry] *levels = ref(self._ask_levels) if is_buy else ref(self._bid_levels)
+            size_t i = deref(levels).size()
+            double cumulative_volume = 0
+            double result_price = NaN
+            double level_price
+
+        while i > 0:
+            i -= 1
+            level_price = deref(levels)[i].getPrice()
+            if (level_price > price) if is_buy else (level_price < price):
+                break
+            cumulative_volume += deref(levels)[i].getAmount()
+            result_price = level_price
+
+        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            vector[OrderBookEntry] *levels = ref(self._ask_levels) if is_buy else ref(self._bid_levels)
+            size_t i = deref(levels).size()
+            double cumulative_volume = 0
+            double result_price = NaN
+            double level_price
+
+        while i > 0:
+            i -= 1
+            level_price = deref(levels)[i].getPrice()
+            if (level_price > price) if is_buy else (level_price < price):
+                break
+            cumulative_volume += deref(levels)[i].getAmount() * level_price
+            result_price = level_price
+
+        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+
+    cdef list c_get_price_for_volumes(self, bint is_buy, vector[double] volumes):
+        cdef:
+            vector[OrderBookEntry] *levels = ref(self._ask_levels) if is_buy else ref(self._bid_levels)
+            vector[pair[double, size_t]] queries = c_sorted_queries(volumes, 1.0)
+            size_t i = deref(levels).size()
+            size_t query_index = 0
+            size_t position
+            double cumulative_volume = 0
+            list results = [None] * volumes.size()
+
+        while query_index < queries.size() and i > 0:
+            i -= 1
+            cumulative_volume += deref(levels)[i].getAmount()
+            while query_index < queries.size() and cumulative_volume >= queries[query_index].first:
+                position = queries[query_index].second
+                results[position] = OrderBookQueryResult(NaN, volumes[position], deref(levels)[i].getPrice(),
+                                                         min(cumulative_volume, volumes[position]))
+                query_index += 1
+
+        while query_index < queries.size():
+            position = queries[query_index].second
+            results[position] = OrderBookQueryResult(NaN, volumes[position], NaN,
+                                                     min(cumulative_volume, volumes[position]))
+            query_index += 1
+
+        return results
+
+    cdef list c_get_vwap_for_volumes(self, bint is_buy, vector[double] volumes):
+        cdef:
+            vector[OrderBookEntry] *levels = ref(self._ask_levels) if is_buy else ref(self._bid_levels)
+            vector[pair[double, size_t]] queries = c_sorted_queries(volumes, 1.0)
+            size_t i = deref(levels).size()
+            size_t query_index = 0
+            size_t position
+            double total_cost = 0
+            double total_volume = 0
+            double level_cost
+            double query_cost
+            double query_volume
+            double incremental_amount
+            OrderBookEntry entry
+            list results = [None] * volumes.size()
+
+        while query_index < queries.size() and i > 0:
+            i -= 1
+            entry = deref(levels)[i]
+            level_cost = entry.getAmount() * entry.getPrice()
+            total_cost += level_cost
+            total_volume += entry.getAmount()
+            while query_index < queries.size() and total_volume >= queries[query_index].first:
+                position = queries[query_index].second
+                query_cost = total_cost - level_cost
+                query_volume = total_volume - entry.getAmount()
+                incremental_amount = volumes[position] - query_volume
+                query_cost += incremental_amount * entry.getPrice()
+                query_volume += incremental_amount
+                results[position] = OrderBookQueryResult(NaN, volumes[position], query_cost / query_volume,
+                                                         min(query_volume, volumes[position]))
+                query_index += 1
+
+        while query_index < queries.size():
+            position = queries[query_index].second
+            results[position] = OrderBookQueryResult(NaN, volumes[position], NaN,
+                                                     min(total_volume, volumes[position]))
+            query_index += 1
+
+        return results
+
+    cdef list c_get_volume_for_prices(self, bint is_buy, vector[double] prices):
+        cdef:
+            vector[OrderBookEntry] *levels = ref(self._ask_levels) if is_buy else ref(self._bid_levels)
+            vector[pair[double, size_t]] queries = c_sorted_queries(prices, 1.0 if is_buy else -1.0)
+            size_t i = deref(levels).size()
+            size_t query_index = 0
+            size_t position
+            double cumulative_volume = 0
+            double result_price = NaN
+            double level_price
+            list results = [None] * prices.size()
+
+        while query_index < queries.size() and i > 0:
+            i -= 1
+            level_price = deref(levels)[i].getPrice()
+            while query_index < queries.size() and \
+                    ((level_price > prices[queries[query_index].second]) if is_buy
+                     else (level_price < prices[queries[query_index].second])):
+                position = queries[query_index].second
+                results[position] = OrderBookQueryResult(prices[position], NaN, result_price, cumulative_volume)
+                query_index += 1
+            cumulative_volume += deref(levels)[i].getAmount()
+            result_price = level_price
+
+        while query_index < queries.size():
+            position = queries[query_index].second
+            results[position] = OrderBookQueryResult(prices[position], NaN, result_price, cumulative_volume)
+            query_index += 1
+
+        return results
@@ -2,6 +2,7 @@
 
 from libc.stdint cimport int64_t
 from libcpp.set cimport set
+from libcpp.utility cimport pair
 from libcpp.vector cimport vector
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
 from hummingbot.core.pubsub cimport PubSub
@@ -9,6 +10,10 @@ from .order_book_query_result cimport OrderBookQueryResult
 cimport numpy as np
 
 
+cdef vector[pair[double, size_t]] c_sorted_queries(const vector[double] &values, double direction)
+cdef np.ndarray c_entries_buffer(size_t size, Py_ssize_t depth, object out)
+
+
 cdef class OrderBook(PubSub):
     cdef set[OrderBookEntry] _bid_book
     cdef set[OrderBookEntry] _ask_book
@@ -30,6 +35,7 @@ cdef class OrderBook(PubSub):
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
                                 np.ndarray[np.float64_t, ndim=2] asks_array)
+    cdef np.ndarray c_entries_array(self, bint is_bid, Py_ssize_t depth, object out)
     cdef double c_get_price(self, bint is_buy) except? -1
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
@@ -37,3 +43,6 @@ cdef class OrderBook(PubSub):
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price)
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount)
+    cdef list c_get_price_for_volumes(self, bint is_buy, vector[double] volumes)
+    cdef list c_get_vwap_for_volumes(self, bint is_buy, vector[double] volumes)
+    cdef list c_get_volume_for_prices(self, bint is_buy, vector[double] prices)
@@ -32,11 +32,62 @@ from hummingbot.core.event.events import (
 )
 
 cimport numpy as np
+from libcpp.algorithm cimport sort
 
 ob_logger = None
 NaN = float("nan")
 
 
+cdef vector[pair[double, size_t]] c_sorted_queries(const vector[double] &values, double direction):
+    """
+    Returns (direction * value, index) pairs sorted in ascending order, so batched queries can be answered in the
+    order the book is walked.
+    """
+    cdef:
+        vector[pair[double, size_t]] queries
+        size_t i
+    queries.reserve(values.size())
+    for i in range(values.size()):
+        queries.push_back(pair[double, size_t](direction * values[i], i))
+    sort(queries.begin(), queries.end())
+    return queries
+
+
+cdef int64_t c_entries_from_array(np.ndarray[np.float64_t, ndim=2] array,
+                                  vector[OrderBookEntry] &entries,
+                                  int64_t entries_update_id=0):
+    """
+    Appends the [price, amount, update_id] rows of the array to the entries, and returns their latest update id.
+    [price, amount] rows all get entries_update_id instead, which is not limited to the integers a double can hold.
+    """
+    cdef:
+        Py_ssize_t i
+        int64_t update_id = entries_update_id
+        int64_t last_update_id = 0
+        bint has_update_ids = array.shape[1] > 2
+    entries.reserve(entries.size() + array.shape[0])
+    for i in range(array.shape[0]):
+        if has_update_ids:
+            update_id = <int64_t>array[i, 2]
+        entries.push_back(OrderBookEntry(array[i, 0], array[i, 1], update_id))
+        last_update_id = max(last_update_id, update_id)
+    return last_update_id
+
+
+cdef np.ndarray c_entries_buffer(size_t size, Py_ssize_t depth, object out):
+    """
+    Returns the (rows, 3) float64 buffer that entries are exported into, either newly allocated or the caller's
+    preallocated one. A negative depth exports every entry.
+    """
+    cdef:
+        size_t rows = size if depth < 0 else min(size, <size_t>depth)
+    if out is None:
+        return np.empty((rows, 3), dtype=np.float64)
+    if out.dtype != np.float64 or out.ndim != 2 or out.shape[1] != 3 or out.shape[0] < rows:
+        raise ValueError(f"Expected a float64 buffer of shape ({rows}, 3) or larger, got {out.dtype} {out.shape}.")
+    return out[:rows]
+
+
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
 
@@ -172,12 +223,52 @@ cdef class OrderBook(PubSub):
 
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
+        return self.get_snapshot()
+
+    def get_snapshot(self, depth: Optional[int] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Same as the snapshot property, limited to the best `depth` levels of each side when given.
+        """
+        bids_df = pd.DataFrame(data=self.bids_array(depth), columns=OrderBookRow._fields, copy=False)
+        asks_df = pd.DataFrame(data=self.asks_array(depth), columns=OrderBookRow._fields, copy=False)
         return bids_df, asks_df
 
+    def bids_array(self, depth: Optional[int] = None, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Exports the best `depth` bids (all of them if depth is None), best first, as a float64 array with the columns
+        [price, amount, update_id]. Pass a preallocated C-contiguous array as `out` to reuse it between calls, the
+        returned array is then a view on its first rows.
+        """
+        return self.c_entries_array(True, -1 if depth is None else depth, out)
+
+    def asks_array(self, depth: Optional[int] = None, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Same as bids_array() for the ask side.
+        """
+        return self.c_entries_array(False, -1 if depth is None else depth, out)
+
+    cdef np.ndarray c_entries_array(self, bint is_bid, Py_ssize_t depth, object out):
+        cdef:
+            np.ndarray result = c_entries_buffer(self._bid_book.size() if is_bid else self._ask_book.size(), depth, out)
+            double[:, ::1] buffer = result
+            Py_ssize_t rows = buffer.shape[0]
+            Py_ssize_t i
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            OrderBookEntry entry
+
+        for i in range(rows):
+            if is_bid:
+                entry = deref(bid_it)
+                inc(bid_it)
+            else:
+                entry = deref(ask_it)
+                inc(ask_it)
+            buffer[i, 0] = entry.getPrice()
+            buffer[i, 1] = entry.getAmount()
+            buffer[i, 2] = entry.getUpdateId()
+        return result
+
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -209,12 +300,23 @@ cdef class OrderBook(PubSub):
         """
         self.apply_numpy_diffs(bids_df.values, asks_df.values)
 
-    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: Optional[int] = None):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+
+        The update id of the diff defaults to the latest update id of its rows. When it is given, the arrays may only
+        have the [price, amount] columns, and their rows get the update id of the diff.
         """
-        self.c_apply_numpy_diffs(bids_array, asks_array)
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        if update_id is None:
+            self.c_apply_numpy_diffs(bids_array, asks_array)
+        else:
+            c_entries_from_array(bids_array, cpp_bids, update_id)
+            c_entries_from_array(asks_array, cpp_asks, update_id)
+            self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
 
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
@@ -226,22 +328,40 @@ cdef class OrderBook(PubSub):
         cdef:
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
-            int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+            int64_t last_update_id = max(c_entries_from_array(bids_array, cpp_bids),
+                                         c_entries_from_array(asks_array, cpp_asks))
         self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
 
-    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: Optional[int] = None):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+
+        The update id of the snapshot defaults to the latest update id of its rows. When it is given, the arrays may
+        only have the [price, amount] columns, and their rows get the update id of the snapshot.
         """
-        self.c_apply_numpy_snapshot(bids_array, asks_array)
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        if update_id is None:
+            self.c_apply_numpy_snapshot(bids_array, asks_array)
+        else:
+            c_entries_from_array(bids_array, cpp_bids, update_id)
+            c_entries_from_array(asks_array, cpp_asks, update_id)
+            self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
+
+    def apply_diff_message(self, message: OrderBookMessage):
+        """
+        Applies a diff message from the float64 arrays of its entries, which are parsed once and cached on the message.
+        """
+        self.apply_numpy_diffs(message.bids_array, message.asks_array, message.update_id)
+
+    def apply_snapshot_message(self, message: OrderBookMessage):
+        """
+        Applies a snapshot message from the float64 arrays of its entries, which are parsed once and cached on the
+        message.
+        """
+        self.apply_numpy_snapshot(message.bids_array, message.asks_array, message.update_id)
 
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
@@ -253,14 +373,8 @@ cdef class OrderBook(PubSub):
         cdef:
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
-            int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+            int64_t last_update_id = max(c_entries_from_array(bids_array, cpp_bids),
+                                         c_entries_from_array(asks_array, cpp_asks))
         self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
@@ -323,19 +437,21 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            OrderBookEntry entry
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+        while (ask_it != self._ask_book.end()) if is_buy else (bid_it != self._bid_book.rend()):
+            if is_buy:
+                entry = deref(ask_it)
+                inc(ask_it)
+            else:
+                entry = deref(bid_it)
+                inc(bid_it)
+            cumulative_volume += entry.getAmount()
+            if cumulative_volume >= volume:
+                result_price = entry.getPrice()
+                break
 
         return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
 
@@ -344,30 +460,28 @@ cdef class OrderBook(PubSub):
             double total_cost = 0
             double total_volume = 0
             double result_vwap = NaN
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
+            double incremental_amount
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            OrderBookEntry entry
+
+        while (ask_it != self._ask_book.end()) if is_buy else (bid_it != self._bid_book.rend()):
+            if is_buy:
+                entry = deref(ask_it)
+                inc(ask_it)
+            else:
+                entry = deref(bid_it)
+                inc(bid_it)
+            total_cost += entry.getAmount() * entry.getPrice()
+            total_volume += entry.getAmount()
+            if total_volume >= volume:
+                total_cost -= entry.getAmount() * entry.getPrice()
+                total_volume -= entry.getAmount()
+                incremental_amount = volume - total_volume
+                total_cost += incremental_amount * entry.getPrice()
+                total_volume += incremental_amount
+                result_vwap = total_cost / total_volume
+                break
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
@@ -375,19 +489,21 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            OrderBookEntry entry
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
+        while (ask_it != self._ask_book.end()) if is_buy else (bid_it != self._bid_book.rend()):
+            if is_buy:
+                entry = deref(ask_it)
+                inc(ask_it)
+            else:
+                entry = deref(bid_it)
+                inc(bid_it)
+            cumulative_volume += entry.getAmount() * entry.getPrice()
+            if cumulative_volume >= quote_volume:
+                result_price = entry.getPrice()
+                break
 
         return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
 
@@ -396,25 +512,24 @@ cdef class OrderBook(PubSub):
             double cumulative_volume = 0
             double cumulative_base_amount = 0
             double row_amount = 0
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            OrderBookEntry entry
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
+        while (ask_it != self._ask_book.end()) if is_buy else (bid_it != self._bid_book.rend()):
+            if is_buy:
+                entry = deref(ask_it)
+                inc(ask_it)
+            else:
+                entry = deref(bid_it)
+                inc(bid_it)
+            row_amount = entry.getAmount()
+            if row_amount + cumulative_base_amount >= base_amount:
+                row_amount = base_amount - cumulative_base_amount
+            cumulative_base_amount += row_amount
+            cumulative_volume += row_amount * entry.getPrice()
+            if cumulative_base_amount >= base_amount:
+                break
 
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
@@ -422,19 +537,23 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            OrderBookEntry entry
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
+        while (ask_it != self._ask_book.end()) if is_buy else (bid_it != self._bid_book.rend()):
+            if is_buy:
+                entry = deref(ask_it)
+                inc(ask_it)
+                if entry.getPrice() > price:
                     break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
+            else:
+                entry = deref(bid_it)
+                inc(bid_it)
+                if entry.getPrice() < price:
                     break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+            cumulative_volume += entry.getAmount()
+            result_price = entry.getPrice()
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
@@ -442,22 +561,156 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            OrderBookEntry entry
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
+        while (ask_it != self._ask_book.end()) if is_buy else (bid_it != self._bid_book.rend()):
+            if is_buy:
+                entry = deref(ask_it)
+                inc(ask_it)
+                if entry.getPrice() > price:
                     break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
+            else:
+                entry = deref(bid_it)
+                inc(bid_it)
+                if entry.getPrice() < price:
                     break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+            cumulative_volume += entry.getAmount() * entry.getPrice()
+            result_price = entry.getPrice()
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
+    cdef list c_get_price_for_volumes(self, bint is_buy, vector[double] volumes):
+        """
+        Answers several c_get_price_for_volume() queries with a single walk over the book.
+        Results are returned in the same order as the queried volumes.
+        """
+        cdef:
+            vector[pair[double, size_t]] queries = c_sorted_queries(volumes, 1.0)
+            size_t query_index = 0
+            size_t position
+            double cumulative_volume = 0
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            OrderBookEntry entry
+            list results = [None] * volumes.size()
+
+        while query_index < queries.size() and \
+                ((ask_it != self._ask_book.end()) if is_buy else (bid_it != self._bid_book.rend())):
+            if is_buy:
+                entry = deref(ask_it)
+                inc(ask_it)
+            else:
+                entry = deref(bid_it)
+                inc(bid_it)
+            cumulative_volume += entry.getAmount()
+            while query_index < queries.size() and cumulative_volume >= queries[query_index].first:
+                position = queries[query_index].second
+                results[position] = OrderBookQueryResult(NaN, volumes[position], entry.getPrice(),
+                                                         min(cumulative_volume, volumes[position]))
+                query_index += 1
+
+        while query_index < queries.size():
+            position = queries[query_index].second
+            results[position] = OrderBookQueryResult(NaN, volumes[position], NaN,
+                                                     min(cumulative_volume, volumes[position]))
+            query_index += 1
+
+        return results
+
+    cdef list c_get_vwap_for_volumes(self, bint is_buy, vector[double] volumes):
+        """
+        Answers several c_get_vwap_for_volume() queries with a single walk over the book.
+        Results are returned in the same order as the queried volumes.
+        """
+        cdef:
+            vector[pair[double, size_t]] queries = c_sorted_queries(volumes, 1.0)
+            size_t query_index = 0
+            size_t position
+            double total_cost = 0
+            double total_volume = 0
+            double level_cost
+            double query_cost
+            double query_volume
+            double incremental_amount
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            OrderBookEntry entry
+            list results = [None] * volumes.size()
+
+        while query_index < queries.size() and \
+                ((ask_it != self._ask_book.end()) if is_buy else (bid_it != self._bid_book.rend())):
+            if is_buy:
+                entry = deref(ask_it)
+                inc(ask_it)
+            else:
+                entry = deref(bid_it)
+                inc(bid_it)
+            level_cost = entry.getAmount() * entry.getPrice()
+            total_cost += level_cost
+            total_volume += entry.getAmount()
+            while query_index < queries.size() and total_volume >= queries[query_index].first:
+                # Same arithmetic as c_get_vwap_for_volume(), so the batched results are identical.
+                position = queries[query_index].second
+                query_cost = total_cost - level_cost
+                query_volume = total_volume - entry.getAmount()
+                incremental_amount = volumes[position] - query_volume
+                query_cost += incremental_amount * entry.getPrice()
+                query_volume += incremental_amount
+                results[position] = OrderBookQueryResult(NaN, volumes[position], query_cost / query_volume,
+                                                         min(query_volume, volumes[position]))
+                query_index += 1
+
+        while query_index < queries.size():
+            position = queries[query_index].second
+            results[position] = OrderBookQueryResult(NaN, volumes[position], NaN,
+                                                     min(total_volume, volumes[position]))
+            query_index += 1
+
+        return results
+
+    cdef list c_get_volume_for_prices(self, bint is_buy, vector[double] prices):
+        """
+        Answers several c_get_volume_for_price() queries with a single walk over the book.
+        Results are returned in the same order as the queried prices.
+        """
+        cdef:
+            # Asks are walked upwards and bids downwards, so the queried prices are sorted in walking order.
+            vector[pair[double, size_t]] queries = c_sorted_queries(prices, 1.0 if is_buy else -1.0)
+            size_t query_index = 0
+            size_t position
+            double cumulative_volume = 0
+            double result_price = NaN
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            OrderBookEntry entry
+            list results = [None] * prices.size()
+
+        while query_index < queries.size() and \
+                ((ask_it != self._ask_book.end()) if is_buy else (bid_it != self._bid_book.rend())):
+            if is_buy:
+                entry = deref(ask_it)
+                inc(ask_it)
+            else:
+                entry = deref(bid_it)
+                inc(bid_it)
+            while query_index < queries.size() and \
+                    ((entry.getPrice() > prices[queries[query_index].second]) if is_buy
+                     else (entry.getPrice() < prices[queries[query_index].second])):
+                position = queries[query_index].second
+                results[position] = OrderBookQueryResult(prices[position], NaN, result_price, cumulative_volume)
+                query_index += 1
+            cumulative_volume += entry.getAmount()
+            result_price = entry.getPrice()
+
+        while query_index < queries.size():
+            position = queries[query_index].second
+            results[position] = OrderBookQueryResult(prices[position], NaN, result_price, cumulative_volume)
+            query_index += 1
+
+        return results
+
     def get_price_for_volume(self, is_buy: bool, volume: float) -> OrderBookQueryResult:
         return self.c_get_price_for_volume(is_buy, volume)
 
@@ -476,6 +729,15 @@ cdef class OrderBook(PubSub):
     def get_quote_volume_for_price(self, is_buy: bool, price: float) -> OrderBookQueryResult:
         return self.c_get_quote_volume_for_price(is_buy, price)
 
+    def get_price_for_volumes(self, is_buy: bool, volumes: List[float]) -> List[OrderBookQueryResult]:
+        return self.c_get_price_for_volumes(is_buy, volumes)
+
+    def get_vwap_for_volumes(self, is_buy: bool, volumes: List[float]) -> List[OrderBookQueryResult]:
+        return self.c_get_vwap_for_volumes(is_buy, volumes)
+
+    def get_volume_for_prices(self, is_buy: bool, prices: List[float]) -> List[OrderBookQueryResult]:
+        return self.c_get_volume_for_prices(is_buy, prices)
+
     @classmethod
     def snapshot_message_from_kafka(cls, record: ConsumerRecord, metadata: Optional[Dict] = None) -> OrderBookMessage:
         pass
@@ -487,6 +749,6 @@ cdef class OrderBook(PubSub):
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.apply_snapshot_message(snapshot)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_diff_message(diff)
@@ -1,8 +1,10 @@
 from collections import namedtuple
 from enum import Enum
-from functools import total_ordering
+from functools import cached_property, total_ordering
 from typing import Dict, List, Optional
 
+import numpy as np
+
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
 
@@ -64,6 +66,35 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
             OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
         ]
 
+    @cached_property
+    def asks_array(self) -> np.ndarray:
+        """
+        The asks as a (rows, 2) float64 array of [price, amount], parsed once and cached on the message. The update id
+        is left out, since a double can't hold every int64 id (e.g. nanosecond timestamps), and is the update_id of
+        the message.
+        """
+        return self._entries_array("asks")
+
+    @cached_property
+    def bids_array(self) -> np.ndarray:
+        """
+        The bids as a (rows, 2) float64 array of [price, amount], parsed once and cached on the message.
+        """
+        return self._entries_array("bids")
+
+    def _entries_array(self, side: str) -> np.ndarray:
+        if getattr(type(self), side) is not getattr(OrderBookMessage, side):
+            # Messages with their own content layout only know how to build their rows.
+            rows: List[OrderBookRow] = getattr(self, side)
+            return np.array([[row.price, row.amount] for row in rows], dtype=np.float64).reshape(-1, 2)
+        raw_entries: List[list] = self.content[side]
+        if len(raw_entries) == 0:
+            return np.empty((0, 2), dtype=np.float64)
+        try:
+            return np.array(raw_entries, dtype=np.float64)[:, :2]
+        except (TypeError, ValueError, IndexError):
+            return np.array([[price, amount] for price, amount, *trash in raw_entries], dtype=np.float64)
+
     @property
     def has_update_id(self) -> bool:
         return self.type in {OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT}
@@ -0,0 +1,132 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+
+@dataclass
+class OrderBookQueueStats:
+    """
+    Backlog of the order book messages of a trading pair, waiting to be applied to its order book.
+    :param queue_depth: Number of messages queued
+    :param lag: Seconds since the oldest queued message was received
+    :param collapsed_diffs: Number of diff messages merged into net diffs since the queue was created
+    :param resnapshots: Number of times the queued messages were dropped in favour of a fresh snapshot
+    """
+    queue_depth: int
+    lag: float
+    collapsed_diffs: int = 0
+    resnapshots: int = 0
+
+
+class OrderBookMessageQueue(asyncio.Queue):
+    """
+    Bounded queue of the order book messages of a single trading pair.
+
+    Putting a message never blocks the producer. When the queue is full, the queued diffs are collapsed into a net
+    diff (each price level keeps its latest amount, which is what applying the diffs one by one would leave in the
+    book). Messages that cannot be merged are dropped instead, and a fresh snapshot is requested.
+    """
+
+    def __init__(self, maxsize: int, request_snapshot: Callable[[], None]):
+        super().__init__(maxsize=maxsize)
+        self._request_snapshot: Callable[[], None] = request_snapshot
+        self._received_at: Deque[float] = deque()
+        self._collapsed_diffs: int = 0
+        self._resnapshots: int = 0
+
+    @property
+    def lag(self) -> float:
+        return time.perf_counter() - self._received_at[0] if len(self._received_at) > 0 else 0.0
+
+    @property
+    def stats(self) -> OrderBookQueueStats:
+        return OrderBookQueueStats(queue_depth=self.qsize(),
+                                   lag=self.lag,
+                                   collapsed_diffs=self._collapsed_diffs,
+                                   resnapshots=self._resnapshots)
+
+    def put_nowait(self, item: OrderBookMessage):
+        if self.full():
+            self._relieve_backlog()
+        super().put_nowait(item)
+
+    async def put(self, item: OrderBookMessage):
+        self.put_nowait(item)
+
+    def _put(self, item: OrderBookMessage):
+        super()._put(item)
+        self._received_at.append(time.perf_counter())
+
+    def _get(self) -> OrderBookMessage:
+        self._received_at.popleft()
+        return super()._get()
+
+    def _relieve_backlog(self):
+        queued: List[Tuple[OrderBookMessage, float]] = list(zip(self._queue, self._received_at))
+        collapsed: Optional[List[Tuple[OrderBookMessage, float]]] = self.collapse_messages(queued)
+        self._queue.clear()
+        self._received_at.clear()
+        if collapsed is None:
+            self._resnapshots += 1
+            self._request_snapshot()
+        else:
+            self._collapsed_diffs += len(queued) - len(collapsed)
+            for message, received_at in collapsed:
+                self._queue.append(message)
+                self._received_at.append(received_at)
+
+    @classmethod
+    def collapse_messages(
+            cls, queued: List[Tuple[OrderBookMessage, float]]) -> Optional[List[Tuple[OrderBookMessage, float]]]:
+        """
+        Collapses a backlog of messages, along with the time each one was received, into at most a net diff, the
+        latest snapshot and a net diff of the messages that came after it. The earlier snapshots are superseded by the
+        latest one.
+        :return: the collapsed backlog, or None if it holds messages that cannot be merged
+        """
+        mergeable_types = (OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT)
+        if any(type(message) is not OrderBookMessage or message.type not in mergeable_types
+               for message, _ in queued):
+            return None
+        last_snapshot_index: int = max((index for index, (message, _) in enumerate(queued)
+                                        if message.type is OrderBookMessageType.SNAPSHOT), default=-1)
+        collapsed: List[Tuple[OrderBookMessage, float]] = []
+        diffs_before: List[Tuple[OrderBookMessage, float]] = [
+            (message, received_at) for message, received_at in queued[:max(last_snapshot_index, 0)]
+            if message.type is OrderBookMessageType.DIFF
+        ]
+        if len(diffs_before) > 0:
+            collapsed.append(cls._net_diff(diffs_before))
+        if last_snapshot_index >= 0:
+            collapsed.append(queued[last_snapshot_index])
+        diffs_after: List[Tuple[OrderBookMessage, float]] = queued[last_snapshot_index + 1:]
+        if len(diffs_after) > 0:
+            collapsed.append(cls._net_diff(diffs_after))
+        return collapsed
+
+    @staticmethod
+    def _net_diff(diffs: List[Tuple[OrderBookMessage, float]]) -> Tuple[OrderBookMessage, float]:
+        first_diff, first_received_at = diffs[0]
+        last_diff, _ = diffs[-1]
+        bids: Dict[float, list] = {}
+        asks: Dict[float, list] = {}
+        for diff, _ in diffs:
+            for price, amount, *_ in diff.content["bids"]:
+                bids[float(price)] = [price, amount]
+            for price, amount, *_ in diff.content["asks"]:
+                asks[float(price)] = [price, amount]
+        net_diff: OrderBookMessage = OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {
+                "trading_pair": last_diff.trading_pair,
+                "first_update_id": first_diff.first_update_id,
+                "update_id": last_diff.update_id,
+                "bids": list(bids.values()),
+                "asks": list(asks.values()),
+            },
+            timestamp=last_diff.timestamp)
+        return net_diff, first_received_at
@@ -2,17 +2,22 @@ import asyncio
 import logging
 import time
 from collections import defaultdict, deque
+from collections.abc import Mapping as MappingABC
+from dataclasses import dataclass
 from enum import Enum
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import Callable, Deque, Dict, Iterator, List, Mapping, Optional, Tuple
 
 import pandas as pd
 
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_message_queue import OrderBookMessageQueue, OrderBookQueueStats
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
-from hummingbot.core.event.events import OrderBookTradeEvent
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.event.events import OrderBookEvent, OrderBookTradeEvent, OrderBookUpdateEvent
+from hummingbot.core.instrumentation.instrumentation import ORDER_BOOK_UPDATE_LATENCY, Instrumentation
+from hummingbot.core.instrumentation.latency_histogram import LatencyHistogram
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 
 
@@ -21,8 +26,63 @@ class OrderBookTrackerDataSourceType(Enum):
     EXCHANGE_API = 3
 
 
+@dataclass
+class OrderBookSyncStats:
+    """
+    Continuity of the diff sequence of a trading pair, for the data sources with sequenced diffs.
+    :param gaps: Number of gaps found between consecutive diffs
+    :param resyncs: Number of times the order book was rebuilt from a snapshot and the diffs buffered after a gap
+    :param out_of_sync_time: Seconds spent waiting for a resync, including the ongoing one
+    """
+    gaps: int = 0
+    resyncs: int = 0
+    out_of_sync_time: float = 0.0
+
+
+class OrderBookSnapshots(MappingABC):
+    """
+    Read-only view of the order book snapshots of a tracker. Each snapshot is only built when its trading pair is
+    looked up, and is limited to the best `depth` levels of each side when a depth is given.
+    """
+
+    def __init__(self, order_books: Dict[str, OrderBook], depth: Optional[int] = None):
+        self._order_books: Dict[str, OrderBook] = order_books
+        self._depth: Optional[int] = depth
+
+    def __getitem__(self, trading_pair: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        return self._order_books[trading_pair].get_snapshot(self._depth)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._order_books)
+
+    def __len__(self) -> int:
+        return len(self._order_books)
+
+
+class OrderBookDiffRouter:
+    """
+    Queue-like output handed to the data sources in place of the diff stream, routing each diff message straight to
+    the queue of its trading pair.
+    """
+
+    def __init__(self, route: Callable[[OrderBookMessage], None]):
+        self._route: Callable[[OrderBookMessage], None] = route
+
+    def put_nowait(self, message: OrderBookMessage):
+        self._route(message)
+
+    async def put(self, message: OrderBookMessage):
+        self._route(message)
+
+
 class OrderBookTracker():
     PAST_DIFF_WINDOW_SIZE: int = 32
+    # Snapshot requests in flight at once, for the data sources whose snapshot requests are throttled
+    MAX_CONCURRENT_SNAPSHOT_REQUESTS: int = 10
+    # Pause after each snapshot request of the data sources without a throttler, which request them one at a time
+    SNAPSHOT_REQUEST_INTERVAL: float = 1.0
+    # Messages queued for a trading pair before its backlog is collapsed (or replaced with a fresh snapshot)
+    MAX_MESSAGE_QUEUE_SIZE: int = 1000
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -36,6 +96,7 @@ class OrderBookTracker():
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._order_book_ready_events: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
@@ -45,6 +106,14 @@ class OrderBookTracker():
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._resnapshot_tasks: Dict[str, asyncio.Task] = {}
+        self._sync_stats: Dict[str, OrderBookSyncStats] = defaultdict(OrderBookSyncStats)
+        self._out_of_sync_diffs: Dict[str, Deque[OrderBookMessage]] = {}
+        self._out_of_sync_since: Dict[str, float] = {}
+        self._diff_messages_queued: int = 0
+        self._diff_messages_accepted: int = 0
+        self._diff_messages_rejected: int = 0
+        self._last_diff_message_timestamp: float = time.time()
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -68,6 +137,46 @@ class OrderBookTracker():
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    def order_book_ready(self, trading_pair: str) -> bool:
+        """
+        :return: True if the order book of the trading pair is initialized, even if others are not yet
+        """
+        return self._order_book_ready_events[trading_pair].is_set()
+
+    async def wait_for_order_book(self, trading_pair: str) -> OrderBook:
+        """
+        Waits for the order book of the trading pair to be initialized, without waiting for the other trading pairs.
+        """
+        await self._order_book_ready_events[trading_pair].wait()
+        return self._order_books[trading_pair]
+
+    @property
+    def queue_stats(self) -> Dict[str, OrderBookQueueStats]:
+        """
+        Backlog of messages of each tracked trading pair. The lag is only measured for the bounded queues created by
+        this class, and is NaN for the ones created by subclasses.
+        """
+        return {
+            trading_pair: (queue.stats if isinstance(queue, OrderBookMessageQueue)
+                           else OrderBookQueueStats(queue_depth=queue.qsize(), lag=float("nan")))
+            for trading_pair, queue in self._tracking_message_queues.items()
+        }
+
+    @property
+    def sync_stats(self) -> Dict[str, OrderBookSyncStats]:
+        """
+        Gaps and resyncs of the diff sequence of each trading pair. Only tracked when the data source has sequenced
+        diffs.
+        """
+        now: float = time.perf_counter()
+        return {
+            trading_pair: OrderBookSyncStats(
+                gaps=stats.gaps,
+                resyncs=stats.resyncs,
+                out_of_sync_time=stats.out_of_sync_time + now - self._out_of_sync_since.get(trading_pair, now))
+            for trading_pair, stats in self._sync_stats.items()
+        }
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -75,6 +184,13 @@ class OrderBookTracker():
             for trading_pair, order_book in self._order_books.items()
         }
 
+    def get_snapshots(self, depth: Optional[int] = None) -> Mapping[str, Tuple[pd.DataFrame, pd.DataFrame]]:
+        """
+        Lazy alternative to the snapshot property: books are only copied when their trading pair is accessed, and
+        only up to `depth` levels per side.
+        """
+        return OrderBookSnapshots(self._order_books, depth)
+
     def start(self):
         self.stop()
         self._init_order_books_task = safe_ensure_future(
@@ -83,8 +199,16 @@ class OrderBookTracker():
         self._emit_trade_event_task = safe_ensure_future(
             self._emit_trade_event_loop()
         )
+        if type(self)._order_book_diff_router is OrderBookTracker._order_book_diff_router:
+            # Diffs skip the shared stream, unless a subclass routes them its own way
+            diff_output = OrderBookDiffRouter(self._route_diff_message)
+        else:
+            diff_output = self._order_book_diff_stream
+            self._order_book_diff_router_task = safe_ensure_future(
+                self._order_book_diff_router()
+            )
         self._order_book_diff_listener_task = safe_ensure_future(
-            self._data_source.listen_for_order_book_diffs(self._ev_loop, self._order_book_diff_stream)
+            self._data_source.listen_for_order_book_diffs(self._ev_loop, diff_output)
         )
         self._order_book_trade_listener_task = safe_ensure_future(
             self._data_source.listen_for_trades(self._ev_loop, self._order_book_trade_stream)
@@ -95,9 +219,6 @@ class OrderBookTracker():
         self._order_book_stream_listener_task = safe_ensure_future(
             self._data_source.listen_for_subscriptions()
         )
-        self._order_book_diff_router_task = safe_ensure_future(
-            self._order_book_diff_router()
-        )
         self._order_book_snapshot_router_task = safe_ensure_future(
             self._order_book_snapshot_router()
         )
@@ -137,7 +258,15 @@ class OrderBookTracker():
             for _, task in self._tracking_tasks.items():
                 task.cancel()
             self._tracking_tasks.clear()
+        for task in self._resnapshot_tasks.values():
+            task.cancel()
+        self._resnapshot_tasks.clear()
+        for trading_pair in list(self._out_of_sync_since):
+            self._end_out_of_sync(trading_pair)
+        self._out_of_sync_diffs.clear()
         self._order_books_initialized.clear()
+        for ready_event in self._order_book_ready_events.values():
+            ready_event.clear()
 
     async def _update_last_trade_prices_loop(self):
         '''
@@ -171,56 +300,110 @@ class OrderBookTracker():
 
     async def _init_order_books(self):
         """
-        Initialize order books
+        Initialize order books, each order book being tracked as soon as its snapshot arrives. The snapshots are
+        requested concurrently if the data source throttles them, and one at a time with a pause between them if not.
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await asyncio.sleep(1)
+        start_time: float = time.perf_counter()
+        throttled: bool = self._data_source.THROTTLED_SNAPSHOTS
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SNAPSHOT_REQUESTS if throttled else 1)
+        initialized_trading_pairs: List[str] = []
+
+        async def init_order_book(trading_pair: str):
+            async with semaphore:
+                order_book: OrderBook = await self._initial_order_book_with_retries(trading_pair)
+                self._order_books[trading_pair] = order_book
+                self._tracking_message_queues[trading_pair] = OrderBookMessageQueue(
+                    maxsize=self.MAX_MESSAGE_QUEUE_SIZE,
+                    request_snapshot=lambda: self._request_resnapshot(trading_pair))
+                self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+                self._order_book_ready_events[trading_pair].set()
+                initialized_trading_pairs.append(trading_pair)
+                self.logger().info(f"Initialized order book for {trading_pair}. "
+                                   f"{len(initialized_trading_pairs)}/{len(self._trading_pairs)} completed.")
+                if not throttled:
+                    await asyncio.sleep(self.SNAPSHOT_REQUEST_INTERVAL)
+
+        await safe_gather(*[init_order_book(trading_pair) for trading_pair in self._trading_pairs])
         self._order_books_initialized.set()
+        self.logger().info(f"Initialized {len(self._trading_pairs)} order books in "
+                           f"{time.perf_counter() - start_time:.2f} seconds.")
 
-    async def _order_book_diff_router(self):
-        """
-        Routes the real-time order book diff messages to the correct order book.
-        """
-        last_message_timestamp: float = time.time()
-        messages_queued: int = 0
-        messages_accepted: int = 0
-        messages_rejected: int = 0
-
+    async def _initial_order_book_with_retries(self, trading_pair: str) -> OrderBook:
         while True:
             try:
-                ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
-                trading_pair: str = ob_message.trading_pair
+                return await self._initial_order_book_for_trading_pair(trading_pair)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error initializing the order book for {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg=f"Could not initialize the order book for {trading_pair}. "
+                                    f"Retrying after 5 seconds."
+                )
+                await asyncio.sleep(5.0)
 
-                if trading_pair not in self._tracking_message_queues:
-                    messages_queued += 1
-                    # Save diff messages received before snapshots are ready
-                    self._saved_message_queues[trading_pair].append(ob_message)
-                    continue
-                message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-                # Check the order book's initial update ID. If it's larger, don't bother.
-                order_book: OrderBook = self._order_books[trading_pair]
+    def _request_resnapshot(self, trading_pair: str, reason: str = "fell behind its updates"):
+        """
+        Fetches a fresh snapshot for a trading pair whose queued messages were dropped (or that missed some diffs), and
+        queues it. Requests made while a snapshot is already being fetched are ignored.
+        """
+        task: Optional[asyncio.Task] = self._resnapshot_tasks.get(trading_pair)
+        if task is None or task.done():
+            self._resnapshot_tasks[trading_pair] = safe_ensure_future(self._resnapshot(trading_pair, reason))
+
+    async def _resnapshot(self, trading_pair: str, reason: str):
+        self.logger().warning(f"The order book of {trading_pair} {reason}. Requesting a new snapshot.")
+        order_book: OrderBook = await self._initial_order_book_with_retries(trading_pair)
+        snapshot_message: OrderBookMessage = OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {
+                "trading_pair": trading_pair,
+                "update_id": order_book.snapshot_uid,
+                "bids": [[row.price, row.amount] for row in order_book.bid_entries()],
+                "asks": [[row.price, row.amount] for row in order_book.ask_entries()],
+            },
+            timestamp=time.time())
+        self._tracking_message_queues[trading_pair].put_nowait(snapshot_message)
+
+    def _route_diff_message(self, ob_message: OrderBookMessage):
+        """
+        Routes a real-time order book diff message to the queue of its order book.
+        """
+        trading_pair: str = ob_message.trading_pair
+
+        if trading_pair not in self._tracking_message_queues:
+            self._diff_messages_queued += 1
+            # Save diff messages received before snapshots are ready
+            self._saved_message_queues[trading_pair].append(ob_message)
+            return
+        # Check the order book's initial update ID. If it's larger, don't bother.
+        order_book: OrderBook = self._order_books[trading_pair]
 
-                if order_book.snapshot_uid > ob_message.update_id:
-                    messages_rejected += 1
-                    continue
-                await message_queue.put(ob_message)
-                messages_accepted += 1
+        if order_book.snapshot_uid > ob_message.update_id:
+            self._diff_messages_rejected += 1
+            return
+        self._tracking_message_queues[trading_pair].put_nowait(ob_message)
+        self._diff_messages_accepted += 1
 
-                # Log some statistics.
-                now: float = time.time()
-                if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                    self.logger().debug(f"Diff messages processed: {messages_accepted}, "
-                                        f"rejected: {messages_rejected}, queued: {messages_queued}")
-                    messages_accepted = 0
-                    messages_rejected = 0
-                    messages_queued = 0
+        # Log some statistics.
+        now: float = time.time()
+        if int(now / 60.0) > int(self._last_diff_message_timestamp / 60.0):
+            self.logger().debug(f"Diff messages processed: {self._diff_messages_accepted}, "
+                                f"rejected: {self._diff_messages_rejected}, queued: {self._diff_messages_queued}")
+            self._diff_messages_accepted = 0
+            self._diff_messages_rejected = 0
+            self._diff_messages_queued = 0
 
-                last_message_timestamp = now
+        self._last_diff_message_timestamp = now
+
+    async def _order_book_diff_router(self):
+        """
+        Routes the real-time order book diff messages of the shared diff stream to the correct order book.
+        """
+        while True:
+            try:
+                self._route_diff_message(await self._order_book_diff_stream.get())
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -250,6 +433,35 @@ class OrderBookTracker():
                 self.logger().error("Unknown error. Retrying after 5 seconds.", exc_info=True)
                 await asyncio.sleep(5.0)
 
+    def _start_out_of_sync(self, trading_pair: str, diff: OrderBookMessage, last_update_id: int):
+        """
+        Buffers the diffs of a trading pair from the first one after a gap, until a snapshot resyncs its order book.
+        """
+        self._sync_stats[trading_pair].gaps += 1
+        self._out_of_sync_since[trading_pair] = time.perf_counter()
+        self._out_of_sync_diffs[trading_pair] = deque([diff], maxlen=self.MAX_MESSAGE_QUEUE_SIZE)
+        self._request_resnapshot(
+            trading_pair, f"missed the diffs {last_update_id + 1} to {diff.first_update_id - 1}")
+
+    def _end_out_of_sync(self, trading_pair: str):
+        self._sync_stats[trading_pair].out_of_sync_time += (time.perf_counter()
+                                                            - self._out_of_sync_since.pop(trading_pair))
+        self._out_of_sync_diffs.pop(trading_pair, None)
+
+    @staticmethod
+    def _diffs_following_snapshot(snapshot: OrderBookMessage,
+                                  diffs: List[OrderBookMessage]) -> Optional[List[OrderBookMessage]]:
+        """
+        :return: the diffs more recent than the snapshot, or None if they do not continue it without a gap
+        """
+        following_diffs: List[OrderBookMessage] = [diff for diff in diffs if diff.update_id > snapshot.update_id]
+        expected_update_id: int = snapshot.update_id + 1
+        for diff in following_diffs:
+            if diff.first_update_id > expected_update_id:
+                return None
+            expected_update_id = diff.update_id + 1
+        return following_diffs
+
     async def _track_single_book(self, trading_pair: str):
         past_diffs_window = self._past_diffs_windows[trading_pair]
 
@@ -257,6 +469,11 @@ class OrderBookTracker():
         order_book: OrderBook = self._order_books[trading_pair]
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
+        # With sequenced diffs, each diff must start right after the last update applied to the order book
+        sequenced_diffs: bool = self._data_source.SEQUENCED_DIFFS
+        last_update_id: int = order_book.snapshot_uid
+        update_latency: LatencyHistogram = Instrumentation.get_instance().histogram(
+            ORDER_BOOK_UPDATE_LATENCY, type(self._data_source).__name__, trading_pair)
 
         while True:
             try:
@@ -269,19 +486,50 @@ class OrderBookTracker():
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                    if sequenced_diffs:
+                        if trading_pair in self._out_of_sync_diffs:
+                            self._out_of_sync_diffs[trading_pair].append(message)
+                            continue
+                        if message.update_id <= last_update_id:
+                            # Already part of the order book
+                            continue
+                        if message.first_update_id > last_update_id + 1:
+                            self._start_out_of_sync(trading_pair, message, last_update_id)
+                            continue
+                    order_book.apply_diff_message(message)
+                    last_update_id = message.update_id
+                    order_book.trigger_event(OrderBookEvent.UpdateEvent,
+                                             OrderBookUpdateEvent(trading_pair, message.update_id))
                     past_diffs_window.append(message)
                     diff_messages_accepted += 1
 
-                    # Output some statistics periodically.
                     now: float = time.time()
+                    # Skips the diffs timestamped after now, by an exchange clock ahead of the local one (or in
+                    # milliseconds)
+                    if now >= message.timestamp:
+                        update_latency.record(now - message.timestamp)
+
+                    # Output some statistics periodically.
                     if int(now / 60.0) > int(last_message_timestamp / 60.0):
                         self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair}.")
                         diff_messages_accepted = 0
                     last_message_timestamp = now
                 elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[OrderBookMessage] = list(past_diffs_window)
+                    if trading_pair in self._out_of_sync_diffs:
+                        past_diffs: Optional[List[OrderBookMessage]] = self._diffs_following_snapshot(
+                            message, list(self._out_of_sync_diffs[trading_pair]))
+                        if past_diffs is None:
+                            self._request_resnapshot(trading_pair, "received a snapshot older than its buffered diffs")
+                            continue
+                        self._sync_stats[trading_pair].resyncs += 1
+                        self._end_out_of_sync(trading_pair)
+                        past_diffs_window.extend(past_diffs)
+                    else:
+                        past_diffs = list(past_diffs_window)
                     order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                    last_update_id = max([message.update_id] + [diff.update_id for diff in past_diffs])
+                    order_book.trigger_event(OrderBookEvent.UpdateEvent,
+                                             OrderBookUpdateEvent(trading_pair, order_book.last_diff_uid))
                     self.logger().debug(f"Processed order book snapshot for {trading_pair}.")
             except asyncio.CancelledError:
                 raise
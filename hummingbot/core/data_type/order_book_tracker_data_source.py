@@ -13,6 +13,12 @@ from hummingbot.logger import HummingbotLogger
 
 class OrderBookTrackerDataSource(metaclass=ABCMeta):
     FULL_ORDER_BOOK_RESET_DELTA_SECONDS = 60 * 60
+    # True if each diff message starts (first_update_id) right after the update id of the previous one, so the order
+    # book tracker can detect the missing diffs and resync the order book
+    SEQUENCED_DIFFS = False
+    # True if the order book snapshot requests go through the connector throttler, so the order book tracker can send
+    # them concurrently and leave the pacing to the rate limits
+    THROTTLED_SNAPSHOTS = False
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -34,6 +34,7 @@ class MarketEvent(Enum):
 
 class OrderBookEvent(int, Enum):
     TradeEvent = 901
+    UpdateEvent = 902
 
 
 class TokenApprovalEvent(Enum):
@@ -144,6 +145,11 @@ class OrderBookTradeEvent(NamedTuple):
     amount: Decimal
 
 
+class OrderBookUpdateEvent(NamedTuple):
+    trading_pair: str
+    update_id: int
+
+
 class OrderFilledEvent(NamedTuple):
     timestamp: float
     order_id: str
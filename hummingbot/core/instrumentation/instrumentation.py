@@ -0,0 +1,126 @@
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from hummingbot.core.instrumentation.latency_histogram import LatencyHistogram
+
+
+@dataclass(frozen=True)
+class LatencyMetric:
+    """
+    A latency measured at a point of the trading loop, with a histogram per combination of its label values.
+    :param name: Name of the metric, also the name of the Prometheus summary (with a `hummingbot_` prefix and a
+        `_seconds` suffix)
+    :param description: What is measured
+    :param label_names: Names of the labels the latencies are split by
+    """
+    name: str
+    description: str
+    label_names: Tuple[str, ...] = ()
+
+
+EVENT_LOOP_LAG = LatencyMetric(
+    name="event_loop_lag",
+    description="Delay of the clock ticks past their scheduled time")
+TICK_DURATION = LatencyMetric(
+    name="tick_duration",
+    description="Time spent in the tick of each clock iterator",
+    label_names=("iterator",))
+ORDER_BOOK_UPDATE_LATENCY = LatencyMetric(
+    name="order_book_update_latency",
+    description="Time from the timestamp of an order book diff to its application to the order book",
+    label_names=("data_source", "trading_pair"))
+ORDER_ROUND_TRIP = LatencyMetric(
+    name="order_round_trip",
+    description="Time from the start of the tracking of an order to the first update of its state by the exchange",
+    label_names=("connector",))
+THROTTLER_WAIT = LatencyMetric(
+    name="throttler_wait",
+    description="Time the API requests waited for rate limit capacity, by request priority lane",
+    label_names=("lane",))
+
+LATENCY_METRICS: List[LatencyMetric] = [
+    EVENT_LOOP_LAG, TICK_DURATION, ORDER_BOOK_UPDATE_LATENCY, ORDER_ROUND_TRIP, THROTTLER_WAIT,
+]
+# Percentiles reported by the instrumentation command and exported as Prometheus quantiles
+REPORTED_PERCENTILES: List[float] = [50, 90, 99, 99.9]
+
+
+class Instrumentation:
+    """
+    Registry of the latency histograms of the process. The instrumented code gets the histogram of a metric and label
+    values once, and records its latencies in it directly.
+    """
+    _shared_instance: Optional["Instrumentation"] = None
+
+    @classmethod
+    def get_instance(cls) -> "Instrumentation":
+        if cls._shared_instance is None:
+            cls._shared_instance = Instrumentation()
+        return cls._shared_instance
+
+    def __init__(self):
+        self._histograms: Dict[LatencyMetric, Dict[Tuple[str, ...], LatencyHistogram]] = {
+            metric: {} for metric in LATENCY_METRICS
+        }
+
+    def histogram(self, metric: LatencyMetric, *label_values: str) -> LatencyHistogram:
+        """
+        :param metric: the latency metric
+        :param label_values: the values of the labels of the metric, in the order of its label names
+        :return: the histogram of the metric for the label values, created when first requested
+        """
+        if len(label_values) != len(metric.label_names):
+            raise ValueError(f"The {metric.name} metric has the labels {metric.label_names}, got {label_values}.")
+        metric_histograms = self._histograms.setdefault(metric, {})
+        histogram = metric_histograms.get(label_values)
+        if histogram is None:
+            histogram = metric_histograms[label_values] = LatencyHistogram()
+        return histogram
+
+    def histograms(self) -> List[Tuple[LatencyMetric, Tuple[str, ...], LatencyHistogram]]:
+        """
+        :return: the histograms with recorded latencies, with their metric and label values, by metric and labels
+        """
+        return [(metric, label_values, histogram)
+                for metric, metric_histograms in self._histograms.items()
+                for label_values, histogram in sorted(metric_histograms.items())
+                if histogram.count > 0]
+
+    def reset(self):
+        """
+        Clears the recorded latencies. The histograms are kept, the instrumented code holding on to them.
+        """
+        for metric_histograms in self._histograms.values():
+            for histogram in metric_histograms.values():
+                histogram.reset()
+
+    def prometheus_text(self) -> str:
+        """
+        :return: the latencies recorded, in the Prometheus text exposition format, as a summary per metric
+        """
+        lines = []
+        for metric, metric_histograms in self._histograms.items():
+            summary_name = f"hummingbot_{metric.name}_seconds"
+            lines.append(f"# HELP {summary_name} {metric.description}.")
+            lines.append(f"# TYPE {summary_name} summary")
+            for label_values, histogram in sorted(metric_histograms.items()):
+                labels = [f'{name}="{self._escape_label_value(value)}"'
+                          for name, value in zip(metric.label_names, label_values)]
+                for percentile in REPORTED_PERCENTILES:
+                    quantile_labels = ",".join(labels + [f'quantile="{percentile / 100:g}"'])
+                    lines.append(f"{summary_name}{{{quantile_labels}}} "
+                                 f"{self._prometheus_value(histogram.percentile(percentile))}")
+                labels_text = f"{{{','.join(labels)}}}" if labels else ""
+                total = histogram.mean * histogram.count if histogram.count > 0 else 0.0
+                lines.append(f"{summary_name}_sum{labels_text} {self._prometheus_value(total)}")
+                lines.append(f"{summary_name}_count{labels_text} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _escape_label_value(value: str) -> str:
+        return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+    @staticmethod
+    def _prometheus_value(value: float) -> str:
+        return "NaN" if math.isnan(value) else repr(value)
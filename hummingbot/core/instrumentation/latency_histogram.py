@@ -0,0 +1,101 @@
+import math
+from typing import List
+
+# Durations are counted in microseconds
+MICROSECONDS_PER_SECOND = 1_000_000
+# The durations below 2 ** SUB_BUCKET_BITS microseconds are counted exactly. Above, each power of 2 is divided into
+# 2 ** (SUB_BUCKET_BITS - 1) buckets, which bounds the error on the reported durations to 1 / 64 of their value.
+SUB_BUCKET_BITS = 7
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+SUB_BUCKET_HALF_COUNT = SUB_BUCKET_COUNT >> 1
+# Longest duration counted, the longer ones being counted as this one
+HIGHEST_TRACKABLE_SECONDS = 3600.0
+
+
+class LatencyHistogram:
+    """
+    Distribution of durations, with the bucket layout of an HDR histogram: a bucket per microsecond for the shortest
+    durations, then a fixed number of buckets per power of 2, so that the relative error of the percentiles is the
+    same from microseconds to an hour. Recording a duration is a few integer operations and a list increment, and
+    the memory used does not depend on the number of durations recorded.
+
+    The count, mean and maximum are exact, the percentiles are the highest duration of their bucket.
+    """
+
+    def __init__(self, highest_trackable_seconds: float = HIGHEST_TRACKABLE_SECONDS):
+        self._highest_trackable_value: int = int(highest_trackable_seconds * MICROSECONDS_PER_SECOND)
+        self._counts: List[int] = [0] * (self._bucket_index(self._highest_trackable_value) + 1)
+        self._count: int = 0
+        self._total: int = 0
+        self._max: int = 0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        """
+        Mean of the durations recorded in seconds, NaN if none was
+        """
+        return self._total / self._count / MICROSECONDS_PER_SECOND if self._count > 0 else math.nan
+
+    @property
+    def max(self) -> float:
+        """
+        Longest duration recorded in seconds, NaN if none was
+        """
+        return self._max / MICROSECONDS_PER_SECOND if self._count > 0 else math.nan
+
+    def record(self, seconds: float):
+        """
+        Counts a duration, the negative ones as 0 and the ones longer than the highest trackable one as this one.
+        :param seconds: the duration in seconds
+        """
+        value = int(seconds * MICROSECONDS_PER_SECOND)
+        if value < 0:
+            value = 0
+        elif value > self._highest_trackable_value:
+            value = self._highest_trackable_value
+        self._counts[self._bucket_index(value)] += 1
+        self._count += 1
+        self._total += value
+        if value > self._max:
+            self._max = value
+
+    def percentile(self, percentile: float) -> float:
+        """
+        :param percentile: the percentile, from 0 to 100
+        :return: the duration in seconds that the given percentage of the recorded durations do not exceed, NaN if
+        none was recorded
+        """
+        if self._count == 0:
+            return math.nan
+        rank = max(1, math.ceil(percentile / 100 * self._count))
+        cumulated = 0
+        for index, count in enumerate(self._counts):
+            cumulated += count
+            if cumulated >= rank:
+                return min(self._highest_value_in_bucket(index), self._max) / MICROSECONDS_PER_SECOND
+        return self.max
+
+    def reset(self):
+        self._counts = [0] * len(self._counts)
+        self._count = 0
+        self._total = 0
+        self._max = 0
+
+    @staticmethod
+    def _bucket_index(value: int) -> int:
+        if value < SUB_BUCKET_COUNT:
+            return value
+        shift = value.bit_length() - SUB_BUCKET_BITS
+        return SUB_BUCKET_COUNT + (shift - 1) * SUB_BUCKET_HALF_COUNT + (value >> shift) - SUB_BUCKET_HALF_COUNT
+
+    @staticmethod
+    def _highest_value_in_bucket(index: int) -> int:
+        if index < SUB_BUCKET_COUNT:
+            return index
+        shift, sub_bucket = divmod(index - SUB_BUCKET_COUNT, SUB_BUCKET_HALF_COUNT)
+        shift += 1
+        return ((sub_bucket + SUB_BUCKET_HALF_COUNT + 1) << shift) - 1
@@ -0,0 +1,52 @@
+from typing import Optional
+
+from aiohttp import web
+
+from hummingbot.core.instrumentation.instrumentation import Instrumentation
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class PrometheusEndpoint:
+    """
+    Serves the latencies of the instrumentation at `/metrics`, in the Prometheus text exposition format, on the local
+    host only.
+    """
+
+    def __init__(self, instrumentation: Instrumentation, host: str = "127.0.0.1", port: int = 9101):
+        self._instrumentation = instrumentation
+        self._host = host
+        self._port = port
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def started(self) -> bool:
+        return self._runner is not None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self._host}:{self._port}/metrics"
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/metrics", self._metrics)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, self._host, self._port)
+        try:
+            await site.start()
+        except Exception:
+            await runner.cleanup()
+            raise
+        if self._port == 0:
+            self._port = site._server.sockets[0].getsockname()[1]
+        self._runner = runner
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _metrics(self, request: web.Request) -> web.Response:
+        return web.Response(body=self._instrumentation.prometheus_text().encode("utf-8"),
+                            headers={"Content-Type": PROMETHEUS_CONTENT_TYPE})
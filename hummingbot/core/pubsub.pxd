@@ -17,11 +17,17 @@ ctypedef pair[int64_t, EventListenersCollection] EventsPair
 cdef class PubSub:
     cdef:
         Events _events
+        dict _listener_snapshots
+        dict _dead_listener_watchers
+        dict _dead_listener_reapers
+        set _events_with_dead_listeners
         object __weakref__
 
     cdef c_log_exception(self, int64_t event_tag, object arg)
     cdef c_add_listener(self, int64_t event_tag, EventListener listener)
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener)
+    cdef c_mark_dead_listeners(self, int64_t event_tag)
     cdef c_remove_dead_listeners(self, int64_t event_tag)
+    cdef tuple c_get_listener_snapshot(self, int64_t event_tag)
     cdef c_get_listeners(self, int64_t event_tag)
     cdef c_trigger_event(self, int64_t event_tag, object arg)
@@ -14,7 +14,6 @@ from cython.operator cimport(
 from libcpp.vector cimport vector
 from enum import Enum
 import logging
-import random
 from typing import List
 
 from hummingbot.logger import HummingbotLogger
@@ -24,26 +23,39 @@ from hummingbot.core.event.event_listener cimport EventListener
 class_logger = None
 
 
-cdef class PubSub:
+cdef class _DeadListenerReaper:
+    """
+    Weak reference callback, notifying a PubSub that one of the listeners of an event has been garbage collected. It
+    only holds a weak reference to the PubSub, so the listeners never keep the PubSub alive.
     """
-    PubSub with weak references. This avoids the lapsed listener problem by periodically performing GC on dead
-    event listener.
+    cdef:
+        object _pubsub_ref
+        int64_t _event_tag
 
-    Dead listener is done by calling c_remove_dead_listeners(), which checks whether the listener weak references are
-    alive or not, and removes the dead ones. Each call to c_remove_dead_listeners() takes O(n).
+    def __init__(self, PubSub pubsub, int64_t event_tag):
+        self._pubsub_ref = PyWeakref_NewRef(pubsub, None)
+        self._event_tag = event_tag
 
-    Here's how the dead listener GC is performed:
+    def __call__(self, object dead_listener_watcher):
+        cdef object pubsub = <object>PyWeakref_GetObject(self._pubsub_ref)
+        if pubsub is not None:
+            (<PubSub>pubsub).c_mark_dead_listeners(self._event_tag)
 
-    1. c_add_listener():
-       Randomly with ADD_LISTENER_GC_PROBABILITY. This assumes c_add_listener() is called frequently and so it doesn't
-       make sense to do the GC every time.
-    2. c_remove_listener():
-       Every time. This assumes c_remove_listener() is called infrequently.
-    3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
+
+cdef class PubSub:
     """
+    PubSub with weak references. This avoids the lapsed listener problem by removing the dead event listeners as
+    they get garbage collected.
 
-    ADD_LISTENER_GC_PROBABILITY = 0.005
+    Every listener is watched by a weak reference with a callback, which marks the event as having dead listeners.
+    The dead listeners are then removed by c_remove_dead_listeners(), in O(n), the next time the listeners of the
+    event are added, removed, read or triggered. Events without dead listeners skip the cleanup.
+
+    c_trigger_event() iterates over a snapshot (a tuple of the listener weak references) of the listeners of the event.
+    The snapshot is built on the first trigger after the listeners of the event change, so triggering an event costs
+    no copy of the listeners in the steady state. Since the snapshot is immutable, listeners are free to add or remove
+    listeners while the event is being dispatched; the changes apply from the next trigger.
+    """
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -52,6 +64,12 @@ cdef class PubSub:
             class_logger = logging.getLogger(__name__)
         return class_logger
 
+    def __cinit__(self):
+        self._listener_snapshots = {}
+        self._dead_listener_watchers = {}
+        self._dead_listener_reapers = {}
+        self._events_with_dead_listeners = set()
+
     def __init__(self):
         self._events = Events()
 
@@ -72,20 +90,33 @@ cdef class PubSub:
 
     cdef c_add_listener(self, int64_t event_tag, EventListener listener):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
+            EventsIterator it
             EventListenersCollection new_listeners
             EventListenersCollection *listeners_ptr
             object listener_weakref = PyWeakref_NewRef(listener, None)
             PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
+            dict watchers
+            object reaper
+        if event_tag in self._events_with_dead_listeners:
+            self.c_remove_dead_listeners(event_tag)
+        it = self._events.find(event_tag)
+        watchers = self._dead_listener_watchers.get(event_tag)
         if it != self._events.end():
             listeners_ptr = address(deref(it).second)
+            if deref(listeners_ptr).find(listener_wrapper) != deref(listeners_ptr).end():
+                return
             deref(listeners_ptr).insert(listener_wrapper)
         else:
             new_listeners.insert(listener_wrapper)
             self._events.insert(EventsPair(event_tag, new_listeners))
 
-        if random.random() < PubSub.ADD_LISTENER_GC_PROBABILITY:
-            self.c_remove_dead_listeners(event_tag)
+        if watchers is None:
+            watchers = self._dead_listener_watchers[event_tag] = {}
+        reaper = self._dead_listener_reapers.get(event_tag)
+        if reaper is None:
+            reaper = self._dead_listener_reapers[event_tag] = _DeadListenerReaper(self, event_tag)
+        watchers[listener_weakref] = PyWeakref_NewRef(listener, reaper)
+        self._listener_snapshots.pop(event_tag, None)
 
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener):
         cdef:
@@ -100,7 +131,17 @@ cdef class PubSub:
         lit = deref(listeners_ptr).find(listener_wrapper)
         if lit != deref(listeners_ptr).end():
             deref(listeners_ptr).erase(lit)
-        self.c_remove_dead_listeners(event_tag)
+            self._dead_listener_watchers[event_tag].pop(listener_weakref, None)
+            self._listener_snapshots.pop(event_tag, None)
+        if deref(listeners_ptr).size() < 1:
+            self._events.erase(it)
+            self._dead_listener_watchers.pop(event_tag, None)
+        if event_tag in self._events_with_dead_listeners:
+            self.c_remove_dead_listeners(event_tag)
+
+    cdef c_mark_dead_listeners(self, int64_t event_tag):
+        self._events_with_dead_listeners.add(event_tag)
+        self._listener_snapshots.pop(event_tag, None)
 
     cdef c_remove_dead_listeners(self, int64_t event_tag):
         cdef:
@@ -109,6 +150,9 @@ cdef class PubSub:
             object listener_weakref
             EventListenersIterator lit
             vector[EventListenersIterator] lit_to_remove
+            dict watchers = self._dead_listener_watchers.get(event_tag)
+        self._events_with_dead_listeners.discard(event_tag)
+        self._listener_snapshots.pop(event_tag, None)
         if it == self._events.end():
             return
         listeners_ptr = address(deref(it).second)
@@ -117,49 +161,60 @@ cdef class PubSub:
             listener_weakref = <object>(deref(lit).get())
             if <object>(PyWeakref_GetObject(listener_weakref)) is None:
                 lit_to_remove.push_back(lit)
+                if watchers is not None:
+                    watchers.pop(listener_weakref, None)
             inc(lit)
         for lit in lit_to_remove:
             deref(listeners_ptr).erase(lit)
         if deref(listeners_ptr).size() < 1:
             self._events.erase(it)
+            self._dead_listener_watchers.pop(event_tag, None)
 
-    cdef c_get_listeners(self, int64_t event_tag):
-        self.c_remove_dead_listeners(event_tag)
-
+    cdef tuple c_get_listener_snapshot(self, int64_t event_tag):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weafref
-            EventListener typed_listener
-
+            tuple snapshot = self._listener_snapshots.get(event_tag)
+            EventsIterator it
+            list listener_weakrefs
+        if snapshot is not None:
+            return snapshot
+        if event_tag in self._events_with_dead_listeners:
+            self.c_remove_dead_listeners(event_tag)
+        it = self._events.find(event_tag)
         if it == self._events.end():
-            return []
+            snapshot = ()
+        else:
+            listener_weakrefs = []
+            for pyref in deref(it).second:
+                listener_weakrefs.append(<object>pyref.get())
+            snapshot = tuple(listener_weakrefs)
+        self._listener_snapshots[event_tag] = snapshot
+        return snapshot
 
-        retval = []
-        listeners_ptr = address(deref(it).second)
-        for pyref in deref(listeners_ptr):
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
-            retval.append(typed_listener)
+    cdef c_get_listeners(self, int64_t event_tag):
+        cdef:
+            object listener_weakref
+            object listener
+            list retval = []
+        for listener_weakref in self.c_get_listener_snapshot(event_tag):
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            if listener is not None:
+                retval.append(listener)
         return retval
 
     cdef c_trigger_event(self, int64_t event_tag, object arg):
-        self.c_remove_dead_listeners(event_tag)
-
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection listeners
-            object listener_weafref
+            object listener_weakref
+            object listener
             EventListener typed_listener
-        if it == self._events.end():
-            return
 
-        # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
-        # c_remove_listener(), which breaks the iterator if we're using the underlying set.
-        listeners = deref(it).second
-        for pyref in listeners:
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
+        # The snapshot is never modified once built - so listeners are allowed to call c_add_listener() or
+        # c_remove_listener() while the event is being dispatched.
+        for listener_weakref in self.c_get_listener_snapshot(event_tag):
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            if listener is None:
+                # Collected since the snapshot was built; the next trigger will not see it.
+                continue
+            typed_listener = listener
             try:
                 typed_listener.c_set_event_info(event_tag, self)
                 typed_listener.c_call(arg)
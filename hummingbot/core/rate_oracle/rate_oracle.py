@@ -7,12 +7,12 @@ from typing import TYPE_CHECKING, Dict, List, Optional
 import aiohttp
 
 import hummingbot.client.settings  # noqa
-from hummingbot.connector.exchange.ascend_ex.ascend_ex_api_order_book_data_source import AscendExAPIOrderBookDataSource
 from hummingbot.core.network_base import NetworkBase
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.rate_oracle.utils import find_rate
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.core.web_assistant.connections.connections_manager import ConnectionsManager
 from hummingbot.logger import HummingbotLogger
 
 if TYPE_CHECKING:
@@ -44,7 +44,6 @@ class RateOracle(NetworkBase):
 
     _logger: Optional[HummingbotLogger] = None
     _shared_instance: "RateOracle" = None
-    _shared_client: Optional[aiohttp.ClientSession] = None
     _cgecko_supported_vs_tokens: List[str] = []
 
     binance_price_url = "https://api.binance.com/api/v3/ticker/bookTicker"
@@ -89,9 +88,7 @@ class RateOracle(NetworkBase):
 
     @classmethod
     async def _http_client(cls) -> aiohttp.ClientSession:
-        if cls._shared_client is None:
-            cls._shared_client = aiohttp.ClientSession()
-        return cls._shared_client
+        return await ConnectionsManager.get_instance().get_client_session()
 
     async def get_ready(self):
         """
@@ -295,6 +292,10 @@ class RateOracle(NetworkBase):
         Fetches Ascend Ex mid prices from their ticker endpoint.
         :return A dictionary of trading pairs and prices
         """
+        from hummingbot.connector.exchange.ascend_ex.ascend_ex_api_order_book_data_source import (
+            AscendExAPIOrderBookDataSource,
+        )
+
         results = {}
         client = await cls._http_client()
         async with client.request("GET", cls.ascend_ex_price_url) as resp:
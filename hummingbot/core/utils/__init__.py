@@ -1,23 +1,46 @@
+import asyncio
 import cachetools
 import errno
 import functools
+import inspect
 import numpy as np
 import socket
 import pandas as pd
+from typing import Dict
 
 
 def async_ttl_cache(ttl: int = 3600, maxsize: int = 1):
+    """
+    Caches the results of a coroutine function for `ttl` seconds, keyed by its arguments as bound to its signature
+    (so that positional, keyword and default arguments of equal values share an entry). Concurrent calls with the
+    same arguments await the same call rather than each making it.
+    """
     cache = cachetools.TTLCache(ttl=ttl, maxsize=maxsize)
 
     def decorator(fn):
+        signature = inspect.signature(fn)
+        in_flight: Dict[str, asyncio.Future] = {}
+
+        def call_done(key: str, future: asyncio.Future):
+            del in_flight[key]
+            if not future.cancelled() and future.exception() is None:
+                cache[key] = future.result()
+
         @functools.wraps(fn)
         async def memoize(*args, **kwargs):
-            key = str((args, kwargs))
+            bound_arguments = signature.bind(*args, **kwargs)
+            bound_arguments.apply_defaults()
+            key = str((bound_arguments.args, bound_arguments.kwargs))
             try:
                 return cache[key]
             except KeyError:
-                cache[key] = await fn(*args, **kwargs)
-                return cache[key]
+                pass
+            future = in_flight.get(key)
+            if future is None:
+                future = in_flight[key] = asyncio.ensure_future(fn(*args, **kwargs))
+                future.add_done_callback(functools.partial(call_done, key))
+            # The call carries on for the other callers if this one is cancelled
+            return await asyncio.shield(future)
 
         memoize.cache_clear = lambda: cache.clear()
         return memoize
@@ -1,6 +1,5 @@
-from typing import Optional
-
 import aiohttp
+from hummingbot.core.web_assistant.connections.connections_manager import ConnectionsManager
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
@@ -15,10 +14,10 @@ class ConnectionsFactory:
     `WebAssistantsFactory` to accommodate cases such as Bittrex that uses a specific WebSocket technology requiring
     a separate third-party library. In that case, a factory can be created that returns `RESTConnection`s using
     `aiohttp` and `WSConnection`s using `signalr_aio`.
-    """
 
-    def __init__(self):
-        self._shared_client: Optional[aiohttp.ClientSession] = None
+    The connections use the process wide client session of the `ConnectionsManager`, and its pool of keep-alive
+    connections.
+    """
 
     async def get_rest_connection(self) -> RESTConnection:
         shared_client = await self._get_shared_client()
@@ -31,5 +30,4 @@ class ConnectionsFactory:
         return connection
 
     async def _get_shared_client(self) -> aiohttp.ClientSession:
-        self._shared_client = self._shared_client or aiohttp.ClientSession()
-        return self._shared_client
+        return await ConnectionsManager.get_instance().get_client_session()
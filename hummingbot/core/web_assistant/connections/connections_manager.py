@@ -0,0 +1,178 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Deque, Optional
+
+import aiohttp
+
+if TYPE_CHECKING:
+    from hummingbot.client.config.config_helpers import ClientConfigAdapter
+
+
+@dataclass
+class ConnectionsStats:
+    """
+    Activity of the HTTP connections of the process wide client session.
+    :param requests: Number of requests sent, websocket connection requests included
+    :param connections_created: Number of connections opened, each with its TCP (and TLS) handshake
+    :param connections_reused: Number of requests sent over a keep-alive connection of the pool
+    :param dns_cache_hits: Number of host names found in the DNS cache
+    :param dns_cache_misses: Number of host names resolved
+    :param time_to_first_byte_mean: Mean time in seconds, over the last requests, from the start of a request to the
+        reception of its response headers, including the time to get a connection
+    :param time_to_first_byte_max: Longest time to first byte in seconds, over the last requests
+    """
+    requests: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+    dns_cache_hits: int = 0
+    dns_cache_misses: int = 0
+    time_to_first_byte_mean: float = 0.0
+    time_to_first_byte_max: float = 0.0
+
+    @property
+    def connection_reuse_ratio(self) -> float:
+        connections = self.connections_created + self.connections_reused
+        return self.connections_reused / connections if connections > 0 else 0.0
+
+
+class ConnectionsManager:
+    """
+    Holds the aiohttp client session shared by all the connectors, the rate oracle and the other HTTP clients of the
+    process, so that they share a pool of keep-alive connections per host and a DNS cache, instead of each having its
+    own session with the default settings.
+
+    The connections are kept open `keepalive_timeout` seconds after their last request, which keeps the TCP and TLS
+    handshakes out of the requests following idle periods, and the host names are resolved again after
+    `ttl_dns_cache` seconds. The session is created in the event loop using it, and created again if it is used from
+    another event loop, the session it replaces being closed.
+
+    The shared instance takes its settings from the `connections_pool` section of the client configuration:
+    `connections_limit`, `connections_limit_per_host`, `connections_keepalive_timeout` and `dns_cache_ttl`.
+    """
+    # Most connections open at the same time, websocket connections included (0 for no limit)
+    DEFAULT_LIMIT = 1000
+    # Most connections open at the same time to the same host (0 for no limit)
+    DEFAULT_LIMIT_PER_HOST = 0
+    DEFAULT_KEEPALIVE_TIMEOUT = 60.0
+    DEFAULT_TTL_DNS_CACHE = 300
+    # Number of the last requests the time to first byte statistics are calculated from
+    TIME_TO_FIRST_BYTE_SAMPLES = 1000
+
+    _shared_instance: Optional["ConnectionsManager"] = None
+
+    @classmethod
+    def get_instance(cls, client_config_map: Optional["ClientConfigAdapter"] = None) -> "ConnectionsManager":
+        if cls._shared_instance is None:
+            client_config_map = client_config_map or cls._get_client_config_map()
+            pool_config = client_config_map.connections_pool
+            cls._shared_instance = ConnectionsManager(
+                limit=pool_config.connections_limit,
+                limit_per_host=pool_config.connections_limit_per_host,
+                keepalive_timeout=float(pool_config.connections_keepalive_timeout),
+                ttl_dns_cache=pool_config.dns_cache_ttl,
+            )
+        return cls._shared_instance
+
+    @staticmethod
+    def _get_client_config_map() -> "ClientConfigAdapter":
+        from hummingbot.client.hummingbot_application import HummingbotApplication  # avoids circular import
+
+        return HummingbotApplication.main_application().client_config_map
+
+    def __init__(self,
+                 limit: int = DEFAULT_LIMIT,
+                 limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+                 keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+                 ttl_dns_cache: Optional[int] = DEFAULT_TTL_DNS_CACHE):
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._ttl_dns_cache = ttl_dns_cache
+        self._client_session: Optional[aiohttp.ClientSession] = None
+        self._client_session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stats: ConnectionsStats = ConnectionsStats()
+        self._times_to_first_byte: Deque[float] = deque(maxlen=self.TIME_TO_FIRST_BYTE_SAMPLES)
+
+    @property
+    def stats(self) -> ConnectionsStats:
+        times_to_first_byte = list(self._times_to_first_byte)
+        return ConnectionsStats(
+            requests=self._stats.requests,
+            connections_created=self._stats.connections_created,
+            connections_reused=self._stats.connections_reused,
+            dns_cache_hits=self._stats.dns_cache_hits,
+            dns_cache_misses=self._stats.dns_cache_misses,
+            time_to_first_byte_mean=(sum(times_to_first_byte) / len(times_to_first_byte)
+                                     if times_to_first_byte else 0.0),
+            time_to_first_byte_max=max(times_to_first_byte, default=0.0))
+
+    async def get_client_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._client_session is None or self._client_session.closed or self._client_session_loop is not loop:
+            if self._client_session is not None:
+                self._close_replaced_client_session(self._client_session, self._client_session_loop)
+            self._client_session = self._create_client_session()
+            self._client_session_loop = loop
+        return self._client_session
+
+    async def close(self):
+        if self._client_session is not None and not self._client_session.closed:
+            await self._client_session.close()
+        self._client_session = None
+        self._client_session_loop = None
+
+    @staticmethod
+    def _close_replaced_client_session(client_session: aiohttp.ClientSession,
+                                       loop: Optional[asyncio.AbstractEventLoop]):
+        """
+        Closes a session used from another event loop. It is closed in its own event loop if that one still runs, in
+        another thread. Otherwise its connections are closed right away, since nothing can await the session anymore.
+        """
+        if client_session.closed:
+            return
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(client_session.close(), loop)
+        else:
+            connector = client_session.connector
+            client_session.detach()
+            if connector is not None:
+                connector._close()
+
+    def _create_client_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=self._limit,
+            limit_per_host=self._limit_per_host,
+            keepalive_timeout=self._keepalive_timeout,
+            use_dns_cache=self._ttl_dns_cache != 0,
+            ttl_dns_cache=self._ttl_dns_cache,
+        )
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self._on_request_start)
+        trace_config.on_request_end.append(self._on_request_end)
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        trace_config.on_dns_cache_hit.append(self._on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(self._on_dns_cache_miss)
+        return aiohttp.ClientSession(connector=connector, trace_configs=[trace_config])
+
+    async def _on_request_start(self, session: aiohttp.ClientSession, context: SimpleNamespace, params):
+        self._stats.requests += 1
+        context.start_time = time.perf_counter()
+
+    async def _on_request_end(self, session: aiohttp.ClientSession, context: SimpleNamespace, params):
+        self._times_to_first_byte.append(time.perf_counter() - context.start_time)
+
+    async def _on_connection_create_end(self, session: aiohttp.ClientSession, context: SimpleNamespace, params):
+        self._stats.connections_created += 1
+
+    async def _on_connection_reuseconn(self, session: aiohttp.ClientSession, context: SimpleNamespace, params):
+        self._stats.connections_reused += 1
+
+    async def _on_dns_cache_hit(self, session: aiohttp.ClientSession, context: SimpleNamespace, params):
+        self._stats.dns_cache_hits += 1
+
+    async def _on_dns_cache_miss(self, session: aiohttp.ClientSession, context: SimpleNamespace, params):
+        self._stats.dns_cache_misses += 1
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Mapping, Optional
 
 import aiohttp
@@ -36,6 +37,24 @@ class RESTRequest:
     throttler_limit_id: Optional[str] = None
 
 
+@dataclass(frozen=True)
+class RESTRequestTemplate:
+    """The parts of the requests to an endpoint that do not change from one request to the next.
+
+    Built once per endpoint, for the endpoints called in the hot path such as the order creation and cancellation,
+    so that the URL and the headers are not rebuilt for each request. The headers are read-only, the requests built
+    from the template getting their own copy.
+    """
+    method: RESTMethod
+    url: str
+    throttler_limit_id: str
+    is_auth_required: bool = False
+    headers: Mapping[str, str] = field(default_factory=dict)
+
+    def __post_init__(self):
+        object.__setattr__(self, "headers", MappingProxyType(dict(self.headers)))
+
+
 @dataclass
 class EndpointRESTRequest(RESTRequest, ABC):
     """This request class enable the user to provide either a complete URL or simply an endpoint.
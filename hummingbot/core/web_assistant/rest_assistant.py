@@ -1,11 +1,17 @@
 import json
 from asyncio import wait_for
-from copy import deepcopy
+from copy import copy
 from typing import Any, Dict, List, Optional, Union
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import DEFAULT_PRIORITY
 from hummingbot.core.web_assistant.auth import AuthBase
-from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse
+from hummingbot.core.web_assistant.connections.data_types import (
+    RESTMethod,
+    RESTRequest,
+    RESTRequestTemplate,
+    RESTResponse,
+)
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
@@ -18,6 +24,11 @@ class RESTAssistant:
     the `RESTPreProcessorBase` and `RESTPostProcessorBase` classes. The pre-processors are applied to a request
     before it is sent out, while the post-processors are applied to a response before it is returned to the caller.
     """
+    _BODY_METHODS = frozenset([RESTMethod.POST, RESTMethod.PUT])
+    # Headers of the requests sent by `execute_request`, copied for each request
+    _BODY_HEADERS = {"Content-Type": "application/json"}
+    _NO_BODY_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
     def __init__(
         self,
         connection: RESTConnection,
@@ -42,29 +53,84 @@ class RESTAssistant:
             is_auth_required: bool = False,
             return_err: bool = False,
             timeout: Optional[float] = None,
-            headers: Optional[Dict[str, Any]] = None) -> Union[str, Dict[str, Any]]:
-
-        headers = headers or {}
+            headers: Optional[Dict[str, Any]] = None,
+            throttler_priority: int = DEFAULT_PRIORITY) -> Union[str, Dict[str, Any]]:
 
-        local_headers = {
-            "Content-Type": ("application/json" if method in [RESTMethod.POST, RESTMethod.PUT]
-                             else "application/x-www-form-urlencoded")}
-        local_headers.update(headers)
+        local_headers = dict(self._BODY_HEADERS if method in self._BODY_METHODS else self._NO_BODY_HEADERS)
+        if headers:
+            local_headers.update(headers)
 
         data = json.dumps(data) if data is not None else data
 
+        # The request is built here, only the parameters of the caller need to be copied before it is processed
         request = RESTRequest(
             method=method,
             url=url,
-            params=params,
+            params=copy(params) if params is not None else params,
             data=data,
             headers=local_headers,
             is_auth_required=is_auth_required,
             throttler_limit_id=throttler_limit_id
         )
 
-        async with self._throttler.execute_task(limit_id=throttler_limit_id):
-            response = await self.call(request=request, timeout=timeout)
+        return await self._execute(request=request,
+                                   return_err=return_err,
+                                   timeout=timeout,
+                                   throttler_priority=throttler_priority)
+
+    @classmethod
+    def request_template(
+            cls,
+            url: str,
+            throttler_limit_id: str,
+            method: RESTMethod = RESTMethod.GET,
+            is_auth_required: bool = False,
+            headers: Optional[Dict[str, Any]] = None) -> RESTRequestTemplate:
+        """
+        Builds the template of the requests to an endpoint, with the same headers as `execute_request` would send.
+        """
+        template_headers = dict(cls._BODY_HEADERS if method in cls._BODY_METHODS else cls._NO_BODY_HEADERS)
+        if headers:
+            template_headers.update(headers)
+        return RESTRequestTemplate(method=method,
+                                   url=url,
+                                   throttler_limit_id=throttler_limit_id,
+                                   is_auth_required=is_auth_required,
+                                   headers=template_headers)
+
+    async def execute_template_request(
+            self,
+            template: RESTRequestTemplate,
+            params: Optional[Dict[str, Any]] = None,
+            data: Optional[Dict[str, Any]] = None,
+            return_err: bool = False,
+            timeout: Optional[float] = None,
+            throttler_priority: int = DEFAULT_PRIORITY) -> Union[str, Dict[str, Any]]:
+        """
+        Executes a request to the endpoint of the template, with only its parameters and body built for the request.
+        """
+        request = RESTRequest(
+            method=template.method,
+            url=template.url,
+            params=copy(params) if params is not None else params,
+            data=json.dumps(data) if data is not None else data,
+            headers=dict(template.headers),
+            is_auth_required=template.is_auth_required,
+            throttler_limit_id=template.throttler_limit_id
+        )
+        return await self._execute(request=request,
+                                   return_err=return_err,
+                                   timeout=timeout,
+                                   throttler_priority=throttler_priority)
+
+    async def _execute(
+            self,
+            request: RESTRequest,
+            return_err: bool,
+            timeout: Optional[float],
+            throttler_priority: int) -> Union[str, Dict[str, Any]]:
+        async with self._throttler.execute_task(limit_id=request.throttler_limit_id, priority=throttler_priority):
+            response = await self._call(request=request, timeout=timeout)
 
             if 400 <= response.status:
                 if return_err:
@@ -72,30 +138,43 @@ class RESTAssistant:
                     return error_response
                 else:
                     error_response = await response.text()
-                    raise IOError(f"Error executing request {method.name} {url}. HTTP status is {response.status}. "
-                                  f"Error: {error_response}")
+                    raise IOError(f"Error executing request {request.method.name} {request.url}. "
+                                  f"HTTP status is {response.status}. Error: {error_response}")
             result = await response.json()
             return result
 
     async def call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
-        request = deepcopy(request)
-        request = await self._pre_process_request(request)
-        request = await self._authenticate(request)
-        resp = await wait_for(self._connection.call(request), timeout)
-        resp = await self._post_process_response(resp)
-        return resp
+        request = self._copy_request(request)
+        return await self._call(request=request, timeout=timeout)
 
-    async def _pre_process_request(self, request: RESTRequest) -> RESTRequest:
+    async def _call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
+        """
+        Pre-processes, authenticates and sends a request that can be updated in place, and post-processes its response.
+        The processors and the authenticator are awaited directly, without a helper coroutine for each step.
+        """
         for pre_processor in self._rest_pre_processors:
             request = await pre_processor.pre_process(request)
-        return request
-
-    async def _authenticate(self, request: RESTRequest):
         if self._auth is not None and request.is_auth_required:
             request = await self._auth.rest_authenticate(request)
-        return request
-
-    async def _post_process_response(self, response: RESTResponse) -> RESTResponse:
+        if timeout is None:
+            resp = await self._connection.call(request)
+        else:
+            resp = await wait_for(self._connection.call(request), timeout)
         for post_processor in self._rest_post_processors:
-            response = await post_processor.post_process(response)
-        return response
+            resp = await post_processor.post_process(resp)
+        return resp
+
+    @staticmethod
+    def _copy_request(request: RESTRequest) -> RESTRequest:
+        """
+        Copies a request and its parameters, body and headers, so that the pre-processors and the authenticator can
+        update them in place without changing the request of the caller.
+        """
+        request = copy(request)
+        if request.params is not None:
+            request.params = copy(request.params)
+        if isinstance(request.data, (dict, list)):
+            request.data = copy(request.data)
+        if request.headers is not None:
+            request.headers = copy(request.headers)
+        return request
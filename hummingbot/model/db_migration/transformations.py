@@ -5,7 +5,9 @@ from sqlalchemy import (
 )
 
 from hummingbot.model.db_migration.base_transformation import DatabaseTransformation
+from hummingbot.model.order import Order
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.trade_fill import TradeFill
 
 
 class AddExchangeOrderIdColumnToOrders(DatabaseTransformation):
@@ -134,3 +136,26 @@ class ConvertPriceAndAmountColumnsToBigint(DatabaseTransformation):
     @property
     def to_version(self):
         return 20220130
+
+
+class AddTradeHistoryIndexes(DatabaseTransformation):
+    """
+    Indexes the trade fills by timestamp, for the paged reads of the history and export commands, and by order id,
+    for the trade fills of an order. Also indexes the orders of a config file by market.
+    """
+    index_names = ["tf_timestamp_index", "tf_order_id_index", "o_config_market_timestamp_index"]
+
+    def apply(self, db_handle: SQLConnectionManager) -> SQLConnectionManager:
+        indexes = [index for index in TradeFill.__table__.indexes | Order.__table__.indexes
+                   if index.name in self.index_names]
+        for index in sorted(indexes, key=lambda index: self.index_names.index(index.name)):
+            index.create(db_handle.engine, checkfirst=True)
+        return db_handle
+
+    @property
+    def name(self):
+        return "AddTradeHistoryIndexes"
+
+    @property
+    def to_version(self):
+        return 20221015
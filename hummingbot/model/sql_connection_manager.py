@@ -1,9 +1,9 @@
 import logging
 from enum import Enum
 from os.path import join
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
-from sqlalchemy import MetaData, create_engine, inspect
+from sqlalchemy import MetaData, create_engine, event, inspect
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.orm import Query, Session, sessionmaker
 from sqlalchemy.schema import DropConstraint, ForeignKeyConstraint, Table
@@ -27,7 +27,18 @@ class SQLConnectionManager(TransactionBase):
     _scm_trade_fills_instance: Optional["SQLConnectionManager"] = None
 
     LOCAL_DB_VERSION_KEY = "local_db_version"
-    LOCAL_DB_VERSION_VALUE = "20220130"
+    LOCAL_DB_VERSION_VALUE = "20221015"
+
+    # Applied to every new SQLite connection. With write-ahead logging, reading the trades (e.g. for the history
+    # command) does not block the markets recorder writes, and commits only append to the log.
+    SQLITE_PRAGMAS: Dict[str, str] = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": "5000",
+        "temp_store": "MEMORY",
+        "cache_size": "-65536",
+        "mmap_size": "268435456",
+    }
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -73,6 +84,8 @@ class SQLConnectionManager(TransactionBase):
 
         if connection_type is SQLConnectionType.TRADE_FILLS:
             self._engine: Engine = create_engine(client_config_map.db_mode.get_url(self.db_path))
+            if self._engine.dialect.name == "sqlite":
+                event.listen(self._engine, "connect", self._apply_sqlite_pragmas)
             self._metadata: MetaData = self.get_declarative_base().metadata
             self._metadata.create_all(self._engine)
 
@@ -100,6 +113,13 @@ class SQLConnectionManager(TransactionBase):
     def engine(self) -> Engine:
         return self._engine
 
+    @classmethod
+    def _apply_sqlite_pragmas(cls, dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma, value in cls.SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {pragma}={value}")
+        cursor.close()
+
     def get_new_session(self) -> Session:
         return self._session_cls()
 
@@ -118,15 +138,16 @@ class SQLConnectionManager(TransactionBase):
                     version_info: LocalMetadata = LocalMetadata(key=self.LOCAL_DB_VERSION_KEY,
                                                                 value=self.LOCAL_DB_VERSION_VALUE)
                     session.add(version_info)
-                    session.commit()
-                else:
-                    # There's no past db version to upgrade from at this moment. So we'll just update the version value
-                    # if needed.
-                    if local_db_version.value < self.LOCAL_DB_VERSION_VALUE:
-                        was_migration_successful = Migrator().migrate_db_to_version(
-                            client_config_map, self, int(local_db_version.value), int(self.LOCAL_DB_VERSION_VALUE)
-                        )
-                        if was_migration_successful:
-                            # Cannot use variable local_db_version because reference is not valid
-                            # since Migrator changed it
-                            self.get_local_db_version(session=session).value = self.LOCAL_DB_VERSION_VALUE
+                    return
+                local_db_version_value: str = local_db_version.value
+
+        # The session is closed before migrating, since the migrator copies the database file, and the write-ahead
+        # log of SQLite is only merged into the file once all the connections are closed.
+        if local_db_version_value < self.LOCAL_DB_VERSION_VALUE:
+            was_migration_successful = Migrator().migrate_db_to_version(
+                client_config_map, self, int(local_db_version_value), int(self.LOCAL_DB_VERSION_VALUE)
+            )
+            if was_migration_successful:
+                with self.get_new_session() as session:
+                    with session.begin():
+                        self.get_local_db_version(session=session).value = self.LOCAL_DB_VERSION_VALUE
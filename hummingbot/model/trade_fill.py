@@ -2,6 +2,7 @@ from datetime import datetime
 from typing import (
     Any,
     Dict,
+    Iterator,
     List,
     Optional,
 )
@@ -16,8 +17,10 @@ from sqlalchemy import (
     Integer,
     JSON,
     Text,
+    tuple_,
 )
 from sqlalchemy.orm import (
+    Query,
     relationship,
     Session
 )
@@ -36,7 +39,11 @@ class TradeFill(HummingbotBase):
                       Index("tf_market_base_asset_timestamp_index",
                             "market", "base_asset", "timestamp"),
                       Index("tf_market_quote_asset_timestamp_index",
-                            "market", "quote_asset", "timestamp")
+                            "market", "quote_asset", "timestamp"),
+                      Index("tf_timestamp_index",
+                            "timestamp", "market", "order_id", "exchange_trade_id"),
+                      Index("tf_order_id_index",
+                            "order_id")
                       )
 
     config_file_path = Column(Text, nullable=False)
@@ -104,6 +111,30 @@ class TradeFill(HummingbotBase):
                                              .all())
         return trades
 
+    @classmethod
+    def iter_pages(cls, query: Query, page_size: int = 10000) -> Iterator[List["TradeFill"]]:
+        """
+        Reads the trade fills matched by a query in ascending timestamp order, a page at a time. Each page starts
+        right after the last trade fill of the previous page (instead of at an offset), so reading a page is a range
+        scan of tf_timestamp_index however many trade fills come before it.
+        """
+        page_key = (cls.timestamp, cls.market, cls.order_id, cls.exchange_trade_id)
+        query = query.order_by(*page_key)
+        page: List[TradeFill] = query.limit(page_size).all()
+        while len(page) > 0:
+            yield page
+            if len(page) < page_size:
+                break
+            last_trade: TradeFill = page[-1]
+            page = (query
+                    .filter(cls.timestamp >= last_trade.timestamp,
+                            tuple_(*page_key) > tuple_(last_trade.timestamp,
+                                                       last_trade.market,
+                                                       last_trade.order_id,
+                                                       last_trade.exchange_trade_id))
+                    .limit(page_size)
+                    .all())
+
     @classmethod
     def to_pandas(cls, trades: List):
         columns: List[str] = ["Id",
@@ -12,9 +12,12 @@ cdef class RingBuffer:
     cdef void c_add_value(self, float val)
     cdef void c_increment_delimiter(self)
     cdef double c_get_last_value(self)
+    cdef double c_get_first_value(self)
+    cdef int64_t c_size(self)
     cdef bint c_is_full(self)
     cdef bint c_is_empty(self)
     cdef double c_mean_value(self)
     cdef double c_variance(self)
     cdef double c_std_dev(self)
     cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self)
+    cdef tuple c_get_as_numpy_slices(self)
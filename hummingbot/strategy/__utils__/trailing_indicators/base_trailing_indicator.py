@@ -1,4 +1,5 @@
 import logging
+import math
 from abc import ABC, abstractmethod
 
 import numpy as np
@@ -9,6 +10,16 @@ pmm_logger = None
 
 
 class BaseTrailingIndicator(ABC):
+    """
+    Computes an indicator over a trailing window of samples (the sampling buffer), and smooths it over a trailing
+    window of indicator values (the processing buffer).
+
+    The indicators keep running sums of their windows, updated as each value enters and leaves a window, so adding a
+    sample costs the same whatever the window lengths. To keep rounding errors from accumulating, the running sums are
+    recomputed from the window once it has been fully renewed, and at least MIN_RESYNC_INTERVAL values were added.
+    """
+    MIN_RESYNC_INTERVAL = 1000
+
     @classmethod
     def logger(cls):
         global pmm_logger
@@ -20,22 +31,72 @@ class BaseTrailingIndicator(ABC):
         self._sampling_buffer = RingBuffer(sampling_length)
         self._processing_buffer = RingBuffer(processing_length)
         self._samples_length = 0
+        # Sum of the finite values of the processing buffer, and count of the others
+        self._processing_sum = 0.0
+        self._processing_nan_count = 0
+        self._processing_values_since_resync = 0
+        self._samples_since_resync = 0
 
     def add_sample(self, value: float):
+        evicted_sample = self._sampling_buffer.get_first_value() if self._sampling_buffer.is_full else None
         self._sampling_buffer.add_value(value)
+        self._samples_since_resync += 1
+        if self._samples_since_resync >= max(self._sampling_buffer.length, self.MIN_RESYNC_INTERVAL):
+            self._resync_sampling_state()
+        else:
+            self._update_sampling_state(self._sampling_buffer.get_last_value(), evicted_sample)
         indicator_value = self._indicator_calculation()
-        self._processing_buffer.add_value(indicator_value)
+        self._add_processing_value(indicator_value)
+
+    def _update_sampling_state(self, sample: float, evicted_sample: float):
+        """
+        Updates the running state of the indicator with the sample just added to the sampling buffer and, if the
+        buffer was full, the sample it evicted (None otherwise).
+        """
+        pass
+
+    def _resync_sampling_state(self):
+        """
+        Recomputes the running state of the indicator from the sampling buffer.
+        """
+        self._samples_since_resync = 0
 
     @abstractmethod
     def _indicator_calculation(self) -> float:
         raise NotImplementedError
 
+    def _add_processing_value(self, value: float):
+        if self._processing_buffer.is_full:
+            self._update_processing_sum(self._processing_buffer.get_first_value(), -1)
+        self._processing_buffer.add_value(value)
+        self._processing_values_since_resync += 1
+        if self._processing_values_since_resync >= max(self._processing_buffer.length, self.MIN_RESYNC_INTERVAL):
+            self._resync_processing_sum()
+        else:
+            self._update_processing_sum(self._processing_buffer.get_last_value(), 1)
+
+    def _update_processing_sum(self, value: float, sign: int):
+        if math.isfinite(value):
+            self._processing_sum += sign * value
+        else:
+            self._processing_nan_count += sign
+
+    def _resync_processing_sum(self):
+        processing_array = self._processing_buffer.get_as_numpy_array()
+        finite = np.isfinite(processing_array)
+        self._processing_sum = float(np.sum(processing_array[finite]))
+        self._processing_nan_count = int(processing_array.size - np.count_nonzero(finite))
+        self._processing_values_since_resync = 0
+
     def _processing_calculation(self) -> float:
         """
         Processing of the processing buffer to return final value.
         Default behavior is buffer average
         """
-        return np.mean(self._processing_buffer.get_as_numpy_array())
+        values_count = len(self._processing_buffer)
+        if values_count == 0 or self._processing_nan_count > 0:
+            return np.nan
+        return self._processing_sum / values_count
 
     @property
     def current_value(self) -> float:
@@ -51,7 +112,7 @@ class BaseTrailingIndicator(ABC):
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        buffer_len = len(self._sampling_buffer.get_as_numpy_array())
+        buffer_len = len(self._sampling_buffer)
         is_changed = self._samples_length != buffer_len
         self._samples_length = buffer_len
         return is_changed
@@ -63,6 +124,7 @@ class BaseTrailingIndicator(ABC):
     @sampling_length.setter
     def sampling_length(self, value):
         self._sampling_buffer.length = value
+        self._resync_sampling_state()
 
     @property
     def processing_length(self) -> int:
@@ -71,3 +133,4 @@ class BaseTrailingIndicator(ABC):
     @processing_length.setter
     def processing_length(self, value):
         self._processing_buffer.length = value
+        self._resync_processing_sum()
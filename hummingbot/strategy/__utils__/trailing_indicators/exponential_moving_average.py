@@ -1,17 +1,43 @@
-from base_trailing_indicator import BaseTrailingIndicator
-import pandas as pd
+import numpy as np
+
+from .base_trailing_indicator import BaseTrailingIndicator
 
 
 class ExponentialMovingAverageIndicator(BaseTrailingIndicator):
+    """
+    Exponential moving average of the sampling buffer, with a span of the sampling length. Like pandas
+    `ewm(span=sampling_length, adjust=True).mean()`, the weights are normalized over the samples in the buffer.
+    """
     def __init__(self, sampling_length: int = 30, processing_length: int = 1):
         if processing_length != 1:
             raise Exception("Exponential moving average processing_length should be 1")
+        # Weighted sum of the samples, and sum of their weights. The newest sample has a weight of 1.
+        self._weighted_sum: float = 0.0
+        self._weights_sum: float = 0.0
         super().__init__(sampling_length, processing_length)
 
+    @property
+    def _decay(self) -> float:
+        return 1 - 2 / (self.sampling_length + 1)
+
+    def _update_sampling_state(self, sample: float, evicted_sample: float):
+        decay = self._decay
+        self._weighted_sum = decay * self._weighted_sum + sample
+        self._weights_sum = decay * self._weights_sum + 1
+        if evicted_sample is not None:
+            evicted_weight = decay ** self.sampling_length
+            self._weighted_sum -= evicted_weight * evicted_sample
+            self._weights_sum -= evicted_weight
+
+    def _resync_sampling_state(self):
+        super()._resync_sampling_state()
+        samples = self._sampling_buffer.get_as_numpy_array()
+        weights = self._decay ** np.arange(samples.size - 1, -1, -1)
+        self._weighted_sum = float(np.dot(weights, samples))
+        self._weights_sum = float(np.sum(weights))
+
     def _indicator_calculation(self) -> float:
-        ema = pd.Series(self._sampling_buffer.get_as_numpy_array())\
-            .ewm(span=self._sampling_length, adjust=True).mean()
-        return ema[-1]
+        return self._weighted_sum / self._weights_sum
 
     def _processing_calculation(self) -> float:
         return self._processing_buffer.get_last_value()
@@ -1,18 +1,63 @@
-from .base_trailing_indicator import BaseTrailingIndicator
+from collections import deque
+from typing import Deque, Optional
+
 import numpy as np
 
+from .base_trailing_indicator import BaseTrailingIndicator
+
 
 class HistoricalVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
+        # Log returns between consecutive samples of the sampling buffer, with their running mean and sum of squared
+        # deviations from the mean (Welford's algorithm, which also supports removing values)
+        self._log_returns: Deque[float] = deque()
+        self._log_returns_mean: float = 0.0
+        self._log_returns_m2: float = 0.0
+        self._previous_log_price: Optional[float] = None
         super().__init__(sampling_length, processing_length)
 
-    def _indicator_calculation(self) -> float:
+    def _update_sampling_state(self, sample: float, evicted_sample: float):
+        log_price = float(np.log(sample))
+        if self._previous_log_price is not None:
+            log_return = log_price - self._previous_log_price
+            self._log_returns.append(log_return)
+            self._add_log_return(log_return)
+        self._previous_log_price = log_price
+        # The return from the evicted sample is no longer within the buffer
+        while len(self._log_returns) >= len(self._sampling_buffer):
+            self._remove_log_return(self._log_returns.popleft())
+
+    def _add_log_return(self, log_return: float):
+        delta = log_return - self._log_returns_mean
+        self._log_returns_mean += delta / len(self._log_returns)
+        self._log_returns_m2 += delta * (log_return - self._log_returns_mean)
+
+    def _remove_log_return(self, log_return: float):
+        if len(self._log_returns) == 0:
+            self._log_returns_mean = 0.0
+            self._log_returns_m2 = 0.0
+            return
+        delta = log_return - self._log_returns_mean
+        self._log_returns_mean -= delta / len(self._log_returns)
+        self._log_returns_m2 -= delta * (log_return - self._log_returns_mean)
+
+    def _resync_sampling_state(self):
+        super()._resync_sampling_state()
         prices = self._sampling_buffer.get_as_numpy_array()
-        if prices.size > 0:
-            log_returns = np.diff(np.log(prices))
-            return np.var(log_returns)
+        log_prices = np.log(prices)
+        log_returns = np.diff(log_prices)
+        self._log_returns = deque(log_returns.tolist())
+        self._log_returns_mean = float(np.mean(log_returns)) if log_returns.size > 0 else 0.0
+        self._log_returns_m2 = float(np.var(log_returns) * log_returns.size) if log_returns.size > 0 else 0.0
+        self._previous_log_price = float(log_prices[-1]) if log_prices.size > 0 else None
+
+    def _indicator_calculation(self) -> float:
+        if len(self._log_returns) == 0:
+            return np.nan
+        return max(self._log_returns_m2, 0.0) / len(self._log_returns)
 
     def _processing_calculation(self) -> float:
-        processing_array = self._processing_buffer.get_as_numpy_array()
-        if processing_array.size > 0:
-            return np.sqrt(np.mean(np.nan_to_num(processing_array)))
+        values_count = len(self._processing_buffer)
+        if values_count > 0:
+            # Like np.nan_to_num, the missing values count as zeros
+            return np.sqrt(self._processing_sum / values_count)
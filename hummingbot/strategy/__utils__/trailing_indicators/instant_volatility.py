@@ -1,18 +1,42 @@
-from .base_trailing_indicator import BaseTrailingIndicator
+from collections import deque
+from typing import Deque, Optional
+
 import numpy as np
 
+from .base_trailing_indicator import BaseTrailingIndicator
+
 
 class InstantVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
+        # Squared differences between consecutive samples of the sampling buffer, and their sum
+        self._squared_diffs: Deque[float] = deque()
+        self._squared_diffs_sum: float = 0.0
+        self._previous_sample: Optional[float] = None
         super().__init__(sampling_length, processing_length)
 
+    def _update_sampling_state(self, sample: float, evicted_sample: float):
+        if self._previous_sample is not None:
+            squared_diff = (sample - self._previous_sample) ** 2
+            self._squared_diffs.append(squared_diff)
+            self._squared_diffs_sum += squared_diff
+        self._previous_sample = sample
+        # The difference with the evicted sample is no longer within the buffer
+        while len(self._squared_diffs) >= len(self._sampling_buffer):
+            self._squared_diffs_sum -= self._squared_diffs.popleft()
+
+    def _resync_sampling_state(self):
+        super()._resync_sampling_state()
+        np_sampling_buffer = self._sampling_buffer.get_as_numpy_array()
+        squared_diffs = np.square(np.diff(np_sampling_buffer))
+        self._squared_diffs = deque(squared_diffs.tolist())
+        self._squared_diffs_sum = float(np.sum(squared_diffs))
+        self._previous_sample = float(np_sampling_buffer[-1]) if np_sampling_buffer.size > 0 else None
+
     def _indicator_calculation(self) -> float:
         # The standard deviation should be calculated between ticks and not with a mean of the whole buffer
         # Otherwise if the asset is trending, changing the length of the buffer would result in a greater volatility as more ticks would be further away from the mean
         # which is a nonsense result. If volatility of the underlying doesn't change in fact, changing the length of the buffer shouldn't change the result.
-        np_sampling_buffer = self._sampling_buffer.get_as_numpy_array()
-        vol = np.sqrt(np.sum(np.square(np.diff(np_sampling_buffer))) / np_sampling_buffer.size)
-        return vol
+        return np.sqrt(max(self._squared_diffs_sum, 0.0) / len(self._sampling_buffer))
 
     def _processing_calculation(self) -> float:
         # Only the last calculated volatlity, not an average of multiple past volatilities
@@ -20,10 +20,19 @@ cdef class TradingIntensityIndicator:
         list _last_quotes
         int _sampling_length
         int _samples_length
+        dict _volume_by_price_level
+        dict _trades_by_price_level
+        double _volume
+        double _volume_changed
+        double _refine_threshold
+        bint _is_fitted
 
     cdef c_calculate(self, timestamp)
     cdef c_register_trade(self, object trade)
+    cdef c_add_volume(self, double price_level, double amount)
+    cdef c_remove_volume(self, double price_level, double amount)
     cdef c_estimate_intensity(self)
+    cdef tuple c_fit_log_lambdas(self, object price_levels, object lambdas)
 
 cdef class TradesForwarder(EventListener):
     cdef:
@@ -3,7 +3,7 @@
 
 import warnings
 from decimal import Decimal
-from typing import Tuple
+from typing import Dict, Tuple
 
 import numpy as np
 from scipy.optimize import curve_fit
@@ -17,6 +17,15 @@ from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderBookEvent
 from hummingbot.strategy.asset_price_delegate import AssetPriceDelegate
 
+def intensity(delta, alpha, kappa):
+    return alpha * np.exp(-kappa * delta)
+
+
+def intensity_jacobian(delta, alpha, kappa):
+    decay = np.exp(-kappa * delta)
+    return np.column_stack((decay, -alpha * delta * decay))
+
+
 cdef class TradesForwarder(EventListener):
     def __init__(self, indicator: 'TradingIntensityIndicator'):
         self._indicator = indicator
@@ -26,8 +35,22 @@ cdef class TradesForwarder(EventListener):
 
 
 cdef class TradingIntensityIndicator:
-
-    def __init__(self, order_book: OrderBook, price_delegate: AssetPriceDelegate, sampling_length: int = 30):
+    """
+    Estimates the parameters of the trading intensity lambda(delta) = alpha * exp(-kappa * delta), delta being the
+    distance of the trades to the mid price, from the trades of the last `sampling_length` samples.
+
+    The traded volume of every price level of the window is accumulated as the trades are sampled, and deducted as
+    their samples leave the window. The first estimate is a closed-form fit of log(lambda); the estimates are then
+    refined by a nonlinear least squares fit, started from the previous estimate, once the volume added to and removed
+    from the window since the last fit exceeds `refine_threshold` times the volume of the window. With the default
+    threshold of 0, the parameters are refitted whenever the window changed.
+    """
+
+    def __init__(self,
+                 order_book: OrderBook,
+                 price_delegate: AssetPriceDelegate,
+                 sampling_length: int = 30,
+                 refine_threshold: float = 0.0):
         self._alpha = 0
         self._kappa = 0
         self._trade_samples = {}
@@ -39,6 +62,12 @@ cdef class TradingIntensityIndicator:
         self._sampling_length = sampling_length
         self._samples_length = 0
         self._last_quotes = []
+        self._volume_by_price_level = {}
+        self._trades_by_price_level = {}
+        self._volume = 0
+        self._volume_changed = 0
+        self._refine_threshold = refine_threshold
+        self._is_fitted = False
 
         warnings.simplefilter("ignore", OptimizeWarning)
 
@@ -48,12 +77,12 @@ cdef class TradingIntensityIndicator:
 
     @property
     def is_sampling_buffer_full(self) -> bool:
-        return len(self._trade_samples.keys()) == self._sampling_length
+        return len(self._trade_samples) == self._sampling_length
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        is_changed = self._samples_length != len(self._trade_samples.keys())
-        self._samples_length = len(self._trade_samples.keys())
+        is_changed = self._samples_length != len(self._trade_samples)
+        self._samples_length = len(self._trade_samples)
         return is_changed
 
     @property
@@ -64,6 +93,14 @@ cdef class TradingIntensityIndicator:
     def sampling_length(self, new_len: int):
         self._sampling_length = new_len
 
+    @property
+    def refine_threshold(self) -> float:
+        return self._refine_threshold
+
+    @refine_threshold.setter
+    def refine_threshold(self, value: float):
+        self._refine_threshold = value
+
     @property
     def last_quotes(self) -> list:
         """A helper method to be used in unit tests"""
@@ -74,44 +111,53 @@ cdef class TradingIntensityIndicator:
         """A helper method to be used in unit tests"""
         self._last_quotes = value
 
+    @property
+    def volume_by_price_level(self) -> Dict[float, float]:
+        """The traded volume of every price level of the sampling window"""
+        return self._volume_by_price_level
+
     def calculate(self, timestamp):
         """A helper method to be used in unit tests"""
         self.c_calculate(timestamp)
 
     cdef c_calculate(self, timestamp):
+        cdef:
+            object latest_processed_quote_idx = None
+            int i
+            list quotes
+            list sample
+
         price = self._price_delegate.get_price_by_type(PriceType.MidPrice)
         # Descending order of price-timestamp quotes
-        self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
+        self._last_quotes.insert(0, {'timestamp': timestamp, 'price': price})
+        quotes = ([(quote["timestamp"], float(quote["price"])) for quote in self._last_quotes]
+                  if len(self._current_trade_sample) > 0 else [])
 
-        latest_processed_quote_idx = None
         for trade in self._current_trade_sample:
-            for i, quote in enumerate(self._last_quotes):
-                if quote["timestamp"] < trade.timestamp:
+            for i in range(len(quotes)):
+                quote_timestamp, quote_price = quotes[i]
+                if quote_timestamp < trade.timestamp:
                     if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
                         latest_processed_quote_idx = i
-                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
-
-                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
-                        self._trade_samples[quote["timestamp"] + 1] = []
-
-                    self._trade_samples[quote["timestamp"] + 1] += [trade]
+                    sample = self._trade_samples.get(quote_timestamp + 1)
+                    if sample is None:
+                        sample = self._trade_samples[quote_timestamp + 1] = []
+                    price_level = abs(trade.price - quote_price)
+                    sample.append((price_level, trade.amount))
+                    self.c_add_volume(price_level, trade.amount)
                     break
 
         # THere are no trades left to process
         self._current_trade_sample = []
         # Store quotes that happened after the latest trade + one before
         if latest_processed_quote_idx is not None:
-            self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
-
-        if len(self._trade_samples.keys()) > self._sampling_length:
-            timestamps = list(self._trade_samples.keys())
-            timestamps.sort()
-            timestamps = timestamps[-self._sampling_length:]
+            del self._last_quotes[latest_processed_quote_idx + 1:]
 
-            trade_samples = {}
-            for timestamp in timestamps:
-                trade_samples[timestamp] = self._trade_samples[timestamp]
-            self._trade_samples = trade_samples
+        if len(self._trade_samples) > self._sampling_length:
+            timestamps = sorted(self._trade_samples)
+            for sample_timestamp in timestamps[:-self._sampling_length]:
+                for price_level, amount in self._trade_samples.pop(sample_timestamp):
+                    self.c_remove_volume(price_level, amount)
 
         if self.is_sampling_buffer_full:
             self.c_estimate_intensity()
@@ -123,40 +169,58 @@ cdef class TradingIntensityIndicator:
     cdef c_register_trade(self, object trade):
         self._current_trade_sample.append(trade)
 
+    cdef c_add_volume(self, double price_level, double amount):
+        self._volume_by_price_level[price_level] = self._volume_by_price_level.get(price_level, 0) + amount
+        self._trades_by_price_level[price_level] = self._trades_by_price_level.get(price_level, 0) + 1
+        self._volume += amount
+        self._volume_changed += abs(amount)
+
+    cdef c_remove_volume(self, double price_level, double amount):
+        cdef int trades = self._trades_by_price_level[price_level] - 1
+        if trades == 0:
+            # Drop the level rather than keeping the rounding error of the subtractions
+            del self._volume_by_price_level[price_level]
+            del self._trades_by_price_level[price_level]
+        else:
+            self._volume_by_price_level[price_level] -= amount
+            self._trades_by_price_level[price_level] = trades
+        self._volume = self._volume - amount if len(self._volume_by_price_level) > 0 else 0
+        self._volume_changed += abs(amount)
+
     cdef c_estimate_intensity(self):
         cdef:
-            dict trades_consolidated
-            list lambdas
-            list price_levels
-
-        # Calculate lambdas / trading intensities
-        lambdas = []
-
-        trades_consolidated = {}
-        price_levels = []
-        for timestamp in self._trade_samples.keys():
-            tick = self._trade_samples[timestamp]
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
+            object price_levels
+            object lambdas
 
-                trades_consolidated[trade['price_level']] += trade['amount']
-
-        price_levels = sorted(price_levels, reverse=True)
-
-        for price_level in price_levels:
-            lambdas += [trades_consolidated[price_level]]
+        if self._is_fitted and self._volume_changed <= self._refine_threshold * abs(self._volume):
+            return
+        if len(self._volume_by_price_level) == 0:
+            return
 
+        # Calculate lambdas / trading intensities
+        price_levels = np.fromiter(self._volume_by_price_level.keys(), dtype=float,
+                                   count=len(self._volume_by_price_level))
+        lambdas = np.fromiter(self._volume_by_price_level.values(), dtype=float,
+                              count=len(self._volume_by_price_level))
         # Adjust to be able to calculate log
-        lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
-
-        # Fit the probability density function; reuse previously calculated parameters as initial values
+        lambdas[lambdas <= 0] = 1e-10
+
+        if self._is_fitted:
+            # Reuse previously calculated parameters as initial values
+            initial_params = (self._alpha, self._kappa)
+        else:
+            initial_params = self.c_fit_log_lambdas(price_levels, lambdas)
+            self._alpha, self._kappa = initial_params
+            self._is_fitted = True
+        self._volume_changed = 0
+
+        # Refine the estimate with a nonlinear least squares fit of the probability density function
         try:
-            params = curve_fit(lambda t, a, b: a*np.exp(-b*t),
+            params = curve_fit(intensity,
                                price_levels,
-                               lambdas_adj,
-                               p0=(self._alpha, self._kappa),
+                               lambdas,
+                               p0=initial_params,
+                               jac=intensity_jacobian,
                                method='dogbox',
                                bounds=([0, 0], [np.inf, np.inf]))
 
@@ -164,3 +228,27 @@ cdef class TradingIntensityIndicator:
             self._alpha = Decimal(str(params[0][0]))
         except (RuntimeError, ValueError) as e:
             pass
+
+    cdef tuple c_fit_log_lambdas(self, object price_levels, object lambdas):
+        """
+        Fits log(lambda) = log(alpha) - kappa * delta by least squares, weighted by lambda ** 2 so that the errors
+        are those of lambda rather than of its logarithm, as the nonlinear fit minimizes them.
+        """
+        cdef:
+            double weights_sum
+            double mean_price_level
+            double variance
+            double kappa
+
+        log_lambdas = np.log(lambdas)
+        weights = lambdas * lambdas
+        weights_sum = weights.sum()
+        mean_price_level = np.dot(weights, price_levels) / weights_sum
+        mean_log_lambda = np.dot(weights, log_lambdas) / weights_sum
+        deviations = price_levels - mean_price_level
+        variance = np.dot(weights, deviations * deviations)
+        kappa = -np.dot(weights, deviations * (log_lambdas - mean_log_lambda)) / variance if variance > 0 else 0
+        if kappa <= 0:
+            # Bounded at a flat intensity, which the mean fits best
+            return float(np.mean(lambdas)), 0.0
+        return float(np.exp(mean_log_lambda + kappa * mean_price_level)), kappa
@@ -1,6 +1,7 @@
 from decimal import Decimal
 from typing import List, Optional
 
+from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from .data_types import (
     ArbProposal,
@@ -29,20 +30,21 @@ async def create_arb_proposals(
     """
     order_amount = Decimal(str(order_amount))
     results = []
+    # Fetches the quote and order prices of both markets for both sides at once, rather than one gateway round trip
+    # after the other
+    prices: List[Optional[Decimal]] = await safe_gather(*[
+        price_request
+        for is_buy in (True, False)
+        for price_request in (
+            market_info_1.market.get_quote_price(market_info_1.trading_pair, is_buy, order_amount),
+            market_info_1.market.get_order_price(market_info_1.trading_pair, is_buy, order_amount),
+            market_info_2.market.get_quote_price(market_info_2.trading_pair, not is_buy, order_amount),
+            market_info_2.market.get_order_price(market_info_2.trading_pair, not is_buy, order_amount),
+        )
+    ])
     for index in range(0, 2):
         is_buy: bool = not bool(index)  # bool(0) is False, so start with buy first
-        m_1_q_price: Optional[Decimal] = await market_info_1.market.get_quote_price(
-            market_info_1.trading_pair, is_buy, order_amount
-        )
-        m_1_o_price: Optional[Decimal] = await market_info_1.market.get_order_price(
-            market_info_1.trading_pair, is_buy, order_amount
-        )
-        m_2_q_price: Optional[Decimal] = await market_info_2.market.get_quote_price(
-            market_info_2.trading_pair, not is_buy, order_amount
-        )
-        m_2_o_price: Optional[Decimal] = await market_info_2.market.get_order_price(
-            market_info_2.trading_pair, not is_buy, order_amount
-        )
+        m_1_q_price, m_1_o_price, m_2_q_price, m_2_o_price = prices[index * 4:index * 4 + 4]
         if any(p is None for p in (m_1_o_price, m_1_q_price, m_2_o_price, m_2_q_price)):
             continue
         first_side = ArbProposalSide(
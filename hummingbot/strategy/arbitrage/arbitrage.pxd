@@ -1,5 +1,6 @@
 # distutils: language=c++
 
+from hummingbot.connector.exchange_base cimport ExchangeBase
 from hummingbot.core.data_type.order_book cimport OrderBook
 from hummingbot.strategy.strategy_base cimport StrategyBase
 from libc.stdint cimport int64_t
@@ -29,11 +30,25 @@ cdef class ArbitrageStrategy(StrategyBase):
         bint _hb_app_notification
         tuple _current_profitability
         double _last_conv_rates_logged
+        dict _quantization_cache
+        double _last_quantization_cache_reset
+        bint _event_driven_evaluation
+        set _dirty_market_pairs
+        dict _order_book_market_pairs
+        dict _subscribed_order_books
+        object _order_book_update_forwarder
+        bint _evaluation_scheduled
+        int64_t _evaluations_run
+        int64_t _evaluations_skipped
 
+    cdef bint c_ready_for_trading(self, bint should_report_warnings) except *
+    cdef c_update_order_book_subscriptions(self)
+    cdef c_process_dirty_market_pairs(self, bint count_skipped)
     cdef tuple c_calculate_arbitrage_top_order_profitability(self, object market_pair)
     cdef c_process_market_pair(self, object market_pair)
     cdef c_process_market_pair_inner(self, object buy_market_trading_pair, object sell_market_trading_pair)
     cdef tuple c_find_best_profitable_amount(self, object buy_market_trading_pair, object sell_market_trading_pair)
+    cdef tuple c_get_step_fee(self, object market_trading_pair_tuple, object trade_type, double amount, double price)
     cdef bint c_ready_for_new_orders(self, list market_trading_pairs)
 
 cdef list c_find_profitable_arbitrage_orders(object min_profitability,
@@ -41,3 +56,23 @@ cdef list c_find_profitable_arbitrage_orders(object min_profitability,
                                              object sell_market_trading_pair_tuple,
                                              object buy_market_conversion_rate,
                                              object sell_market_conversion_rate)
+
+cdef tuple c_find_profitable_arbitrage_steps(object min_profitability,
+                                             object buy_market_trading_pair_tuple,
+                                             object sell_market_trading_pair_tuple,
+                                             object buy_market_conversion_rate,
+                                             object sell_market_conversion_rate,
+                                             dict quantization_cache=*)
+
+cdef tuple c_match_arbitrage_levels(object bid_levels,
+                                    object ask_levels,
+                                    double bid_conversion_rate,
+                                    double ask_conversion_rate,
+                                    double min_profitability_ratio,
+                                    bint check_min_profitability,
+                                    int amount_decimals)
+
+cdef Py_ssize_t c_rows_needed(object rows, Py_ssize_t steps) except -1
+
+cdef int c_quantize_levels(ExchangeBase market, str trading_pair, double[:, ::1] raw_levels, Py_ssize_t count,
+                           list levels, tuple quantization_cache) except -1
@@ -1,6 +1,9 @@
 # distutils: language=c++
+import asyncio
 import logging
+import time
 from decimal import Decimal
+import numpy as np
 import pandas as pd
 from typing import (
     List,
@@ -9,10 +12,14 @@ from typing import (
 
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.exchange_base cimport ExchangeBase
+from hummingbot.core.clock cimport Clock
+from hummingbot.core.clock_mode import ClockMode
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.market_order import MarketOrder
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import OrderBookEvent
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.strategy.strategy_base import StrategyBase
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
@@ -22,6 +29,11 @@ from hummingbot.client.performance import PerformanceMetrics
 
 NaN = float("nan")
 s_decimal_0 = Decimal(0)
+# Number of levels read from each order book before the arbitrage search knows how deep the books cross
+ARBITRAGE_SEARCH_DEPTH = 8
+# Quantized order book levels are cached per market, up to this many prices or amounts, and for this many seconds
+QUANTIZATION_CACHE_SIZE = 10000
+QUANTIZATION_CACHE_TTL = 60. * 5
 as_logger = None
 
 
@@ -51,7 +63,8 @@ cdef class ArbitrageStrategy(StrategyBase):
                     use_oracle_conversion_rate: bool = False,
                     secondary_to_primary_base_conversion_rate: Decimal = Decimal("1"),
                     secondary_to_primary_quote_conversion_rate: Decimal = Decimal("1"),
-                    hb_app_notification: bool = False):
+                    hb_app_notification: bool = False,
+                    event_driven_evaluation: bool = False):
         """
         :param market_pairs: list of arbitrage market pairs
         :param min_profitability: minimum profitability limit, for calculating arbitrage order sizes
@@ -65,6 +78,8 @@ cdef class ArbitrageStrategy(StrategyBase):
         :param secondary_to_primary_base_conversion_rate: Conversion rate of base token between markets. The default is 1
         :param secondary_to_primary_quote_conversion_rate: Conversion rate of quote token between markets. The default is 1
         :param hb_app_notification: Enables sending notifications to the client application. The default is false.
+        :param event_driven_evaluation: Evaluates market pairs as soon as one of their order books is updated, and
+        only re-evaluates the market pairs with updated order books on clock ticks. The default is false.
         """
         if len(market_pairs) < 0:
             raise ValueError(f"market_pairs must not be empty.")
@@ -83,8 +98,18 @@ cdef class ArbitrageStrategy(StrategyBase):
         self._secondary_to_primary_base_conversion_rate = secondary_to_primary_base_conversion_rate
         self._secondary_to_primary_quote_conversion_rate = secondary_to_primary_quote_conversion_rate
         self._last_conv_rates_logged = 0
+        self._quantization_cache = {}
+        self._last_quantization_cache_reset = 0
 
         self._hb_app_notification = hb_app_notification
+        self._event_driven_evaluation = event_driven_evaluation
+        self._dirty_market_pairs = set()
+        self._order_book_market_pairs = {}
+        self._subscribed_order_books = {}
+        self._order_book_update_forwarder = SourceInfoEventForwarder(self._did_update_order_book)
+        self._evaluation_scheduled = False
+        self._evaluations_run = 0
+        self._evaluations_skipped = 0
 
         cdef:
             set all_markets = {
@@ -99,6 +124,25 @@ cdef class ArbitrageStrategy(StrategyBase):
     def min_profitability(self) -> Decimal:
         return self._min_profitability
 
+    @property
+    def event_driven_evaluation(self) -> bool:
+        return self._event_driven_evaluation
+
+    @property
+    def evaluations_run(self) -> int:
+        """
+        Number of market pair evaluations run, on clock ticks or on order book updates.
+        """
+        return self._evaluations_run
+
+    @property
+    def evaluations_skipped(self) -> int:
+        """
+        Number of market pair evaluations skipped on clock ticks in event driven mode, because neither order book of
+        the market pair was updated since the last evaluation.
+        """
+        return self._evaluations_skipped
+
     @property
     def use_oracle_conversion_rate(self) -> Decimal:
         return self._use_oracle_conversion_rate
@@ -216,6 +260,9 @@ cdef class ArbitrageStrategy(StrategyBase):
 
             warning_lines.extend(self.balance_warning([market_pair.first, market_pair.second]))
 
+        if self._event_driven_evaluation:
+            lines.extend(["", f"  Evaluations run: {self._evaluations_run}, skipped: {self._evaluations_skipped}"])
+
         if len(warning_lines) > 0:
             lines.extend(["", "  *** WARNINGS ***"] + warning_lines)
 
@@ -225,12 +272,57 @@ cdef class ArbitrageStrategy(StrategyBase):
         if self._hb_app_notification:
             super().notify_hb_app(msg)
 
+    cdef c_start(self, Clock clock, double timestamp):
+        StrategyBase.c_start(self, clock, timestamp)
+        if self._event_driven_evaluation:
+            self.c_update_order_book_subscriptions()
+
+    cdef c_stop(self, Clock clock):
+        cdef:
+            OrderBook order_book
+        for order_book in self._order_book_market_pairs:
+            order_book.c_remove_listener(OrderBookEvent.UpdateEvent.value, self._order_book_update_forwarder)
+        self._order_book_market_pairs.clear()
+        self._subscribed_order_books.clear()
+        StrategyBase.c_stop(self, clock)
+
+    cdef c_update_order_book_subscriptions(self):
+        """
+        Listens to the updates of the order books of every market pair. The order book trackers create new order books
+        when they start again (e.g. after a reconnection), so the market pairs whose order books were replaced move
+        their listeners to the new order books, and are marked for evaluation.
+        """
+        cdef:
+            OrderBook order_book
+            OrderBook subscribed_order_book
+            list market_pair_indices
+        for index, market_pair in enumerate(self._market_pairs):
+            for market_trading_pair_tuple in (market_pair.first, market_pair.second):
+                order_book = market_trading_pair_tuple.order_book
+                subscribed_order_book = self._subscribed_order_books.get((index, market_trading_pair_tuple))
+                if order_book is subscribed_order_book:
+                    continue
+                if subscribed_order_book is not None:
+                    market_pair_indices = self._order_book_market_pairs[subscribed_order_book]
+                    market_pair_indices.remove(index)
+                    if len(market_pair_indices) == 0:
+                        del self._order_book_market_pairs[subscribed_order_book]
+                        subscribed_order_book.c_remove_listener(OrderBookEvent.UpdateEvent.value,
+                                                                self._order_book_update_forwarder)
+                if order_book not in self._order_book_market_pairs:
+                    self._order_book_market_pairs[order_book] = []
+                    order_book.c_add_listener(OrderBookEvent.UpdateEvent.value, self._order_book_update_forwarder)
+                self._order_book_market_pairs[order_book].append(index)
+                self._subscribed_order_books[(index, market_trading_pair_tuple)] = order_book
+                self._dirty_market_pairs.add(index)
+
     cdef c_tick(self, double timestamp):
         """
         Clock tick entry point.
 
         For arbitrage strategy, this function simply checks for the readiness and connection status of markets, and
-        then delegates the processing of each market pair to c_process_market_pair().
+        then delegates the processing of each market pair to c_process_market_pair(). In event driven mode, only the
+        market pairs with order book updates not evaluated yet are processed.
 
         :param timestamp: current tick timestamp
         """
@@ -242,31 +334,92 @@ cdef class ArbitrageStrategy(StrategyBase):
             bint should_report_warnings = ((current_tick > last_tick) and
                                            (self._logging_options & self.OPTION_LOG_STATUS_REPORT))
         try:
-            if not self._all_markets_ready:
-                self._all_markets_ready = all([market.ready for market in self._sb_markets])
-                if not self._all_markets_ready:
-                    # Markets not ready yet. Don't do anything.
-                    if should_report_warnings:
-                        self.logger().warning(f"Markets are not ready. No arbitrage trading is permitted.")
-                    return
-                else:
-                    if self.OPTION_LOG_STATUS_REPORT:
-                        self.logger().info(f"Markets are ready. Trading started.")
-
-            if not all([market.network_status is NetworkStatus.CONNECTED for market in self._sb_markets]):
-                if should_report_warnings:
-                    self.logger().warning(f"Markets are not all online. No arbitrage trading is permitted.")
+            if not self.c_ready_for_trading(should_report_warnings):
                 return
 
-            for market_pair in self._market_pairs:
-                self.c_process_market_pair(market_pair)
+            if self._event_driven_evaluation:
+                self.c_update_order_book_subscriptions()
+                self.c_process_dirty_market_pairs(True)
+            else:
+                for market_pair in self._market_pairs:
+                    self.c_process_market_pair(market_pair)
             # log conversion rates every 5 minutes
             if self._last_conv_rates_logged + (60. * 5) < self._current_timestamp:
                 self.log_conversion_rates()
                 self._last_conv_rates_logged = self._current_timestamp
+            # markets may refresh their trading rules, so cached quantized levels are dropped from time to time
+            if self._last_quantization_cache_reset + QUANTIZATION_CACHE_TTL < self._current_timestamp:
+                self._quantization_cache.clear()
+                self._last_quantization_cache_reset = self._current_timestamp
         finally:
             self._last_timestamp = timestamp
 
+    cdef bint c_ready_for_trading(self, bint should_report_warnings) except *:
+        """
+        Checks whether all markets are ready and connected, which is required before any arbitrage trading.
+
+        :param should_report_warnings: whether to log the reason markets are not ready for trading
+        :return: True if ready, False if not
+        """
+        if not self._all_markets_ready:
+            self._all_markets_ready = all([market.ready for market in self._sb_markets])
+            if not self._all_markets_ready:
+                # Markets not ready yet. Don't do anything.
+                if should_report_warnings:
+                    self.logger().warning(f"Markets are not ready. No arbitrage trading is permitted.")
+                return False
+            else:
+                if self.OPTION_LOG_STATUS_REPORT:
+                    self.logger().info(f"Markets are ready. Trading started.")
+
+        if not all([market.network_status is NetworkStatus.CONNECTED for market in self._sb_markets]):
+            if should_report_warnings:
+                self.logger().warning(f"Markets are not all online. No arbitrage trading is permitted.")
+            return False
+        return True
+
+    cdef c_process_dirty_market_pairs(self, bint count_skipped):
+        """
+        Processes the market pairs with order book updates since their last evaluation.
+
+        :param count_skipped: whether to count the market pairs without updates as skipped evaluations
+        """
+        cdef:
+            set dirty_market_pairs = self._dirty_market_pairs
+        self._dirty_market_pairs = set()
+        for index, market_pair in enumerate(self._market_pairs):
+            if index in dirty_market_pairs:
+                self.c_process_market_pair(market_pair)
+            elif count_skipped:
+                self._evaluations_skipped += 1
+
+    def _did_update_order_book(self, event_tag: int, order_book: OrderBook, event: object):
+        """
+        Marks the market pairs of an updated order book for evaluation. The evaluation runs on the next iteration of
+        the event loop, so a burst of updates applied in one go is evaluated once.
+        """
+        self._dirty_market_pairs.update(self._order_book_market_pairs.get(order_book, ()))
+        if not self._evaluation_scheduled:
+            self._evaluation_scheduled = True
+            asyncio.get_event_loop().call_soon(self._evaluate_dirty_market_pairs)
+
+    def _evaluate_dirty_market_pairs(self):
+        """
+        Evaluates the market pairs marked by the order book updates. It runs between two clock ticks, so the strategy
+        timestamp (used for the orders and the logs) is first brought up to date with the clock.
+        """
+        self._evaluation_scheduled = False
+        try:
+            # the strategy may have been stopped since the evaluation was scheduled
+            if len(self._order_book_market_pairs) == 0 or not self.c_ready_for_trading(False):
+                return
+            if self._clock is not None:
+                self._current_timestamp = (time.time() if self._clock.clock_mode is ClockMode.REALTIME
+                                           else self._clock.current_timestamp)
+            self.c_process_dirty_market_pairs(False)
+        except Exception:
+            self.logger().error("Unexpected error evaluating the updated market pairs.", exc_info=True)
+
     cdef c_did_complete_buy_order(self, object buy_order_completed_event):
         """
         Output log for completed buy order.
@@ -385,8 +538,12 @@ cdef class ArbitrageStrategy(StrategyBase):
         :param market_pair: arbitrage market pair
         """
         if not self.c_ready_for_new_orders([market_pair.first, market_pair.second]):
+            if self._event_driven_evaluation:
+                # evaluate it again once the market pair is ready, even if its order books did not change
+                self._dirty_market_pairs.add(self._market_pairs.index(market_pair))
             return
 
+        self._evaluations_run += 1
         self._current_profitability = \
             self.c_calculate_arbitrage_top_order_profitability(market_pair)
 
@@ -456,6 +613,19 @@ cdef class ArbitrageStrategy(StrategyBase):
                                                   buy_market_conversion_rate,
                                                   sell_market_conversion_rate)
 
+    @staticmethod
+    def find_profitable_arbitrage_steps(min_profitability: Decimal,
+                                        buy_market_trading_pair: MarketTradingPairTuple,
+                                        sell_market_trading_pair: MarketTradingPairTuple,
+                                        buy_market_conversion_rate,
+                                        sell_market_conversion_rate):
+
+        return c_find_profitable_arbitrage_steps(min_profitability,
+                                                 buy_market_trading_pair,
+                                                 sell_market_trading_pair,
+                                                 buy_market_conversion_rate,
+                                                 sell_market_conversion_rate)
+
     def market_conversion_rate(self, market_info: MarketTradingPairTuple) -> Decimal:
         if market_info == self._market_pairs[0].first:
             return Decimal("1")
@@ -481,131 +651,143 @@ cdef class ArbitrageStrategy(StrategyBase):
         markets and the profitability ratio. This function accounts for trading fees required by both markets before
         arriving at the optimal order size and profitability ratio.
 
+        The step schedule comes from c_find_profitable_arbitrage_steps(), and the accumulated profitability of every
+        step is evaluated in a single pass over float arrays. The fees of each step are those of its accumulated amount
+        at its price; they are only fetched for every step when the fees of the first and the last steps differ (e.g.
+        tiered or gas fees), and the available balances are fetched once. Decimal is only used for the resulting order
+        size and prices.
+
         :param buy_market_trading_pair_tuple: trading pair for buy side
         :param sell_market_trading_pair_tuple: trading pair for sell side
         :return: (order size, profitability ratio, bid_price, ask_price)
-        :rtype: Tuple[float, float, float, float]
+        :rtype: Tuple[Decimal, Decimal, Decimal, Decimal]
         """
         cdef:
-            object total_bid_value = s_decimal_0  # total revenue
-            object total_ask_value = s_decimal_0  # total cost
-            object total_bid_value_adjusted = s_decimal_0  # total revenue adjusted with exchange rate conversion
-            object total_ask_value_adjusted = s_decimal_0  # total cost adjusted with exchange rate conversion
-            object total_previous_step_base_amount = s_decimal_0
-            object bid_price = s_decimal_0  # bid price
-            object ask_price = s_decimal_0  # ask price
-            object profitability
             object best_profitable_order_amount = s_decimal_0
             object best_profitable_order_profitability = s_decimal_0
-            object buy_fee
-            object sell_fee
-            object total_sell_flat_fees
+            object bid_price = s_decimal_0
+            object ask_price = s_decimal_0
+            list buy_fees
+            list sell_fees
+            object buy_fee_percent
             object total_buy_flat_fees
-            object quantized_profitable_base_amount
-            object net_sell_proceeds
-            object net_buy_costs
             object buy_market_quote_balance
             object sell_market_base_balance
+            double min_profitability_ratio = float(1 + self._min_profitability)
+            Py_ssize_t last_step
             ExchangeBase buy_market = buy_market_trading_pair_tuple.market
             ExchangeBase sell_market = sell_market_trading_pair_tuple.market
-            OrderBook buy_order_book = buy_market_trading_pair_tuple.order_book
-            OrderBook sell_order_book = sell_market_trading_pair_tuple.order_book
 
         buy_market_conversion_rate = self.market_conversion_rate(buy_market_trading_pair_tuple)
         sell_market_conversion_rate = self.market_conversion_rate(sell_market_trading_pair_tuple)
-        profitable_orders = c_find_profitable_arbitrage_orders(self._min_profitability,
-                                                               buy_market_trading_pair_tuple,
-                                                               sell_market_trading_pair_tuple,
-                                                               buy_market_conversion_rate,
-                                                               sell_market_conversion_rate)
-
-        # check if each step meets the profit level after fees, and is within the wallet balance
-        # fee must be calculated at every step because fee might change a potentially profitable order to unprofitable
-        # market.c_get_fee returns a namedtuple with 2 keys "percent" and "flat_fees"
-        # "percent" is the percent in decimals the exchange charges for the particular trade
-        # "flat_fees" returns list of additional fees ie: [("ETH", 0.01), ("BNB", 2.5)]
-        # typically most exchanges will only have 1 flat fee (ie: gas cost of transaction in ETH)
-        for bid_price_adjusted, ask_price_adjusted, bid_price, ask_price, amount in profitable_orders:
-            buy_fee = buy_market.c_get_fee(
-                buy_market_trading_pair_tuple.base_asset,
-                buy_market_trading_pair_tuple.quote_asset,
-                buy_market_trading_pair_tuple.market.get_taker_order_type(),
-                TradeType.BUY,
-                total_previous_step_base_amount + amount,
-                ask_price
-            )
-            sell_fee = sell_market.c_get_fee(
-                sell_market_trading_pair_tuple.base_asset,
-                sell_market_trading_pair_tuple.quote_asset,
-                sell_market_trading_pair_tuple.market.get_taker_order_type(),
-                TradeType.SELL,
-                total_previous_step_base_amount + amount,
-                bid_price
-            )
-            # accumulated flat fees of exchange
-            total_buy_flat_fees = self.c_sum_flat_fees(buy_market_trading_pair_tuple.quote_asset, buy_fee.flat_fees)
-            total_sell_flat_fees = self.c_sum_flat_fees(sell_market_trading_pair_tuple.quote_asset, sell_fee.flat_fees)
-
-            # accumulated profitability with fees
-            total_bid_value_adjusted += bid_price_adjusted * amount
-            total_ask_value_adjusted += ask_price_adjusted * amount
-            net_sell_proceeds = total_bid_value_adjusted * (1 - sell_fee.percent) - total_sell_flat_fees
-            net_buy_costs = total_ask_value_adjusted * (1 + buy_fee.percent) + total_buy_flat_fees
-            profitability = net_sell_proceeds / net_buy_costs
-
-            # if current step is within minimum profitability, set to best profitable order
-            # because the total amount is greater than the previous step
-            if profitability > (1 + self._min_profitability):
-                best_profitable_order_amount = total_previous_step_base_amount + amount
-                best_profitable_order_profitability = profitability
-
-            if self._logging_options & self.OPTION_LOG_PROFITABILITY_STEP:
-                self.log_with_clock(logging.DEBUG, f"Total profitability with fees: {profitability}, "
-                                                   f"Current step profitability: {bid_price/ask_price},"
-                                                   f"bid, ask price, amount: {bid_price, ask_price, amount}")
-            buy_market_quote_balance = buy_market.c_get_available_balance(buy_market_trading_pair_tuple.quote_asset)
-            sell_market_base_balance = sell_market.c_get_available_balance(sell_market_trading_pair_tuple.base_asset)
-            # stop current step if buy/sell market does not have enough asset
-            if (buy_market_quote_balance < net_buy_costs or
-                    sell_market_base_balance < (total_previous_step_base_amount + amount)):
-                # use previous step as best profitable order if below min profitability
-                if profitability < (1 + self._min_profitability):
-                    break
-                if self._logging_options & self.OPTION_LOG_INSUFFICIENT_ASSET:
-                    self.log_with_clock(logging.DEBUG,
-                                        f"Not enough asset to complete this step. "
-                                        f"Quote asset needed: {total_ask_value + ask_price * amount}. "
-                                        f"Quote asset available balance: {buy_market_quote_balance}. "
-                                        f"Base asset needed: {total_bid_value + bid_price * amount}. "
-                                        f"Base asset available balance: {sell_market_base_balance}. ")
-
-                # market buys need to be adjusted to account for additional fees
-                buy_market_adjusted_order_size = ((buy_market_quote_balance / ask_price - total_buy_flat_fees) /
-                                                  (1 + buy_fee.percent))
-                # buy and sell with the amount of available base or quote asset, whichever is smaller
-                best_profitable_order_amount = min(sell_market_base_balance, buy_market_adjusted_order_size)
-                best_profitable_order_profitability = profitability
-                break
-
-            total_bid_value += bid_price * amount
-            total_ask_value += ask_price * amount
-            total_previous_step_base_amount += amount
-
+        bid_prices_adjusted, ask_prices_adjusted, bid_prices, ask_prices, amounts, amount_decimals = \
+            c_find_profitable_arbitrage_steps(self._min_profitability,
+                                              buy_market_trading_pair_tuple,
+                                              sell_market_trading_pair_tuple,
+                                              buy_market_conversion_rate,
+                                              sell_market_conversion_rate,
+                                              self._quantization_cache)
+        if amounts.shape[0] == 0:
+            return best_profitable_order_amount, best_profitable_order_profitability, bid_price, ask_price
+
+        total_amounts = np.round(np.cumsum(amounts), amount_decimals)
+        # (percent, total flat fees) of each step. The fees of the steps in between are assumed to be the same when the
+        # first and the last steps have the same fees, otherwise they are fetched for every step.
+        last_step = amounts.shape[0] - 1
+        buy_fees = [self.c_get_step_fee(buy_market_trading_pair_tuple, TradeType.BUY, total_amounts[0], ask_prices[0])]
+        sell_fees = [self.c_get_step_fee(sell_market_trading_pair_tuple, TradeType.SELL, total_amounts[0], bid_prices[0])]
+        if last_step > 0:
+            buy_fees.append(self.c_get_step_fee(buy_market_trading_pair_tuple, TradeType.BUY,
+                                                total_amounts[last_step], ask_prices[last_step]))
+            sell_fees.append(self.c_get_step_fee(sell_market_trading_pair_tuple, TradeType.SELL,
+                                                 total_amounts[last_step], bid_prices[last_step]))
+            if buy_fees[0] == buy_fees[1] and sell_fees[0] == sell_fees[1]:
+                buy_fees = buy_fees[:1]
+                sell_fees = sell_fees[:1]
+            else:
+                buy_fees = [self.c_get_step_fee(buy_market_trading_pair_tuple, TradeType.BUY,
+                                                total_amounts[step], ask_prices[step])
+                            for step in range(last_step + 1)]
+                sell_fees = [self.c_get_step_fee(sell_market_trading_pair_tuple, TradeType.SELL,
+                                                 total_amounts[step], bid_prices[step])
+                             for step in range(last_step + 1)]
+        buy_fee_percents = np.array([float(percent) for percent, _ in buy_fees])
+        buy_flat_fees = np.array([float(flat_fees) for _, flat_fees in buy_fees])
+        sell_fee_percents = np.array([float(percent) for percent, _ in sell_fees])
+        sell_flat_fees = np.array([float(flat_fees) for _, flat_fees in sell_fees])
+        buy_market_quote_balance = buy_market.c_get_available_balance(buy_market_trading_pair_tuple.quote_asset)
+        sell_market_base_balance = sell_market.c_get_available_balance(sell_market_trading_pair_tuple.base_asset)
+
+        # accumulated profitability with fees, for every step
+        net_sell_proceeds = np.cumsum(bid_prices_adjusted * amounts) * (1 - sell_fee_percents) - sell_flat_fees
+        net_buy_costs = np.cumsum(ask_prices_adjusted * amounts) * (1 + buy_fee_percents) + buy_flat_fees
+        profitabilities = net_sell_proceeds / net_buy_costs
+
+        # the search stops at the first step that the buy/sell market does not have enough asset for
+        insufficient_asset = ((net_buy_costs > float(buy_market_quote_balance)) |
+                              (total_amounts > float(sell_market_base_balance)))
+        if insufficient_asset.any():
+            last_step = np.argmax(insufficient_asset)
+
+        # the largest step within minimum profitability is the best profitable order
+        profitable_steps = np.flatnonzero(profitabilities[:last_step + 1] > min_profitability_ratio)
+        if profitable_steps.shape[0] > 0:
+            best_profitable_order_amount = Decimal(str(total_amounts[profitable_steps[-1]]))
+            best_profitable_order_profitability = Decimal(str(profitabilities[profitable_steps[-1]]))
+
+        bid_price = Decimal(str(bid_prices[last_step]))
+        ask_price = Decimal(str(ask_prices[last_step]))
+        if insufficient_asset[last_step] and not profitabilities[last_step] < min_profitability_ratio:
+            if self._logging_options & self.OPTION_LOG_INSUFFICIENT_ASSET:
+                self.log_with_clock(logging.DEBUG,
+                                    f"Not enough asset to complete this step. "
+                                    f"Quote asset needed: {net_buy_costs[last_step]}. "
+                                    f"Quote asset available balance: {buy_market_quote_balance}. "
+                                    f"Base asset needed: {total_amounts[last_step]}. "
+                                    f"Base asset available balance: {sell_market_base_balance}. ")
+            # market buys need to be adjusted to account for additional fees
+            buy_fee_percent, total_buy_flat_fees = buy_fees[last_step if len(buy_fees) > 1 else 0]
+            buy_market_adjusted_order_size = ((buy_market_quote_balance / ask_price - total_buy_flat_fees) /
+                                              (1 + buy_fee_percent))
+            # buy and sell with the amount of available base or quote asset, whichever is smaller
+            best_profitable_order_amount = min(sell_market_base_balance, buy_market_adjusted_order_size)
+            best_profitable_order_profitability = Decimal(str(profitabilities[last_step]))
+
+        if self._logging_options & self.OPTION_LOG_PROFITABILITY_STEP:
+            for step in range(last_step + 1):
+                self.log_with_clock(logging.DEBUG, f"Total profitability with fees: {profitabilities[step]}, "
+                                                   f"Current step profitability: {bid_prices[step] / ask_prices[step]},"
+                                                   f"bid, ask price, amount: "
+                                                   f"{bid_prices[step], ask_prices[step], amounts[step]}")
         if self._logging_options & self.OPTION_LOG_FULL_PROFITABILITY_STEP:
             self.log_with_clock(
                 logging.DEBUG,
                 "\n" + pd.DataFrame(
-                    data=[
-                        [b_price_adjusted/a_price_adjusted,
-                         b_price_adjusted, a_price_adjusted, b_price, a_price, amount]
-                        for b_price_adjusted, a_price_adjusted, b_price, a_price, amount in profitable_orders],
-                    columns=['raw_profitability', 'bid_price_adjusted', 'ask_price_adjusted',
-                             'bid_price', 'ask_price', 'step_amount']
+                    data={"raw_profitability": bid_prices_adjusted / ask_prices_adjusted,
+                          "bid_price_adjusted": bid_prices_adjusted,
+                          "ask_price_adjusted": ask_prices_adjusted,
+                          "bid_price": bid_prices,
+                          "ask_price": ask_prices,
+                          "step_amount": amounts}
                 ).to_string()
             )
 
         return best_profitable_order_amount, best_profitable_order_profitability, bid_price, ask_price
 
+    cdef tuple c_get_step_fee(self, object market_trading_pair_tuple, object trade_type, double amount, double price):
+        """
+        :return: (fee percent, total flat fees in quote asset) of a taker order for an arbitrage step
+        """
+        cdef:
+            ExchangeBase market = market_trading_pair_tuple.market
+        fee = market.c_get_fee(market_trading_pair_tuple.base_asset,
+                               market_trading_pair_tuple.quote_asset,
+                               market.get_taker_order_type(),
+                               trade_type,
+                               Decimal(str(amount)),
+                               Decimal(str(price)))
+        return fee.percent, self.c_sum_flat_fees(market_trading_pair_tuple.quote_asset, fee.flat_fees)
+
     # The following exposed Python functions are meant for unit tests
     # ---------------------------------------------------------------
     def find_best_profitable_amount(self, buy_market: MarketTradingPairTuple, sell_market: MarketTradingPairTuple):
@@ -704,3 +886,209 @@ cdef list c_find_profitable_arbitrage_orders(object min_profitability,
         pass
 
     return profitable_orders
+
+
+cdef tuple c_find_profitable_arbitrage_steps(object min_profitability,
+                                             object buy_market_trading_pair_tuple,
+                                             object sell_market_trading_pair_tuple,
+                                             object buy_market_conversion_rate,
+                                             object sell_market_conversion_rate,
+                                             dict quantization_cache=None):
+    """
+    Vectorized equivalent of c_find_profitable_arbitrage_orders().
+
+    The bid and ask levels are matched against each other through their cumulative amounts, instead of advancing both
+    order book iterators one step at a time. The raw order book levels are matched first to find how deep the books
+    cross, then only those levels are quantized by their markets, the same way as order_book_bid_entries() and
+    order_book_ask_entries() do, and matched again to produce the steps.
+
+    :param min_profitability: Minimum profit ratio
+    :param buy_market_trading_pair_tuple: trading pair for buy side
+    :param sell_market_trading_pair_tuple: trading pair for sell side
+    :param buy_market_conversion_rate: conversion rate for buy market price
+    :param sell_market_conversion_rate: conversion rate for sell market price
+    :param quantization_cache: quantized order book levels from previous searches, by market and trading pair
+    :return: (bid_price_adjusted, ask_price_adjusted, bid_price, ask_price, amount, amount_decimals), the first five
+             being float arrays with one element per step, and amount_decimals the number of decimals the cumulative
+             amounts should be rounded to
+    """
+    cdef:
+        ExchangeBase buy_market = buy_market_trading_pair_tuple.market
+        ExchangeBase sell_market = sell_market_trading_pair_tuple.market
+        OrderBook buy_order_book = buy_market_trading_pair_tuple.order_book
+        OrderBook sell_order_book = sell_market_trading_pair_tuple.order_book
+        str buy_trading_pair = buy_market_trading_pair_tuple.trading_pair
+        str sell_trading_pair = sell_market_trading_pair_tuple.trading_pair
+        double bid_conversion_rate = float(sell_market_conversion_rate)
+        double ask_conversion_rate = float(buy_market_conversion_rate)
+        double min_profitability_ratio = float(1 + min_profitability)
+        bint check_min_profitability = min_profitability < 0
+        Py_ssize_t depth = ARBITRAGE_SEARCH_DEPTH
+        Py_ssize_t bid_count
+        Py_ssize_t ask_count
+        Py_ssize_t steps
+        int amount_decimals = 0
+        list bids = []
+        list asks = []
+        bint bids_exhausted
+        bint asks_exhausted
+        bint grow
+        tuple buy_quantization_cache
+        tuple sell_quantization_cache
+
+    if quantization_cache is None:
+        quantization_cache = {}
+    buy_quantization_cache = quantization_cache.setdefault((buy_market, buy_trading_pair), ({}, {}))
+    sell_quantization_cache = quantization_cache.setdefault((sell_market, sell_trading_pair), ({}, {}))
+
+    raw_bids = sell_order_book.bids_array(depth)
+    raw_asks = buy_order_book.asks_array(depth)
+    while True:
+        totals, bid_rows, ask_rows, steps, bids_exhausted, asks_exhausted = c_match_arbitrage_levels(
+            raw_bids, raw_asks, bid_conversion_rate, ask_conversion_rate, min_profitability_ratio,
+            check_min_profitability, -1
+        )
+        if steps < totals.shape[0] or not ((bids_exhausted and raw_bids.shape[0] == depth) or
+                                           (asks_exhausted and raw_asks.shape[0] == depth)):
+            break
+        depth *= 4
+        raw_bids = sell_order_book.bids_array(depth)
+        raw_asks = buy_order_book.asks_array(depth)
+
+    # quantization may move the point where the books stop crossing, so one more level is read from each side
+    bid_count = c_rows_needed(bid_rows, steps) + 1
+    ask_count = c_rows_needed(ask_rows, steps) + 1
+    while True:
+        if ((bid_count > raw_bids.shape[0] and raw_bids.shape[0] == depth) or
+                (ask_count > raw_asks.shape[0] and raw_asks.shape[0] == depth)):
+            depth = max(bid_count, ask_count) * 2
+            raw_bids = sell_order_book.bids_array(depth)
+            raw_asks = buy_order_book.asks_array(depth)
+        bid_count = min(bid_count, raw_bids.shape[0])
+        ask_count = min(ask_count, raw_asks.shape[0])
+        amount_decimals = max(amount_decimals,
+                              c_quantize_levels(sell_market, sell_trading_pair, raw_bids, bid_count, bids,
+                                                sell_quantization_cache),
+                              c_quantize_levels(buy_market, buy_trading_pair, raw_asks, ask_count, asks,
+                                                buy_quantization_cache))
+        bid_levels = np.array(bids, dtype=np.float64).reshape(-1, 2)
+        ask_levels = np.array(asks, dtype=np.float64).reshape(-1, 2)
+        totals, bid_rows, ask_rows, steps, bids_exhausted, asks_exhausted = c_match_arbitrage_levels(
+            bid_levels, ask_levels, bid_conversion_rate, ask_conversion_rate, min_profitability_ratio,
+            check_min_profitability, amount_decimals
+        )
+
+        # keep reading levels while the steps run out of a side that has more of them
+        grow = False
+        if steps == totals.shape[0]:
+            if bids_exhausted and (bid_count < raw_bids.shape[0] or raw_bids.shape[0] == depth):
+                bid_count *= 2
+                grow = True
+            if asks_exhausted and (ask_count < raw_asks.shape[0] or raw_asks.shape[0] == depth):
+                ask_count *= 2
+                grow = True
+        if not grow:
+            break
+
+    bid_prices = bid_levels[bid_rows[:steps], 0]
+    ask_prices = ask_levels[ask_rows[:steps], 0]
+    amounts = np.round(np.diff(totals[:steps], prepend=0), amount_decimals)
+    return (bid_prices * bid_conversion_rate,
+            ask_prices * ask_conversion_rate,
+            bid_prices,
+            ask_prices,
+            amounts,
+            amount_decimals)
+
+
+cdef tuple c_match_arbitrage_levels(object bid_levels,
+                                    object ask_levels,
+                                    double bid_conversion_rate,
+                                    double ask_conversion_rate,
+                                    double min_profitability_ratio,
+                                    bint check_min_profitability,
+                                    int amount_decimals):
+    """
+    Matches bid levels against ask levels, both given as arrays with the price and amount in their first two columns
+    and the best price first. Every step ends where the cumulative amount of either side reaches the end of a level.
+
+    :param amount_decimals: decimals the cumulative amounts are rounded to, or -1 to leave them as they are
+    :return: (cumulative amounts at the end of every step, bid level row of every step, ask level row of every step,
+              number of profitable steps, whether the bid levels ran out, whether the ask levels ran out)
+    """
+    # levels without amount never make a step
+    bid_rows = np.flatnonzero(bid_levels[:, 1] > 0)
+    ask_rows = np.flatnonzero(ask_levels[:, 1] > 0)
+    if bid_rows.shape[0] == 0 or ask_rows.shape[0] == 0:
+        return np.empty(0, dtype=np.float64), bid_rows[:0], ask_rows[:0], 0, bid_rows.shape[0] == 0, \
+            ask_rows.shape[0] == 0
+
+    bid_totals = np.cumsum(bid_levels[bid_rows, 1])
+    ask_totals = np.cumsum(ask_levels[ask_rows, 1])
+    if amount_decimals >= 0:
+        bid_totals = np.round(bid_totals, amount_decimals)
+        ask_totals = np.round(ask_totals, amount_decimals)
+    totals = np.union1d(bid_totals, ask_totals)
+    totals = totals[totals <= min(bid_totals[-1], ask_totals[-1])]
+    bid_rows = bid_rows[np.searchsorted(bid_totals, totals)]
+    ask_rows = ask_rows[np.searchsorted(ask_totals, totals)]
+
+    # arbitrage is not possible from the first step where the adjusted prices no longer cross
+    bid_prices_adjusted = bid_levels[bid_rows, 0] * bid_conversion_rate
+    ask_prices_adjusted = ask_levels[ask_rows, 0] * ask_conversion_rate
+    crossed = bid_prices_adjusted >= ask_prices_adjusted
+    if check_min_profitability:
+        # allow negative profitability for debugging
+        crossed &= bid_prices_adjusted / ask_prices_adjusted >= min_profitability_ratio
+    steps = totals.shape[0] if crossed.all() else np.argmin(crossed)
+    return totals, bid_rows, ask_rows, steps, bid_totals[-1] <= ask_totals[-1], ask_totals[-1] <= bid_totals[-1]
+
+
+cdef Py_ssize_t c_rows_needed(object rows, Py_ssize_t steps) except -1:
+    """
+    :return: the number of levels of a side read by the first steps, including the one the search stops at
+    """
+    if rows.shape[0] == 0:
+        return 0
+    return rows[min(steps, rows.shape[0] - 1)] + 1
+
+
+cdef int c_quantize_levels(ExchangeBase market, str trading_pair, double[:, ::1] raw_levels, Py_ssize_t count,
+                           list levels, tuple quantization_cache) except -1:
+    """
+    Quantizes order book levels the same way as ExchangeBase.order_book_bid_entries() does, extending levels with the
+    (price, amount) of the raw levels up to count.
+
+    Levels rarely change between two searches, so the quantized prices and amounts are looked up in
+    quantization_cache, a (prices, amounts) tuple of dictionaries keyed by the raw values, before asking the market.
+
+    :return: the number of decimals of the most precise quantized amount
+    """
+    cdef:
+        dict quantized_prices = quantization_cache[0]
+        dict quantized_amounts = quantization_cache[1]
+        int amount_decimals = 0
+        Py_ssize_t i
+        double raw_price
+        double raw_amount
+
+    if len(quantized_prices) > QUANTIZATION_CACHE_SIZE:
+        quantized_prices.clear()
+    if len(quantized_amounts) > QUANTIZATION_CACHE_SIZE:
+        quantized_amounts.clear()
+
+    for i in range(len(levels), count):
+        raw_price = raw_levels[i, 0]
+        raw_amount = raw_levels[i, 1]
+        price = quantized_prices.get(raw_price)
+        if price is None:
+            price = float(market.c_quantize_order_price(trading_pair, Decimal(raw_price)))
+            quantized_prices[raw_price] = price
+        amount_and_decimals = quantized_amounts.get(raw_amount)
+        if amount_and_decimals is None:
+            amount = market.c_quantize_order_amount(trading_pair, Decimal(raw_amount))
+            amount_and_decimals = (float(amount), max(0, -amount.as_tuple().exponent))
+            quantized_amounts[raw_amount] = amount_and_decimals
+        amount_decimals = max(amount_decimals, amount_and_decimals[1])
+        levels.append((price, amount_and_decimals[0]))
+    return amount_decimals
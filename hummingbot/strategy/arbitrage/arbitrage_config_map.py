@@ -130,4 +130,12 @@ arbitrage_config_map = {
         validator=lambda v: validate_decimal(v, Decimal(0), inclusive=False),
         type_str="decimal",
     ),
+    "event_driven_evaluation": ConfigVar(
+        key="event_driven_evaluation",
+        type_str="bool",
+        prompt="Do you want to evaluate arbitrage as soon as an order book changes, instead of on every clock tick? "
+               "(Yes/No) >>> ",
+        default=False,
+        validator=lambda v: validate_bool(v),
+    ),
 }
@@ -18,6 +18,7 @@ def start(self):
     use_oracle_conversion_rate = arbitrage_config_map.get("use_oracle_conversion_rate").value
     secondary_to_primary_base_conversion_rate = arbitrage_config_map["secondary_to_primary_base_conversion_rate"].value
     secondary_to_primary_quote_conversion_rate = arbitrage_config_map["secondary_to_primary_quote_conversion_rate"].value
+    event_driven_evaluation = arbitrage_config_map.get("event_driven_evaluation").value
 
     try:
         primary_trading_pair: str = raw_primary_trading_pair
@@ -44,4 +45,5 @@ def start(self):
                               use_oracle_conversion_rate=use_oracle_conversion_rate,
                               secondary_to_primary_base_conversion_rate=secondary_to_primary_base_conversion_rate,
                               secondary_to_primary_quote_conversion_rate=secondary_to_primary_quote_conversion_rate,
-                              hb_app_notification=True)
+                              hb_app_notification=True,
+                              event_driven_evaluation=event_driven_evaluation)
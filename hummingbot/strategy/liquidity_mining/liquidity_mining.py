@@ -1,7 +1,6 @@
 import asyncio
 import logging
 from decimal import Decimal
-from statistics import mean
 from typing import Dict, List, Set
 
 import numpy as np
@@ -22,6 +21,7 @@ from hummingbot.strategy.pure_market_making.inventory_skew_calculator import (
 from hummingbot.strategy.strategy_py_base import StrategyPyBase
 from hummingbot.strategy.utils import order_age
 from .data_types import PriceSize, Proposal
+from .rolling_volatility import RollingVolatility
 
 NaN = float("nan")
 s_decimal_zero = Decimal(0)
@@ -79,7 +79,8 @@ class LiquidityMiningStrategy(StrategyPyBase):
         self._token_balances = {}
         self._sell_budgets = {}
         self._buy_budgets = {}
-        self._mid_prices = {market: [] for market in market_infos}
+        self._mid_prices_volatility = {market: RollingVolatility(volatility_interval, avg_volatility_period)
+                                       for market in market_infos}
         self._volatility = {market: s_decimal_nan for market in self._market_infos}
         self._last_vol_reported = 0.
         self._hb_app_notification = hb_app_notification
@@ -530,28 +531,13 @@ class LiquidityMiningStrategy(StrategyPyBase):
         """
         for market in self._market_infos:
             mid_price = self._market_infos[market].get_mid_price()
-            self._mid_prices[market].append(mid_price)
-            # To avoid memory leak, we store only the last part of the list needed for volatility calculation
-            max_len = self._volatility_interval * self._avg_volatility_period
-            self._mid_prices[market] = self._mid_prices[market][-1 * max_len:]
+            self._mid_prices_volatility[market].add_price(mid_price)
 
     def update_volatility(self):
         """
         Update volatility data from the market
         """
-        self._volatility = {market: s_decimal_nan for market in self._market_infos}
-        for market, mid_prices in self._mid_prices.items():
-            last_index = len(mid_prices) - 1
-            atr = []
-            first_index = last_index - (self._volatility_interval * self._avg_volatility_period)
-            first_index = max(first_index, 0)
-            for i in range(last_index, first_index, self._volatility_interval * -1):
-                prices = mid_prices[i - self._volatility_interval + 1: i + 1]
-                if not prices:
-                    break
-                atr.append((max(prices) - min(prices)) / min(prices))
-            if atr:
-                self._volatility[market] = mean(atr)
+        self._volatility = {market: volatility.value for market, volatility in self._mid_prices_volatility.items()}
         if self._last_vol_reported < self.current_timestamp - self._volatility_interval:
             for market, vol in self._volatility.items():
                 if not vol.is_nan():
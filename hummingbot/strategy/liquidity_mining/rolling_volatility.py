@@ -0,0 +1,85 @@
+from collections import deque
+from decimal import MAX_EMAX, MAX_PREC, MIN_EMIN, Context, Decimal
+from typing import Deque, List
+
+import numpy as np
+
+s_decimal_0 = Decimal("0")
+s_decimal_nan = Decimal("NaN")
+# Context of the running sums of the price ranges, large enough for them to be exact
+exact_context = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN)
+
+
+class RollingVolatility:
+    """
+    Volatility of the mid prices of a market as the liquidity mining strategy calculates it: the mean, over the last
+    `avg_volatility_period` intervals of `volatility_interval` mid prices ending at the last one, of the price range of
+    each interval relative to its lowest price.
+
+    The mid prices needed are kept in a fixed size ring buffer. The range of the interval ending at a mid price is
+    calculated once, when the price is added, from the rolling lowest and highest prices kept by monotonic deques, and
+    stored in a second ring buffer. The ranges of the intervals ending every `volatility_interval` prices are summed
+    as they are stored and dropped, so that the volatility is their running sum divided by their count. The sums are
+    exact, and the volatility is the mean `statistics.mean` calculates from the ranges.
+    """
+
+    def __init__(self, volatility_interval: int, avg_volatility_period: int):
+        self._interval: int = volatility_interval
+        self._length: int = volatility_interval * avg_volatility_period
+        self._prices: np.ndarray = np.empty(self._length, dtype=object)
+        # Relative price range of the interval ending at each price, once there are enough prices for a whole interval
+        self._ranges: np.ndarray = np.empty(self._length, dtype=object)
+        self._count: int = 0
+        # Sum of the stored ranges of the intervals ending at the prices of each index modulo volatility_interval
+        self._range_sums: List[Decimal] = [s_decimal_0] * volatility_interval
+        # Indices of the prices of the current interval that can still be its lowest (highest) price, in increasing
+        # (decreasing) price order
+        self._lowest_indices: Deque[int] = deque()
+        self._highest_indices: Deque[int] = deque()
+
+    @property
+    def value(self) -> Decimal:
+        size = min(self._count, self._length)
+        if size < 2:
+            return s_decimal_nan
+        if size < self._interval:
+            # Until there are enough prices for a whole interval, a single, shorter, interval is used, from the
+            # (2 * size - volatility_interval)th price
+            prices = self._prices[max(0, 2 * size - self._interval):size]
+            lowest = min(prices)
+            return (max(prices) - lowest) / lowest
+
+        # The intervals end at the last price and every volatility_interval prices before it, the first one being
+        # left out when volatility_interval is 1, its range being 0 anyway
+        intervals = (size - 1 - max(self._interval - 1, 1)) // self._interval + 1
+        return self._range_sums[(self._count - 1) % self._interval] / intervals
+
+    def add_price(self, price: Decimal):
+        index = self._count
+        self._prices[index % self._length] = price
+        self._count += 1
+
+        while self._lowest_indices and self._price(self._lowest_indices[-1]) >= price:
+            self._lowest_indices.pop()
+        self._lowest_indices.append(index)
+        while self._highest_indices and self._price(self._highest_indices[-1]) <= price:
+            self._highest_indices.pop()
+        self._highest_indices.append(index)
+        if self._lowest_indices[0] <= index - self._interval:
+            self._lowest_indices.popleft()
+        if self._highest_indices[0] <= index - self._interval:
+            self._highest_indices.popleft()
+
+        if index >= self._interval - 1:
+            lowest = self._price(self._lowest_indices[0])
+            highest = self._price(self._highest_indices[0])
+            price_range = (highest - lowest) / lowest
+            range_sum = self._range_sums[index % self._interval]
+            if index - self._length >= self._interval - 1:
+                # The range of the interval volatility_interval * avg_volatility_period prices ago is replaced
+                range_sum = exact_context.subtract(range_sum, self._ranges[index % self._length])
+            self._range_sums[index % self._interval] = exact_context.add(range_sum, price_range)
+            self._ranges[index % self._length] = price_range
+
+    def _price(self, index: int) -> Decimal:
+        return self._prices[index % self._length]
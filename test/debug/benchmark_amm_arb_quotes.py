@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+
+"""
+Times the price requests of an amm_arb arbitrage check between two gateway connectors, on a gateway answering after
+a fixed latency, against the previous requests made one after the other, each with its own cache entry.
+
+The quote cache is cleared before every check, as it is when the 5 s TTL expired between two checks.
+
+Usage: python test/debug/benchmark_amm_arb_quotes.py [checks] [gateway_latency_ms]
+"""
+
+import asyncio
+import sys
+import time
+from decimal import Decimal
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.gateway_EVM_AMM import GatewayEVMAMM
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
+from hummingbot.strategy.amm_arb.utils import create_arb_proposals
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+
+CHECKS = 20
+GATEWAY_LATENCY_MS = 50
+TRADING_PAIR = "WETH-DAI"
+ORDER_AMOUNT = Decimal("1")
+
+
+class GatewayStub:
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.requests = 0
+
+    async def get_price(self, chain: str, network: str, connector: str, base_asset: str, quote_asset: str,
+                        amount: Decimal, side: TradeType, *args, **kwargs) -> Dict[str, Any]:
+        self.requests += 1
+        await asyncio.sleep(self.latency)
+        return {
+            "price": "1500.5" if side is TradeType.BUY else "1499.5",
+            "gasLimit": 200000,
+            "gasPrice": 30,
+            "gasCost": "0.006",
+            "gasPriceToken": "ETH",
+            "swaps": [],
+        }
+
+
+def make_connector(client_config_map: ClientConfigAdapter, connector_name: str) -> GatewayEVMAMM:
+    connector = GatewayEVMAMM(client_config_map, connector_name, "ethereum", "mainnet", "0xabc", [TRADING_PAIR])
+    connector._account_balances = {"ETH": Decimal(100), "WETH": Decimal(100), "DAI": Decimal(1000000)}
+    connector._allowances = {"WETH": Decimal(100), "DAI": Decimal(1000000)}
+    return connector
+
+
+async def previous_create_arb_proposals(market_info_1: MarketTradingPairTuple, market_info_2: MarketTradingPairTuple):
+    """
+    The price requests of create_arb_proposals before they were made concurrently, without the cache that missed
+    anyway: get_order_price passing ignore_shim as a keyword argument, it had other cache entries than get_quote_price.
+    """
+    get_quote_price = GatewayEVMAMM.get_quote_price.__wrapped__
+    prices = []
+    for is_buy in (True, False):
+        for market_info, side in ((market_info_1, is_buy), (market_info_2, not is_buy)):
+            for _ in ("quote price", "order price"):
+                prices.append(await get_quote_price(market_info.market, market_info.trading_pair, side, ORDER_AMOUNT))
+    return prices
+
+
+async def run_checks(check, market_info_1: MarketTradingPairTuple, market_info_2: MarketTradingPairTuple,
+                     checks: int) -> List[float]:
+    elapsed = []
+    for _ in range(checks):
+        GatewayEVMAMM.get_quote_price.cache_clear()
+        start = time.perf_counter()
+        await check(market_info_1, market_info_2)
+        elapsed.append(time.perf_counter() - start)
+    return elapsed
+
+
+async def arb_proposals(market_info_1: MarketTradingPairTuple, market_info_2: MarketTradingPairTuple):
+    return await create_arb_proposals(market_info_1, market_info_2, [], [], ORDER_AMOUNT)
+
+
+def main():
+    checks = int(sys.argv[1]) if len(sys.argv) > 1 else CHECKS
+    latency_ms = float(sys.argv[2]) if len(sys.argv) > 2 else GATEWAY_LATENCY_MS
+    client_config_map = ClientConfigAdapter(ClientConfigMap())
+    gateway = GatewayStub(latency_ms / 1e3)
+    base, quote = TRADING_PAIR.split("-")
+    market_info_1 = MarketTradingPairTuple(make_connector(client_config_map, "uniswap"), TRADING_PAIR, base, quote)
+    market_info_2 = MarketTradingPairTuple(make_connector(client_config_map, "sushiswap"), TRADING_PAIR, base, quote)
+
+    print(f"{checks} arbitrage checks, gateway latency {latency_ms:g} ms\n")
+    print(f"{'price requests':>16}{'ms per check':>14}{'gateway requests per check':>28}")
+    with patch.object(GatewayHttpClient, "get_price", gateway.get_price):
+        for name, check in (("previous", previous_create_arb_proposals), ("new", arb_proposals)):
+            gateway.requests = 0
+            elapsed = asyncio.get_event_loop().run_until_complete(
+                run_checks(check, market_info_1, market_info_2, checks))
+            print(f"{name:>16}{sum(elapsed) / checks * 1e3:>14.1f}{gateway.requests / checks:>28.1f}")
+
+
+if __name__ == "__main__":
+    main()
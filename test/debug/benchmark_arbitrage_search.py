@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+
+"""
+Compares the Decimal, step by step search for the best arbitrage order amount against the vectorized search used by
+ArbitrageStrategy, on 2000-level books crossing over an increasing number of levels.
+
+Usage: PYTHONPATH=. python test/debug/benchmark_arbitrage_search.py
+"""
+
+import time
+from decimal import Decimal
+from test.hummingbot.strategy.arbitrage.arbitrage_test_support import find_best_profitable_amount_decimal
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.strategy.arbitrage.arbitrage import ArbitrageStrategy
+from hummingbot.strategy.arbitrage.arbitrage_market_pair import ArbitrageMarketPair
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+
+LEVELS = 2000
+PRICE_STEP = 0.001
+REPEATS = 50
+
+
+def build_market(trading_pair: str, mid_price: float) -> MockPaperExchange:
+    market = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+    market.set_balanced_order_book(trading_pair, mid_price, mid_price - LEVELS * PRICE_STEP,
+                                   mid_price + LEVELS * PRICE_STEP, PRICE_STEP, 1)
+    market.set_quantization_param(QuantizationParams(trading_pair, 6, 6, 6, 6))
+    base, quote = trading_pair.split("-")
+    market.set_balance(base, 10 ** 9)
+    market.set_balance(quote, 10 ** 9)
+    return market
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        func()
+    return (time.perf_counter() - start) / REPEATS
+
+
+def main():
+    print(f"{LEVELS} levels per side, {REPEATS} searches per case\n")
+    print(f"{'crossing levels':>16}{'decimal ms':>14}{'vectorized ms':>16}{'speedup':>10}")
+    for crossing_levels in (1, 10, 100, 500):
+        buy_market = MarketTradingPairTuple(build_market("COINALPHA-WETH", 1.0), "COINALPHA-WETH", "COINALPHA", "WETH")
+        sell_market = MarketTradingPairTuple(build_market("COINALPHA-WETH", 1.0 + crossing_levels * PRICE_STEP),
+                                             "COINALPHA-WETH", "COINALPHA", "WETH")
+        strategy = ArbitrageStrategy()
+        strategy.init_params([ArbitrageMarketPair(buy_market, sell_market)], min_profitability=Decimal("0"),
+                             logging_options=0)
+
+        expected = find_best_profitable_amount_decimal(strategy, buy_market, sell_market)
+        actual = strategy.find_best_profitable_amount(buy_market, sell_market)
+        assert expected[0] == actual[0], (expected, actual)
+
+        decimal_elapsed = timed(lambda: find_best_profitable_amount_decimal(strategy, buy_market, sell_market))
+        vectorized_elapsed = timed(lambda: strategy.find_best_profitable_amount(buy_market, sell_market))
+        print(f"{crossing_levels:>16}{decimal_elapsed * 1e3:>14.3f}{vectorized_elapsed * 1e3:>16.3f}"
+              f"{decimal_elapsed / vectorized_elapsed:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
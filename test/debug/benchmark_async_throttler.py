@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+
+"""
+Measures the cost of acquiring AsyncThrottler capacity for a request linked to 5 rate limits, against a replica of
+the previous engine, which summed the weights of every task log on every acquire and polled every retry interval.
+
+The first case uses limits high enough for no request to wait, so it only measures the accounting. The second one
+saturates a limit and reports how late the waiting requests are released compared to the time capacity was freed.
+
+Usage: python test/debug/benchmark_async_throttler.py
+"""
+
+import asyncio
+import time
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import List
+
+from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog
+
+REQUESTS = 10000
+LEGACY_REQUESTS = 1000
+POOLS = ["REQUEST_WEIGHT", "ORDERS_1S", "ORDERS_1D", "RAW_REQUESTS"]
+ORDER_PATH = "/api/v3/order"
+
+
+def rate_limits(pool_limit: int, time_interval: float) -> List[RateLimit]:
+    limits = [RateLimit(limit_id=pool, limit=pool_limit, time_interval=time_interval) for pool in POOLS]
+    # Only the pools constrain the requests
+    limits.append(RateLimit(limit_id=ORDER_PATH, limit=10 ** 9, time_interval=time_interval,
+                            linked_limits=[LinkedLimitWeightPair(pool, 1) for pool in POOLS]))
+    return limits
+
+
+class BenchmarkThrottler(AsyncThrottler):
+
+    def _client_config_map(self):
+        # Avoids starting the whole application only to read the rate limits share
+        return SimpleNamespace(rate_limits_share_pct=Decimal("100"))
+
+
+class LegacyThrottler:
+    """
+    The task log scan the throttler used before the rate limit windows.
+    """
+
+    def __init__(self, throttler: BenchmarkThrottler):
+        self._throttler = throttler
+        self._task_logs: List[TaskLog] = []
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, limit_id: str):
+        rate_limit, related_limits = self._throttler.get_related_limits(limit_id)
+        margin = self._throttler._safety_margin_pct
+        while True:
+            async with self._lock:
+                now = time.time()
+                for task in self._task_logs:
+                    if now - task.timestamp > task.rate_limit.time_interval * (1 + margin):
+                        self._task_logs.remove(task)
+                if all(sum([task.weight for task in self._task_logs
+                            if limit.limit_id == task.rate_limit.limit_id and
+                            now - task.timestamp - task.rate_limit.time_interval * margin
+                            <= task.rate_limit.time_interval]) + weight <= limit.limit
+                       for limit, weight in related_limits):
+                    break
+            await asyncio.sleep(self._throttler._retry_interval)
+        async with self._lock:
+            now = time.time()
+            self._task_logs.append(TaskLog(timestamp=now, rate_limit=rate_limit, weight=rate_limit.weight))
+            for limit, weight in related_limits:
+                self._task_logs.append(TaskLog(timestamp=now, rate_limit=limit, weight=weight))
+
+
+async def unconstrained_acquires():
+    print(f"Acquire cost, {len(POOLS) + 1} related limits, no waiting\n")
+    print(f"{'engine':<16}{'requests':>10}{'us/request':>14}")
+    throttler = BenchmarkThrottler(rate_limits=rate_limits(10 ** 9, 60))
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        async with throttler.execute_task(ORDER_PATH):
+            pass
+    elapsed = time.perf_counter() - start
+    print(f"{'windows':<16}{REQUESTS:>10}{elapsed / REQUESTS * 1e6:>14.1f}")
+
+    legacy = LegacyThrottler(BenchmarkThrottler(rate_limits=rate_limits(10 ** 9, 60)))
+    start = time.perf_counter()
+    for _ in range(LEGACY_REQUESTS):
+        await legacy.acquire(ORDER_PATH)
+    elapsed = time.perf_counter() - start
+    print(f"{'task log scan':<16}{LEGACY_REQUESTS:>10}{elapsed / LEGACY_REQUESTS * 1e6:>14.1f}")
+
+
+async def saturated_acquires():
+    pool_limit, time_interval, requests = 50, 0.5, 150
+    print(f"\n{requests} concurrent requests, {pool_limit} per {time_interval}s\n")
+    print(f"{'engine':<16}{'total s':>10}{'mean release delay ms':>24}")
+    for label in ("windows", "task log scan"):
+        throttler = BenchmarkThrottler(rate_limits=rate_limits(pool_limit, time_interval))
+        legacy = LegacyThrottler(throttler)
+        period = time_interval * (1 + throttler._safety_margin_pct)
+        acquired_at: List[float] = []
+
+        async def request():
+            if label == "windows":
+                async with throttler.execute_task(ORDER_PATH):
+                    acquired_at.append(time.time())
+            else:
+                await legacy.acquire(ORDER_PATH)
+                acquired_at.append(time.time())
+
+        start = time.time()
+        await asyncio.gather(*[request() for _ in range(requests)])
+        # Each request beyond the first batch could start as soon as the request one batch ahead of it expired.
+        delays = [acquired_at[i] - (acquired_at[i - pool_limit] + period) for i in range(pool_limit, requests)]
+        print(f"{label:<16}{time.time() - start:>10.2f}{sum(delays) / len(delays) * 1e3:>24.1f}")
+
+
+def main():
+    # The capacity warnings are notified through the application, which the benchmark does not start
+    AsyncRequestContextBase._last_max_cap_warning_ts = float("inf")
+    ev_loop = asyncio.get_event_loop()
+    ev_loop.run_until_complete(unconstrained_acquires())
+    ev_loop.run_until_complete(saturated_acquires())
+
+
+if __name__ == "__main__":
+    main()
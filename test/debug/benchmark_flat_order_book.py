@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+
+"""
+Compares diff application and top-of-book reads between the std::set OrderBook and FlatOrderBook.
+
+A recorded stream can be replayed by passing a file with one Binance depth update per line (the websocket payload,
+with "b", "a" and "u" keys). Without one, a synthetic stream concentrated around the top of the book is generated.
+
+Usage: python test/debug/benchmark_flat_order_book.py [recorded_depth_stream.jsonl]
+"""
+
+import json
+import sys
+import time
+from typing import List, Tuple
+
+import numpy as np
+
+from hummingbot.core.data_type.flat_order_book import FlatOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+LEVELS = 5000
+DIFFS = 50000
+TOP_N = 20
+
+Diff = Tuple[List[OrderBookRow], List[OrderBookRow], int]
+
+
+def load_recorded_stream(path: str) -> List[Diff]:
+    diffs = []
+    with open(path) as recorded:
+        for line in recorded:
+            message = json.loads(line)
+            message = message.get("data", message)
+            update_id = int(message["u"])
+            diffs.append(([OrderBookRow(float(p), float(a), update_id) for p, a in message["b"]],
+                          [OrderBookRow(float(p), float(a), update_id) for p, a in message["a"]],
+                          update_id))
+    return diffs
+
+
+def synthetic_stream(count: int) -> List[Diff]:
+    rng = np.random.default_rng(0)
+    diffs = []
+    for update_id in range(2, count + 2):
+        # Most exchange diffs touch the first few dozen levels of each side.
+        bid_prices = np.round(99.99 - np.abs(rng.exponential(0.2, 5)), 2)
+        ask_prices = np.round(100.00 + np.abs(rng.exponential(0.2, 5)), 2)
+        amounts = np.where(rng.random(10) < 0.3, 0, rng.uniform(0.1, 5, 10))
+        diffs.append(([OrderBookRow(p, a, update_id) for p, a in zip(bid_prices, amounts[:5])],
+                      [OrderBookRow(p, a, update_id) for p, a in zip(ask_prices, amounts[5:])],
+                      update_id))
+    return diffs
+
+
+def initial_snapshot(diffs: List[Diff]) -> Tuple[List[OrderBookRow], List[OrderBookRow]]:
+    first_bids, first_asks, _ = diffs[0]
+    best_bid = max((row.price for row in first_bids), default=99.99)
+    best_ask = min((row.price for row in first_asks), default=100.0)
+    tick = 0.01
+    bids = [OrderBookRow(round(best_bid - i * tick, 8), 1.0, 1) for i in range(LEVELS)]
+    asks = [OrderBookRow(round(best_ask + i * tick, 8), 1.0, 1) for i in range(LEVELS)]
+    return bids, asks
+
+
+def run(order_book: OrderBook, diffs: List[Diff], bids, asks):
+    order_book.apply_snapshot(bids, asks, 1)
+    start = time.perf_counter()
+    for diff_bids, diff_asks, update_id in diffs:
+        order_book.apply_diffs(diff_bids, diff_asks, update_id)
+    apply_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(len(diffs) // 10):
+        bid_it = order_book.bid_entries()
+        ask_it = order_book.ask_entries()
+        for _ in range(TOP_N):
+            next(bid_it, None)
+            next(ask_it, None)
+    top_n_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(len(diffs) // 10):
+        order_book.get_vwap_for_volume(True, 50)
+        order_book.get_vwap_for_volume(False, 50)
+    query_elapsed = time.perf_counter() - start
+    return apply_elapsed, top_n_elapsed, query_elapsed
+
+
+def main():
+    diffs = load_recorded_stream(sys.argv[1]) if len(sys.argv) > 1 else synthetic_stream(DIFFS)
+    bids, asks = initial_snapshot(diffs)
+    print(f"{len(diffs)} diffs on a {LEVELS}-level book\n")
+    print(f"{'backend':<16}{'diffs/s':>14}{f'top-{TOP_N} reads/s':>18}{'vwap queries/s':>18}")
+    for label, order_book in (("std::set", OrderBook()), ("flat arrays", FlatOrderBook())):
+        apply_elapsed, top_n_elapsed, query_elapsed = run(order_book, diffs, bids, asks)
+        reads = len(diffs) // 10
+        print(f"{label:<16}{len(diffs) / apply_elapsed:>14,.0f}{reads / top_n_elapsed:>18,.0f}"
+              f"{2 * reads / query_elapsed:>18,.0f}")
+
+
+if __name__ == "__main__":
+    main()
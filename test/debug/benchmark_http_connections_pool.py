@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+
+"""
+Times requests to a local aiohttp server from several connectors: each connector with its own client session with the
+default settings, as before, against the client session shared through the ConnectionsManager, warmed up with a few
+concurrent requests per connector as the connectors do when their network starts. The first requests of each
+connector pay the TCP (and TLS, with --tls) handshakes unless their connections were opened beforehand.
+
+Usage: python test/debug/benchmark_http_connections_pool.py [connectors] [requests] [--tls]
+"""
+
+import asyncio
+import os
+import ssl
+import subprocess
+import sys
+import tempfile
+import time
+from statistics import median
+from typing import List, Optional
+
+import aiohttp
+from aiohttp import web
+
+from hummingbot.core.web_assistant.connections.connections_manager import ConnectionsManager
+
+CONNECTORS = 10
+REQUESTS = 50
+WARM_UP_CONNECTIONS = 2
+
+
+def make_server_ssl_context(directory: str) -> ssl.SSLContext:
+    cert_file = os.path.join(directory, "cert.pem")
+    key_file = os.path.join(directory, "key.pem")
+    subprocess.run(["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1", "-subj", "/CN=127.0.0.1",
+                    "-keyout", key_file, "-out", cert_file],
+                   check=True, capture_output=True)
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(cert_file, key_file)
+    return context
+
+
+async def start_server(ssl_context: Optional[ssl.SSLContext]) -> (web.AppRunner, str):
+    async def handler(request: web.Request) -> web.Response:
+        return web.json_response({"serverTime": time.time()})
+
+    app = web.Application()
+    app.router.add_get("/api/v3/time", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0, ssl_context=ssl_context)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    scheme = "https" if ssl_context is not None else "http"
+    return runner, f"{scheme}://127.0.0.1:{port}/api/v3/time"
+
+
+async def timed_request(session: aiohttp.ClientSession, url: str) -> float:
+    start = time.perf_counter()
+    async with session.get(url, ssl=False) as response:
+        await response.json()
+    return time.perf_counter() - start
+
+
+async def run_connectors(sessions: List[aiohttp.ClientSession], url: str, requests: int) -> (List[float], List[float]):
+    """
+    Sends the requests of every connector concurrently, each connector sending its requests in sequence
+    """
+    async def run_connector(session: aiohttp.ClientSession) -> List[float]:
+        return [await timed_request(session, url) for _ in range(requests)]
+
+    elapsed = await asyncio.gather(*[run_connector(session) for session in sessions])
+    first = [connector_elapsed[0] for connector_elapsed in elapsed]
+    rest = [value for connector_elapsed in elapsed for value in connector_elapsed[1:]]
+    return first, rest
+
+
+async def run_default_sessions(url: str, connectors: int, requests: int) -> (List[float], List[float]):
+    sessions = [aiohttp.ClientSession() for _ in range(connectors)]
+    try:
+        return await run_connectors(sessions, url, requests)
+    finally:
+        for session in sessions:
+            await session.close()
+
+
+async def run_shared_session(url: str, connectors: int, requests: int) -> (List[float], List[float], ConnectionsManager):
+    manager = ConnectionsManager()
+    session = await manager.get_client_session()
+    try:
+        await asyncio.gather(*[timed_request(session, url) for _ in range(connectors * WARM_UP_CONNECTIONS)])
+        first, rest = await run_connectors([session] * connectors, url, requests)
+        return first, rest, manager
+    finally:
+        await manager.close()
+
+
+def print_row(name: str, first: List[float], rest: List[float]):
+    print(f"{name:>16}{median(first) * 1e3:>18.3f}{max(first) * 1e3:>18.3f}{median(rest) * 1e3:>18.3f}")
+
+
+async def main_async(connectors: int, requests: int, tls: bool):
+    with tempfile.TemporaryDirectory() as directory:
+        ssl_context = make_server_ssl_context(directory) if tls else None
+        runner, url = await start_server(ssl_context)
+    try:
+        default_first, default_rest = await run_default_sessions(url, connectors, requests)
+        shared_first, shared_rest, manager = await run_shared_session(url, connectors, requests)
+    finally:
+        await runner.cleanup()
+
+    print(f"{connectors} connectors, {requests} requests each, {'https' if tls else 'http'}\n")
+    print(f"{'sessions':>16}{'first median ms':>18}{'first max ms':>18}{'next median ms':>18}")
+    print_row("per connector", default_first, default_rest)
+    print_row("shared, warm", shared_first, shared_rest)
+    stats = manager.stats
+    print(f"\nshared session: {stats.requests} requests, {stats.connections_created} connections created, "
+          f"reuse ratio {stats.connection_reuse_ratio:.3f}, time to first byte mean "
+          f"{stats.time_to_first_byte_mean * 1e3:.3f} ms, max {stats.time_to_first_byte_max * 1e3:.3f} ms")
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if arg != "--tls"]
+    connectors = int(args[0]) if len(args) > 0 else CONNECTORS
+    requests = int(args[1]) if len(args) > 1 else REQUESTS
+    asyncio.get_event_loop().run_until_complete(main_async(connectors, requests, "--tls" in sys.argv))
+
+
+if __name__ == "__main__":
+    main()
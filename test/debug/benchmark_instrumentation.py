@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+
+"""
+Measures the overhead the latency instrumentation adds to the instrumented code: the recording of a duration in a
+latency histogram, alone and with the two `time.perf_counter()` calls timing it, against keeping every duration in a
+list, and the time the instrumentation command and the Prometheus endpoint take to compute the percentiles.
+
+Usage: python test/debug/benchmark_instrumentation.py [durations]
+"""
+
+import random
+import sys
+import time
+from typing import Callable, List
+
+from hummingbot.core.instrumentation.instrumentation import REPORTED_PERCENTILES, TICK_DURATION, Instrumentation
+from hummingbot.core.instrumentation.latency_histogram import LatencyHistogram
+
+DURATIONS = 1_000_000
+
+
+def nanoseconds_per_call(function: Callable[[float], None], durations: List[float]) -> float:
+    start = time.perf_counter()
+    for duration in durations:
+        function(duration)
+    return (time.perf_counter() - start) / len(durations) * 1e9
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DURATIONS
+    rng = random.Random(42)
+    # Log-normal durations, around a millisecond with a long tail, as the ticks and the order round trips
+    durations = [rng.lognormvariate(-7, 1.5) for _ in range(count)]
+
+    kept_durations: List[float] = []
+    histogram = LatencyHistogram()
+    timed_histogram = Instrumentation().histogram(TICK_DURATION, "Benchmark")
+
+    def timed_record(_: float):
+        start = time.perf_counter()
+        timed_histogram.record(time.perf_counter() - start)
+
+    list_ns = nanoseconds_per_call(kept_durations.append, durations)
+    record_ns = nanoseconds_per_call(histogram.record, durations)
+    timed_record_ns = nanoseconds_per_call(timed_record, durations)
+
+    start = time.perf_counter()
+    percentiles = [histogram.percentile(percentile) for percentile in REPORTED_PERCENTILES]
+    percentiles_ms = (time.perf_counter() - start) * 1e3
+
+    kept_durations.sort()
+    errors = [abs(reported - kept_durations[max(0, int(percentile / 100 * count + 0.5) - 1)]) / reported
+              for percentile, reported in zip(REPORTED_PERCENTILES, percentiles)]
+
+    print(f"{count} durations\n")
+    print(f"{'recording':>28}{'ns per duration':>18}")
+    print(f"{'list append':>28}{list_ns:>18.0f}")
+    print(f"{'histogram record':>28}{record_ns:>18.0f}")
+    print(f"{'timed histogram record':>28}{timed_record_ns:>18.0f}")
+    print(f"\n{len(REPORTED_PERCENTILES)} percentiles computed in {percentiles_ms:.2f} ms, "
+          f"max relative error {max(errors):.2%}")
+
+
+if __name__ == "__main__":
+    main()
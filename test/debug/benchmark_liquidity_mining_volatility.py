@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+
+"""
+Times the mid prices volatility update of a liquidity mining tick over many markets, once the default volatility
+window of 10 intervals of 300 mid prices is full: the rolling volatility against the previous calculation, that
+sliced the list of the last mid prices and went over the prices of every interval on every tick.
+
+Usage: python test/debug/benchmark_liquidity_mining_volatility.py [markets] [ticks]
+"""
+
+import random
+import sys
+import time
+from decimal import Decimal
+from statistics import mean
+from typing import Dict, List
+
+from hummingbot.strategy.liquidity_mining.rolling_volatility import RollingVolatility
+
+MARKETS = 60
+TICKS = 50
+VOLATILITY_INTERVAL = 300
+AVG_VOLATILITY_PERIOD = 10
+
+
+class PreviousVolatility:
+    """
+    The volatility calculation of LiquidityMiningStrategy before the rolling volatility.
+    """
+
+    def __init__(self, volatility_interval: int, avg_volatility_period: int):
+        self._volatility_interval = volatility_interval
+        self._avg_volatility_period = avg_volatility_period
+        self._mid_prices = []
+
+    def add_price(self, mid_price: Decimal):
+        self._mid_prices.append(mid_price)
+        max_len = self._volatility_interval * self._avg_volatility_period
+        self._mid_prices = self._mid_prices[-1 * max_len:]
+
+    @property
+    def value(self) -> Decimal:
+        mid_prices = self._mid_prices
+        last_index = len(mid_prices) - 1
+        atr = []
+        first_index = last_index - (self._volatility_interval * self._avg_volatility_period)
+        first_index = max(first_index, 0)
+        for i in range(last_index, first_index, self._volatility_interval * -1):
+            prices = mid_prices[i - self._volatility_interval + 1: i + 1]
+            if not prices:
+                break
+            atr.append((max(prices) - min(prices)) / min(prices))
+        return mean(atr) if atr else Decimal("NaN")
+
+
+def make_mid_prices(markets: int, count: int) -> List[List[Decimal]]:
+    rng = random.Random(42)
+    all_mid_prices = []
+    for _ in range(markets):
+        price = Decimal(rng.randint(1000, 100000)) / 100
+        mid_prices = []
+        for _ in range(count):
+            price = max(Decimal("0.01"), price + Decimal(rng.randint(-100, 100)) / 1000)
+            mid_prices.append(price)
+        all_mid_prices.append(mid_prices)
+    return all_mid_prices
+
+
+def run(volatility_class, all_mid_prices: List[List[Decimal]], ticks: int) -> (float, List[Dict[int, Decimal]]):
+    volatilities = [volatility_class(VOLATILITY_INTERVAL, AVG_VOLATILITY_PERIOD) for _ in all_mid_prices]
+    warm_up = len(all_mid_prices[0]) - ticks
+    for volatility, mid_prices in zip(volatilities, all_mid_prices):
+        for mid_price in mid_prices[:warm_up]:
+            volatility.add_price(mid_price)
+
+    values = []
+    start = time.perf_counter()
+    for tick in range(warm_up, warm_up + ticks):
+        for volatility, mid_prices in zip(volatilities, all_mid_prices):
+            volatility.add_price(mid_prices[tick])
+        values.append({market: volatility.value for market, volatility in enumerate(volatilities)})
+    return (time.perf_counter() - start) / ticks, values
+
+
+def main():
+    markets = int(sys.argv[1]) if len(sys.argv) > 1 else MARKETS
+    ticks = int(sys.argv[2]) if len(sys.argv) > 2 else TICKS
+    all_mid_prices = make_mid_prices(markets, VOLATILITY_INTERVAL * AVG_VOLATILITY_PERIOD + ticks)
+
+    previous_elapsed, previous_values = run(PreviousVolatility, all_mid_prices, ticks)
+    elapsed, values = run(RollingVolatility, all_mid_prices, ticks)
+    assert previous_values == values
+
+    print(f"{markets} markets, volatility interval {VOLATILITY_INTERVAL}, average volatility period "
+          f"{AVG_VOLATILITY_PERIOD}, {ticks} ticks\n")
+    print(f"{'volatility':>12}{'ms per tick':>14}")
+    print(f"{'previous':>12}{previous_elapsed * 1e3:>14.2f}")
+    print(f"{'rolling':>12}{elapsed * 1e3:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+
+"""
+Measures how long the MarketsRecorder event handlers keep the event loop busy for a burst of order creations and
+fills, when writing to a SQLite file synchronously and when queueing the writes for the writer thread, and how long
+the writer thread takes to flush them on stop.
+
+Usage: python test/debug/benchmark_markets_recorder.py
+"""
+
+import asyncio
+import os
+import time
+from decimal import Decimal
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import BuyOrderCreatedEvent, MarketEvent, OrderFilledEvent
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+
+ORDERS = 2000
+TRADING_PAIR = "COINALPHA-HBOT"
+
+
+class BenchmarkMarket:
+    display_name = "benchmark_market"
+
+    def __init__(self):
+        self.tracking_states = {}
+
+    def add_listener(self, event_tag, listener):
+        pass
+
+    def remove_listener(self, event_tag, listener):
+        pass
+
+    def add_trade_fills_from_market_recorder(self, current_trade_fills):
+        pass
+
+    def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
+        pass
+
+
+def record_burst(recorder: MarketsRecorder, market: BenchmarkMarket) -> float:
+    """
+    :return: the seconds the handlers took, yielding to the event loop every 10 orders
+    """
+    ev_loop = asyncio.get_event_loop()
+    elapsed = 0.0
+    for order_number in range(ORDERS):
+        market.tracking_states = {"orders": order_number}
+        create_event = BuyOrderCreatedEvent(1642010000, OrderType.LIMIT, TRADING_PAIR, Decimal(1), Decimal(1000),
+                                            f"OID{order_number}", 1642010000, f"EOID{order_number}")
+        fill_event = OrderFilledEvent(1642010001, f"OID{order_number}", TRADING_PAIR, TradeType.BUY,
+                                      OrderType.LIMIT, Decimal(1000), Decimal(1), AddedToCostTradeFee(),
+                                      f"TradeId{order_number}")
+        start = time.perf_counter()
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, market, create_event)
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, market, fill_event)
+        elapsed += time.perf_counter() - start
+        if order_number % 10 == 9:
+            start = time.perf_counter()
+            ev_loop.run_until_complete(asyncio.sleep(0))
+            elapsed += time.perf_counter() - start
+    return elapsed
+
+
+def run(write_behind: bool):
+    with TemporaryDirectory() as data_dir:
+        with patch("hummingbot.model.sql_connection_manager.create_engine") as engine_mock, \
+                patch("hummingbot.connector.markets_recorder.data_path", return_value=data_dir):
+            engine_mock.return_value = create_engine(f"sqlite:///{os.path.join(data_dir, 'benchmark.sqlite')}")
+            manager = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS,
+                                           db_name="benchmark")
+            market = BenchmarkMarket()
+            recorder = MarketsRecorder(manager, [market], "benchmark.yml", "benchmark")
+            if write_behind:
+                recorder.start()
+            handlers_elapsed = record_burst(recorder, market)
+            start = time.perf_counter()
+            recorder.stop()
+            stop_elapsed = time.perf_counter() - start
+            manager.engine.dispose()
+            return handlers_elapsed, stop_elapsed, recorder.stats
+
+
+def main():
+    print(f"{ORDERS} orders created and filled\n")
+    print(f"{'mode':>14}{'handlers ms':>14}{'us/event':>10}{'stop ms':>10}{'batches':>9}{'states':>8}")
+    for name, write_behind in (("synchronous", False), ("write-behind", True)):
+        handlers_elapsed, stop_elapsed, stats = run(write_behind)
+        print(f"{name:>14}{handlers_elapsed * 1e3:>14.1f}{handlers_elapsed / (2 * ORDERS) * 1e6:>10.1f}"
+              f"{stop_elapsed * 1e3:>10.1f}{stats.batches:>9}{stats.market_states_saved:>8}")
+
+
+if __name__ == "__main__":
+    main()
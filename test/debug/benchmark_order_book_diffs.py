@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+
+"""
+Replays a Binance <symbol>@depth@100ms stream into an order book, decoding the diffs into OrderBookRow lists as the
+tracker used to, and into the float64 arrays cached on the messages, which are applied with apply_diff_message.
+
+The stream is read from a file with one raw websocket text frame per line, as recorded from
+wss://stream.binance.com:9443/stream?streams=btcusdt@depth@100ms. Without a file, a synthetic stream with the same
+layout is generated.
+
+Usage: python test/debug/benchmark_order_book_diffs.py [recorded_stream.jsonl]
+"""
+
+import json
+import random
+import sys
+import time
+from typing import Callable, List
+
+from hummingbot.connector.exchange.binance.binance_order_book import BinanceOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
+
+TRADING_PAIR = "BTC-USDT"
+SYNTHETIC_FRAMES = 20000
+
+
+def synthetic_stream(frames: int = SYNTHETIC_FRAMES) -> List[str]:
+    rng = random.Random(42)
+    mid_price = 30000.0
+    update_id = 1
+    stream = []
+    for i in range(frames):
+        mid_price += rng.gauss(0, 2)
+        levels = rng.randint(5, 40)
+        bids = []
+        asks = []
+        for _ in range(levels):
+            offset = rng.randint(1, 500) * 0.01
+            amount = "0.00000000" if rng.random() < 0.3 else f"{rng.uniform(0.0001, 5):.8f}"
+            if rng.random() < 0.5:
+                bids.append([f"{mid_price - offset:.2f}", amount])
+            else:
+                asks.append([f"{mid_price + offset:.2f}", amount])
+        first_update_id = update_id
+        update_id += rng.randint(1, 20)
+        stream.append(json.dumps({
+            "stream": "btcusdt@depth@100ms",
+            "data": {"e": "depthUpdate", "E": 1650000000000 + i * 100, "s": "BTCUSDT",
+                     "U": first_update_id, "u": update_id, "b": bids, "a": asks}}))
+    return stream
+
+
+def decode(frames: List[str]) -> List[OrderBookMessage]:
+    return [BinanceOrderBook.diff_message_from_exchange(json.loads(frame)["data"], time.time(),
+                                                        {"trading_pair": TRADING_PAIR})
+            for frame in frames]
+
+
+def timed(frames: List[str], apply: Callable[[OrderBook, OrderBookMessage], None]) -> (float, OrderBook):
+    order_book = OrderBook()
+    start = time.perf_counter()
+    for message in decode(frames):
+        apply(order_book, message)
+    return time.perf_counter() - start, order_book
+
+
+def main():
+    if len(sys.argv) > 1:
+        with open(sys.argv[1]) as recorded:
+            frames = [line for line in recorded if line.strip()]
+    else:
+        frames = synthetic_stream()
+    levels = sum(len(message.bids_array) + len(message.asks_array) for message in decode(frames))
+
+    start = time.perf_counter()
+    decode(frames)
+    decode_elapsed = time.perf_counter() - start
+    rows_elapsed, rows_book = timed(
+        frames, lambda order_book, message: order_book.apply_diffs(message.bids, message.asks, message.update_id))
+    arrays_elapsed, arrays_book = timed(frames, lambda order_book, message: order_book.apply_diff_message(message))
+    assert list(rows_book.bid_entries()) == list(arrays_book.bid_entries())
+    assert list(rows_book.ask_entries()) == list(arrays_book.ask_entries())
+
+    print(f"{len(frames)} diffs, {levels} price levels\n")
+    print(f"{'path':>24}{'total ms':>12}{'us/diff':>10}{'diffs/s':>12}")
+    for name, elapsed in (("json + message only", decode_elapsed),
+                          ("OrderBookRow lists", rows_elapsed),
+                          ("cached float64 arrays", arrays_elapsed)):
+        print(f"{name:>24}{elapsed * 1e3:>12.1f}{elapsed / len(frames) * 1e6:>10.2f}{len(frames) / elapsed:>12,.0f}")
+    print(f"\nbook update cost, excluding decoding: {(rows_elapsed - decode_elapsed) * 1e3:.1f} ms with rows, "
+          f"{(arrays_elapsed - decode_elapsed) * 1e3:.1f} ms with arrays")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+
+"""
+Compares the OrderBook depth queries walking the bid_entries()/ask_entries() generators (the previous
+implementation) against the native C++ set walk and the batched queries, on 5000-level books.
+
+Usage: python test/debug/benchmark_order_book_queries.py
+"""
+
+import math
+import time
+from typing import Callable, List
+
+import numpy as np
+
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+
+LEVELS = 5000
+REPEATS = 20
+
+
+def build_order_book(levels: int, order_book_class=OrderBook) -> OrderBook:
+    rng = np.random.default_rng(0)
+    bid_prices = 100 - np.cumsum(rng.uniform(0.001, 0.01, levels))
+    ask_prices = 100 + np.cumsum(rng.uniform(0.001, 0.01, levels))
+    bids = np.column_stack([bid_prices, rng.uniform(0.1, 5, levels), np.ones(levels)])
+    asks = np.column_stack([ask_prices, rng.uniform(0.1, 5, levels), np.ones(levels)])
+    order_book = order_book_class()
+    order_book.apply_numpy_snapshot(bids, asks)
+    return order_book
+
+
+def generator_price_for_volume(order_book: OrderBook, is_buy: bool, volume: float) -> float:
+    cumulative_volume = 0
+    for row in (order_book.ask_entries() if is_buy else order_book.bid_entries()):
+        cumulative_volume += row.amount
+        if cumulative_volume >= volume:
+            return row.price
+    return math.nan
+
+
+def timed(label: str, func: Callable[[], None], queries: int):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed / REPEATS * 1e3:10.3f} ms/run {queries * REPEATS / elapsed:14,.0f} queries/s")
+
+
+def main():
+    order_book = build_order_book(LEVELS)
+    # CompositeOrderBook without recorded fills still answers the queries from its row generators.
+    rows_order_book = build_order_book(LEVELS, CompositeOrderBook)
+    total_ask_volume = sum(row.amount for row in order_book.ask_entries())
+    # Volumes spread over the whole book, so every query walks a large part of it.
+    volumes: List[float] = list(np.linspace(total_ask_volume * 0.05, total_ask_volume * 0.95, 20))
+
+    print(f"{LEVELS} levels per side, {len(volumes)} volumes per run, {REPEATS} runs\n")
+    timed("python loop over ask_entries()",
+          lambda: [generator_price_for_volume(order_book, True, v) for v in volumes], len(volumes))
+    timed("row walk get_price_for_volume",
+          lambda: [rows_order_book.get_price_for_volume(True, v) for v in volumes], len(volumes))
+    timed("native get_price_for_volume",
+          lambda: [order_book.get_price_for_volume(True, v) for v in volumes], len(volumes))
+    timed("native get_vwap_for_volume",
+          lambda: [order_book.get_vwap_for_volume(True, v) for v in volumes], len(volumes))
+    timed("batched get_price_for_volumes",
+          lambda: order_book.get_price_for_volumes(True, volumes), len(volumes))
+    timed("batched get_vwap_for_volumes",
+          lambda: order_book.get_vwap_for_volumes(True, volumes), len(volumes))
+
+
+if __name__ == "__main__":
+    main()
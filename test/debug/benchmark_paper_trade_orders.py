@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+
+"""
+Times the paper trade exchange with thousands of resting limit orders: the clock tick crossing check, the matching
+of order book trades, the cancellation and replacement of an order, and the available balance query, which summed
+the balances on hold over all the limit orders before they were kept up to date as orders are created and removed.
+
+Usage: python test/debug/benchmark_paper_trade_orders.py [trades_per_tick]
+"""
+
+import random
+import sys
+import time
+from decimal import Decimal
+from typing import List
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.event.events import OrderBookTradeEvent
+
+RESTING_ORDERS = (1000, 10000)
+TICKS = 200
+TRADES_PER_TICK = 100
+TRADING_PAIR = "COINALPHA-HBOT"
+
+
+def previous_available_balance(exchange: MockPaperExchange, currency: str) -> Decimal:
+    """
+    The available balance as computed before, from the balances on hold summed over all the limit orders.
+    """
+    on_hold = Decimal(0)
+    for limit_order in exchange.limit_orders:
+        if limit_order.is_buy and limit_order.quote_currency == currency:
+            on_hold += limit_order.quantity * limit_order.price
+        elif not limit_order.is_buy and limit_order.base_currency == currency:
+            on_hold += limit_order.quantity
+    return exchange.get_balance(currency) - on_hold
+
+
+def place_order(exchange: MockPaperExchange, rng: random.Random) -> str:
+    is_buy = rng.random() < 0.5
+    price = Decimal(rng.randrange(1, 10000)) / 1000
+    if is_buy:
+        return exchange.buy(TRADING_PAIR, Decimal(1), OrderType.LIMIT, Decimal(89) + price)
+    return exchange.sell(TRADING_PAIR, Decimal(1), OrderType.LIMIT, Decimal(111) - price)
+
+
+def timed_per_call(func, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - start) / calls
+
+
+def run(resting_orders: int, trades_per_tick: int) -> List[float]:
+    rng = random.Random(42)
+    exchange = MockPaperExchange(ClientConfigAdapter(ClientConfigMap()))
+    exchange.set_balanced_order_book(TRADING_PAIR, 100, 50, 150, 0.01, 1)
+    exchange.set_balance("COINALPHA", 1e9)
+    exchange.set_balance("HBOT", 1e12)
+    clock = Clock(ClockMode.BACKTEST, 1.0, 0, 1e9)
+    clock.add_iterator(exchange)
+    order_ids = [place_order(exchange, rng) for _ in range(resting_orders)]
+    order_book = exchange.order_books[TRADING_PAIR]
+
+    # Trades around the mid price, a few of them reaching the resting orders, at 1 from it at least
+    trades = [OrderBookTradeEvent(TRADING_PAIR, 1, rng.choice((TradeType.BUY, TradeType.SELL)),
+                                  rng.gauss(100, 1), 1)
+              for _ in range(TICKS * trades_per_tick)]
+    trades_iterator = iter(trades)
+
+    def cancel_and_replace():
+        exchange.cancel(TRADING_PAIR, order_ids.pop(rng.randrange(len(order_ids))))
+        order_ids.append(place_order(exchange, rng))
+
+    balance_elapsed = timed_per_call(lambda: exchange.get_available_balance("HBOT"), 1000)
+    previous_balance_elapsed = timed_per_call(lambda: previous_available_balance(exchange, "HBOT"), 10)
+    assert previous_available_balance(exchange, "HBOT") == exchange.get_available_balance("HBOT")
+    cancel_elapsed = timed_per_call(cancel_and_replace, 1000)
+    tick_elapsed = timed_per_call(lambda: clock.backtest_til(clock.current_timestamp + 1), TICKS)
+    trade_elapsed = timed_per_call(lambda: order_book.apply_trade(next(trades_iterator)), len(trades))
+    return [tick_elapsed, trade_elapsed, cancel_elapsed, balance_elapsed, previous_balance_elapsed]
+
+
+def main():
+    trades_per_tick = int(sys.argv[1]) if len(sys.argv) > 1 else TRADES_PER_TICK
+    print(f"{TICKS} ticks, {trades_per_tick} order book trades per tick, times in us\n")
+    print(f"{'resting orders':>16}{'tick':>10}{'trade':>10}{'cancel+replace':>16}{'available balance':>19}"
+          f"{'previously':>12}")
+    for resting_orders in RESTING_ORDERS:
+        elapsed = run(resting_orders, trades_per_tick)
+        print(f"{resting_orders:>16}" + "".join(f"{value * 1e6:>{width}.1f}"
+                                                for value, width in zip(elapsed, (10, 10, 16, 19, 12))))
+
+
+if __name__ == "__main__":
+    main()
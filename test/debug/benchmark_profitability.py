@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+
+"""
+Times the profitability check of the kill switch after a growing number of trade fills: the performance metrics
+recalculated from all the trade fills of the session, as calculated before, against the metrics of the performance
+accumulated as the fills were recorded. The time to query the fills from the database is not included.
+
+Usage: python test/debug/benchmark_profitability.py [checks]
+"""
+
+import asyncio
+import sys
+import time
+from decimal import Decimal
+from typing import List
+
+from hummingbot.client.performance import PerformanceAccumulator, PerformanceMetrics
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.model.order import Order  # noqa: F401 — Order needs to be defined for TradeFill
+from hummingbot.model.order_status import OrderStatus  # noqa: F401 — OrderStatus needs to be defined for Order
+from hummingbot.model.trade_fill import TradeFill
+
+CHECKS = 10
+TRADE_FILLS = (1000, 10000, 50000)
+TRADING_PAIR = "BTC-USDT"
+
+
+def make_trade_fills(count: int) -> List[TradeFill]:
+    fees = [AddedToCostTradeFee(percent=Decimal("0.001")).to_json(),
+            AddedToCostTradeFee(flat_fees=[TokenAmount("BNB", Decimal("0.0001"))]).to_json()]
+    return [TradeFill(config_file_path="benchmark.yml",
+                      strategy="pure_market_making",
+                      market="binance",
+                      symbol=TRADING_PAIR,
+                      base_asset="BTC",
+                      quote_asset="USDT",
+                      timestamp=1640001112223 + i,
+                      order_id=f"order{i // 2}",
+                      trade_type="BUY" if i % 4 < 2 else "SELL",
+                      order_type="LIMIT",
+                      price=Decimal(20000 + i % 100),
+                      amount=Decimal("0.01"),
+                      trade_fee=fees[i % 2],
+                      exchange_trade_id=f"trade{i}",
+                      position="NIL")
+            for i in range(count)]
+
+
+async def timed_checks(check, checks: int) -> float:
+    start = time.perf_counter()
+    for _ in range(checks):
+        await check()
+    return (time.perf_counter() - start) / checks
+
+
+async def run(trade_fills_count: int, checks: int):
+    current_balances = {"BTC": Decimal(1), "USDT": Decimal(10000)}
+    trade_fills = make_trade_fills(trade_fills_count)
+    accumulator = PerformanceAccumulator(TRADING_PAIR)
+    start = time.perf_counter()
+    for trade_fill in trade_fills:
+        accumulator.add_trade(trade_fill)
+    add_elapsed = (time.perf_counter() - start) / trade_fills_count
+
+    previous_elapsed = await timed_checks(
+        lambda: PerformanceMetrics.create(TRADING_PAIR, trade_fills, current_balances), checks)
+    accumulated_elapsed = await timed_checks(lambda: accumulator.metrics(current_balances), checks)
+    previous = await PerformanceMetrics.create(TRADING_PAIR, trade_fills, current_balances)
+    accumulated = await accumulator.metrics(current_balances)
+    assert previous.return_pct == accumulated.return_pct
+    print(f"{trade_fills_count:>12}{previous_elapsed * 1e3:>14.2f}{accumulated_elapsed * 1e3:>16.3f}"
+          f"{add_elapsed * 1e6:>19.1f}")
+
+
+def main():
+    checks = int(sys.argv[1]) if len(sys.argv) > 1 else CHECKS
+    rate_oracle = RateOracle()
+    rate_oracle._prices[TRADING_PAIR] = Decimal(20050)
+    rate_oracle._prices["BNB-USDT"] = Decimal(300)
+    RateOracle._shared_instance = rate_oracle
+
+    print(f"{checks} profitability checks\n")
+    print(f"{'trade fills':>12}{'previous ms':>14}{'accumulated ms':>16}{'us per fill added':>19}")
+    for trade_fills_count in TRADE_FILLS:
+        asyncio.get_event_loop().run_until_complete(run(trade_fills_count, checks))
+
+
+if __name__ == "__main__":
+    main()
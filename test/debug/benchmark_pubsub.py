@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+
+"""
+Measures how many events per second PubSub dispatches to 1, 10 and 100 listeners, in the steady state and while
+listeners keep being added, removed and garbage collected.
+
+Usage: python test/debug/benchmark_pubsub.py
+"""
+
+import gc
+import time
+from enum import Enum
+from typing import List, Tuple
+
+from hummingbot.core.event.event_listener import EventListener
+from hummingbot.core.pubsub import PubSub
+
+EVENTS = 200000
+
+
+class BenchmarkEvent(Enum):
+    Tick = 1
+
+
+class CountingListener(EventListener):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def __call__(self, arg):
+        self.calls += 1
+
+
+def subscribed_pubsub(listeners_count: int) -> Tuple[PubSub, List[CountingListener]]:
+    pubsub = PubSub()
+    listeners = [CountingListener() for _ in range(listeners_count)]
+    for listener in listeners:
+        pubsub.add_listener(BenchmarkEvent.Tick, listener)
+    return pubsub, listeners
+
+
+def steady_state(listeners_count: int) -> float:
+    pubsub, listeners = subscribed_pubsub(listeners_count)
+    events = EVENTS // listeners_count
+    start = time.perf_counter()
+    for _ in range(events):
+        pubsub.trigger_event(BenchmarkEvent.Tick, None)
+    elapsed = time.perf_counter() - start
+    assert all(listener.calls == events for listener in listeners)
+    return events / elapsed
+
+
+def with_churn(listeners_count: int, churn_every: int = 100) -> float:
+    """
+    Every `churn_every` events a new listener subscribes, and the oldest one is dropped without unsubscribing.
+    """
+    pubsub, listeners = subscribed_pubsub(listeners_count)
+    events = EVENTS // listeners_count
+    start = time.perf_counter()
+    for i in range(events):
+        if i % churn_every == 0:
+            listeners.pop(0)
+            listeners.append(CountingListener())
+            pubsub.add_listener(BenchmarkEvent.Tick, listeners[-1])
+        pubsub.trigger_event(BenchmarkEvent.Tick, None)
+    elapsed = time.perf_counter() - start
+    assert len(pubsub.get_listeners(BenchmarkEvent.Tick)) == listeners_count
+    return events / elapsed
+
+
+def main():
+    gc.disable()
+    print(f"{'listeners':>10}{'steady events/s':>18}{'churn events/s':>18}{'listener calls/s':>20}")
+    for listeners_count in (1, 10, 100):
+        steady = steady_state(listeners_count)
+        churn = with_churn(listeners_count)
+        print(f"{listeners_count:>10}{steady:>18,.0f}{churn:>18,.0f}{steady * listeners_count:>20,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+
+"""
+Measures the number of authenticated Binance order creation requests the RESTAssistant prepares per second, from the
+call to `execute_request` to the handing of the signed request to the connection, with a connection answering
+immediately: the assistant and the authenticator against their previous implementations, that deep copied the
+request, went through a helper coroutine per processing step, quoted every parameter for the signature, and keyed a
+new HMAC for each request. The current assistant is also measured through `execute_template_request`, with the
+request template of the order endpoint built once, as ExchangePyBase does for the order creation and cancellation.
+
+Usage: python test/debug/benchmark_rest_assistant.py [requests]
+"""
+
+import asyncio
+import hashlib
+import hmac
+import sys
+import time
+from copy import deepcopy
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+
+from hummingbot.connector.exchange.binance.binance_auth import BinanceAuth
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse
+from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
+
+REQUESTS = 20000
+ORDER_URL = "https://api.binance.com/api/v3/order"
+ORDER_PATH = "/order"
+
+
+class PreviousRESTAssistant(RESTAssistant):
+    """
+    The request processing of RESTAssistant before the copy of the requests was reduced to their mutable fields.
+    """
+
+    async def _call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
+        request = deepcopy(request)
+        request = await self._pre_process_request(request)
+        request = await self._authenticate(request)
+        resp = await asyncio.wait_for(self._connection.call(request), timeout)
+        resp = await self._post_process_response(resp)
+        return resp
+
+    async def _pre_process_request(self, request: RESTRequest) -> RESTRequest:
+        for pre_processor in self._rest_pre_processors:
+            request = await pre_processor.pre_process(request)
+        return request
+
+    async def _authenticate(self, request: RESTRequest):
+        if self._auth is not None and request.is_auth_required:
+            request = await self._auth.rest_authenticate(request)
+        return request
+
+    async def _post_process_response(self, response: RESTResponse) -> RESTResponse:
+        for post_processor in self._rest_post_processors:
+            response = await post_processor.post_process(response)
+        return response
+
+
+class PreviousBinanceAuth(BinanceAuth):
+    """
+    The signature of BinanceAuth before the HMAC was keyed once.
+    """
+
+    def _generate_signature(self, params: Dict[str, Any]) -> str:
+        encoded_params_str = urlencode(params)
+        digest = hmac.new(self.secret_key.encode("utf8"), encoded_params_str.encode("utf8"), hashlib.sha256).hexdigest()
+        return digest
+
+
+class FixedTimeProvider:
+    """
+    Server time that does not change, so that the requests signed by both implementations can be compared.
+    """
+
+    def time(self) -> float:
+        return 1640001112.223
+
+
+class ImmediateResponse:
+    status = 200
+
+    async def json(self) -> Dict[str, Any]:
+        return {"orderId": 28, "status": "NEW"}
+
+
+class ImmediateConnection:
+    def __init__(self):
+        self.last_request: Optional[RESTRequest] = None
+
+    async def call(self, request: RESTRequest) -> ImmediateResponse:
+        self.last_request = request
+        return ImmediateResponse()
+
+
+def order_data(index: int) -> Dict[str, Any]:
+    return {
+        "symbol": "BTCUSDT",
+        "side": "BUY",
+        "type": "LIMIT",
+        "timeInForce": "GTC",
+        "quantity": "0.00100000",
+        "price": f"{20000 + index % 100}.01",
+        "newClientOrderId": f"x-XEKWYICX-BBTUT{1640001112223000 + index}",
+    }
+
+
+async def run(assistant_class, auth_class, requests: int, use_template: bool = False) -> (float, RESTRequest):
+    auth = auth_class(api_key="benchmarkApiKey", secret_key="benchmarkSecret" * 4, time_provider=FixedTimeProvider())
+    throttler = AsyncThrottler([RateLimit(limit_id=ORDER_PATH, limit=requests * 10, time_interval=1)])
+    connection = ImmediateConnection()
+    assistant = assistant_class(connection=connection, throttler=throttler, auth=auth)
+    # Built once, as ExchangePyBase does for the order creation and cancellation endpoints
+    template = RESTAssistant.request_template(url=ORDER_URL, throttler_limit_id=ORDER_PATH, method=RESTMethod.POST,
+                                              is_auth_required=True)
+
+    start = time.perf_counter()
+    if use_template:
+        for index in range(requests):
+            await assistant.execute_template_request(template, data=order_data(index))
+    else:
+        for index in range(requests):
+            await assistant.execute_request(url=ORDER_URL, throttler_limit_id=ORDER_PATH, data=order_data(index),
+                                            method=RESTMethod.POST, is_auth_required=True)
+    return requests / (time.perf_counter() - start), connection.last_request
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else REQUESTS
+    loop = asyncio.get_event_loop()
+    previous_rate, previous_request = loop.run_until_complete(run(PreviousRESTAssistant, PreviousBinanceAuth, requests))
+    rate, request = loop.run_until_complete(run(RESTAssistant, BinanceAuth, requests))
+    template_rate, template_request = loop.run_until_complete(
+        run(RESTAssistant, BinanceAuth, requests, use_template=True))
+    for compared_request in (request, template_request):
+        assert previous_request.data == compared_request.data
+        assert previous_request.headers == compared_request.headers
+
+    print(f"{requests} authenticated order creation requests\n")
+    print(f"{'assistant':>18}{'requests/s':>14}{'us per request':>16}")
+    print(f"{'previous':>18}{previous_rate:>14.0f}{1e6 / previous_rate:>16.1f}")
+    print(f"{'current':>18}{rate:>14.0f}{1e6 / rate:>16.1f}")
+    print(f"{'current, template':>18}{template_rate:>14.0f}{1e6 / template_rate:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+
+"""
+Measures, in fresh interpreters run with `-X importtime`, the creation of the connector settings alone and with the
+client modules imported by bin/hummingbot.py: on the first run, which builds the connector settings manifest by
+importing the utils module of every connector, and on the next runs, which load the manifest.
+
+Reports the wall time, the import time reported by `-X importtime`, the number of modules and of connector modules
+imported, and the slowest imports only made when building the manifest.
+
+Usage: python test/debug/benchmark_startup_imports.py [runs]
+"""
+
+import os
+import subprocess
+import sys
+from tempfile import TemporaryDirectory
+from typing import Dict, List, NamedTuple, Tuple
+
+RUNS = 3
+SLOWEST_IMPORTS = 10
+
+STARTUP_SCRIPT = """
+import sys
+import time
+
+start = time.perf_counter()
+import hummingbot
+hummingbot.set_prefix_path(sys.argv[1])
+
+if sys.argv[2] == "client":
+    from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
+from hummingbot.client.settings import AllConnectorSettings
+
+AllConnectorSettings.get_connector_settings()
+print(time.perf_counter() - start)
+"""
+
+
+class StartupRun(NamedTuple):
+    wall_seconds: float
+    # Self import time in microseconds of every module, as reported by -X importtime
+    import_times: Dict[str, int]
+
+
+def run_startup(prefix_path: str, startup: str) -> StartupRun:
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STARTUP_SCRIPT, prefix_path, startup],
+        capture_output=True, text=True, check=True, env={**os.environ, "PYTHONPATH": os.getcwd()},
+    )
+    wall_seconds = float(process.stdout.split()[-1])
+    import_times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, module = line[len("import time:"):].split("|")
+        import_times[module.strip()] = int(self_us)
+    return StartupRun(wall_seconds, import_times)
+
+
+def connector_modules(run: StartupRun) -> List[str]:
+    return [module for module in run.import_times
+            if module.startswith(("hummingbot.connector.exchange.", "hummingbot.connector.derivative.",
+                                  "hummingbot.connector.connector.", "hummingbot.connector.other."))]
+
+
+def summary(name: str, runs: List[StartupRun]) -> Tuple[str, StartupRun]:
+    fastest = min(runs, key=lambda run: run.wall_seconds)
+    return (f"{name:>42}{fastest.wall_seconds * 1e3:>10.0f}{sum(fastest.import_times.values()) / 1e3:>14.0f}"
+            f"{len(fastest.import_times):>10}{len(connector_modules(fastest)):>13}"), fastest
+
+
+def main():
+    runs_count = int(sys.argv[1]) if len(sys.argv) > 1 else RUNS
+    print(f"{'startup':>42}{'wall ms':>10}{'imports ms':>14}{'modules':>10}{'connectors':>13}")
+    for startup in ("connector settings", "client"):
+        first_runs = []
+        next_runs = []
+        for _ in range(runs_count):
+            with TemporaryDirectory() as prefix_path:
+                first_runs.append(run_startup(prefix_path, startup))
+                next_runs.append(run_startup(prefix_path, startup))
+        first_line, first_run = summary(f"{startup}, building the manifest", first_runs)
+        next_line, next_run = summary(f"{startup}, loading the manifest", next_runs)
+        print(first_line)
+        print(next_line)
+
+    print("\nslowest imports only made when building the manifest, self ms:")
+    only_first = {module: self_us for module, self_us in first_run.import_times.items()
+                  if module not in next_run.import_times}
+    for module, self_us in sorted(only_first.items(), key=lambda item: item[1], reverse=True)[:SLOWEST_IMPORTS]:
+        print(f"{self_us / 1e3:>10.1f}  {module}")
+
+
+if __name__ == "__main__":
+    main()
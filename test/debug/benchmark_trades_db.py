@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+
+"""
+Builds a synthetic trades database, 5M trade fills by default, and times the queries of the history command and of
+the markets recorder without and with the indexes added by the AddTradeHistoryIndexes migration, as well as the
+commit latency of single trade fills with the default journal and with the SQLite pragmas of SQLConnectionManager.
+
+The database is kept between runs, building it takes a few minutes. Like the databases of the client, it has no
+ANALYZE statistics, so SQLite plans the queries from the indexes alone.
+
+Usage: python test/debug/benchmark_trades_db.py [database_path] [trade_fills]
+"""
+
+import os
+import random
+import sqlite3
+import sys
+import time
+from typing import Callable, List
+
+from sqlalchemy.orm import Query
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.model.db_migration.transformations import AddTradeHistoryIndexes
+from hummingbot.model.order import Order
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.trade_fill import TradeFill
+
+TRADE_FILLS = 5000000
+FILLS_PER_ORDER = 5
+CONFIG_FILES = ["conf_pure_mm_1.yml", "conf_pure_mm_2.yml", "conf_xemm_1.yml"]
+MARKETS = ["binance", "kucoin", "gate_io", "ascend_ex"]
+DAYS = 180
+HISTORY_DAYS = 1
+END_TIMESTAMP = 1660000000000
+START_TIMESTAMP = END_TIMESTAMP - DAYS * 24 * 3600 * 1000
+
+
+def build_database(db_path: str, trade_fills: int):
+    manager = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS,
+                                   db_path=db_path)
+    manager.engine.dispose()
+    connection = sqlite3.connect(db_path)
+    connection.execute("PRAGMA synchronous=OFF")
+    for index_name in AddTradeHistoryIndexes.index_names:
+        connection.execute(f"DROP INDEX {index_name}")
+    rng = random.Random(42)
+    orders = trade_fills // FILLS_PER_ORDER
+    step = (END_TIMESTAMP - START_TIMESTAMP) // orders
+    for chunk_start in range(0, orders, 100000):
+        order_rows = []
+        trade_rows = []
+        for order_number in range(chunk_start, min(chunk_start + 100000, orders)):
+            config_file_path = rng.choice(CONFIG_FILES)
+            market = rng.choice(MARKETS)
+            creation_timestamp = START_TIMESTAMP + order_number * step
+            order_id = f"HBOTBPXUT{order_number:012d}"
+            order_rows.append((order_id, config_file_path, "pure_market_making", market, "BTC-USDT", "BTC", "USDT",
+                               creation_timestamp, "LIMIT", 1000000, 1, 30000000000, "BuyOrderCompleted",
+                               creation_timestamp + FILLS_PER_ORDER, f"{order_number}", "NIL"))
+            for fill_number in range(FILLS_PER_ORDER):
+                trade_rows.append((config_file_path, "pure_market_making", market, "BTC-USDT", "BTC", "USDT",
+                                   creation_timestamp + fill_number, order_id, "BUY", "LIMIT", 30000000000, 200000,
+                                   1, '{"percent": "0", "flat_fees": []}', f"{order_number}_{fill_number}", "NIL"))
+        connection.executemany('INSERT INTO "Order" VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                               order_rows)
+        connection.executemany("INSERT INTO TradeFill VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                               trade_rows)
+        connection.commit()
+    connection.close()
+
+
+def timed(func: Callable, repeats: int = 5) -> float:
+    """
+    :return: the fastest of `repeats` runs, after a warm up run
+    """
+    func()
+    elapsed = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        elapsed.append(time.perf_counter() - start)
+    return min(elapsed)
+
+
+def time_queries(manager: SQLConnectionManager, paged: bool, order_id: str) -> List[float]:
+    history_start = END_TIMESTAMP - HISTORY_DAYS * 24 * 3600 * 1000
+
+    def history():
+        with manager.get_new_session() as session:
+            query: Query = (session
+                            .query(TradeFill)
+                            .filter(TradeFill.timestamp >= history_start,
+                                    TradeFill.config_file_path.like(f"%{CONFIG_FILES[0]}%")))
+            if paged:
+                trades = [trade for page in TradeFill.iter_pages(query) for trade in page]
+            else:
+                trades = query.order_by(TradeFill.timestamp.desc()).all()
+            assert len(trades) > 0
+
+    def recent_orders():
+        with manager.get_new_session() as session:
+            orders = (session
+                      .query(Order)
+                      .filter(Order.config_file_path == CONFIG_FILES[0],
+                              Order.market == MARKETS[0],
+                              Order.exchange_order_id.isnot(None))
+                      .order_by(Order.creation_timestamp)
+                      .limit(2000)
+                      .all())
+            assert len(orders) == 2000
+
+    def order_trade_fills():
+        with manager.get_new_session() as session:
+            order = session.query(Order).filter(Order.id == order_id).one()
+            assert len(order.trade_fills) == FILLS_PER_ORDER
+
+    return [timed(history), timed(recent_orders), timed(order_trade_fills)]
+
+
+def commit_latency(db_path: str, pragmas: bool, commits: int = 500) -> float:
+    connection = sqlite3.connect(db_path)
+    if pragmas:
+        for pragma, value in SQLConnectionManager.SQLITE_PRAGMAS.items():
+            connection.execute(f"PRAGMA {pragma}={value}")
+    else:
+        connection.execute("PRAGMA journal_mode=DELETE")
+        connection.execute("PRAGMA synchronous=FULL")
+    start = time.perf_counter()
+    for commit_number in range(commits):
+        connection.execute("INSERT INTO TradeFill VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                           ("benchmark.yml", "pure_market_making", "binance", "BTC-USDT", "BTC", "USDT",
+                            END_TIMESTAMP + commit_number, "benchmark", "BUY", "LIMIT", 1, 1, 1, "{}",
+                            f"{pragmas}_{commit_number}", "NIL"))
+        connection.commit()
+    elapsed = time.perf_counter() - start
+    connection.execute("DELETE FROM TradeFill WHERE order_id = 'benchmark'")
+    connection.commit()
+    connection.close()
+    return elapsed / commits
+
+
+def main():
+    db_path = sys.argv[1] if len(sys.argv) > 1 else os.path.join("data", "benchmark_trades.sqlite")
+    trade_fills = int(sys.argv[2]) if len(sys.argv) > 2 else TRADE_FILLS
+    if not os.path.exists(db_path):
+        start = time.perf_counter()
+        build_database(db_path, trade_fills)
+        print(f"built {db_path} in {time.perf_counter() - start:.0f} s")
+    client_config_map = ClientConfigAdapter(ClientConfigMap())
+
+    connection = sqlite3.connect(db_path)
+    for index_name in AddTradeHistoryIndexes.index_names:
+        connection.execute(f"DROP INDEX IF EXISTS {index_name}")
+    orders = connection.execute('SELECT MAX(rowid) FROM "Order"').fetchone()[0]
+    order_id = f"HBOTBPXUT{orders // 2:012d}"
+    connection.close()
+    manager = SQLConnectionManager(client_config_map, SQLConnectionType.TRADE_FILLS, db_path=db_path,
+                                   called_from_migrator=True)
+    before = time_queries(manager, paged=False, order_id=order_id)
+
+    start = time.perf_counter()
+    AddTradeHistoryIndexes(migrator=None).apply(manager)
+    migration_elapsed = time.perf_counter() - start
+    after = time_queries(manager, paged=True, order_id=order_id)
+    manager.engine.dispose()
+
+    connection = sqlite3.connect(db_path)
+    trade_fills = connection.execute("SELECT COUNT(*) FROM TradeFill").fetchone()[0]
+    connection.close()
+    print(f"{trade_fills:,} trade fills, AddTradeHistoryIndexes took {migration_elapsed:.1f} s\n")
+    print(f"{'query':>36}{'before ms':>12}{'after ms':>12}{'speedup':>10}")
+    for name, before_elapsed, after_elapsed in zip(
+            (f"history of the last {HISTORY_DAYS} day", "first 2000 orders of a market", "trade fills of an order"),
+            before, after):
+        print(f"{name:>36}{before_elapsed * 1e3:>12.2f}{after_elapsed * 1e3:>12.2f}"
+              f"{before_elapsed / after_elapsed:>9.1f}x")
+
+    default_latency = commit_latency(db_path, pragmas=False)
+    tuned_latency = commit_latency(db_path, pragmas=True)
+    print(f"\ncommit of a single trade fill: {default_latency * 1e3:.2f} ms with the default journal, "
+          f"{tuned_latency * 1e3:.2f} ms with the SQLConnectionManager pragmas")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+
+"""
+Times the TradingIntensityIndicator calculation of an Avellaneda tick on synthetic trades, against the previous
+calculation that consolidated the volumes of the whole window and refitted them on every tick, and reports the
+difference of the estimates.
+
+Usage: python test/debug/benchmark_trading_intensity.py [ticks] [sampling_length]
+"""
+
+import sys
+import time
+import warnings
+from typing import List, Tuple
+
+import numpy as np
+from scipy.optimize import OptimizeWarning, curve_fit
+
+from hummingbot.core.data_type.common import PriceType, TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import TradingIntensityIndicator
+
+TICKS = 3000
+SAMPLING_LENGTH = 200
+TRADES_PER_TICK = 3
+ALPHA = 5.0
+KAPPA = 2.0
+
+
+class MidPriceDelegate:
+    def __init__(self):
+        self.mid_price = 100.0
+
+    def get_price_by_type(self, price_type: PriceType) -> float:
+        return self.mid_price
+
+
+class PreviousTradingIntensityIndicator:
+    """
+    The calculation of the indicator before the per price level volumes, in Python.
+    """
+
+    def __init__(self, price_delegate: MidPriceDelegate, sampling_length: int):
+        self._alpha = 0
+        self._kappa = 0
+        self._trade_samples = {}
+        self._current_trade_sample = []
+        self._price_delegate = price_delegate
+        self._sampling_length = sampling_length
+        self._last_quotes = []
+
+    @property
+    def current_value(self) -> Tuple[float, float]:
+        return self._alpha, self._kappa
+
+    def register_trade(self, trade):
+        self._current_trade_sample.append(trade)
+
+    def calculate(self, timestamp):
+        price = self._price_delegate.get_price_by_type(PriceType.MidPrice)
+        self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
+        latest_processed_quote_idx = None
+        for trade in self._current_trade_sample:
+            for i, quote in enumerate(self._last_quotes):
+                if quote["timestamp"] < trade.timestamp:
+                    if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
+                        latest_processed_quote_idx = i
+                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
+                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
+                        self._trade_samples[quote["timestamp"] + 1] = []
+                    self._trade_samples[quote["timestamp"] + 1] += [trade]
+                    break
+        self._current_trade_sample = []
+        if latest_processed_quote_idx is not None:
+            self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
+        if len(self._trade_samples.keys()) > self._sampling_length:
+            timestamps = sorted(self._trade_samples.keys())[-self._sampling_length:]
+            self._trade_samples = {timestamp: self._trade_samples[timestamp] for timestamp in timestamps}
+        if len(self._trade_samples.keys()) == self._sampling_length:
+            self.estimate_intensity()
+
+    def estimate_intensity(self):
+        trades_consolidated = {}
+        price_levels = []
+        for timestamp in self._trade_samples.keys():
+            for trade in self._trade_samples[timestamp]:
+                if trade['price_level'] not in trades_consolidated.keys():
+                    trades_consolidated[trade['price_level']] = 0
+                    price_levels += [trade['price_level']]
+                trades_consolidated[trade['price_level']] += trade['amount']
+        price_levels = sorted(price_levels, reverse=True)
+        lambdas = [trades_consolidated[price_level] for price_level in price_levels]
+        lambdas_adj = [10**-10 if x == 0 else x for x in lambdas]
+        try:
+            params = curve_fit(lambda t, a, b: a * np.exp(-b * t),
+                               price_levels,
+                               lambdas_adj,
+                               p0=(self._alpha, self._kappa),
+                               method='dogbox',
+                               bounds=([0, 0], [np.inf, np.inf]))
+            self._kappa, self._alpha = params[0][1], params[0][0]
+        except (RuntimeError, ValueError):
+            pass
+
+
+def make_ticks(ticks: int) -> List[Tuple[float, List[OrderBookTradeEvent]]]:
+    """
+    :return: the mid price and the trades of every tick, the trades being at exponentially distributed distances
+    from the previous mid price, on a 0.01 price grid
+    """
+    rng = np.random.default_rng(42)
+    mid_prices = np.round(100 * np.exp(np.cumsum(rng.normal(0, 0.0005, ticks))), 1)
+    result = []
+    for tick, mid_price in enumerate(mid_prices):
+        previous_mid_price = mid_prices[tick - 1] if tick > 0 else mid_price
+        trades = []
+        for _ in range(rng.poisson(TRADES_PER_TICK)):
+            distance = rng.exponential(1 / KAPPA)
+            side = rng.choice([-1, 1])
+            trades.append(OrderBookTradeEvent(
+                trading_pair="COINALPHA-HBOT",
+                timestamp=tick + 0.5,
+                price=round(previous_mid_price + side * round(distance, 2), 2),
+                amount=float(rng.exponential(ALPHA)),
+                type=TradeType.BUY if side > 0 else TradeType.SELL))
+        result.append((float(mid_price), trades))
+    return result
+
+
+def run(indicator, price_delegate: MidPriceDelegate, ticks) -> Tuple[List[float], List[Tuple[float, float]]]:
+    elapsed = []
+    estimates = []
+    for tick, (mid_price, trades) in enumerate(ticks):
+        start = time.perf_counter()
+        for trade in trades:
+            indicator.register_trade(trade)
+        price_delegate.mid_price = mid_price
+        indicator.calculate(tick)
+        elapsed.append(time.perf_counter() - start)
+        estimates.append(tuple(float(value) for value in indicator.current_value))
+    return elapsed, estimates
+
+
+def main():
+    ticks_count = int(sys.argv[1]) if len(sys.argv) > 1 else TICKS
+    sampling_length = int(sys.argv[2]) if len(sys.argv) > 2 else SAMPLING_LENGTH
+    warnings.simplefilter("ignore", OptimizeWarning)
+    ticks = make_ticks(ticks_count)
+
+    price_delegate = MidPriceDelegate()
+    previous_elapsed, previous_estimates = run(
+        PreviousTradingIntensityIndicator(price_delegate, sampling_length), price_delegate, ticks)
+    print(f"{ticks_count} ticks, {TRADES_PER_TICK} trades per tick, sampling length {sampling_length}\n")
+    print(f"{'calculation':>28}{'mean us':>10}{'p99 us':>10}{'speedup':>9}{'max alpha diff':>16}"
+          f"{'max kappa diff':>16}")
+    rows = [("previous", previous_elapsed, previous_estimates)]
+    for refine_threshold in (0.0, 0.01, 0.05):
+        elapsed, estimates = run(
+            TradingIntensityIndicator(OrderBook(), price_delegate, sampling_length, refine_threshold=refine_threshold),
+            price_delegate,
+            ticks)
+        rows.append((f"refine threshold {refine_threshold:g}", elapsed, estimates))
+
+    # The estimates are compared once both were refined from their first fit
+    first_compared_tick = next(tick for tick, estimate in enumerate(previous_estimates) if estimate != (0, 0)) + 1
+    for name, elapsed, estimates in rows:
+        differences = np.abs(np.array(estimates[first_compared_tick:]) - np.array(previous_estimates[first_compared_tick:]))
+        print(f"{name:>28}{np.mean(elapsed) * 1e6:>10.0f}{np.percentile(elapsed, 99) * 1e6:>10.0f}"
+              f"{np.mean(previous_elapsed) / np.mean(elapsed):>8.1f}x"
+              f"{differences[:, 0].max():>16.2e}{differences[:, 1].max():>16.2e}")
+
+
+if __name__ == "__main__":
+    main()
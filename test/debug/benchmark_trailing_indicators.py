@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+
+"""
+Times adding a sample to the trailing indicators with running sums, against recomputing each indicator over its
+whole sampling and processing buffers as they used to, for increasing sampling lengths.
+
+Usage: python test/debug/benchmark_trailing_indicators.py
+"""
+
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.strategy.__utils__.ring_buffer import RingBuffer
+from hummingbot.strategy.__utils__.trailing_indicators.exponential_moving_average import (
+    ExponentialMovingAverageIndicator,
+)
+from hummingbot.strategy.__utils__.trailing_indicators.historical_volatility import HistoricalVolatilityIndicator
+from hummingbot.strategy.__utils__.trailing_indicators.instant_volatility import InstantVolatilityIndicator
+
+SAMPLES = 20000
+PROCESSING_LENGTH = 15
+
+
+class FullWindowIndicator:
+    def __init__(self, indicator_calculation, processing_calculation, sampling_length: int, processing_length: int):
+        self._indicator_calculation = indicator_calculation
+        self._processing_calculation = processing_calculation
+        self.sampling_buffer = RingBuffer(sampling_length)
+        self.processing_buffer = RingBuffer(processing_length)
+
+    def add_sample(self, value: float):
+        self.sampling_buffer.add_value(value)
+        self.processing_buffer.add_value(self._indicator_calculation(self.sampling_buffer))
+
+    @property
+    def current_value(self) -> float:
+        return self._processing_calculation(self.processing_buffer)
+
+
+def historical_volatility(buffer: RingBuffer) -> float:
+    return np.var(np.diff(np.log(buffer.get_as_numpy_array())))
+
+
+def instant_volatility(buffer: RingBuffer) -> float:
+    samples = buffer.get_as_numpy_array()
+    return np.sqrt(np.sum(np.square(np.diff(samples))) / samples.size)
+
+
+def exponential_moving_average(buffer: RingBuffer) -> float:
+    return pd.Series(buffer.get_as_numpy_array()).ewm(span=buffer.length, adjust=True).mean().iloc[-1]
+
+
+INDICATORS = {
+    "historical volatility": (
+        lambda length: HistoricalVolatilityIndicator(length, PROCESSING_LENGTH),
+        lambda length: FullWindowIndicator(
+            historical_volatility,
+            lambda buffer: np.sqrt(np.mean(np.nan_to_num(buffer.get_as_numpy_array()))),
+            length, PROCESSING_LENGTH)),
+    "instant volatility": (
+        lambda length: InstantVolatilityIndicator(length, 1),
+        lambda length: FullWindowIndicator(instant_volatility, lambda buffer: buffer.get_last_value(), length, 1)),
+    "exponential moving average": (
+        lambda length: ExponentialMovingAverageIndicator(length, 1),
+        lambda length: FullWindowIndicator(exponential_moving_average, lambda buffer: buffer.get_last_value(),
+                                           length, 1)),
+}
+
+
+def timed(indicator, prices: np.ndarray) -> float:
+    start = time.perf_counter()
+    for price in prices:
+        indicator.add_sample(price)
+        indicator.current_value
+    return (time.perf_counter() - start) / len(prices)
+
+
+def main():
+    warnings.simplefilter("ignore", RuntimeWarning)
+    prices = 100 * np.exp(np.cumsum(np.random.default_rng(7).normal(0, 0.002, SAMPLES)))
+    print(f"{SAMPLES} samples, time per sample and read of the current value\n")
+    print(f"{'indicator':>28}{'sampling length':>17}{'full window us':>16}{'running sums us':>17}{'speedup':>10}")
+    for name, (incremental, full_window) in INDICATORS.items():
+        for sampling_length in (30, 300, 3000):
+            samples = prices if name != "exponential moving average" else prices[:SAMPLES // 10]
+            full_window_elapsed = timed(full_window(sampling_length), samples)
+            incremental_elapsed = timed(incremental(sampling_length), samples)
+            print(f"{name:>28}{sampling_length:>17}{full_window_elapsed * 1e6:>16.1f}"
+                  f"{incremental_elapsed * 1e6:>17.1f}{full_window_elapsed / incremental_elapsed:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import asyncio
+import unittest
+from typing import Awaitable
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.core.web_assistant.connections.connections_manager import ConnectionsManager
+
+from test.mock.mock_cli import CLIMockingAssistant  # isort: skip
+
+
+class ExitCommandTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+
+        self.async_run_with_timeout(read_system_configs_from_yml())
+
+        self.app = HummingbotApplication(ClientConfigAdapter(ClientConfigMap()))
+        self.cli_mock_assistant = CLIMockingAssistant(self.app.app)
+        self.cli_mock_assistant.start()
+
+    def tearDown(self) -> None:
+        self.cli_mock_assistant.stop()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @patch("hummingbot.client.ui.hummingbot_cli.HummingbotCLI.exit")
+    def test_exit_closes_the_shared_http_client_session(self, app_exit_mock: MagicMock):
+        connections_manager = ConnectionsManager()
+        connections_manager.close = AsyncMock()
+        prometheus_endpoint = MagicMock()
+        prometheus_endpoint.stop = AsyncMock()
+        self.app.prometheus_endpoint = prometheus_endpoint
+
+        with patch.object(ConnectionsManager, "_shared_instance", connections_manager):
+            self.async_run_with_timeout(self.app.exit_loop(force=True))
+
+        connections_manager.close.assert_awaited_once()
+        prometheus_endpoint.stop.assert_awaited_once()
+        app_exit_mock.assert_called_once()
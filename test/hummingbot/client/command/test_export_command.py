@@ -0,0 +1,115 @@
+import asyncio
+import tempfile
+import unittest
+from decimal import Decimal
+from pathlib import Path
+from test.mock.mock_cli import CLIMockingAssistant
+from typing import Awaitable
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pandas as pd
+
+from hummingbot.client.config.client_config_map import ClientConfigMap, DBSqliteMode
+from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.model.order import Order
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.trade_fill import TradeFill
+
+
+class ExportCommandTest(unittest.TestCase):
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher")
+    def setUp(self, _: MagicMock) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+
+        self.async_run_with_timeout(read_system_configs_from_yml())
+        self.client_config_map = ClientConfigAdapter(ClientConfigMap())
+        self.client_config_map.db_mode = DBSqliteMode()
+        self.export_dir = tempfile.TemporaryDirectory()
+        self.client_config_map.log_file_path = Path(self.export_dir.name)
+
+        self.app = HummingbotApplication(client_config_map=self.client_config_map)
+        self.mock_strategy_name = "test-export-strategy"
+        self.app.strategy_file_name = f"{self.mock_strategy_name}.yml"
+        self.app.init_time = 0
+
+        self.cli_mock_assistant = CLIMockingAssistant(self.app.app)
+        self.cli_mock_assistant.start()
+
+    def tearDown(self) -> None:
+        self.cli_mock_assistant.stop()
+        self.app.trade_fill_db.engine.dispose()
+        SQLConnectionManager._scm_trade_fills_instance = None
+        db_path = Path(SQLConnectionManager.create_db_path(db_name=self.mock_strategy_name))
+        db_path.unlink(missing_ok=True)
+        self.export_dir.cleanup()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def add_trades(self, count: int):
+        trade_fee = AddedToCostTradeFee(percent=Decimal("5"))
+        with self.app.trade_fill_db.get_new_session() as session:
+            session.add(Order(
+                id="someId",
+                config_file_path=f"{self.mock_strategy_name}.yml",
+                strategy=self.mock_strategy_name,
+                market="binance",
+                symbol="BTC-USDT",
+                base_asset="BTC",
+                quote_asset="USDT",
+                creation_timestamp=0,
+                order_type="LMT",
+                amount=4,
+                leverage=0,
+                price=3,
+                last_status="PENDING",
+                last_update_timestamp=0,
+            ))
+            for i in range(1, count + 1):
+                session.add(TradeFill(
+                    config_file_path=f"{self.mock_strategy_name}.yml",
+                    strategy=self.mock_strategy_name,
+                    market="binance",
+                    symbol="BTC-USDT",
+                    base_asset="BTC",
+                    quote_asset="USDT",
+                    timestamp=i * 1000,
+                    order_id="someId",
+                    trade_type="BUY",
+                    order_type="LIMIT",
+                    price=i,
+                    amount=2,
+                    leverage=1,
+                    trade_fee=trade_fee.to_json(),
+                    exchange_trade_id=f"someExchangeId{i}",
+                ))
+            session.commit()
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_export_trades_without_trades(self, notify_mock: MagicMock):
+        self.app.prompt_new_export_file_name = AsyncMock()
+
+        self.async_run_with_timeout(self.app.export_trades())
+
+        notify_mock.assert_called_once_with("No past trades to export.")
+        self.app.prompt_new_export_file_name.assert_not_called()
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_export_trades_writes_every_page_to_the_file(self, notify_mock: MagicMock):
+        self.add_trades(5)
+        self.app.prompt_new_export_file_name = AsyncMock(return_value="trades.csv")
+        iter_pages = TradeFill.iter_pages
+
+        with patch.object(TradeFill, "iter_pages", side_effect=lambda query: iter_pages(query, page_size=2)):
+            self.async_run_with_timeout(self.app.export_trades())
+
+        file_path = Path(self.export_dir.name) / "trades.csv"
+        notify_mock.assert_called_once_with(f"Successfully exported trades to {file_path}")
+        df = pd.read_csv(file_path)
+        self.assertEqual([f"someExchangeId{i}" for i in range(1, 6)], list(df["Id"]))
+        self.assertEqual([1, 2, 3, 4, 5], list(df["Price"]))
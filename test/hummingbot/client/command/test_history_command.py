@@ -13,6 +13,7 @@ from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_sy
 from hummingbot.client.hummingbot_application import HummingbotApplication
 from hummingbot.connector.exchange.paper_trade import PaperTradeExchange
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.model.order import Order
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
@@ -172,3 +173,23 @@ class HistoryCommandTest(unittest.TestCase):
         )
 
         self.assertEqual(df_str_expected, captures[0])
+
+    @patch("hummingbot.client.command.history_command.HistoryCommand.get_current_balances")
+    def test_profitability_calculated_from_the_recorded_trades_performance(self, get_current_balances_mock: AsyncMock):
+        rate_oracle = RateOracle()
+        rate_oracle._prices["BTC-USDT"] = Decimal("1.5")
+        RateOracle._shared_instance = rate_oracle
+        self.addCleanup(setattr, RateOracle, "_shared_instance", None)
+        get_current_balances_mock.return_value = {"BTC": Decimal("10"), "USDT": Decimal("100")}
+        self.app.strategy_file_name = f"{self.mock_strategy_name}.yml"
+        self.app.markets_recorder = MagicMock()
+        trades = self.get_trades()
+        for trade in trades:
+            self.app.add_trade_performance(trade)
+
+        profitability = self.async_run_with_timeout(self.app.calculate_profitability())
+
+        expected_profitability = self.async_run_with_timeout(
+            self.app.history_report(start_time=time.time(), trades=trades, display_report=False))
+        self.assertEqual(expected_profitability, profitability)
+        self.assertNotEqual(Decimal("0"), profitability)
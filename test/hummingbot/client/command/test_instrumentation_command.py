@@ -0,0 +1,97 @@
+import asyncio
+import unittest
+from typing import Awaitable
+from unittest.mock import patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.core.instrumentation.instrumentation import EVENT_LOOP_LAG, TICK_DURATION, Instrumentation
+
+from test.mock.mock_cli import CLIMockingAssistant  # isort: skip
+
+
+class InstrumentationCommandTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+
+        self.async_run_with_timeout(read_system_configs_from_yml())
+
+        self.app = HummingbotApplication(ClientConfigAdapter(ClientConfigMap()))
+        self.cli_mock_assistant = CLIMockingAssistant(self.app.app)
+        self.cli_mock_assistant.start()
+
+        self.instrumentation = Instrumentation()
+        self.instrumentation_patch = patch.object(Instrumentation, "_shared_instance", self.instrumentation)
+        self.instrumentation_patch.start()
+
+    def tearDown(self) -> None:
+        if self.app.prometheus_endpoint is not None:
+            self.async_run_with_timeout(self.app.prometheus_endpoint.stop())
+        self.instrumentation_patch.stop()
+        self.cli_mock_assistant.stop()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_report_without_latencies(self):
+        self.app.instrumentation()
+
+        self.assertTrue(self.cli_mock_assistant.check_log_called_with("No latency recorded yet."))
+
+    def test_report(self):
+        for duration in (0.001, 0.002, 0.003):
+            self.instrumentation.histogram(TICK_DURATION, "PureMarketMakingStrategy").record(duration)
+        self.instrumentation.histogram(EVENT_LOOP_LAG).record(0.0005)
+
+        report = self.app.instrumentation_report()
+
+        self.assertTrue(report.startswith("\n  Latencies:\n"))
+        self.assertIn("p99.9 (ms)", report)
+        self.assertIn("event_loop_lag", report)
+        self.assertIn("iterator=PureMarketMakingStrategy", report)
+        self.assertLess(report.index("event_loop_lag"), report.index("tick_duration"))
+        tick_duration_row = next(line for line in report.split("\n") if "tick_duration" in line)
+        cells = [cell.strip() for cell in tick_duration_row.strip(" |").split("|")]
+        self.assertEqual("3", cells[2])
+        self.assertAlmostEqual(2, float(cells[3]))
+        self.assertAlmostEqual(2, float(cells[4]), delta=2 / 64)
+        self.assertAlmostEqual(3, float(cells[-1]))
+
+    def test_reset(self):
+        self.instrumentation.histogram(EVENT_LOOP_LAG).record(0.0005)
+
+        self.app.instrumentation(reset=True)
+
+        self.assertEqual([], self.instrumentation.histograms())
+        self.assertTrue(self.cli_mock_assistant.check_log_called_with("The recorded latencies were cleared."))
+
+    def test_start_and_stop_prometheus_endpoint(self):
+        self.async_run_with_timeout(self.app.set_prometheus_endpoint(0))
+        self.assertIsNone(self.app.prometheus_endpoint)
+
+        with patch("hummingbot.core.instrumentation.prometheus_endpoint.PrometheusEndpoint.start"):
+            self.async_run_with_timeout(self.app.set_prometheus_endpoint(9101))
+
+        endpoint = self.app.prometheus_endpoint
+        self.assertIsNotNone(endpoint)
+        self.assertTrue(self.cli_mock_assistant.check_log_called_with(
+            "Serving the latencies in the Prometheus format at http://127.0.0.1:9101/metrics"))
+
+        self.async_run_with_timeout(self.app.set_prometheus_endpoint(0))
+
+        self.assertIsNone(self.app.prometheus_endpoint)
+        self.assertTrue(self.cli_mock_assistant.check_log_called_with(
+            "Stopped serving the latencies in the Prometheus format."))
+
+    def test_prometheus_endpoint_port_unavailable(self):
+        with patch("hummingbot.core.instrumentation.prometheus_endpoint.PrometheusEndpoint.start",
+                   side_effect=OSError("Address already in use")):
+            self.async_run_with_timeout(self.app.set_prometheus_endpoint(9101))
+
+        self.assertIsNone(self.app.prometheus_endpoint)
+        self.assertTrue(self.cli_mock_assistant.check_log_called_with(
+            "Could not serve the latencies on port 9101: Address already in use"))
@@ -5,7 +5,7 @@ from decimal import Decimal
 from typing import Awaitable
 from unittest.mock import MagicMock, patch
 
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import PerformanceAccumulator, PerformanceMetrics
 from hummingbot.core.data_type.common import PositionAction, OrderType, TradeType
 from hummingbot.core.data_type.trade import Trade
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
@@ -326,3 +326,104 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
         expected_fee_amount += flat_fees[0].amount * Decimal("0.9") * Decimal("2")
         expected_fee_amount += flat_fees[1].amount * Decimal("2")
         self.assertEqual(expected_fee_amount, performance_metric.fee_in_quote)
+
+
+class PerformanceAccumulatorTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        rate_oracle = RateOracle()
+        rate_oracle._prices[trading_pair] = Decimal("11")
+        rate_oracle._prices["DAI-USDT"] = Decimal("0.99")
+        RateOracle._shared_instance = rate_oracle
+
+    def tearDown(self) -> None:
+        RateOracle._shared_instance = None
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @staticmethod
+    def trade_fill(order_id: str, trade_type: str, price: str, amount: str, position: str,
+                   trade_fee: AddedToCostTradeFee, index: int) -> TradeFill:
+        return TradeFill(
+            config_file_path="some-strategy.yml",
+            strategy="pure_market_making",
+            market="binance",
+            symbol=trading_pair,
+            base_asset=base,
+            quote_asset=quote,
+            timestamp=1640001112223 + index,
+            order_id=order_id,
+            trade_type=trade_type,
+            order_type="LIMIT",
+            price=Decimal(price),
+            amount=Decimal(amount),
+            trade_fee=trade_fee.to_json(),
+            exchange_trade_id=f"someExchangeId{index}",
+            position=position,
+        )
+
+    def assert_metrics_equal(self, expected: PerformanceMetrics, actual: PerformanceMetrics):
+        for field in PerformanceMetrics.__dataclass_fields__:
+            self.assertEqual(getattr(expected, field), getattr(actual, field), field)
+        self.assertEqual(dict(expected.fees), dict(actual.fees))
+
+    def test_accumulated_metrics_match_performance_metrics(self):
+        fees = [AddedToCostTradeFee(percent=Decimal("0.001")),
+                AddedToCostTradeFee(flat_fees=[TokenAmount("DAI", Decimal("0.25"))]),
+                AddedToCostTradeFee(percent=Decimal("0.002"), flat_fees=[TokenAmount(base, Decimal("0.01"))])]
+        trades = [self.trade_fill(order_id=f"someId{i // 2}",
+                                  trade_type="BUY" if i % 3 else "SELL",
+                                  price=str(Decimal("10") + Decimal(i % 7) / 10),
+                                  amount=str(Decimal(i % 5 + 1) / 4),
+                                  position=PositionAction.NIL.value,
+                                  trade_fee=fees[i % 3],
+                                  index=i)
+                  for i in range(50)]
+        current_balances = {base: Decimal("100"), quote: Decimal("1000")}
+        accumulator = PerformanceAccumulator(trading_pair)
+
+        for count, trade in enumerate(trades, start=1):
+            accumulator.add_trade(trade)
+            if count % 10 == 0:
+                expected = self.async_run_with_timeout(
+                    PerformanceMetrics.create(trading_pair, trades[:count], current_balances))
+                actual = self.async_run_with_timeout(accumulator.metrics(current_balances))
+                self.assert_metrics_equal(expected, actual)
+
+        self.assertEqual(50, accumulator.num_trades)
+        self.assertEqual(3, len(actual.fees))
+
+    def test_accumulated_metrics_match_performance_metrics_for_derivatives(self):
+        # (order id, trade type, price, amount, position), orders being filled in several fills
+        fills = [
+            ("long1", "BUY", "10", "1", "OPEN"),
+            ("long1", "BUY", "10.5", "1", "OPEN"),
+            ("short1", "SELL", "11", "2", "OPEN"),
+            ("long1-close", "SELL", "12", "1.5", "CLOSE"),
+            ("long2", "BUY", "9", "3", "OPEN"),
+            ("long1-close", "SELL", "12.5", "0.5", "CLOSE"),
+            ("short1-close", "BUY", "10", "1", "CLOSE"),
+            ("long2-close", "SELL", "8", "3", "CLOSE"),
+            ("short1-close", "BUY", "9.5", "1", "CLOSE"),
+            ("short2", "SELL", "9", "1", "OPEN"),
+        ]
+        trade_fee = AddedToCostTradeFee(flat_fees=[TokenAmount(quote, Decimal("0.1"))])
+        current_balances = {base: Decimal("0"), quote: Decimal("1000")}
+        accumulator = PerformanceAccumulator(trading_pair)
+
+        for count, fill in enumerate(fills, start=1):
+            accumulator.add_trade(self.trade_fill(*fill, trade_fee=trade_fee, index=count))
+            # PerformanceMetrics updates the trade fills when aggregating the fills of an order
+            trades = [self.trade_fill(*fill, trade_fee=trade_fee, index=index)
+                      for index, fill in enumerate(fills[:count], start=1)]
+            expected = self.async_run_with_timeout(
+                PerformanceMetrics.create(trading_pair, trades, current_balances))
+            actual = self.async_run_with_timeout(accumulator.metrics(current_balances))
+            self.assert_metrics_equal(expected, actual)
+
+        # Long positions: (12.25 - 10.25) * 2 + (8 - 9) * 3, short position: (11 - 9.75) * 2
+        self.assertEqual(Decimal("3.5"), actual.trade_pnl)
@@ -1,8 +1,19 @@
+import json
 import unittest
+from os.path import exists, join
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 from pydantic import SecretStr
 
-from hummingbot.client.settings import ConnectorSetting, ConnectorType
+from hummingbot.client.settings import (
+    AllConnectorSettings,
+    ConnectorConfigKeysSource,
+    ConnectorSetting,
+    ConnectorType,
+    ManifestConnectorSetting,
+)
+from hummingbot.connector.exchange.binance import binance_utils
 from hummingbot.connector.exchange.binance.binance_utils import BinanceConfigMap
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 
@@ -36,3 +47,61 @@ class SettingsTest(unittest.TestCase):
         self.assertEqual(api_key, connector.api_key)
         self.assertNotIsInstance(connector.secret_key, SecretStr)
         self.assertEqual(api_secret, connector.secret_key)
+
+
+class ConnectorSettingsManifestTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.data_dir = TemporaryDirectory()
+        self.addCleanup(self.data_dir.cleanup)
+        self.manifest_path = join(self.data_dir.name, "connector_settings_manifest.json")
+        manifest_path_patcher = patch.object(
+            AllConnectorSettings, "connector_settings_manifest_path", return_value=self.manifest_path
+        )
+        manifest_path_patcher.start()
+        self.addCleanup(manifest_path_patcher.stop)
+        all_connector_settings = AllConnectorSettings.all_connector_settings
+        self.addCleanup(setattr, AllConnectorSettings, "all_connector_settings", all_connector_settings)
+
+    def test_manifest_is_built_once_and_loaded_without_imports(self):
+        built_settings = dict(AllConnectorSettings.create_connector_settings())
+        self.assertTrue(exists(self.manifest_path))
+
+        with patch("hummingbot.client.settings.importlib.import_module") as import_module_mock:
+            loaded_settings = dict(AllConnectorSettings.create_connector_settings())
+            import_module_mock.assert_not_called()
+
+        self.assertEqual(built_settings, loaded_settings)
+        binance_settings = loaded_settings["binance"]
+        self.assertIsInstance(binance_settings, ManifestConnectorSetting)
+        self.assertEqual(ConnectorType.Exchange, binance_settings.type)
+        self.assertEqual(binance_utils.EXAMPLE_PAIR, binance_settings.example_pair)
+        self.assertEqual(binance_utils.DEFAULT_FEES, binance_settings.trade_fee_schema)
+        self.assertIs(binance_utils.KEYS, binance_settings.config_keys)
+        self.assertIs(binance_utils.OTHER_DOMAINS_KEYS["binance_us"], loaded_settings["binance_us"].config_keys)
+        self.assertEqual("binance", loaded_settings["binance_us"].parent_name)
+
+    def test_manifest_is_rebuilt_when_the_utils_modules_changed(self):
+        AllConnectorSettings.create_connector_settings()
+        with open(self.manifest_path) as manifest_file:
+            manifest = json.load(manifest_file)
+        manifest["fingerprint"][0][2] -= 1
+        with open(self.manifest_path, "w") as manifest_file:
+            json.dump(manifest, manifest_file)
+
+        with patch.object(AllConnectorSettings, "_import_connector_settings",
+                          side_effect=AllConnectorSettings._import_connector_settings) as import_mock:
+            AllConnectorSettings.create_connector_settings()
+            AllConnectorSettings.create_connector_settings()
+
+        self.assertEqual(1, import_mock.call_count)
+
+    def test_paper_trade_settings_keep_the_config_keys_source(self):
+        AllConnectorSettings.create_connector_settings()
+        AllConnectorSettings.initialize_paper_trade_settings(["binance"])
+
+        paper_trade_settings = AllConnectorSettings.all_connector_settings["binance_paper_trade"]
+        self.assertEqual("binance", paper_trade_settings.parent_name)
+        self.assertEqual(ConnectorConfigKeysSource("hummingbot.connector.exchange.binance.binance_utils", None),
+                         paper_trade_settings.config_keys_source())
+        self.assertIs(binance_utils.KEYS, paper_trade_settings.config_keys)
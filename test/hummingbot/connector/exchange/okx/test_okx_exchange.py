@@ -4,7 +4,7 @@ from decimal import Decimal
 from typing import Any, Callable, List, Optional, Tuple
 from unittest.mock import patch
 
-from aioresponses import aioresponses
+from aioresponses import CallbackResult, aioresponses
 from aioresponses.core import RequestCall
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
@@ -16,6 +16,7 @@ from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.in_flight_order import InFlightOrder
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
+from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.event.events import OrderType
 
 
@@ -544,12 +545,28 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
         """
         :return: a list of all configured URLs for the cancelations
         """
-        all_urls = []
-        url = self.configure_successful_cancelation_response(order=successful_order, mock_api=mock_api)
-        all_urls.append(url)
-        url = self.configure_erroneous_cancelation_response(order=erroneous_order, mock_api=mock_api)
-        all_urls.append(url)
-        return all_urls
+        # Both orders are canceled in one batch request
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH)
+        response = {
+            "code": "2",
+            "msg": "",
+            "data": [
+                {
+                    "clOrdId": successful_order.client_order_id,
+                    "ordId": successful_order.exchange_order_id,
+                    "sCode": "0",
+                    "sMsg": ""
+                },
+                {
+                    "clOrdId": erroneous_order.client_order_id,
+                    "ordId": erroneous_order.exchange_order_id,
+                    "sCode": "1",
+                    "sMsg": "Error"
+                },
+            ]
+        }
+        mock_api.post(url, body=json.dumps(response))
+        return [url]
 
     def configure_completely_filled_order_status_response(
             self,
@@ -854,6 +871,109 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
 
         self.assertEqual(result, expected_client_order_id)
 
+    @aioresponses()
+    def test_orders_created_in_a_tick_are_placed_in_one_batch(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_PLACE_ORDERS_PATH)
+        mock_api.post(url, callback=self._batch_orders_placement_callback(rejected_client_order_ids=[]))
+
+        buy_id = self.exchange.buy(trading_pair=self.trading_pair, amount=Decimal("100"),
+                                   order_type=OrderType.LIMIT, price=Decimal("10000"))
+        sell_id = self.exchange.sell(trading_pair=self.trading_pair, amount=Decimal("90"),
+                                     order_type=OrderType.LIMIT, price=Decimal("11000"))
+        self.async_run_with_timeout(self.exchange._pending_order_actions_task)
+
+        self.assertEqual(0, len(self._all_executed_requests(mock_api, self.order_creation_url)))
+        batch_request = self._all_executed_requests(mock_api, url)[0]
+        self.validate_auth_credentials_present(batch_request)
+        request_data = json.loads(batch_request.kwargs["data"])
+        self.assertEqual([buy_id, sell_id], [order_data["clOrdId"] for order_data in request_data])
+        self.assertEqual(["buy", "sell"], [order_data["side"] for order_data in request_data])
+        self.assertEqual([Decimal("100"), Decimal("90")], [Decimal(order_data["sz"]) for order_data in request_data])
+        self.assertEqual([Decimal("10000"), Decimal("11000")],
+                         [Decimal(order_data["px"]) for order_data in request_data])
+
+        self.assertEqual(f"{buy_id}_EOID", self.exchange.in_flight_orders[buy_id].exchange_order_id)
+        self.assertEqual(f"{sell_id}_EOID", self.exchange.in_flight_orders[sell_id].exchange_order_id)
+        self.assertEqual(buy_id, self.buy_order_created_logger.event_log[0].order_id)
+        self.assertEqual(sell_id, self.sell_order_created_logger.event_log[0].order_id)
+
+    @aioresponses()
+    def test_batch_orders_placement_fails_the_rejected_orders_only(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_PLACE_ORDERS_PATH)
+
+        order_ids = [self.exchange.buy(trading_pair=self.trading_pair, amount=Decimal("100"),
+                                       order_type=OrderType.LIMIT, price=Decimal(price))
+                     for price in ("10000", "10100")]
+        mock_api.post(url, callback=self._batch_orders_placement_callback(rejected_client_order_ids=order_ids[1:]))
+        self.async_run_with_timeout(self.exchange._pending_order_actions_task)
+
+        self.assertIn(order_ids[0], self.exchange.in_flight_orders)
+        self.assertNotIn(order_ids[1], self.exchange.in_flight_orders)
+        self.assertEqual([order_ids[0]], [event.order_id for event in self.buy_order_created_logger.event_log])
+        self.assertEqual([order_ids[1]], [event.order_id for event in self.order_failure_logger.event_log])
+        self.assertTrue(
+            self.is_logged(
+                "NETWORK",
+                f"Error submitting buy LIMIT order to {self.exchange.name_cap} for 100.000000 {self.trading_pair} "
+                "10100.0000."
+            )
+        )
+
+    @aioresponses()
+    def test_orders_canceled_in_a_tick_are_canceled_in_one_batch(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        orders = []
+        for order_id, trade_type in (("OID1", TradeType.BUY), ("OID2", TradeType.SELL)):
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=f"E{order_id}",
+                trading_pair=self.trading_pair,
+                trade_type=trade_type,
+                price=Decimal("10000"),
+                amount=Decimal("100"),
+                order_type=OrderType.LIMIT,
+            )
+            orders.append(self.exchange.in_flight_orders[order_id])
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH)
+        response = {
+            "code": "0",
+            "msg": "",
+            "data": [self._order_cancelation_request_successful_mock_response(order)["data"][0] for order in orders]
+        }
+        mock_api.post(url, body=json.dumps(response))
+
+        for order in orders:
+            self.exchange.cancel(trading_pair=order.trading_pair, order_id=order.client_order_id)
+        self.async_run_with_timeout(self.exchange._pending_order_actions_task)
+
+        batch_request = self._all_executed_requests(mock_api, url)[0]
+        self.validate_auth_credentials_present(batch_request)
+        request_data = json.loads(batch_request.kwargs["data"])
+        self.assertEqual(["OID1", "OID2"], [order_data["clOrdId"] for order_data in request_data])
+        self.assertTrue(all(order.is_pending_cancel_confirmation for order in orders))
+
+    def _batch_orders_placement_callback(self, rejected_client_order_ids: List[str]) -> Callable:
+        def callback(url, **kwargs) -> CallbackResult:
+            orders_data = [
+                {
+                    "clOrdId": order_data["clOrdId"],
+                    "ordId": f"{order_data['clOrdId']}_EOID",
+                    "tag": "",
+                    "sCode": "51008" if order_data["clOrdId"] in rejected_client_order_ids else "0",
+                    "sMsg": "Order placement failed due to insufficient balance"
+                    if order_data["clOrdId"] in rejected_client_order_ids else "",
+                }
+                for order_data in json.loads(kwargs["data"])
+            ]
+            return CallbackResult(body=json.dumps({"code": "2" if rejected_client_order_ids else "0",
+                                                   "msg": "",
+                                                   "data": orders_data}))
+        return callback
+
     def _order_cancelation_request_successful_mock_response(self, order: InFlightOrder) -> Any:
         return {
             "code": "0",
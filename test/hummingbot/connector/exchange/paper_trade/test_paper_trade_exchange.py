@@ -1,3 +1,4 @@
+from decimal import Decimal
 from unittest import TestCase
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
@@ -5,7 +6,12 @@ from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
 from hummingbot.connector.exchange.kucoin.kucoin_api_order_book_data_source import KucoinAPIOrderBookDataSource
 from hummingbot.connector.exchange.paper_trade import create_paper_trade_market, get_order_book_tracker
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent, OrderBookTradeEvent
 
 
 class PaperTradeExchangeTests(TestCase):
@@ -29,3 +35,73 @@ class PaperTradeExchangeTests(TestCase):
             client_config_map=ClientConfigAdapter(ClientConfigMap()),
             trading_pairs=["COINALPHA-HBOT"])
         self.assertEqual(KucoinAPIOrderBookDataSource, type(paper_exchange.order_book_tracker.data_source))
+
+
+class PaperTradeExchangeLimitOrdersTests(TestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.exchange = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        self.exchange.set_balanced_order_book(self.trading_pair, 100, 50, 150, 1, 1)
+        self.exchange.set_balance("COINALPHA", 100)
+        self.exchange.set_balance("HBOT", 10000)
+        self.clock = Clock(ClockMode.BACKTEST, 1.0, 0, 1e9)
+        self.clock.add_iterator(self.exchange)
+        self.fill_logger = EventLogger()
+        self.cancel_logger = EventLogger()
+        self.exchange.add_listener(MarketEvent.OrderFilled, self.fill_logger)
+        self.exchange.add_listener(MarketEvent.OrderCancelled, self.cancel_logger)
+
+    def test_on_hold_balances_follow_the_limit_orders(self):
+        buy_ids = [self.exchange.buy(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal(price))
+                   for price in ("90", "91")]
+        sell_id = self.exchange.sell(self.trading_pair, Decimal("3"), OrderType.LIMIT, Decimal("110"))
+
+        self.assertEqual({"HBOT": Decimal("362"), "COINALPHA": Decimal("3")}, self.exchange.on_hold_balances)
+        self.assertEqual(Decimal("9638"), self.exchange.get_available_balance("HBOT"))
+        self.assertEqual(Decimal("97"), self.exchange.get_available_balance("COINALPHA"))
+
+        self.exchange.cancel(self.trading_pair, buy_ids[0])
+        self.exchange.cancel(self.trading_pair, sell_id)
+
+        self.assertEqual({"HBOT": Decimal("182")}, self.exchange.on_hold_balances)
+        self.assertEqual(Decimal("100"), self.exchange.get_available_balance("COINALPHA"))
+        self.assertEqual([buy_ids[1]], [order.client_order_id for order in self.exchange.limit_orders])
+
+    def test_cancel_only_cancels_the_order(self):
+        order_ids = [self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("90"))
+                     for _ in range(3)]
+
+        self.exchange.cancel(self.trading_pair, order_ids[1])
+        # Unknown, already cancelled, or other trading pair orders are ignored
+        self.exchange.cancel(self.trading_pair, order_ids[1])
+        self.exchange.cancel("HBOT-COINALPHA", order_ids[0])
+
+        self.assertEqual([order_ids[1]], [event.order_id for event in self.cancel_logger.event_log])
+        self.assertEqual({order_ids[0], order_ids[2]},
+                         {order.client_order_id for order in self.exchange.limit_orders})
+
+    def test_trades_fill_the_crossed_orders_only(self):
+        buy_ids = [self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal(price))
+                   for price in ("97", "98", "99")]
+        sell_id = self.exchange.sell(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("105"))
+
+        self.exchange.order_books[self.trading_pair].apply_trade(
+            OrderBookTradeEvent(self.trading_pair, 1, TradeType.SELL, 97.5, 10))
+
+        self.assertEqual({buy_ids[1], buy_ids[2]}, {event.order_id for event in self.fill_logger.event_log})
+        self.assertEqual({buy_ids[0], sell_id}, {order.client_order_id for order in self.exchange.limit_orders})
+        self.assertEqual({"HBOT": Decimal("97"), "COINALPHA": Decimal("1")}, self.exchange.on_hold_balances)
+        self.assertEqual(Decimal("9803"), self.exchange.get_balance("HBOT"))
+
+    def test_tick_fills_the_orders_crossed_by_the_order_book(self):
+        sell_ids = [self.exchange.sell(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal(price))
+                    for price in ("99", "100", "102")]
+
+        self.clock.backtest_til(1)
+
+        # The best bid is 99.5
+        self.assertEqual([sell_ids[0]], [event.order_id for event in self.fill_logger.event_log])
+        self.assertEqual(set(sell_ids[1:]), {order.client_order_id for order in self.exchange.limit_orders})
+        self.assertEqual({"COINALPHA": Decimal("2")}, self.exchange.on_hold_balances)
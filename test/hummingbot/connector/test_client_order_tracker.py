@@ -21,6 +21,7 @@ from hummingbot.core.event.events import (
     OrderCancelledEvent,
     OrderFilledEvent,
 )
+from hummingbot.core.instrumentation.instrumentation import ORDER_ROUND_TRIP, Instrumentation
 
 
 class MockExchange(ExchangeBase):
@@ -357,6 +358,42 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
         self.assertEqual(event_logged.trading_pair, order.trading_pair)
         self.assertEqual(event_logged.type, order.order_type)
 
+    def test_process_order_update_records_order_round_trip(self):
+        instrumentation = Instrumentation()
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+
+        order_creation_update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.OPEN,
+        )
+        order_fill_update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            update_timestamp=2,
+            new_state=OrderState.PARTIALLY_FILLED,
+        )
+
+        with patch.object(Instrumentation, "_shared_instance", instrumentation):
+            self.async_run_with_timeout(self.tracker.process_order_update(order_creation_update))
+            self.async_run_with_timeout(self.tracker.process_order_update(order_fill_update))
+
+        histogram = instrumentation.histogram(ORDER_ROUND_TRIP, self.connector.name)
+        self.assertEqual(1, histogram.count)
+        self.assertGreaterEqual(histogram.max, 0)
+
     def test_process_order_update_trigger_order_creation_event_without_client_order_id(self):
         order: InFlightOrder = InFlightOrder(
             client_order_id="someClientOrderId",
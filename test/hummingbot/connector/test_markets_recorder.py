@@ -1,5 +1,9 @@
+import asyncio
+import os
+import threading
 import time
 from decimal import Decimal
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 from unittest.mock import patch
 
@@ -17,6 +21,7 @@ from hummingbot.core.event.events import (
     OrderFilledEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
@@ -220,6 +225,41 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(self.config_file_path, trade_fills[0].config_file_path)
         self.assertEqual(fill_event.order_id, trade_fills[0].order_id)
 
+    def test_recorded_trade_fills_are_passed_to_the_trade_fill_listener(self):
+        trade_fills = []
+
+        def trade_fill_listener(trade_fill: TradeFill):
+            # The trade fill record expires once written, the listener reads it when called
+            trade_fills.append((trade_fill.config_file_path, trade_fill.market, trade_fill.symbol,
+                                trade_fill.trade_type, trade_fill.price, trade_fill.amount))
+
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            trade_fill_listener=trade_fill_listener,
+        )
+
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id="OID1-1642010000000000",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.SELL,
+            order_type=OrderType.LIMIT,
+            price=Decimal(1010),
+            amount=Decimal(2),
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TradeId1"
+        )
+
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+
+        self.assertEqual(
+            [(self.config_file_path, self.display_name, self.trading_pair, TradeType.SELL.name, Decimal(1010),
+              Decimal(2))],
+            trade_fills)
+
     def test_create_order_and_completed(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -266,3 +306,183 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(MarketEvent.BuyOrderCreated.name, order_status[0].status)
         self.assertEqual(MarketEvent.BuyOrderCompleted.name, order_status[1].status)
         self.assertEqual(0, len(trade_fills))
+
+
+class MarketsRecorderWriteBehindTests(TestCase):
+    level = 0
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def setUp(self, engine_mock) -> None:
+        super().setUp()
+        self.display_name = "test_market"
+        self.config_file_path = "test_config.yml"
+        self.strategy_name = "test_strategy"
+        self.trading_pair = "COINALPHA-HBOT"
+        self.tracking_states = {"orders": 0}
+        self.ev_loop = asyncio.get_event_loop()
+
+        # The writer thread has its own connection, so the database can't be in memory.
+        self.data_dir = TemporaryDirectory()
+        engine_mock.return_value = create_engine(f"sqlite:///{os.path.join(self.data_dir.name, 'test_DB.sqlite')}")
+        self.manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+        data_path_patch = patch("hummingbot.connector.markets_recorder.data_path", return_value=self.data_dir.name)
+        data_path_patch.start()
+        self.addCleanup(data_path_patch.stop)
+
+        self.recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name
+        )
+        self.recorder.logger().setLevel(1)
+        self.recorder.logger().addHandler(self)
+        self.log_records = []
+
+    def tearDown(self) -> None:
+        self.recorder.stop()
+        self.recorder.logger().removeHandler(self)
+        self.manager.engine.dispose()
+        self.data_dir.cleanup()
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def add_listener(self, event_tag, listener):
+        pass
+
+    def remove_listener(self, event_tag, listener):
+        pass
+
+    def add_trade_fills_from_market_recorder(self, current_trade_fills):
+        pass
+
+    def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
+        pass
+
+    def create_event(self, order_number: int) -> BuyOrderCreatedEvent:
+        return BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id=f"OID{order_number}",
+            creation_timestamp=1640001112.223,
+            exchange_order_id=f"EOID{order_number}",
+        )
+
+    def fill_event(self, order_number: int) -> OrderFilledEvent:
+        return OrderFilledEvent(
+            timestamp=1642020000,
+            order_id=f"OID{order_number}",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal(1010),
+            amount=Decimal(1),
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id=f"TradeId{order_number}"
+        )
+
+    def run_loop_iteration(self):
+        self.ev_loop.run_until_complete(asyncio.sleep(0))
+
+    def test_stop_writes_all_queued_events(self):
+        self.recorder.start()
+        for order_number in range(50):
+            self.recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self.create_event(order_number))
+            self.recorder._did_fill_order(MarketEvent.OrderFilled.value, self, self.fill_event(order_number))
+        self.recorder.stop()
+
+        with self.manager.get_new_session() as session:
+            orders = session.query(Order).all()
+            self.assertEqual(50, len(orders))
+            self.assertTrue(all(len(order.status) == 2 for order in orders))
+            self.assertEqual(50, session.query(TradeFill).count())
+            self.assertEqual(MarketEvent.OrderFilled.name, orders[0].last_status)
+
+        stats = self.recorder.stats
+        self.assertEqual(0, stats.queue_depth)
+        self.assertEqual(100, stats.writes)
+        self.assertEqual(0, stats.failed_writes)
+
+    def test_market_states_are_saved_once_per_loop_iteration(self):
+        self.recorder.start()
+        for order_number in range(10):
+            self.tracking_states = {"orders": order_number}
+            self.recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self.create_event(order_number))
+        self.run_loop_iteration()
+        self.recorder.stop()
+
+        with self.manager.get_new_session() as session:
+            market_states = session.query(MarketState).all()
+            self.assertEqual(1, len(market_states))
+            self.assertEqual({"orders": 9}, market_states[0].saved_state)
+
+        stats = self.recorder.stats
+        self.assertEqual(1, stats.market_states_saved)
+        self.assertEqual(9, stats.market_states_coalesced)
+
+    def test_trades_csv_file_is_kept_open_until_stop(self):
+        self.recorder.start()
+        self.recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self.create_event(1))
+        self.recorder._did_fill_order(MarketEvent.OrderFilled.value, self, self.fill_event(1))
+        self.recorder._did_fill_order(MarketEvent.OrderFilled.value, self, self.fill_event(2))
+        self.recorder.stop()
+
+        csv_path = os.path.join(self.data_dir.name, "trades_test_config.csv")
+        with open(csv_path) as csv_file:
+            lines = csv_file.read().splitlines()
+        self.assertEqual(3, len(lines))
+        self.assertTrue(lines[0].startswith("exchange_trade_id,"))
+        self.assertTrue(lines[1].startswith("TradeId1,"))
+        self.assertTrue(lines[2].startswith("TradeId2,"))
+        self.assertEqual({}, self.recorder._csv_files)
+
+    def test_failed_write_does_not_lose_the_rest_of_the_batch(self):
+        def failing_write(session):
+            raise ValueError("Invalid record")
+
+        self.recorder.start()
+        self.recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self.create_event(1))
+        self.recorder._record(failing_write)
+        self.recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self.create_event(2))
+        self.recorder.stop()
+
+        with self.manager.get_new_session() as session:
+            self.assertEqual(2, session.query(Order).count())
+        self.assertEqual(1, self.recorder.stats.failed_writes)
+        self.assertTrue(any(record.getMessage() == "Error writing a market event to the database."
+                            for record in self.log_records))
+
+    def test_full_queue_does_not_block_handlers(self):
+        database_released = threading.Event()
+        commit = self.recorder._commit
+
+        def slow_commit(writes, market_states):
+            database_released.wait()
+            return commit(writes, market_states)
+
+        self.recorder._write_queue = self.recorder._write_queue.__class__(maxsize=1)
+        self.recorder._commit = slow_commit
+        self.recorder.start()
+
+        start = time.perf_counter()
+        for order_number in range(20):
+            self.recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self.create_event(order_number))
+        elapsed = time.perf_counter() - start
+        overflowed_writes = self.recorder.stats.overflowed_writes
+        database_released.set()
+        self.recorder.stop()
+
+        self.assertLess(elapsed, 0.5)
+        self.assertGreater(overflowed_writes, 0)
+        self.assertTrue(any(record.levelname == "WARNING" and "writes queue is full" in record.getMessage()
+                            for record in self.log_records))
+        with self.manager.get_new_session() as session:
+            self.assertEqual(20, session.query(Order).count())
+        self.assertEqual(1, self.recorder.stats.max_queue_depth)
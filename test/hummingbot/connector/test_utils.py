@@ -1,15 +1,18 @@
 import importlib
 import unittest
+from collections import OrderedDict
+from decimal import Decimal
 from os import DirEntry, scandir
 from os.path import exists, join
 from typing import cast
+from urllib.parse import urlencode
 
 from pydantic import SecretStr
 
 from hummingbot import root_path
 from hummingbot.client.config.config_data_types import BaseConnectorConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
-from hummingbot.connector.utils import get_new_client_order_id
+from hummingbot.connector.utils import get_new_client_order_id, urlencode_params
 
 
 class UtilsTest(unittest.TestCase):
@@ -32,6 +35,22 @@ class UtilsTest(unittest.TestCase):
 
         self.assertEqual(len(id0) - 2, len(id2))
 
+    def test_urlencode_params_matches_urlencode(self):
+        params = OrderedDict([
+            ("symbol", "BTCUSDT"),
+            ("quantity", Decimal("0.001")),
+            ("timestamp", 1640001112223),
+            ("newClientOrderId", "x-ABC/12+3 4"),
+            ("reduceOnly", True),
+            ("orderIdList", [1, 2]),
+            ("note", "déjà vu"),
+            ("empty", ""),
+            ("raw", b"a b"),
+        ])
+
+        self.assertEqual(urlencode(params), urlencode_params(params))
+        self.assertEqual("symbol=BTCUSDT&price=20000.01", urlencode_params({"symbol": "BTCUSDT", "price": "20000.01"}))
+
     def test_connector_config_maps(self):
         connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade", "celo"]
 
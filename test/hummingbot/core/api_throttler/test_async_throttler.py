@@ -10,7 +10,8 @@ from unittest.mock import patch
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.core.api_throttler.async_throttler import AsyncRequestContext, AsyncThrottler
-from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, RequestPriority, TaskLog
+from hummingbot.core.instrumentation.instrumentation import THROTTLER_WAIT, Instrumentation
 from hummingbot.logger.struct_logger import METRICS_LOG_LEVEL
 
 TEST_PATH_URL = "/hummingbot"
@@ -93,37 +94,38 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         lock = asyncio.Lock()
 
         rate_limit = self.rate_limits[0]
-        self.assertEqual(0, len(self.throttler._task_logs))
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+        self.assertEqual(0, len(self.throttler._limit_windows[rate_limit.limit_id]))
+        context = AsyncRequestContext(limit_windows=self.throttler._limit_windows,
                                       rate_limit=rate_limit,
                                       related_limits=[(rate_limit, rate_limit.weight)],
                                       lock=lock,
                                       safety_margin_pct=self.throttler._safety_margin_pct)
         context.flush()
-        self.assertEqual(0, len(self.throttler._task_logs))
+        self.assertEqual(0, len(self.throttler._limit_windows[rate_limit.limit_id]))
 
     def test_flush_only_elapsed_tasks_are_flushed(self):
         lock = asyncio.Lock()
         rate_limit = self.rate_limits[0]
-        self.throttler._task_logs = [
-            TaskLog(timestamp=1.0, rate_limit=rate_limit, weight=rate_limit.weight),
-            TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight)
-        ]
+        window = self.throttler._limit_windows[rate_limit.limit_id]
+        window.append(TaskLog(timestamp=1.0, rate_limit=rate_limit, weight=rate_limit.weight))
+        window.append(TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight))
 
-        self.assertEqual(2, len(self.throttler._task_logs))
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+        self.assertEqual(2, len(window))
+        context = AsyncRequestContext(limit_windows=self.throttler._limit_windows,
                                       rate_limit=rate_limit,
                                       related_limits=[(rate_limit, rate_limit.weight)],
                                       lock=lock,
                                       safety_margin_pct=self.throttler._safety_margin_pct)
         context.flush()
-        self.assertEqual(1, len(self.throttler._task_logs))
+        self.assertEqual(1, len(window))
+        self.assertEqual(1, window.capacity_used)
 
     def test_within_capacity_singular_non_weighted_task_returns_false(self):
         rate_limit, _ = self.throttler.get_related_limits(limit_id=TEST_POOL_ID)
-        self.throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight))
+        self.throttler._limit_windows[rate_limit.limit_id].append(
+            TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight))
 
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+        context = AsyncRequestContext(limit_windows=self.throttler._limit_windows,
                                       rate_limit=rate_limit,
                                       related_limits=[(rate_limit, rate_limit.weight)],
                                       lock=asyncio.Lock(),
@@ -132,7 +134,7 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
 
     def test_within_capacity_singular_non_weighted_task_returns_true(self):
         rate_limit, _ = self.throttler.get_related_limits(limit_id=TEST_POOL_ID)
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+        context = AsyncRequestContext(limit_windows=self.throttler._limit_windows,
                                       rate_limit=rate_limit,
                                       related_limits=[(rate_limit, rate_limit.weight)],
                                       lock=asyncio.Lock(),
@@ -143,9 +145,10 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         rate_limit, related_limits = self.throttler.get_related_limits(limit_id=TEST_PATH_URL)
 
         for linked_limit, weight in related_limits:
-            self.throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
+            self.throttler._limit_windows[linked_limit.limit_id].append(
+                TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
 
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+        context = AsyncRequestContext(limit_windows=self.throttler._limit_windows,
                                       rate_limit=rate_limit,
                                       related_limits=related_limits,
                                       lock=asyncio.Lock(),
@@ -155,7 +158,7 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
     def test_within_capacity_pool_non_weighted_task_returns_true(self):
         rate_limit, related_limits = self.throttler.get_related_limits(limit_id=TEST_PATH_URL)
 
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+        context = AsyncRequestContext(limit_windows=self.throttler._limit_windows,
                                       rate_limit=rate_limit,
                                       related_limits=related_limits,
                                       lock=asyncio.Lock(),
@@ -167,13 +170,15 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
 
         # Simulate Weighted Task 1 and Task 2 already in task logs, resulting in a used capacity of 6/10
         for linked_limit, weight in task_1_related_limits:
-            self.throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
+            self.throttler._limit_windows[linked_limit.limit_id].append(
+                TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
         task_2, task_2_related_limits = self.throttler.get_related_limits(limit_id=TEST_WEIGHTED_TASK_2_ID)
         for linked_limit, weight in task_2_related_limits:
-            self.throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
+            self.throttler._limit_windows[linked_limit.limit_id].append(
+                TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
 
         # Another Task 1(weight=5) will exceed the capacity(11/10)
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+        context = AsyncRequestContext(limit_windows=self.throttler._limit_windows,
                                       rate_limit=task_1,
                                       related_limits=task_1_related_limits,
                                       lock=asyncio.Lock(),
@@ -181,7 +186,7 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         self.assertFalse(context.within_capacity())
 
         # However Task 2(weight=1) will not exceed the capacity(7/10)
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+        context = AsyncRequestContext(limit_windows=self.throttler._limit_windows,
                                       rate_limit=task_2,
                                       related_limits=task_2_related_limits,
                                       lock=asyncio.Lock(),
@@ -191,7 +196,7 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
     def test_within_capacity_returns_true(self):
         lock = asyncio.Lock()
         rate_limit = self.rate_limits[0]
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+        context = AsyncRequestContext(limit_windows=self.throttler._limit_windows,
                                       rate_limit=rate_limit,
                                       related_limits=[(rate_limit, rate_limit.weight)],
                                       lock=lock,
@@ -200,18 +205,19 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
 
     def test_acquire_appends_to_task_logs(self):
         rate_limit = self.rate_limits[0]
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+        context = AsyncRequestContext(limit_windows=self.throttler._limit_windows,
                                       rate_limit=rate_limit,
                                       related_limits=[(rate_limit, rate_limit.weight)],
                                       lock=asyncio.Lock(),
                                       safety_margin_pct=self.throttler._safety_margin_pct)
         self.ev_loop.run_until_complete(context.acquire())
-        self.assertEqual(2, len(self.throttler._task_logs))
+        self.assertEqual(2, len(self.throttler._limit_windows[rate_limit.limit_id]))
 
     def test_acquire_awaits_when_exceed_capacity(self):
         rate_limit = self.rate_limits[0]
-        self.throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight))
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+        self.throttler._limit_windows[rate_limit.limit_id].append(
+            TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight))
+        context = AsyncRequestContext(limit_windows=self.throttler._limit_windows,
                                       rate_limit=rate_limit,
                                       related_limits=[(rate_limit, rate_limit.weight)],
                                       lock=asyncio.Lock(),
@@ -225,3 +231,176 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         throttler = AsyncThrottler(rate_limits=[])
         context = throttler.execute_task(limit_id="test_limit_id")
         self.assertTrue(context.within_capacity())
+
+    def test_seconds_until_capacity_is_computed_from_the_oldest_task_logs(self):
+        rate_limit, related_limits = self.throttler.get_related_limits(limit_id=TEST_WEIGHTED_TASK_1_ID)
+        now = time.time()
+        pool_window = self.throttler._limit_windows[TEST_WEIGHTED_POOL_ID]
+        pool_limit = pool_window.rate_limit
+        for seconds_ago in (4.0, 3.0, 2.0):
+            pool_window.append(TaskLog(timestamp=now - seconds_ago, rate_limit=pool_limit, weight=3))
+
+        context = self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_1_ID)
+        self.assertFalse(context.within_capacity())
+        # 9/10 is used, so the two oldest task logs have to expire before a task of weight 5 fits
+        self.assertAlmostEqual(now - 3.0 + pool_window.period, time.time() + context.seconds_until_capacity(),
+                               delta=0.01)
+
+        context = self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID)
+        self.assertTrue(context.within_capacity())
+        self.assertEqual(0, context.seconds_until_capacity())
+
+    def test_acquire_wakes_up_when_capacity_is_freed(self):
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=2, time_interval=0.2)],
+                                   retry_interval=10.0)
+        start = time.time()
+        self.ev_loop.run_until_complete(asyncio.wait_for(self.execute_requests(2, TEST_POOL_ID, throttler), 2.0))
+        elapsed = time.time() - start
+
+        # The second request waits for the first one to leave the window, without waiting for the retry interval
+        self.assertEqual(2, self._req_counters[TEST_POOL_ID])
+        self.assertGreaterEqual(elapsed, 0.2)
+        self.assertLess(elapsed, 0.5)
+
+    def test_concurrent_tasks_stay_within_limits(self):
+        throttler = AsyncThrottler(rate_limits=self.rate_limits)
+        acquired_at: List[float] = []
+
+        async def request():
+            async with throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID):
+                acquired_at.append(time.time())
+
+        async def run_requests():
+            await asyncio.gather(*[request() for _ in range(12)])
+
+        start = time.time()
+        with patch.object(throttler._limit_windows[TEST_WEIGHTED_POOL_ID], "period", 0.3):
+            self.ev_loop.run_until_complete(asyncio.wait_for(run_requests(), 3.0))
+
+        # Task 2 uses a weight of 1 out of the 10 of the pool, so the last two tasks wait for the first ones to expire
+        self.assertEqual(12, len(acquired_at))
+        self.assertLess(acquired_at[9] - start, 0.1)
+        self.assertGreaterEqual(acquired_at[10] - start, 0.3)
+        self.assertLess(acquired_at[11] - start, 0.6)
+
+    def test_waiting_tasks_get_capacity_by_priority(self):
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=0.1)])
+        acquired: List[RequestPriority] = []
+
+        async def request(priority: RequestPriority):
+            async with throttler.execute_task(limit_id=TEST_POOL_ID, priority=priority):
+                acquired.append(priority)
+
+        async def run_requests():
+            # Takes the only capacity of the pool, so that the other tasks wait in the order they were created
+            await request(RequestPriority.STATUS)
+            await asyncio.gather(request(RequestPriority.METADATA),
+                                 request(RequestPriority.STATUS),
+                                 request(RequestPriority.CREATE),
+                                 request(RequestPriority.CANCEL))
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(run_requests(), 3.0))
+
+        self.assertEqual([RequestPriority.STATUS,
+                          RequestPriority.CANCEL,
+                          RequestPriority.CREATE,
+                          RequestPriority.STATUS,
+                          RequestPriority.METADATA], acquired)
+        metrics = throttler.lane_wait_metrics
+        self.assertEqual(2, metrics[RequestPriority.STATUS].requests)
+        self.assertEqual(1, metrics[RequestPriority.STATUS].delayed_requests)
+        self.assertLess(metrics[RequestPriority.CANCEL].max_wait, metrics[RequestPriority.METADATA].max_wait)
+        self.assertGreater(metrics[RequestPriority.METADATA].mean_wait, 0.3)
+
+    def test_lane_waits_are_recorded_in_the_throttler_wait_histograms(self):
+        instrumentation = Instrumentation()
+        with patch.object(Instrumentation, "_shared_instance", instrumentation):
+            throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=0.1)])
+
+        async def request(priority: RequestPriority):
+            async with throttler.execute_task(limit_id=TEST_POOL_ID, priority=priority):
+                pass
+
+        async def run_requests():
+            await request(RequestPriority.STATUS)
+            await request(RequestPriority.CANCEL)
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(run_requests(), 1.0))
+
+        status_histogram = instrumentation.histogram(THROTTLER_WAIT, RequestPriority.STATUS.name)
+        cancel_histogram = instrumentation.histogram(THROTTLER_WAIT, RequestPriority.CANCEL.name)
+        self.assertEqual(1, status_histogram.count)
+        self.assertEqual(0, status_histogram.max)
+        self.assertEqual(1, cancel_histogram.count)
+        self.assertGreater(cancel_histogram.max, 0.05)
+
+    def test_less_urgent_tasks_on_other_limits_are_not_preempted(self):
+        throttler = AsyncThrottler(rate_limits=self.rate_limits)
+        self.ev_loop.run_until_complete(self.execute_requests(1, TEST_POOL_ID, throttler))
+
+        async def cancel_request():
+            async with throttler.execute_task(limit_id=TEST_POOL_ID, priority=RequestPriority.CANCEL):
+                pass
+
+        async def run_requests():
+            cancel = asyncio.ensure_future(cancel_request())
+            await asyncio.sleep(0)
+            self.assertIn(RequestPriority.CANCEL, throttler._limit_windows[TEST_POOL_ID].waiters)
+            # The weighted pool is not related to the waiting cancel
+            async with throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID, priority=RequestPriority.METADATA):
+                self.assertFalse(cancel.done())
+            cancel.cancel()
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(run_requests(), 1.0))
+        self.assertEqual(0, throttler.lane_wait_metrics[RequestPriority.METADATA].delayed_requests)
+        self.assertEqual({}, throttler._limit_windows[TEST_POOL_ID].waiters)
+
+    def test_weights_exceeding_their_limit_are_capped(self):
+        throttler = AsyncThrottler(rate_limits=[
+            RateLimit(limit_id=TEST_POOL_ID, limit=3, time_interval=0.1),
+            RateLimit(limit_id=TEST_PATH_URL, limit=2, time_interval=0.1, weight=4,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID, 5)]),
+        ])
+
+        rate_limit, related_limits = throttler.get_related_limits(TEST_PATH_URL)
+
+        self.assertEqual(2, rate_limit.weight)
+        self.assertEqual([(throttler._id_to_limit_map[TEST_POOL_ID], 3), (rate_limit, 2)], related_limits)
+
+    def test_oversized_urgent_task_does_not_block_less_urgent_tasks(self):
+        throttler = AsyncThrottler(rate_limits=[
+            RateLimit(limit_id=TEST_POOL_ID, limit=3, time_interval=0.1),
+            RateLimit(limit_id=TEST_PATH_URL, limit=1000, time_interval=0.1,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID, 5)]),
+        ])
+        acquired: List[RequestPriority] = []
+
+        async def request(limit_id: str, priority: RequestPriority):
+            async with throttler.execute_task(limit_id=limit_id, priority=priority):
+                acquired.append(priority)
+
+        async def run_requests():
+            await request(TEST_POOL_ID, RequestPriority.STATUS)
+            await asyncio.gather(request(TEST_PATH_URL, RequestPriority.CANCEL),
+                                 request(TEST_POOL_ID, RequestPriority.STATUS))
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(run_requests(), 1.0))
+
+        self.assertEqual([RequestPriority.STATUS, RequestPriority.CANCEL, RequestPriority.STATUS], acquired)
+
+    def test_preempted_task_checks_capacity_again_after_the_retry_interval(self):
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=0.1)],
+                                   retry_interval=0.05)
+        window = throttler._limit_windows[TEST_POOL_ID]
+        # A more urgent request that stops waiting without waking up the less urgent ones
+        window.waiters[RequestPriority.CANCEL] = {object()}
+
+        async def run_requests():
+            status = asyncio.ensure_future(self.execute_requests(1, TEST_POOL_ID, throttler))
+            await asyncio.sleep(0.01)
+            self.assertFalse(status.done())
+            del window.waiters[RequestPriority.CANCEL]
+            await status
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(run_requests(), 1.0))
+        self.assertEqual(1, self._req_counters[TEST_POOL_ID])
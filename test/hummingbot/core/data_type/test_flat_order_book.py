@@ -0,0 +1,149 @@
+import math
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.flat_order_book import FlatOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+class FlatOrderBookParityTest(unittest.TestCase):
+    """
+    FlatOrderBook must behave exactly like the std::set backed OrderBook for the same stream of updates.
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.rng = np.random.default_rng(7)
+
+    def random_snapshot(self, levels: int = 100):
+        bid_prices = np.round(100 - np.arange(1, levels + 1) * 0.01, 2)
+        ask_prices = np.round(100 + np.arange(0, levels) * 0.01, 2)
+        bids = [OrderBookRow(p, a, 1) for p, a in zip(bid_prices, self.rng.uniform(0.1, 5, levels))]
+        asks = [OrderBookRow(p, a, 1) for p, a in zip(ask_prices, self.rng.uniform(0.1, 5, levels))]
+        # Snapshots are not always sorted, and may repeat a price level.
+        self.rng.shuffle(bids)
+        bids.append(OrderBookRow(bids[0].price, 42.0, 1))
+        return bids, asks
+
+    def random_diff(self, update_id: int):
+        bids = []
+        asks = []
+        for _ in range(self.rng.integers(1, 10)):
+            price = round(float(100 + self.rng.normal(0, 0.3)), 2)
+            amount = 0.0 if self.rng.random() < 0.3 else float(self.rng.uniform(0.1, 5))
+            row = OrderBookRow(price, amount, update_id)
+            (bids if price < 100 + self.rng.normal(0, 0.05) else asks).append(row)
+        return bids, asks
+
+    def assert_books_equal(self, expected: OrderBook, actual: FlatOrderBook):
+        self.assertEqual(list(expected.bid_entries()), list(actual.bid_entries()))
+        self.assertEqual(list(expected.ask_entries()), list(actual.ask_entries()))
+        self.assertEqual(expected.snapshot_uid, actual.snapshot_uid)
+        self.assertEqual(expected.last_diff_uid, actual.last_diff_uid)
+        for is_buy in (True, False):
+            try:
+                expected_price = expected.get_price(is_buy)
+            except EnvironmentError:
+                self.assertRaises(EnvironmentError, actual.get_price, is_buy)
+                continue
+            actual_price = actual.get_price(is_buy)
+            self.assertTrue(expected_price == actual_price or (math.isnan(expected_price) and math.isnan(actual_price)))
+
+    def assert_query_results_equal(self, expected, actual):
+        for attribute in ("query_price", "query_volume", "result_price", "result_volume"):
+            expected_value = getattr(expected, attribute)
+            actual_value = getattr(actual, attribute)
+            if math.isnan(expected_value):
+                self.assertTrue(math.isnan(actual_value))
+            else:
+                self.assertEqual(expected_value, actual_value)
+
+    def replay_random_stream(self, dex: bool):
+        set_book = OrderBook(dex=dex)
+        flat_book = FlatOrderBook(dex=dex)
+        bids, asks = self.random_snapshot()
+        set_book.apply_snapshot(bids, asks, 1)
+        flat_book.apply_snapshot(bids, asks, 1)
+        self.assert_books_equal(set_book, flat_book)
+
+        for update_id in range(2, 500):
+            diff_bids, diff_asks = self.random_diff(update_id)
+            set_book.apply_diffs(diff_bids, diff_asks, update_id)
+            flat_book.apply_diffs(diff_bids, diff_asks, update_id)
+            self.assert_books_equal(set_book, flat_book)
+        return set_book, flat_book
+
+    def test_random_diff_stream_cex(self):
+        self.replay_random_stream(dex=False)
+
+    def test_random_diff_stream_dex(self):
+        self.replay_random_stream(dex=True)
+
+    def test_numpy_snapshot_and_diffs(self):
+        set_book = OrderBook()
+        flat_book = FlatOrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 1, 2], [3, 1, 3]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 2], [6, 1, 3], [7, 1, 4]], dtype=np.float64)
+        set_book.apply_numpy_snapshot(bids_array, asks_array)
+        flat_book.apply_numpy_snapshot(bids_array, asks_array)
+        self.assert_books_equal(set_book, flat_book)
+
+        new_bids = np.array([[50, 0.01, 6]], dtype=np.float64)
+        new_asks = np.array([[2, 0.1, 5]], dtype=np.float64)
+        set_book.apply_numpy_diffs(new_bids, new_asks)
+        flat_book.apply_numpy_diffs(new_bids, new_asks)
+        self.assert_books_equal(set_book, flat_book)
+
+        bids_df, asks_df = flat_book.snapshot
+        self.assertEqual([50., 0.01, 6.], bids_df.iloc[0].tolist())
+        self.assertEqual(0, len(asks_df))
+
+    def test_empty_book(self):
+        flat_book = FlatOrderBook()
+        self.assertRaises(EnvironmentError, flat_book.get_price, True)
+        self.assertRaises(EnvironmentError, flat_book.get_price, False)
+        self.assertEqual([], list(flat_book.bid_entries()))
+        self.assertTrue(math.isnan(flat_book.get_price_for_volume(True, 1).result_price))
+
+    def test_depth_queries(self):
+        set_book, flat_book = self.replay_random_stream(dex=False)
+        volumes = [0.01, 0.5, 3, 17.25, 120, 100000]
+        prices = [99, 99.5, 99.9, 100, 100.1, 100.5, 101, 200]
+        for is_buy in (True, False):
+            for volume in volumes:
+                self.assert_query_results_equal(set_book.get_price_for_volume(is_buy, volume),
+                                                flat_book.get_price_for_volume(is_buy, volume))
+                self.assert_query_results_equal(set_book.get_vwap_for_volume(is_buy, volume),
+                                                flat_book.get_vwap_for_volume(is_buy, volume))
+                self.assert_query_results_equal(set_book.get_price_for_quote_volume(is_buy, volume * 100),
+                                                flat_book.get_price_for_quote_volume(is_buy, volume * 100))
+                self.assert_query_results_equal(set_book.get_quote_volume_for_base_amount(is_buy, volume),
+                                                flat_book.get_quote_volume_for_base_amount(is_buy, volume))
+            for price in prices:
+                self.assert_query_results_equal(set_book.get_volume_for_price(is_buy, price),
+                                                flat_book.get_volume_for_price(is_buy, price))
+                self.assert_query_results_equal(set_book.get_quote_volume_for_price(is_buy, price),
+                                                flat_book.get_quote_volume_for_price(is_buy, price))
+            for expected, actual in zip(set_book.get_price_for_volumes(is_buy, volumes),
+                                        flat_book.get_price_for_volumes(is_buy, volumes)):
+                self.assert_query_results_equal(expected, actual)
+            for expected, actual in zip(set_book.get_vwap_for_volumes(is_buy, volumes),
+                                        flat_book.get_vwap_for_volumes(is_buy, volumes)):
+                self.assert_query_results_equal(expected, actual)
+            for expected, actual in zip(set_book.get_volume_for_prices(is_buy, prices),
+                                        flat_book.get_volume_for_prices(is_buy, prices)):
+                self.assert_query_results_equal(expected, actual)
+
+    def test_simulate_buy_and_sell(self):
+        set_book, flat_book = self.replay_random_stream(dex=False)
+        self.assertEqual(set_book.simulate_buy(10), flat_book.simulate_buy(10))
+        self.assertEqual(set_book.simulate_sell(10), flat_book.simulate_sell(10))
+
+    def test_entries_arrays(self):
+        set_book, flat_book = self.replay_random_stream(dex=False)
+        np.testing.assert_array_equal(set_book.bids_array(), flat_book.bids_array())
+        np.testing.assert_array_equal(set_book.asks_array(depth=5), flat_book.asks_array(depth=5))
+        buffer = np.empty((10, 3), dtype=np.float64)
+        np.testing.assert_array_equal(set_book.bids_array(depth=10), flat_book.bids_array(depth=10, out=buffer))
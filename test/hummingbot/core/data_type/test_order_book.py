@@ -1,8 +1,11 @@
 #!/usr/bin/env python
 
 import logging
+import math
 import unittest
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 import numpy as np
 
 
@@ -50,6 +53,170 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    @staticmethod
+    def _random_books(levels: int = 200):
+        rng = np.random.default_rng(42)
+        bid_prices = 100 - np.cumsum(rng.uniform(0.01, 0.1, levels))
+        ask_prices = 100 + np.cumsum(rng.uniform(0.01, 0.1, levels))
+        bids_array = np.column_stack([bid_prices, rng.uniform(0.1, 5, levels), np.ones(levels)])
+        asks_array = np.column_stack([ask_prices, rng.uniform(0.1, 5, levels), np.ones(levels)])
+        native_book = OrderBook()
+        native_book.apply_numpy_snapshot(bids_array, asks_array)
+        # CompositeOrderBook with no recorded fills walks the bid_entries()/ask_entries() rows.
+        rows_book = CompositeOrderBook()
+        rows_book.apply_numpy_snapshot(bids_array, asks_array)
+        return native_book, rows_book
+
+    def assert_query_results_equal(self, expected, actual):
+        for attribute in ("query_price", "query_volume", "result_price", "result_volume"):
+            expected_value = getattr(expected, attribute)
+            actual_value = getattr(actual, attribute)
+            if math.isnan(expected_value):
+                self.assertTrue(math.isnan(actual_value))
+            else:
+                self.assertEqual(expected_value, actual_value)
+
+    def test_native_depth_queries_match_entry_walk(self):
+        native_book, rows_book = self._random_books()
+        volumes = [0.01, 0.5, 3, 17.25, 120, 100000]
+        prices = [99, 99.5, 100, 100.5, 101, 200]
+        for is_buy in (True, False):
+            for volume in volumes:
+                self.assert_query_results_equal(rows_book.get_price_for_volume(is_buy, volume),
+                                                native_book.get_price_for_volume(is_buy, volume))
+                self.assert_query_results_equal(rows_book.get_vwap_for_volume(is_buy, volume),
+                                                native_book.get_vwap_for_volume(is_buy, volume))
+                self.assert_query_results_equal(rows_book.get_price_for_quote_volume(is_buy, volume * 100),
+                                                native_book.get_price_for_quote_volume(is_buy, volume * 100))
+                self.assert_query_results_equal(rows_book.get_quote_volume_for_base_amount(is_buy, volume),
+                                                native_book.get_quote_volume_for_base_amount(is_buy, volume))
+            for price in prices:
+                self.assert_query_results_equal(rows_book.get_volume_for_price(is_buy, price),
+                                                native_book.get_volume_for_price(is_buy, price))
+                self.assert_query_results_equal(rows_book.get_quote_volume_for_price(is_buy, price),
+                                                native_book.get_quote_volume_for_price(is_buy, price))
+
+    def test_batched_depth_queries_match_single_queries(self):
+        native_book, _ = self._random_books()
+        volumes = [120, 0.01, 17.25, 100000, 0.5, 3, 17.25]
+        prices = [101, 99, 200, 100, 99.5, 100.5, 0]
+        for is_buy in (True, False):
+            for volume, result in zip(volumes, native_book.get_price_for_volumes(is_buy, volumes)):
+                self.assert_query_results_equal(native_book.get_price_for_volume(is_buy, volume), result)
+            for volume, result in zip(volumes, native_book.get_vwap_for_volumes(is_buy, volumes)):
+                self.assert_query_results_equal(native_book.get_vwap_for_volume(is_buy, volume), result)
+            for price, result in zip(prices, native_book.get_volume_for_prices(is_buy, prices)):
+                self.assert_query_results_equal(native_book.get_volume_for_price(is_buy, price), result)
+
+    def test_batched_depth_queries_on_empty_book(self):
+        order_book = OrderBook()
+        results = order_book.get_price_for_volumes(True, [1, 2])
+        self.assertEqual(2, len(results))
+        self.assertTrue(math.isnan(results[0].result_price))
+        self.assertEqual(0, results[1].result_volume)
+        self.assertEqual([], order_book.get_volume_for_prices(False, []))
+
+    def test_entries_arrays(self):
+        native_book, rows_book = self._random_books()
+        bids, asks = native_book.snapshot
+        for order_book in (native_book, rows_book):
+            np.testing.assert_array_equal(bids.values, order_book.bids_array())
+            np.testing.assert_array_equal(asks.values, order_book.asks_array())
+            np.testing.assert_array_equal(bids.values[:10], order_book.bids_array(depth=10))
+            np.testing.assert_array_equal(asks.values[:10], order_book.asks_array(depth=10))
+
+        self.assertEqual(np.float64, native_book.bids_array().dtype)
+        self.assertEqual((0, 3), OrderBook().asks_array(depth=5).shape)
+        self.assertEqual((200, 3), native_book.asks_array(depth=1000).shape)
+
+    def test_entries_arrays_into_preallocated_buffer(self):
+        native_book, _ = self._random_books()
+        buffer = np.zeros((20, 3), dtype=np.float64)
+        result = native_book.bids_array(depth=5, out=buffer)
+        self.assertEqual((5, 3), result.shape)
+        self.assertTrue(np.shares_memory(buffer, result))
+        np.testing.assert_array_equal(native_book.bids_array()[:5], buffer[:5])
+
+        with self.assertRaises(ValueError):
+            native_book.asks_array(depth=50, out=buffer)
+        with self.assertRaises(ValueError):
+            native_book.asks_array(depth=5, out=np.zeros((20, 2), dtype=np.float64))
+
+    def test_apply_messages_match_apply_rows(self):
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 10,
+            "bids": [["99.5", "1"], ["99", "2.5"]],
+            "asks": [["100", "3"], ["100.5", "0.5"]],
+        }, timestamp=1)
+        diffs = [
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "COINALPHA-HBOT",
+                "first_update_id": 11,
+                "update_id": 12,
+                "bids": [["99.5", "0"], ["99.75", "4"]],
+                "asks": [["100", "1.5"]],
+            }, timestamp=2),
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "COINALPHA-HBOT",
+                "first_update_id": 13,
+                "update_id": 13,
+                "bids": [],
+                "asks": [],
+            }, timestamp=3),
+        ]
+        rows_book = OrderBook()
+        messages_book = OrderBook()
+        rows_book.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        messages_book.apply_snapshot_message(snapshot)
+        for diff in diffs:
+            rows_book.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            messages_book.apply_diff_message(diff)
+
+            self.assertEqual(list(rows_book.bid_entries()), list(messages_book.bid_entries()))
+            self.assertEqual(list(rows_book.ask_entries()), list(messages_book.ask_entries()))
+            self.assertEqual(rows_book.snapshot_uid, messages_book.snapshot_uid)
+            self.assertEqual(rows_book.last_diff_uid, messages_book.last_diff_uid)
+        self.assertEqual(13, messages_book.last_diff_uid)
+
+        restored_book = OrderBook()
+        restored_book.restore_from_snapshot_and_diffs(snapshot, diffs)
+        self.assertEqual(list(rows_book.bid_entries()), list(restored_book.bid_entries()))
+        self.assertEqual(list(rows_book.ask_entries()), list(restored_book.ask_entries()))
+
+    def test_apply_messages_keep_update_ids_beyond_float_precision(self):
+        # e.g. nanosecond timestamps used as update ids
+        snapshot_id = 1_660_000_000_123_456_789
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": snapshot_id,
+            "bids": [["99.5", "1"]],
+            "asks": [["100", "3"]],
+        }, timestamp=1)
+        diff = OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": snapshot_id + 1,
+            "bids": [["99.75", "4"]],
+            "asks": [],
+        }, timestamp=2)
+        book = OrderBook()
+
+        book.apply_snapshot_message(snapshot)
+        book.apply_diff_message(diff)
+
+        self.assertEqual(snapshot_id, book.snapshot_uid)
+        self.assertEqual(snapshot_id + 1, book.last_diff_uid)
+        self.assertEqual([snapshot_id + 1, snapshot_id], [row.update_id for row in book.bid_entries()])
+        self.assertEqual([snapshot_id], [row.update_id for row in book.ask_entries()])
+
+    def test_get_snapshot_with_depth(self):
+        native_book, _ = self._random_books()
+        bids, asks = native_book.snapshot
+        depth_bids, depth_asks = native_book.get_snapshot(depth=3)
+        self.assertEqual(["price", "amount", "update_id"], list(depth_bids.columns))
+        self.assertTrue(bids.head(3).equals(depth_bids))
+        self.assertTrue(asks.head(3).equals(depth_asks))
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -1,5 +1,8 @@
 import time
 import unittest
+from typing import List
+
+import numpy as np
 
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, \
     OrderBookMessageType
@@ -119,6 +122,57 @@ class OrderBookMessageTest(unittest.TestCase):
         self.assertEqual(6, bids[0].amount)
         self.assertEqual(update_id, bids[0].update_id)
 
+    def test_bids_and_asks_arrays(self):
+        msg = OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={
+                "update_id": 10,
+                "asks": [["1.5", "2.25"], ["3", "0"]],
+                "bids": [],
+            },
+            timestamp=time.time(),
+        )
+
+        np.testing.assert_array_equal(np.array([[1.5, 2.25], [3, 0]]), msg.asks_array)
+        self.assertEqual(np.float64, msg.asks_array.dtype)
+        self.assertIs(msg.asks_array, msg.asks_array)
+        self.assertEqual((0, 2), msg.bids_array.shape)
+        self.assertEqual([[row.price, row.amount] for row in msg.asks], msg.asks_array.tolist())
+
+    def test_bids_and_asks_arrays_with_extra_entry_fields(self):
+        msg = OrderBookMessage(
+            message_type=OrderBookMessageType.SNAPSHOT,
+            content={
+                "update_id": 3,
+                "asks": [["1.5", "2", "order-1"], ["2", "4", []]],
+                "bids": [[1, 2, 5]],
+            },
+            timestamp=time.time(),
+        )
+
+        np.testing.assert_array_equal(np.array([[1.5, 2], [2, 4]]), msg.asks_array)
+        np.testing.assert_array_equal(np.array([[1, 2]]), msg.bids_array)
+
+    def test_bids_and_asks_arrays_follow_overridden_rows(self):
+        class CustomOrderBookMessage(OrderBookMessage):
+            @property
+            def bids(self) -> List[OrderBookRow]:
+                return [OrderBookRow(float(entry["price"]), float(entry["size"]), self.update_id)
+                        for entry in self.content["bids"]]
+
+        msg = CustomOrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={
+                "update_id": 7,
+                "asks": [["4", "1"]],
+                "bids": [{"price": "3.5", "size": "1.25"}],
+            },
+            timestamp=time.time(),
+        )
+
+        np.testing.assert_array_equal(np.array([[3.5, 1.25]]), msg.bids_array)
+        np.testing.assert_array_equal(np.array([[4, 1]]), msg.asks_array)
+
     def test_has_update_id(self):
         update_id = "someId"
 
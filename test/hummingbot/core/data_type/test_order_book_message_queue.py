@@ -0,0 +1,113 @@
+import asyncio
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_message_queue import OrderBookMessageQueue
+
+
+class CustomOrderBookMessage(OrderBookMessage):
+    pass
+
+
+class OrderBookMessageQueueTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.rng = np.random.default_rng(3)
+        self.snapshot_requests = 0
+
+    def request_snapshot(self):
+        self.snapshot_requests += 1
+
+    def random_diff(self, update_id: int, message_class=OrderBookMessage) -> OrderBookMessage:
+        def levels(center: float, side: int):
+            # Bids and asks never cross, as on a live exchange feed
+            return [[str(round(center + side * abs(self.rng.normal(0, 0.3)), 2)),
+                     "0" if self.rng.random() < 0.3 else str(round(self.rng.uniform(0.1, 5), 3))]
+                    for _ in range(self.rng.integers(1, 6))]
+        return message_class(OrderBookMessageType.DIFF, {
+            "trading_pair": "BTC-USDT", "update_id": update_id, "bids": levels(99.9, -1), "asks": levels(100.1, 1)},
+            timestamp=float(update_id))
+
+    def snapshot(self, update_id: int) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "BTC-USDT", "update_id": update_id,
+            "bids": [[str(99 - i * 0.1), "1"] for i in range(10)],
+            "asks": [[str(101 + i * 0.1), "1"] for i in range(10)]},
+            timestamp=float(update_id))
+
+    def drain(self, queue: OrderBookMessageQueue):
+        messages = []
+        while not queue.empty():
+            messages.append(self.ev_loop.run_until_complete(queue.get()))
+        return messages
+
+    @staticmethod
+    def apply(order_book: OrderBook, messages):
+        for message in messages:
+            if message.type is OrderBookMessageType.DIFF:
+                order_book.apply_diffs(message.bids, message.asks, message.update_id)
+            else:
+                order_book.apply_snapshot(message.bids, message.asks, message.update_id)
+
+    def assert_same_book(self, expected_messages, actual_messages):
+        expected, actual = OrderBook(), OrderBook()
+        self.apply(expected, [self.snapshot(1)] + expected_messages)
+        self.apply(actual, [self.snapshot(1)] + actual_messages)
+        # The rows of a net diff take the update id of its last diff
+        self.assertEqual([(row.price, row.amount) for row in expected.bid_entries()],
+                         [(row.price, row.amount) for row in actual.bid_entries()])
+        self.assertEqual([(row.price, row.amount) for row in expected.ask_entries()],
+                         [(row.price, row.amount) for row in actual.ask_entries()])
+        self.assertEqual(expected.last_diff_uid, actual.last_diff_uid)
+
+    def test_put_below_capacity_keeps_every_message(self):
+        queue = OrderBookMessageQueue(maxsize=10, request_snapshot=self.request_snapshot)
+        messages = [self.random_diff(update_id) for update_id in range(2, 7)]
+        for message in messages:
+            queue.put_nowait(message)
+
+        stats = queue.stats
+        self.assertEqual(5, stats.queue_depth)
+        self.assertGreater(stats.lag, 0)
+        self.assertEqual(0, stats.collapsed_diffs)
+        self.assertEqual(messages, self.drain(queue))
+        self.assertEqual(0, queue.lag)
+
+    def test_full_queue_collapses_diffs_into_net_diff(self):
+        queue = OrderBookMessageQueue(maxsize=10, request_snapshot=self.request_snapshot)
+        messages = [self.random_diff(update_id) for update_id in range(2, 14)]
+        for message in messages:
+            self.ev_loop.run_until_complete(queue.put(message))
+
+        # The 11th message collapsed the first 10, then 2 more were queued
+        self.assertEqual(3, queue.qsize())
+        self.assertEqual(9, queue.stats.collapsed_diffs)
+        collapsed = self.drain(queue)
+        self.assertEqual(2, collapsed[0].first_update_id)
+        self.assertEqual(11, collapsed[0].update_id)
+        self.assertEqual(0, self.snapshot_requests)
+        self.assert_same_book(messages, collapsed)
+
+    def test_collapse_keeps_latest_snapshot_between_net_diffs(self):
+        messages = [self.random_diff(2), self.snapshot(3), self.random_diff(4), self.random_diff(5),
+                    self.snapshot(6), self.random_diff(7), self.random_diff(8)]
+        collapsed = OrderBookMessageQueue.collapse_messages([(message, 0.0) for message in messages])
+
+        self.assertEqual([OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT, OrderBookMessageType.DIFF],
+                         [message.type for message, _ in collapsed])
+        self.assertEqual(6, collapsed[1][0].update_id)
+        self.assert_same_book(messages, [message for message, _ in collapsed])
+
+    def test_full_queue_of_custom_messages_requests_snapshot(self):
+        queue = OrderBookMessageQueue(maxsize=5, request_snapshot=self.request_snapshot)
+        for update_id in range(2, 9):
+            queue.put_nowait(self.random_diff(update_id, CustomOrderBookMessage))
+
+        self.assertEqual(1, self.snapshot_requests)
+        self.assertEqual(1, queue.stats.resnapshots)
+        self.assertEqual([7, 8], [message.update_id for message in self.drain(queue)])
@@ -0,0 +1,374 @@
+import asyncio
+import time
+import unittest
+from typing import Dict, List, Optional
+from unittest.mock import patch
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_message_queue import OrderBookMessageQueue
+from hummingbot.core.data_type.order_book_tracker import OrderBookDiffRouter, OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent
+from hummingbot.core.instrumentation.instrumentation import ORDER_BOOK_UPDATE_LATENCY, Instrumentation
+
+
+class MockOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {}
+
+    async def _order_book_snapshot(self, trading_pair: str):
+        raise NotImplementedError
+
+    async def _connected_websocket_assistant(self):
+        raise NotImplementedError
+
+    async def _subscribe_channels(self, ws):
+        raise NotImplementedError
+
+    async def _parse_trade_message(self, raw_message, message_queue: asyncio.Queue):
+        raise NotImplementedError
+
+    async def _parse_order_book_diff_message(self, raw_message, message_queue: asyncio.Queue):
+        raise NotImplementedError
+
+    async def _parse_order_book_snapshot_message(self, raw_message, message_queue: asyncio.Queue):
+        raise NotImplementedError
+
+
+class SnapshotCountingOrderBook(OrderBook):
+    def __init__(self):
+        super().__init__()
+        self.snapshots_taken = 0
+
+    def get_snapshot(self, depth: Optional[int] = None):
+        self.snapshots_taken += 1
+        return super().get_snapshot(depth)
+
+
+class DelayedSnapshotsDataSource(MockOrderBookTrackerDataSource):
+    """
+    Returns the order book of each trading pair once its snapshot is released by the test.
+    """
+    THROTTLED_SNAPSHOTS = True
+
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(trading_pairs=trading_pairs)
+        self.requested_trading_pairs: List[str] = []
+        self.snapshots_released: Dict[str, asyncio.Event] = {trading_pair: asyncio.Event()
+                                                             for trading_pair in trading_pairs}
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        self.requested_trading_pairs.append(trading_pair)
+        await self.snapshots_released[trading_pair].wait()
+        return OrderBook()
+
+
+class SequencedDiffsDataSource(MockOrderBookTrackerDataSource):
+    """
+    Returns the given snapshots, one per order book request, and never answers once they run out.
+    """
+    SEQUENCED_DIFFS = True
+
+    def __init__(self, trading_pairs: List[str], snapshots: List[OrderBook]):
+        super().__init__(trading_pairs=trading_pairs)
+        self.snapshots: List[OrderBook] = snapshots
+        self.snapshots_requested: int = 0
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        self.snapshots_requested += 1
+        if len(self.snapshots) == 0:
+            await asyncio.Event().wait()
+        return self.snapshots.pop(0)
+
+
+class OrderBookTrackerTest(unittest.TestCase):
+    level = 0
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.trading_pairs = ["COINALPHA-HBOT", "BTC-USDT"]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.log_records = []
+        OrderBookTracker.logger().setLevel(1)
+        OrderBookTracker.logger().addHandler(self)
+        self.data_source = MockOrderBookTrackerDataSource(trading_pairs=self.trading_pairs)
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs)
+        for index, trading_pair in enumerate(self.trading_pairs):
+            order_book = SnapshotCountingOrderBook()
+            bids = np.array([[100 - index - level, 1, 1] for level in range(1, 51)], dtype=np.float64)
+            asks = np.array([[100 + index + level, 1, 1] for level in range(50)], dtype=np.float64)
+            order_book.apply_numpy_snapshot(bids, asks)
+            self.tracker._order_books[trading_pair] = order_book
+
+    def tearDown(self) -> None:
+        OrderBookTracker.logger().removeHandler(self)
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def is_logged(self, log_level: str, message: str) -> bool:
+        return any(record.levelname == log_level and record.getMessage() == message for record in self.log_records)
+
+    def test_snapshot(self):
+        snapshot = self.tracker.snapshot
+        self.assertEqual(set(self.trading_pairs), set(snapshot.keys()))
+        bids, asks = snapshot["BTC-USDT"]
+        self.assertEqual(50, len(bids))
+        self.assertEqual(98, bids.iloc[0].price)
+        self.assertEqual(101, asks.iloc[0].price)
+
+    def test_get_snapshots_is_lazy_and_depth_limited(self):
+        snapshots = self.tracker.get_snapshots(depth=5)
+
+        self.assertEqual(2, len(snapshots))
+        self.assertEqual(self.trading_pairs, list(snapshots))
+
+        bids, asks = snapshots["COINALPHA-HBOT"]
+        self.assertEqual(5, len(bids))
+        self.assertEqual(5, len(asks))
+        self.assertEqual(99, bids.iloc[0].price)
+        self.assertEqual(100, asks.iloc[0].price)
+        self.assertRaises(KeyError, snapshots.__getitem__, "ETH-USDT")
+        self.assertEqual(1, self.tracker.order_books["COINALPHA-HBOT"].snapshots_taken)
+        self.assertEqual(0, self.tracker.order_books["BTC-USDT"].snapshots_taken)
+
+    def test_track_single_book_emits_update_events(self):
+        trading_pair = "BTC-USDT"
+        order_book = self.tracker.order_books[trading_pair]
+        event_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.UpdateEvent, event_logger)
+        message_queue = asyncio.Queue()
+        self.tracker._tracking_message_queues[trading_pair] = message_queue
+        message_queue.put_nowait(OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": trading_pair, "update_id": 2, "bids": [[98.5, 2]], "asks": []}, timestamp=1))
+
+        ev_loop = asyncio.get_event_loop()
+        task = ev_loop.create_task(self.tracker._track_single_book(trading_pair))
+        ev_loop.run_until_complete(asyncio.sleep(0.01))
+        task.cancel()
+
+        self.assertEqual(1, len(event_logger.event_log))
+        self.assertEqual(trading_pair, event_logger.event_log[0].trading_pair)
+        self.assertEqual(2, event_logger.event_log[0].update_id)
+        self.assertEqual(98.5, order_book.get_price(False))
+
+    def test_track_single_book_records_update_latency(self):
+        instrumentation = Instrumentation()
+        trading_pair = "BTC-USDT"
+        message_queue = asyncio.Queue()
+        self.tracker._tracking_message_queues[trading_pair] = message_queue
+        message_queue.put_nowait(OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": trading_pair, "update_id": 2, "bids": [[98.5, 2]], "asks": []},
+            timestamp=time.time() - 0.5))
+        # Diffs timestamped in the future are not recorded
+        message_queue.put_nowait(OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": trading_pair, "update_id": 3, "bids": [[98.6, 2]], "asks": []},
+            timestamp=time.time() * 1e3))
+
+        ev_loop = asyncio.get_event_loop()
+        with patch.object(Instrumentation, "_shared_instance", instrumentation):
+            task = ev_loop.create_task(self.tracker._track_single_book(trading_pair))
+            ev_loop.run_until_complete(asyncio.sleep(0.01))
+        task.cancel()
+
+        histogram = instrumentation.histogram(
+            ORDER_BOOK_UPDATE_LATENCY, MockOrderBookTrackerDataSource.__name__, trading_pair)
+        self.assertEqual(1, histogram.count)
+        self.assertGreaterEqual(histogram.max, 0.5)
+        self.assertLess(histogram.max, 1)
+
+    def test_init_order_books_requests_snapshots_concurrently(self):
+        trading_pairs = ["COINALPHA-HBOT", "BTC-USDT", "ETH-USDT"]
+        data_source = DelayedSnapshotsDataSource(trading_pairs=trading_pairs)
+        tracker = OrderBookTracker(data_source=data_source, trading_pairs=trading_pairs)
+        ev_loop = asyncio.get_event_loop()
+
+        init_task = ev_loop.create_task(tracker._init_order_books())
+        ev_loop.run_until_complete(asyncio.sleep(0.01))
+        self.assertEqual(trading_pairs, data_source.requested_trading_pairs)
+        self.assertFalse(tracker.order_book_ready("BTC-USDT"))
+
+        # Each order book is usable as soon as its own snapshot arrives
+        data_source.snapshots_released["BTC-USDT"].set()
+        order_book = ev_loop.run_until_complete(asyncio.wait_for(tracker.wait_for_order_book("BTC-USDT"), 1))
+        self.assertIs(tracker.order_books["BTC-USDT"], order_book)
+        self.assertIn("BTC-USDT", tracker._tracking_tasks)
+        self.assertFalse(tracker.order_book_ready("ETH-USDT"))
+        self.assertFalse(tracker.ready)
+        self.assertTrue(self.is_logged("INFO", "Initialized order book for BTC-USDT. 1/3 completed."))
+
+        for released in data_source.snapshots_released.values():
+            released.set()
+        ev_loop.run_until_complete(asyncio.wait_for(init_task, 1))
+        self.assertTrue(tracker.ready)
+        self.assertTrue(all(tracker.order_book_ready(trading_pair) for trading_pair in trading_pairs))
+        self.assertTrue(any(record.getMessage().startswith("Initialized 3 order books in ")
+                            for record in self.log_records))
+
+        tracker.stop()
+        self.assertFalse(tracker.order_book_ready("BTC-USDT"))
+
+    @patch.object(OrderBookTracker, "SNAPSHOT_REQUEST_INTERVAL", 0.1)
+    def test_init_order_books_paces_the_snapshots_of_data_sources_without_throttler(self):
+        trading_pairs = ["COINALPHA-HBOT", "BTC-USDT", "ETH-USDT"]
+        data_source = DelayedSnapshotsDataSource(trading_pairs=trading_pairs)
+        data_source.THROTTLED_SNAPSHOTS = False
+        for released in data_source.snapshots_released.values():
+            released.set()
+        tracker = OrderBookTracker(data_source=data_source, trading_pairs=trading_pairs)
+        ev_loop = asyncio.get_event_loop()
+
+        init_task = ev_loop.create_task(tracker._init_order_books())
+        ev_loop.run_until_complete(asyncio.sleep(0.05))
+        # The first order book is tracked right away, the next snapshot is requested after the pause
+        self.assertEqual(["COINALPHA-HBOT"], data_source.requested_trading_pairs)
+        self.assertTrue(tracker.order_book_ready("COINALPHA-HBOT"))
+
+        ev_loop.run_until_complete(asyncio.sleep(0.1))
+        self.assertEqual(["COINALPHA-HBOT", "BTC-USDT"], data_source.requested_trading_pairs)
+
+        ev_loop.run_until_complete(asyncio.wait_for(init_task, 1))
+        self.assertEqual(trading_pairs, data_source.requested_trading_pairs)
+        self.assertTrue(tracker.ready)
+        tracker.stop()
+
+    def test_diffs_are_routed_to_bounded_pair_queues(self):
+        for trading_pair in self.trading_pairs:
+            self.tracker._tracking_message_queues[trading_pair] = OrderBookMessageQueue(
+                maxsize=5, request_snapshot=lambda: None)
+        router = OrderBookDiffRouter(self.tracker._route_diff_message)
+
+        for update_id in range(2, 10):
+            router.put_nowait(OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "BTC-USDT", "update_id": update_id, "bids": [[98.5, update_id]], "asks": []}))
+        # Older than the snapshot of the order book
+        router.put_nowait(OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "COINALPHA-HBOT", "update_id": 0, "bids": [], "asks": []}))
+        # Not tracked yet
+        router.put_nowait(OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "ETH-USDT", "update_id": 2, "bids": [], "asks": []}))
+
+        stats = self.tracker.queue_stats
+        self.assertEqual(4, stats["BTC-USDT"].queue_depth)
+        self.assertEqual(4, stats["BTC-USDT"].collapsed_diffs)
+        self.assertGreater(stats["BTC-USDT"].lag, 0)
+        self.assertEqual(0, stats["COINALPHA-HBOT"].queue_depth)
+        self.assertEqual(1, len(self.tracker._saved_message_queues["ETH-USDT"]))
+
+    @staticmethod
+    def sequenced_diff(first_update_id: int, update_id: int, bids: List[list]) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "BTC-USDT", "first_update_id": first_update_id, "update_id": update_id,
+            "bids": bids, "asks": []}, timestamp=update_id)
+
+    @staticmethod
+    def snapshot_book(update_id: int, best_bid: float) -> OrderBook:
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[best_bid, 1, update_id]], dtype=np.float64),
+                                        np.array([[110, 1, update_id]], dtype=np.float64))
+        return order_book
+
+    def track_sequenced_diffs(self, snapshots: List[OrderBook], diffs: List[OrderBookMessage]) -> OrderBookTracker:
+        trading_pair = "BTC-USDT"
+        data_source = SequencedDiffsDataSource(trading_pairs=[trading_pair], snapshots=snapshots)
+        tracker = OrderBookTracker(data_source=data_source, trading_pairs=[trading_pair])
+        tracker._order_books[trading_pair] = self.tracker.order_books[trading_pair]
+        tracker._tracking_message_queues[trading_pair] = OrderBookMessageQueue(
+            maxsize=100, request_snapshot=lambda: tracker._request_resnapshot(trading_pair))
+        for diff in diffs:
+            tracker._tracking_message_queues[trading_pair].put_nowait(diff)
+
+        ev_loop = asyncio.get_event_loop()
+        task = ev_loop.create_task(tracker._track_single_book(trading_pair))
+        ev_loop.run_until_complete(asyncio.sleep(0.05))
+        task.cancel()
+        return tracker
+
+    def test_sequenced_diffs_without_gaps(self):
+        tracker = self.track_sequenced_diffs(snapshots=[], diffs=[
+            self.sequenced_diff(1, 2, [[98.5, 1]]),
+            # Already applied, and older than the order book
+            self.sequenced_diff(1, 2, [[98.5, 0]]),
+            self.sequenced_diff(3, 4, [[98.75, 1]]),
+        ])
+
+        order_book = tracker.order_books["BTC-USDT"]
+        self.assertEqual(98.75, order_book.get_price(False))
+        self.assertEqual(4, order_book.last_diff_uid)
+        self.assertEqual(0, tracker._data_source.snapshots_requested)
+        self.assertEqual({}, tracker.sync_stats)
+
+    def test_sequence_gap_resyncs_order_book_from_snapshot_and_buffered_diffs(self):
+        tracker = self.track_sequenced_diffs(
+            snapshots=[
+                # Older than the diffs buffered after the gap, requested again
+                self.snapshot_book(update_id=4, best_bid=90),
+                self.snapshot_book(update_id=6, best_bid=95),
+            ],
+            diffs=[
+                self.sequenced_diff(2, 3, [[98.5, 1]]),
+                # The diffs 4 and 5 were dropped
+                self.sequenced_diff(6, 7, [[96, 1]]),
+                self.sequenced_diff(8, 9, [[97, 1]]),
+            ])
+
+        order_book = tracker.order_books["BTC-USDT"]
+        self.assertEqual(2, tracker._data_source.snapshots_requested)
+        self.assertEqual(6, order_book.snapshot_uid)
+        self.assertEqual(9, order_book.last_diff_uid)
+        self.assertEqual([97, 96, 95], [row.price for row in order_book.bid_entries()])
+        stats = tracker.sync_stats["BTC-USDT"]
+        self.assertEqual(1, stats.gaps)
+        self.assertEqual(1, stats.resyncs)
+        self.assertGreater(stats.out_of_sync_time, 0)
+        self.assertNotIn("BTC-USDT", tracker._out_of_sync_diffs)
+        self.assertTrue(self.is_logged("WARNING", "The order book of BTC-USDT missed the diffs 4 to 5. "
+                                                  "Requesting a new snapshot."))
+        self.assertTrue(self.is_logged("WARNING", "The order book of BTC-USDT received a snapshot older than its "
+                                                  "buffered diffs. Requesting a new snapshot."))
+
+    def test_diffs_are_buffered_until_resync(self):
+        trading_pair = "BTC-USDT"
+        tracker = self.track_sequenced_diffs(snapshots=[], diffs=[
+            self.sequenced_diff(4, 5, [[98.5, 1]]),
+            self.sequenced_diff(6, 6, [[98.75, 1]]),
+        ])
+        self.assertFalse(tracker._resnapshot_tasks[trading_pair].done())
+        self.assertEqual(98, tracker.order_books[trading_pair].get_price(False))
+        self.assertEqual([5, 6], [diff.update_id for diff in tracker._out_of_sync_diffs[trading_pair]])
+        stats = tracker.sync_stats[trading_pair]
+        self.assertEqual(1, stats.gaps)
+        self.assertEqual(0, stats.resyncs)
+        self.assertGreater(tracker.sync_stats[trading_pair].out_of_sync_time, stats.out_of_sync_time)
+
+        tracker.stop()
+        self.assertEqual({}, tracker._out_of_sync_diffs)
+
+    def test_resnapshot_queues_a_fresh_snapshot(self):
+        trading_pair = "BTC-USDT"
+        data_source = DelayedSnapshotsDataSource(trading_pairs=[trading_pair])
+        tracker = OrderBookTracker(data_source=data_source, trading_pairs=[trading_pair])
+        queue = OrderBookMessageQueue(maxsize=5, request_snapshot=lambda: tracker._request_resnapshot(trading_pair))
+        tracker._tracking_message_queues[trading_pair] = queue
+        data_source.snapshots_released[trading_pair].set()
+
+        tracker._request_resnapshot(trading_pair)
+        tracker._request_resnapshot(trading_pair)
+        ev_loop = asyncio.get_event_loop()
+        ev_loop.run_until_complete(asyncio.wait_for(tracker._resnapshot_tasks[trading_pair], 1))
+
+        self.assertEqual([trading_pair], data_source.requested_trading_pairs)
+        message = queue.get_nowait()
+        self.assertEqual(OrderBookMessageType.SNAPSHOT, message.type)
+        self.assertEqual(trading_pair, message.trading_pair)
+        self.assertTrue(self.is_logged("WARNING", f"The order book of {trading_pair} fell behind its updates. "
+                                                  f"Requesting a new snapshot."))
@@ -0,0 +1,100 @@
+import asyncio
+import unittest
+from typing import Awaitable
+
+import aiohttp
+
+from hummingbot.core.instrumentation.instrumentation import (
+    EVENT_LOOP_LAG,
+    ORDER_BOOK_UPDATE_LATENCY,
+    TICK_DURATION,
+    Instrumentation,
+)
+from hummingbot.core.instrumentation.prometheus_endpoint import PROMETHEUS_CONTENT_TYPE, PrometheusEndpoint
+
+
+class InstrumentationTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.instrumentation = Instrumentation()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_get_instance_returns_shared_instance(self):
+        self.assertIs(Instrumentation.get_instance(), Instrumentation.get_instance())
+
+    def test_histogram_is_created_once_per_label_values(self):
+        histogram = self.instrumentation.histogram(TICK_DURATION, "ExchangeA")
+
+        self.assertIs(histogram, self.instrumentation.histogram(TICK_DURATION, "ExchangeA"))
+        self.assertIsNot(histogram, self.instrumentation.histogram(TICK_DURATION, "ExchangeB"))
+
+    def test_histogram_with_wrong_label_values_count_raises(self):
+        with self.assertRaises(ValueError):
+            self.instrumentation.histogram(TICK_DURATION)
+        with self.assertRaises(ValueError):
+            self.instrumentation.histogram(EVENT_LOOP_LAG, "extra")
+
+    def test_histograms_returns_only_the_ones_with_recorded_latencies(self):
+        self.instrumentation.histogram(TICK_DURATION, "Unused")
+        self.instrumentation.histogram(TICK_DURATION, "StrategyB").record(0.002)
+        self.instrumentation.histogram(TICK_DURATION, "StrategyA").record(0.001)
+        self.instrumentation.histogram(EVENT_LOOP_LAG).record(0.003)
+
+        histograms = self.instrumentation.histograms()
+
+        self.assertEqual([(EVENT_LOOP_LAG, ()), (TICK_DURATION, ("StrategyA",)), (TICK_DURATION, ("StrategyB",))],
+                         [(metric, label_values) for metric, label_values, _ in histograms])
+
+    def test_reset_clears_the_latencies_and_keeps_the_histograms(self):
+        histogram = self.instrumentation.histogram(EVENT_LOOP_LAG)
+        histogram.record(0.003)
+
+        self.instrumentation.reset()
+
+        self.assertEqual(0, histogram.count)
+        self.assertEqual([], self.instrumentation.histograms())
+        self.assertIs(histogram, self.instrumentation.histogram(EVENT_LOOP_LAG))
+
+    def test_prometheus_text(self):
+        self.instrumentation.histogram(EVENT_LOOP_LAG).record(0.5)
+        self.instrumentation.histogram(ORDER_BOOK_UPDATE_LATENCY, "Source", 'A"B').record(0.25)
+
+        lines = self.instrumentation.prometheus_text().splitlines()
+
+        self.assertIn("# TYPE hummingbot_event_loop_lag_seconds summary", lines)
+        self.assertIn('hummingbot_event_loop_lag_seconds{quantile="0.5"} 0.5', lines)
+        self.assertIn('hummingbot_event_loop_lag_seconds{quantile="0.999"} 0.5', lines)
+        self.assertIn("hummingbot_event_loop_lag_seconds_sum 0.5", lines)
+        self.assertIn("hummingbot_event_loop_lag_seconds_count 1", lines)
+        self.assertIn('hummingbot_order_book_update_latency_seconds'
+                      '{data_source="Source",trading_pair="A\\"B",quantile="0.99"} 0.25', lines)
+        self.assertIn('hummingbot_order_book_update_latency_seconds_count'
+                      '{data_source="Source",trading_pair="A\\"B"} 1', lines)
+        self.assertIn("# TYPE hummingbot_throttler_wait_seconds summary", lines)
+
+    def test_prometheus_endpoint_serves_the_latencies(self):
+        self.instrumentation.histogram(EVENT_LOOP_LAG).record(0.5)
+        endpoint = PrometheusEndpoint(self.instrumentation, port=0)
+
+        async def fetch_metrics():
+            async with aiohttp.ClientSession() as session:
+                async with session.get(endpoint.url) as response:
+                    return response.status, response.headers["Content-Type"], await response.text()
+
+        self.async_run_with_timeout(endpoint.start())
+        try:
+            self.assertTrue(endpoint.started)
+            self.assertNotEqual("http://127.0.0.1:0/metrics", endpoint.url)
+            status, content_type, body = self.async_run_with_timeout(fetch_metrics())
+        finally:
+            self.async_run_with_timeout(endpoint.stop())
+
+        self.assertFalse(endpoint.started)
+        self.assertEqual(200, status)
+        self.assertEqual(PROMETHEUS_CONTENT_TYPE, content_type)
+        self.assertEqual(self.instrumentation.prometheus_text(), body)
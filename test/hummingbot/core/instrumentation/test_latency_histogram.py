@@ -0,0 +1,71 @@
+import math
+import random
+import unittest
+
+from hummingbot.core.instrumentation.latency_histogram import LatencyHistogram
+
+
+class LatencyHistogramTest(unittest.TestCase):
+
+    def test_empty_histogram(self):
+        histogram = LatencyHistogram()
+
+        self.assertEqual(0, histogram.count)
+        self.assertTrue(math.isnan(histogram.mean))
+        self.assertTrue(math.isnan(histogram.max))
+        self.assertTrue(math.isnan(histogram.percentile(50)))
+
+    def test_short_durations_are_counted_exactly(self):
+        histogram = LatencyHistogram()
+        for microseconds in range(1, 101):
+            histogram.record(microseconds / 1e6)
+
+        self.assertEqual(100, histogram.count)
+        self.assertAlmostEqual(50.5e-6, histogram.mean)
+        self.assertAlmostEqual(100e-6, histogram.max)
+        self.assertAlmostEqual(50e-6, histogram.percentile(50))
+        self.assertAlmostEqual(90e-6, histogram.percentile(90))
+        self.assertAlmostEqual(1e-6, histogram.percentile(0))
+        self.assertAlmostEqual(100e-6, histogram.percentile(100))
+
+    def test_percentiles_relative_error_is_bounded(self):
+        rng = random.Random(42)
+        durations = sorted(rng.lognormvariate(-6, 2) for _ in range(10000))
+        histogram = LatencyHistogram()
+        for duration in durations:
+            histogram.record(duration)
+
+        for percentile in (50, 90, 99, 99.9):
+            expected = durations[math.ceil(percentile / 100 * len(durations)) - 1]
+            reported = histogram.percentile(percentile)
+            self.assertGreaterEqual(reported, expected - 1e-6)
+            self.assertLessEqual(reported, expected * (1 + 1 / 64) + 1e-6)
+        self.assertAlmostEqual(durations[-1], histogram.max, delta=1e-6)
+
+    def test_durations_out_of_range_are_clamped(self):
+        histogram = LatencyHistogram(highest_trackable_seconds=1)
+        histogram.record(-0.5)
+        histogram.record(10)
+
+        self.assertEqual(2, histogram.count)
+        self.assertEqual(0, histogram.percentile(50))
+        self.assertEqual(1, histogram.max)
+        self.assertEqual(1, histogram.percentile(100))
+
+    def test_reset(self):
+        histogram = LatencyHistogram()
+        histogram.record(0.01)
+        histogram.reset()
+
+        self.assertEqual(0, histogram.count)
+        self.assertTrue(math.isnan(histogram.percentile(99)))
+
+        histogram.record(0.002)
+        self.assertAlmostEqual(0.002, histogram.max)
+        self.assertAlmostEqual(0.002, histogram.percentile(50), delta=0.002 / 64)
+
+    def test_highest_value_in_bucket_is_consistent_with_bucket_index(self):
+        for value in list(range(0, 300)) + [1_000, 65_535, 65_536, 1_000_000, 3_600_000_000]:
+            index = LatencyHistogram._bucket_index(value)
+            self.assertGreaterEqual(LatencyHistogram._highest_value_in_bucket(index), value)
+            self.assertEqual(index, LatencyHistogram._bucket_index(LatencyHistogram._highest_value_in_bucket(index)))
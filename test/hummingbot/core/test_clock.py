@@ -2,11 +2,13 @@ import unittest
 import asyncio
 import pandas as pd
 import time
+from unittest.mock import patch
 
 from hummingbot.core.clock import (
     Clock,
     ClockMode
 )
+from hummingbot.core.instrumentation.instrumentation import EVENT_LOOP_LAG, TICK_DURATION, Instrumentation
 from hummingbot.core.time_iterator import TimeIterator
 
 
@@ -112,6 +114,32 @@ class ClockUnitTest(unittest.TestCase):
 
         self.assertGreaterEqual(self.clock_realtime.current_timestamp, self.realtime_end_timestamp)
 
+    def test_run_til_records_event_loop_lag_and_tick_durations(self):
+        instrumentation = Instrumentation()
+        self.clock_realtime.add_iterator(TimeIterator())
+
+        with patch.object(Instrumentation, "_shared_instance", instrumentation):
+            with self.clock_realtime:
+                self.ev_loop.run_until_complete(self.clock_realtime.run_til(self.realtime_end_timestamp))
+
+        ticks = instrumentation.histogram(EVENT_LOOP_LAG).count
+        self.assertGreater(ticks, 0)
+        self.assertEqual(ticks, instrumentation.histogram(TICK_DURATION, "TimeIterator").count)
+
+    def test_run_til_resolves_tick_duration_histograms_once(self):
+        instrumentation = Instrumentation()
+        self.clock_realtime.add_iterator(TimeIterator())
+        self.clock_realtime.add_iterator(TimeIterator())
+
+        with patch.object(Instrumentation, "_shared_instance", instrumentation):
+            with patch.object(instrumentation, "histogram", wraps=instrumentation.histogram) as histogram_mock:
+                with self.clock_realtime:
+                    self.ev_loop.run_until_complete(self.clock_realtime.run_til(self.realtime_end_timestamp))
+
+        tick_duration_lookups = [c for c in histogram_mock.call_args_list if c.args[0] == TICK_DURATION]
+        self.assertEqual(1, len(tick_duration_lookups))
+        self.assertGreater(instrumentation.histogram(TICK_DURATION, "TimeIterator").count, 1)
+
     def test_backtest(self):
         # Note: Technically you do not execute `backtest()` when in REALTIME mode
 
@@ -3,11 +3,24 @@ import gc
 import weakref
 
 from hummingbot.core.pubsub import PubSub
+from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.event.event_logger import EventLogger
 
 from test.mock.mock_events import MockEventType, MockEvent
 
 
+class SelfRemovingListener(EventListener):
+    def __init__(self, pubsub: PubSub, event_tag: MockEventType):
+        super().__init__()
+        self.pubsub = pubsub
+        self.event_tag = event_tag
+        self.calls = 0
+
+    def __call__(self, arg):
+        self.calls += 1
+        self.pubsub.remove_listener(self.event_tag, self)
+
+
 class PubSubTest(unittest.TestCase):
     def setUp(self) -> None:
         self.pubsub = PubSub()
@@ -89,6 +102,49 @@ class PubSubTest(unittest.TestCase):
         listeners = self.pubsub.get_listeners(self.event_tag_zero)
         self.assertEqual(0, len(listeners))
 
+    def test_lapsed_listener_skipped_on_trigger_event(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        listener_zero_weakref = weakref.ref(self.listener_zero)
+        self.listener_zero = None  # remove strong reference
+        gc.collect()
+        self.assertIsNone(listener_zero_weakref())
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(2, len(self.listener_one.event_log))
+        self.assertEqual([self.listener_one], self.pubsub.get_listeners(self.event_tag_zero))
+
+    def test_listener_removed_while_triggering_event(self):
+        self_removing_listener = SelfRemovingListener(self.pubsub, self.event_tag_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self_removing_listener)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(1, self_removing_listener.calls)
+        self.assertEqual(2, len(self.listener_zero.event_log))
+        self.assertEqual([self.listener_zero], self.pubsub.get_listeners(self.event_tag_zero))
+
+    def test_listener_added_after_trigger_event(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(2, len(self.listener_zero.event_log))
+        self.assertEqual(1, len(self.listener_one.event_log))
+
+    def test_listeners_do_not_keep_pubsub_alive(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        pubsub_weakref = weakref.ref(self.pubsub)
+        self.pubsub = None
+        gc.collect()
+        self.assertIsNone(pubsub_weakref())
+
+        # Collecting the listener after the PubSub is gone must be harmless.
+        self.listener_zero = None
+        gc.collect()
+
 
 if __name__ == "__main__":
     unittest.main()
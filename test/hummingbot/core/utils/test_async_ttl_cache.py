@@ -21,3 +21,44 @@ class AsyncTTLCacheUnitTest(unittest.TestCase):
         time.sleep(2)
         ret_4 = asyncio.get_event_loop().run_until_complete(self.get_timestamp())
         self.assertGreater(ret_4, ret_3)
+
+    def test_concurrent_calls_share_a_single_call(self):
+        calls = []
+
+        @async_ttl_cache(ttl=3, maxsize=10)
+        async def get_price(trading_pair: str, is_buy: bool, amount: int = 1):
+            calls.append((trading_pair, is_buy, amount))
+            call_number = len(calls)
+            await asyncio.sleep(0.01)
+            return call_number
+
+        results = asyncio.get_event_loop().run_until_complete(asyncio.gather(
+            get_price("HBOT-USDT", True),
+            get_price("HBOT-USDT", True, 1),
+            get_price("HBOT-USDT", is_buy=True, amount=1),
+            get_price("HBOT-USDT", False),
+        ))
+
+        self.assertEqual([1, 1, 1, 2], sorted(results))
+        self.assertEqual(2, len(calls))
+        self.assertEqual(results[0], asyncio.get_event_loop().run_until_complete(get_price("HBOT-USDT", True)))
+        self.assertEqual(2, len(calls))
+
+    def test_failed_calls_are_not_cached(self):
+        calls = []
+
+        @async_ttl_cache(ttl=3, maxsize=10)
+        async def get_price():
+            calls.append(None)
+            await asyncio.sleep(0.01)
+            if len(calls) == 1:
+                raise IOError("Connection reset")
+            return len(calls)
+
+        async def get_prices():
+            return await asyncio.gather(get_price(), get_price(), return_exceptions=True)
+
+        results = asyncio.get_event_loop().run_until_complete(get_prices())
+        self.assertTrue(all(isinstance(result, IOError) for result in results))
+        self.assertEqual(2, asyncio.get_event_loop().run_until_complete(get_price()))
+        self.assertEqual(2, len(calls))
@@ -0,0 +1,145 @@
+import asyncio
+import threading
+import unittest
+from decimal import Decimal
+from typing import Awaitable
+from unittest.mock import patch
+
+from aiohttp import web
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.core.web_assistant.connections.connections_factory import ConnectionsFactory
+from hummingbot.core.web_assistant.connections.connections_manager import ConnectionsManager
+
+
+class ConnectionsManagerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.manager = ConnectionsManager()
+        self.runner = None
+
+    def tearDown(self) -> None:
+        self.async_run_with_timeout(self.manager.close())
+        if self.runner is not None:
+            self.async_run_with_timeout(self.runner.cleanup())
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    async def start_server(self) -> str:
+        async def handler(request: web.Request) -> web.Response:
+            return web.json_response({"ok": True})
+
+        app = web.Application()
+        app.router.add_get("/ping", handler)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}/ping"
+
+    def test_get_instance_returns_the_shared_manager(self):
+        self.assertIs(ConnectionsManager.get_instance(ClientConfigAdapter(ClientConfigMap())),
+                      ConnectionsManager.get_instance())
+
+    @patch.object(ConnectionsManager, "_shared_instance", None)
+    def test_get_instance_takes_the_pool_settings_from_the_client_config(self):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.connections_pool.connections_limit = 50
+        client_config_map.connections_pool.connections_limit_per_host = 10
+        client_config_map.connections_pool.connections_keepalive_timeout = Decimal("15")
+        client_config_map.connections_pool.dns_cache_ttl = 0
+
+        manager = ConnectionsManager.get_instance(client_config_map)
+        session = self.async_run_with_timeout(manager.get_client_session())
+        try:
+            self.assertEqual(50, session.connector.limit)
+            self.assertEqual(10, session.connector.limit_per_host)
+            self.assertEqual(15.0, session.connector._keepalive_timeout)
+            self.assertFalse(session.connector.use_dns_cache)
+        finally:
+            self.async_run_with_timeout(manager.close())
+
+    def test_connections_factories_share_the_client_session(self):
+        manager = self.manager
+
+        with patch.object(ConnectionsManager, "_shared_instance", manager):
+            first_connection = self.async_run_with_timeout(ConnectionsFactory().get_rest_connection())
+            second_connection = self.async_run_with_timeout(ConnectionsFactory().get_rest_connection())
+
+        self.assertIs(first_connection._client_session, second_connection._client_session)
+        self.assertIs(self.async_run_with_timeout(manager.get_client_session()), first_connection._client_session)
+
+    def test_client_session_created_again_when_closed(self):
+        session = self.async_run_with_timeout(self.manager.get_client_session())
+        self.assertIs(session, self.async_run_with_timeout(self.manager.get_client_session()))
+
+        self.async_run_with_timeout(session.close())
+
+        new_session = self.async_run_with_timeout(self.manager.get_client_session())
+        self.assertIsNot(session, new_session)
+        self.assertFalse(new_session.closed)
+
+    def test_client_session_created_again_in_another_event_loop_closes_the_replaced_one(self):
+        session = self.async_run_with_timeout(self.manager.get_client_session())
+
+        other_loop = asyncio.new_event_loop()
+        try:
+            other_session = other_loop.run_until_complete(self.manager.get_client_session())
+            self.assertIsNot(session, other_session)
+            self.assertTrue(session.closed)
+            other_loop.run_until_complete(other_session.close())
+        finally:
+            other_loop.close()
+
+    def test_replaced_client_session_is_closed_in_its_running_event_loop(self):
+        other_loop = asyncio.new_event_loop()
+        other_thread = threading.Thread(target=other_loop.run_forever)
+        other_thread.start()
+        try:
+            other_session = asyncio.run_coroutine_threadsafe(self.manager.get_client_session(), other_loop).result(1)
+
+            session = self.async_run_with_timeout(self.manager.get_client_session())
+            self.async_run_with_timeout(asyncio.sleep(0.1))
+
+            self.assertIsNot(other_session, session)
+            self.assertTrue(other_session.closed)
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            other_thread.join()
+            other_loop.close()
+
+    def test_stats_count_reused_connections_and_time_to_first_byte(self):
+        url = self.async_run_with_timeout(self.start_server())
+
+        async def request():
+            session = await self.manager.get_client_session()
+            async with session.get(url) as response:
+                return await response.json()
+
+        for _ in range(3):
+            self.assertEqual({"ok": True}, self.async_run_with_timeout(request()))
+
+        stats = self.manager.stats
+        self.assertEqual(3, stats.requests)
+        self.assertEqual(1, stats.connections_created)
+        self.assertEqual(2, stats.connections_reused)
+        self.assertAlmostEqual(2 / 3, stats.connection_reuse_ratio)
+        self.assertGreater(stats.time_to_first_byte_mean, 0)
+        self.assertGreaterEqual(stats.time_to_first_byte_max, stats.time_to_first_byte_mean)
+
+    def test_stats_without_requests(self):
+        stats = self.manager.stats
+
+        self.assertEqual(0, stats.requests)
+        self.assertEqual(0.0, stats.connection_reuse_ratio)
+        self.assertEqual(0.0, stats.time_to_first_byte_mean)
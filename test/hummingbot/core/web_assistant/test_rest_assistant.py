@@ -100,3 +100,133 @@ class RESTAssistantTest(unittest.TestCase):
         self.assertIsNotNone(call_request)
         self.assertIsNotNone(call_request.headers)
         self.assertEqual(call_request.headers, auth_header)
+
+    @patch("hummingbot.core.web_assistant.connections.rest_connection.RESTConnection.call")
+    def test_rest_assistant_call_does_not_change_the_request(self, mocked_call):
+        url = "https://www.test.com/url"
+        call_request: Optional[RESTRequest] = None
+
+        async def register_request_and_return(request: RESTRequest):
+            nonlocal call_request
+            call_request = request
+            return {"one": 1}
+
+        mocked_call.side_effect = register_request_and_return
+
+        class AuthDummy(AuthBase):
+            async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
+                request.params["signature"] = "signed"
+                request.headers["authenticated"] = "True"
+                return request
+
+            async def ws_authenticate(self, request: WSRequest) -> WSRequest:
+                pass
+
+        connection = RESTConnection(aiohttp.ClientSession())
+        assistant = RESTAssistant(connection, throttler=AsyncThrottler(rate_limits=[]), auth=AuthDummy())
+        req = RESTRequest(method=RESTMethod.GET, url=url, params={"one": 1}, headers={}, is_auth_required=True)
+
+        self.async_run_with_timeout(assistant.call(req))
+
+        self.assertEqual({"one": 1, "signature": "signed"}, call_request.params)
+        self.assertEqual({"authenticated": "True"}, call_request.headers)
+        self.assertEqual({"one": 1}, req.params)
+        self.assertEqual({}, req.headers)
+
+    @patch("hummingbot.core.web_assistant.connections.rest_connection.RESTConnection.call")
+    def test_rest_assistant_execute_request(self, mocked_call):
+        url = "https://www.test.com/url"
+        call_requests = []
+
+        class ResponseDummy:
+            status = 200
+
+            async def json(self):
+                return {"one": 1}
+
+        async def register_request_and_return(request: RESTRequest):
+            call_requests.append(request)
+            return ResponseDummy()
+
+        mocked_call.side_effect = register_request_and_return
+
+        class AuthDummy(AuthBase):
+            async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
+                if request.params is not None:
+                    request.params["signature"] = "signed"
+                return request
+
+            async def ws_authenticate(self, request: WSRequest) -> WSRequest:
+                pass
+
+        connection = RESTConnection(aiohttp.ClientSession())
+        assistant = RESTAssistant(connection, throttler=AsyncThrottler(rate_limits=[]), auth=AuthDummy())
+        params = {"one": 1}
+
+        result = self.async_run_with_timeout(assistant.execute_request(
+            url=url, throttler_limit_id="limit", params=params, is_auth_required=True, headers={"extra": "header"}))
+        self.async_run_with_timeout(assistant.execute_request(
+            url=url, throttler_limit_id="limit", data={"two": 2}, method=RESTMethod.POST))
+
+        self.assertEqual({"one": 1}, result)
+        get_request, post_request = call_requests
+        self.assertEqual({"one": 1, "signature": "signed"}, get_request.params)
+        self.assertEqual({"one": 1}, params)
+        self.assertEqual({"Content-Type": "application/x-www-form-urlencoded", "extra": "header"}, get_request.headers)
+        self.assertEqual(json.dumps({"two": 2}), post_request.data)
+        self.assertEqual({"Content-Type": "application/json"}, post_request.headers)
+
+    @patch("hummingbot.core.web_assistant.connections.rest_connection.RESTConnection.call")
+    def test_rest_assistant_execute_template_request(self, mocked_call):
+        url = "https://www.test.com/url"
+        call_requests = []
+
+        class ResponseDummy:
+            status = 200
+
+            async def json(self):
+                return {"one": 1}
+
+        async def register_request_and_return(request: RESTRequest):
+            call_requests.append(request)
+            return ResponseDummy()
+
+        mocked_call.side_effect = register_request_and_return
+
+        class AuthDummy(AuthBase):
+            async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
+                request.headers["authenticated"] = "True"
+                return request
+
+            async def ws_authenticate(self, request: WSRequest) -> WSRequest:
+                pass
+
+        connection = RESTConnection(aiohttp.ClientSession())
+        assistant = RESTAssistant(connection, throttler=AsyncThrottler(rate_limits=[]), auth=AuthDummy())
+        template = RESTAssistant.request_template(
+            url=url, throttler_limit_id="limit", method=RESTMethod.POST, is_auth_required=True,
+            headers={"extra": "header"})
+
+        result = self.async_run_with_timeout(assistant.execute_template_request(template, data={"two": 2}))
+        self.async_run_with_timeout(assistant.execute_template_request(template, data={"three": 3}))
+
+        self.assertEqual({"one": 1}, result)
+        first_request, second_request = call_requests
+        self.assertEqual(RESTMethod.POST, first_request.method)
+        self.assertEqual(url, first_request.url)
+        self.assertEqual("limit", first_request.throttler_limit_id)
+        self.assertEqual(json.dumps({"two": 2}), first_request.data)
+        self.assertEqual(json.dumps({"three": 3}), second_request.data)
+        self.assertEqual({"Content-Type": "application/json", "extra": "header", "authenticated": "True"},
+                         first_request.headers)
+        self.assertIsNot(first_request.headers, second_request.headers)
+        self.assertEqual({"Content-Type": "application/json", "extra": "header"}, template.headers)
+
+    def test_request_template_is_immutable(self):
+        template = RESTAssistant.request_template(url="https://www.test.com/url", throttler_limit_id="limit")
+
+        self.assertEqual({"Content-Type": "application/x-www-form-urlencoded"}, template.headers)
+        with self.assertRaises(TypeError):
+            template.headers["extra"] = "header"
+        with self.assertRaises(AttributeError):
+            template.url = "https://www.test.com/other"
@@ -1,7 +1,13 @@
 from unittest import TestCase
 from unittest.mock import MagicMock
 
-from hummingbot.model.db_migration.transformations import ConvertPriceAndAmountColumnsToBigint
+from sqlalchemy import create_engine, inspect
+
+from hummingbot.model import get_declarative_base
+from hummingbot.model.db_migration.transformations import (
+    AddTradeHistoryIndexes,
+    ConvertPriceAndAmountColumnsToBigint,
+)
 
 
 class ConvertPriceAndAmountColumnsToBigintTests(TestCase):
@@ -33,3 +39,32 @@ class ConvertPriceAndAmountColumnsToBigintTests(TestCase):
         self.assertIn("CAST(price * 1000000 AS INTEGER", executed_queries[9])
         self.assertEquals('drop table TradeFill;', executed_queries[10])
         self.assertEquals('alter table TradeFill_dg_tmp rename to TradeFill;', executed_queries[11])
+
+
+class AddTradeHistoryIndexesTests(TestCase):
+
+    def test_name(self):
+        self.assertEqual("AddTradeHistoryIndexes", AddTradeHistoryIndexes(self).name)
+
+    def test_to_version(self):
+        self.assertEqual(20221015, AddTradeHistoryIndexes(self).to_version)
+
+    def test_apply_creates_missing_indexes(self):
+        engine = create_engine("sqlite:///:memory:")
+        get_declarative_base().metadata.create_all(engine)
+        engine.execute("drop index tf_timestamp_index")
+        engine.execute("drop index o_config_market_timestamp_index")
+        db_handle = MagicMock()
+        db_handle.engine = engine
+
+        AddTradeHistoryIndexes(migrator=self).apply(db_handle)
+        # Indexes that already exist are left as they are
+        AddTradeHistoryIndexes(migrator=self).apply(db_handle)
+
+        trade_fill_indexes = {index["name"]: index["column_names"] for index in inspect(engine).get_indexes("TradeFill")}
+        order_indexes = {index["name"]: index["column_names"] for index in inspect(engine).get_indexes("Order")}
+        self.assertEqual(["timestamp", "market", "order_id", "exchange_trade_id"],
+                         trade_fill_indexes["tf_timestamp_index"])
+        self.assertEqual(["order_id"], trade_fill_indexes["tf_order_id_index"])
+        self.assertEqual(["config_file_path", "market", "creation_timestamp"],
+                         order_indexes["o_config_market_timestamp_index"])
@@ -0,0 +1,47 @@
+import os
+import sqlite3
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+
+
+class SQLConnectionManagerTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.client_config_map = ClientConfigAdapter(ClientConfigMap())
+        self.data_dir = TemporaryDirectory()
+        self.db_path = os.path.join(self.data_dir.name, "test_DB.sqlite")
+
+    def tearDown(self) -> None:
+        self.data_dir.cleanup()
+        super().tearDown()
+
+    def test_sqlite_pragmas_are_applied_to_new_connections(self):
+        manager = SQLConnectionManager(self.client_config_map, SQLConnectionType.TRADE_FILLS, db_path=self.db_path)
+
+        with manager.engine.connect() as connection:
+            self.assertEqual("wal", connection.execute("PRAGMA journal_mode").scalar())
+            self.assertEqual(1, connection.execute("PRAGMA synchronous").scalar())
+            self.assertEqual(5000, connection.execute("PRAGMA busy_timeout").scalar())
+        manager.engine.dispose()
+
+    def test_older_database_is_migrated_to_the_current_version(self):
+        manager = SQLConnectionManager(self.client_config_map, SQLConnectionType.TRADE_FILLS, db_path=self.db_path)
+        manager.engine.dispose()
+        with sqlite3.connect(self.db_path) as connection:
+            connection.execute("DROP INDEX tf_timestamp_index")
+            connection.execute("UPDATE Metadata SET value = '20220130' WHERE key = 'local_db_version'")
+        connection.close()
+
+        manager = SQLConnectionManager(self.client_config_map, SQLConnectionType.TRADE_FILLS, db_path=self.db_path)
+
+        with manager.get_new_session() as session:
+            self.assertEqual(SQLConnectionManager.LOCAL_DB_VERSION_VALUE, manager.get_local_db_version(session).value)
+        with manager.engine.connect() as connection:
+            index_names = [row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")]
+        self.assertIn("tf_timestamp_index", index_names)
+        manager.engine.dispose()
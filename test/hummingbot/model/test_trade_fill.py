@@ -1,12 +1,18 @@
 import time
 from decimal import Decimal
 from unittest import TestCase
+from unittest.mock import patch
 
+from sqlalchemy import create_engine
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.core.event.events import (
     OrderType,
     TradeType,
 )
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
 
 
@@ -85,3 +91,39 @@ class TradeFillTests(TestCase):
         ]
 
         self.assertEqual(expected_values, values)
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def test_iter_pages_reads_every_trade_once_in_timestamp_order(self, engine_mock):
+        engine_mock.return_value = create_engine("sqlite:///:memory:")
+        manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+        with manager.get_new_session() as session:
+            with session.begin():
+                # Several trades share each timestamp, so some of them fall on both sides of a page boundary.
+                for trade_number in range(25):
+                    session.add(TradeFill(
+                        config_file_path=self.config_file_path,
+                        strategy=self.strategy_name,
+                        market=self.display_name,
+                        symbol=self.symbol,
+                        base_asset=self.base,
+                        quote_asset=self.quote,
+                        timestamp=1000 + (24 - trade_number) // 4,
+                        order_id=f"OID{trade_number % 3}",
+                        trade_type=TradeType.BUY.name,
+                        order_type=OrderType.LIMIT.name,
+                        price=Decimal(1000),
+                        amount=Decimal(1),
+                        leverage=1,
+                        trade_fee=AddedToCostTradeFee().to_json(),
+                        exchange_trade_id=f"EOID{trade_number}",
+                        position="NILL"))
+
+            query = session.query(TradeFill).filter(TradeFill.timestamp >= 1001)
+            pages = list(TradeFill.iter_pages(query, page_size=5))
+
+        trades = [trade for page in pages for trade in page]
+        self.assertEqual([5, 5, 5, 5, 1], [len(page) for page in pages])
+        self.assertEqual(21, len({trade.exchange_trade_id for trade in trades}))
+        self.assertEqual(sorted(trade.timestamp for trade in trades), [trade.timestamp for trade in trades])
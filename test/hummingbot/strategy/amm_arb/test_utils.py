@@ -35,6 +35,22 @@ class MockConnector2(ConnectorBase):
         return self.get_quote_price(trading_pair, is_buy, amount)
 
 
+class SlowConnector(ConnectorBase):
+    in_flight_requests = 0
+    max_in_flight_requests = 0
+
+    async def get_quote_price(self, trading_pair: str, is_buy: bool, amount: Decimal) -> Decimal:
+        SlowConnector.in_flight_requests += 1
+        SlowConnector.max_in_flight_requests = max(SlowConnector.max_in_flight_requests,
+                                                   SlowConnector.in_flight_requests)
+        await asyncio.sleep(0.01)
+        SlowConnector.in_flight_requests -= 1
+        return Decimal("101") if is_buy else Decimal("100")
+
+    async def get_order_price(self, trading_pair: str, is_buy: bool, amount: Decimal) -> Decimal:
+        return await self.get_quote_price(trading_pair, is_buy, amount)
+
+
 class AmmArbUtilsUnitTest(unittest.TestCase):
 
     def test_create_arb_proposals(self):
@@ -61,3 +77,21 @@ class AmmArbUtilsUnitTest(unittest.TestCase):
         self.assertEqual(buy_1_sell_2_profit_pct, arb_proposals[0].profit_pct())
         buy_2_sell_1_profit_pct = (Decimal("104") - Decimal("103")) / Decimal("103")
         self.assertEqual(buy_2_sell_1_profit_pct, arb_proposals[1].profit_pct())
+
+    def test_create_arb_proposals_requests_prices_concurrently(self):
+        market_info1 = MarketTradingPairTuple(
+            SlowConnector(client_config_map=ClientConfigAdapter(ClientConfigMap())), trading_pair, base, quote)
+        market_info2 = MarketTradingPairTuple(
+            SlowConnector(client_config_map=ClientConfigAdapter(ClientConfigMap())), trading_pair, base, quote)
+
+        arb_proposals = asyncio.get_event_loop().run_until_complete(
+            utils.create_arb_proposals(market_info1, market_info2, [], [], Decimal("1")))
+
+        self.assertEqual(2, len(arb_proposals))
+        # The quote and order prices of both sides of both markets
+        self.assertEqual(8, SlowConnector.max_in_flight_requests)
+        self.assertEqual(Decimal("101"), arb_proposals[0].first_side.quote_price)
+        self.assertEqual(Decimal("100"), arb_proposals[0].second_side.order_price)
+        self.assertFalse(arb_proposals[1].first_side.is_buy)
+        self.assertEqual(Decimal("100"), arb_proposals[1].first_side.quote_price)
+        self.assertEqual(Decimal("101"), arb_proposals[1].second_side.order_price)
@@ -0,0 +1,79 @@
+from decimal import Decimal
+from typing import Tuple
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy.arbitrage.arbitrage import ArbitrageStrategy
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+
+s_decimal_0 = Decimal(0)
+
+
+def find_best_profitable_amount_decimal(strategy: ArbitrageStrategy,
+                                        buy_market_trading_pair_tuple: MarketTradingPairTuple,
+                                        sell_market_trading_pair_tuple: MarketTradingPairTuple
+                                        ) -> Tuple[Decimal, Decimal, Decimal, Decimal]:
+    """
+    Reference implementation of ArbitrageStrategy.find_best_profitable_amount(), walking the order book entries of
+    both markets step by step in Decimal and fetching the fees and balances at every step.
+
+    :return: (order size, profitability ratio, bid_price, ask_price)
+    """
+    buy_market = buy_market_trading_pair_tuple.market
+    sell_market = sell_market_trading_pair_tuple.market
+    min_profitability = strategy.min_profitability
+    total_bid_value_adjusted = s_decimal_0
+    total_ask_value_adjusted = s_decimal_0
+    total_previous_step_base_amount = s_decimal_0
+    bid_price = s_decimal_0
+    ask_price = s_decimal_0
+    best_profitable_order_amount = s_decimal_0
+    best_profitable_order_profitability = s_decimal_0
+
+    profitable_orders = ArbitrageStrategy.find_profitable_arbitrage_orders(
+        min_profitability,
+        buy_market_trading_pair_tuple,
+        sell_market_trading_pair_tuple,
+        strategy.market_conversion_rate(buy_market_trading_pair_tuple),
+        strategy.market_conversion_rate(sell_market_trading_pair_tuple))
+
+    for bid_price_adjusted, ask_price_adjusted, bid_price, ask_price, amount in profitable_orders:
+        buy_fee = buy_market.get_fee(buy_market_trading_pair_tuple.base_asset,
+                                     buy_market_trading_pair_tuple.quote_asset,
+                                     buy_market.get_taker_order_type(),
+                                     TradeType.BUY,
+                                     total_previous_step_base_amount + amount,
+                                     ask_price)
+        sell_fee = sell_market.get_fee(sell_market_trading_pair_tuple.base_asset,
+                                       sell_market_trading_pair_tuple.quote_asset,
+                                       sell_market.get_taker_order_type(),
+                                       TradeType.SELL,
+                                       total_previous_step_base_amount + amount,
+                                       bid_price)
+        total_buy_flat_fees = strategy.cum_flat_fees(buy_market_trading_pair_tuple.quote_asset, buy_fee.flat_fees)
+        total_sell_flat_fees = strategy.cum_flat_fees(sell_market_trading_pair_tuple.quote_asset, sell_fee.flat_fees)
+
+        total_bid_value_adjusted += bid_price_adjusted * amount
+        total_ask_value_adjusted += ask_price_adjusted * amount
+        net_sell_proceeds = total_bid_value_adjusted * (1 - sell_fee.percent) - total_sell_flat_fees
+        net_buy_costs = total_ask_value_adjusted * (1 + buy_fee.percent) + total_buy_flat_fees
+        profitability = net_sell_proceeds / net_buy_costs
+
+        if profitability > (1 + min_profitability):
+            best_profitable_order_amount = total_previous_step_base_amount + amount
+            best_profitable_order_profitability = profitability
+
+        buy_market_quote_balance = buy_market.get_available_balance(buy_market_trading_pair_tuple.quote_asset)
+        sell_market_base_balance = sell_market.get_available_balance(sell_market_trading_pair_tuple.base_asset)
+        if (buy_market_quote_balance < net_buy_costs or
+                sell_market_base_balance < (total_previous_step_base_amount + amount)):
+            if profitability < (1 + min_profitability):
+                break
+            buy_market_adjusted_order_size = ((buy_market_quote_balance / ask_price - total_buy_flat_fees) /
+                                              (1 + buy_fee.percent))
+            best_profitable_order_amount = min(sell_market_base_balance, buy_market_adjusted_order_size)
+            best_profitable_order_profitability = profitability
+            break
+
+        total_previous_step_base_amount += amount
+
+    return best_profitable_order_amount, best_profitable_order_profitability, bid_price, ask_price
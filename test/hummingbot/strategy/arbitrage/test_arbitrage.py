@@ -1,7 +1,12 @@
+import asyncio
+import time
 import unittest
 from decimal import Decimal
+from test.hummingbot.strategy.arbitrage.arbitrage_test_support import find_best_profitable_amount_decimal
 from typing import List
+from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 from nose.plugins.attrib import attr
 
@@ -11,8 +16,9 @@ from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import Quant
 from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
 from hummingbot.core.clock import Clock, ClockMode
 from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
 from hummingbot.core.event.event_logger import EventLogger
-from hummingbot.core.event.events import MarketEvent
+from hummingbot.core.event.events import MarketEvent, OrderBookEvent, OrderBookUpdateEvent
 from hummingbot.strategy.arbitrage.arbitrage import ArbitrageStrategy
 from hummingbot.strategy.arbitrage.arbitrage_market_pair import ArbitrageMarketPair
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
@@ -281,3 +287,223 @@ class ArbitrageUnitTest(unittest.TestCase):
             (Decimal("1.045"), Decimal("0.94999"), Decimal("1.1"), Decimal("0.94999"), Decimal("15.0")),
             (Decimal("1.045"), Decimal("1.0049"), Decimal("1.1"), Decimal("1.0049"), Decimal("10.0"))
         ])
+
+    def randomize_order_books(self, rng: np.random.Generator):
+        for market, trading_pair in ((self.market_1, self.market_1_trading_pairs[0]),
+                                     (self.market_2, self.market_2_trading_pairs[0])):
+            update_id = int(rng.integers(1, 1000))
+            mid_price = rng.uniform(0.95, 1.15)
+            bids = [OrderBookRow(float(price), float(amount), update_id)
+                    for price, amount in zip(np.round(mid_price - rng.uniform(0, 0.15, 20), 4),
+                                             rng.choice([0, 0.25, 2.5, 9.375, 35], 20))]
+            asks = [OrderBookRow(float(price), float(amount), update_id)
+                    for price, amount in zip(np.round(mid_price + rng.uniform(0, 0.15, 20), 4),
+                                             rng.choice([0, 0.5, 3.25, 7.125, 40], 20))]
+            market.order_books[trading_pair].apply_snapshot(bids, asks, update_id)
+        self.market_1.set_balance("WETH", float(rng.choice([5, 50, 500])))
+        self.market_2.set_balance("ETH", float(rng.choice([5, 50, 500])))
+        self.market_1.set_balance("COINALPHA", float(rng.choice([5, 50, 500])))
+        self.market_2.set_balance("COINALPHA", float(rng.choice([5, 50, 500])))
+
+    def test_find_profitable_arbitrage_steps_matches_decimal_orders(self):
+        rng = np.random.default_rng(42)
+        for _ in range(50):
+            self.randomize_order_books(rng)
+            for min_profitability in (Decimal("-0.05"), Decimal("0"), Decimal("0.03")):
+                expected = ArbitrageStrategy.find_profitable_arbitrage_orders(min_profitability,
+                                                                              self.market_trading_pair_tuple_1,
+                                                                              self.market_trading_pair_tuple_2,
+                                                                              Decimal("1"),
+                                                                              Decimal("0.95"))
+                *steps, amount_decimals = ArbitrageStrategy.find_profitable_arbitrage_steps(
+                    min_profitability,
+                    self.market_trading_pair_tuple_1,
+                    self.market_trading_pair_tuple_2,
+                    Decimal("1"),
+                    Decimal("0.95"))
+                self.assertEqual(len(expected), len(steps[0]))
+                for expected_step, step in zip(expected, zip(*steps)):
+                    for expected_value, value in zip(expected_step[:4], step[:4]):
+                        self.assertAlmostEqual(float(expected_value), value, places=12)
+                    self.assertEqual(expected_step[4], Decimal(str(step[4])))
+
+    def test_find_best_profitable_amount_matches_decimal_search(self):
+        rng = np.random.default_rng(7)
+        for min_profitability in (Decimal("-0.01"), Decimal("0"), Decimal("0.03")):
+            self.strategy.init_params(
+                [self.market_pair],
+                min_profitability=min_profitability,
+                logging_options=self.logging_options,
+                secondary_to_primary_quote_conversion_rate=Decimal("0.95")
+            )
+            for _ in range(30):
+                self.randomize_order_books(rng)
+                for buy_market, sell_market in ((self.market_trading_pair_tuple_1, self.market_trading_pair_tuple_2),
+                                                (self.market_trading_pair_tuple_2, self.market_trading_pair_tuple_1)):
+                    expected = find_best_profitable_amount_decimal(self.strategy, buy_market, sell_market)
+                    amount, profitability, bid_price, ask_price = self.strategy.find_best_profitable_amount(
+                        buy_market, sell_market)
+                    self.assertEqual(expected[0], amount)
+                    self.assertAlmostEqual(expected[1], profitability)
+                    self.assertEqual((expected[2], expected[3]), (bid_price, ask_price))
+
+    def test_find_best_profitable_amount_matches_decimal_search_with_amount_dependent_fees(self):
+        def tiered_trade_fee(exchange, is_maker, base_currency, quote_currency, order_type, order_side, amount,
+                             price=Decimal("NaN"), extra_flat_fees=None):
+            # the fee percent goes down with the order amount, and a flat fee depends on the order value
+            return AddedToCostTradeFee(percent=Decimal("0.003") if amount < 10 else Decimal("0.001"),
+                                       flat_fees=[TokenAmount(quote_currency, amount * price / 1000)])
+
+        rng = np.random.default_rng(11)
+        self.strategy.init_params(
+            [self.market_pair],
+            min_profitability=Decimal("-0.01"),
+            logging_options=self.logging_options,
+            secondary_to_primary_quote_conversion_rate=Decimal("0.95")
+        )
+        with patch("hummingbot.connector.exchange.paper_trade.paper_trade_exchange.build_trade_fee",
+                   side_effect=tiered_trade_fee):
+            for _ in range(30):
+                self.randomize_order_books(rng)
+                for buy_market, sell_market in ((self.market_trading_pair_tuple_1, self.market_trading_pair_tuple_2),
+                                                (self.market_trading_pair_tuple_2, self.market_trading_pair_tuple_1)):
+                    expected = find_best_profitable_amount_decimal(self.strategy, buy_market, sell_market)
+                    amount, profitability, bid_price, ask_price = self.strategy.find_best_profitable_amount(
+                        buy_market, sell_market)
+                    self.assertAlmostEqual(expected[0], amount)
+                    self.assertAlmostEqual(expected[1], profitability)
+                    self.assertEqual((expected[2], expected[3]), (bid_price, ask_price))
+
+    def test_event_driven_evaluation(self):
+        strategy: ArbitrageStrategy = ArbitrageStrategy()
+        strategy.init_params(
+            [self.market_pair],
+            min_profitability=Decimal("0.03"),
+            logging_options=self.logging_options,
+            secondary_to_primary_quote_conversion_rate=Decimal("0.95"),
+            event_driven_evaluation=True
+        )
+        clock: Clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.end_timestamp)
+        clock.add_iterator(self.market_1)
+        clock.add_iterator(self.market_2)
+        clock.add_iterator(strategy)
+        order_book = self.market_2.order_books[self.market_2_trading_pairs[0]]
+        # No arbitrage opportunity, so that no order interferes with the evaluations
+        order_book.apply_diffs([OrderBookRow(1.05, 1.0, 2)], [], 2)
+
+        # The market pair is evaluated on the first tick, and skipped until its order books change
+        clock.backtest_til(self.start_timestamp + 3)
+        self.assertEqual(1, strategy.evaluations_run)
+        self.assertEqual(2, strategy.evaluations_skipped)
+
+        # A burst of updates is evaluated once, without waiting for the next tick
+        for update_id in range(3, 13):
+            order_book.apply_diffs([OrderBookRow(1.05, float(update_id), update_id)], [], update_id)
+            order_book.trigger_event(OrderBookEvent.UpdateEvent,
+                                     OrderBookUpdateEvent(self.market_2_trading_pairs[0], update_id))
+        asyncio.get_event_loop().run_until_complete(asyncio.sleep(0))
+        self.assertEqual(2, strategy.evaluations_run)
+        self.assertEqual(2, strategy.evaluations_skipped)
+
+        clock.backtest_til(self.start_timestamp + 4)
+        self.assertEqual(2, strategy.evaluations_run)
+        self.assertEqual(3, strategy.evaluations_skipped)
+        self.assertIn("Evaluations run: 2, skipped: 3", strategy.format_status())
+
+    def test_event_driven_evaluation_follows_replaced_order_books(self):
+        strategy: ArbitrageStrategy = ArbitrageStrategy()
+        strategy.init_params(
+            [self.market_pair],
+            min_profitability=Decimal("0.03"),
+            logging_options=self.logging_options,
+            secondary_to_primary_quote_conversion_rate=Decimal("0.95"),
+            event_driven_evaluation=True
+        )
+        clock: Clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.end_timestamp)
+        clock.add_iterator(self.market_1)
+        clock.add_iterator(self.market_2)
+        clock.add_iterator(strategy)
+        trading_pair = self.market_2_trading_pairs[0]
+        previous_order_book = self.market_2.order_books[trading_pair]
+        # No arbitrage opportunity, so that no order interferes with the evaluations
+        previous_order_book.apply_diffs([OrderBookRow(1.05, 1.0, 2)], [], 2)
+        clock.backtest_til(self.start_timestamp + 1)
+        self.assertEqual(1, strategy.evaluations_run)
+
+        # The order book tracker starts again (e.g. after a reconnection) with a new order book
+        self.market_2.set_balanced_order_book(trading_pair, 1.0, 0.5, 1.5, 0.005, 5)
+        order_book = self.market_2.order_books[trading_pair]
+        order_book.apply_diffs([OrderBookRow(1.05, 1.0, 2)], [], 2)
+        self.assertIsNot(previous_order_book, order_book)
+
+        # The market pair is evaluated on the next tick, and then on the updates of the new order book
+        clock.backtest_til(self.start_timestamp + 2)
+        self.assertEqual(2, strategy.evaluations_run)
+        self.assertEqual(0, strategy.evaluations_skipped)
+        order_book.trigger_event(OrderBookEvent.UpdateEvent, OrderBookUpdateEvent(trading_pair, 3))
+        asyncio.get_event_loop().run_until_complete(asyncio.sleep(0))
+        self.assertEqual(3, strategy.evaluations_run)
+        previous_order_book.trigger_event(OrderBookEvent.UpdateEvent, OrderBookUpdateEvent(trading_pair, 4))
+        asyncio.get_event_loop().run_until_complete(asyncio.sleep(0))
+        self.assertEqual(3, strategy.evaluations_run)
+
+    def test_event_driven_evaluation_refreshes_the_strategy_timestamp(self):
+        strategy: ArbitrageStrategy = ArbitrageStrategy()
+        strategy.init_params(
+            [self.market_pair],
+            min_profitability=Decimal("0.03"),
+            logging_options=self.logging_options,
+            secondary_to_primary_quote_conversion_rate=Decimal("0.95"),
+            event_driven_evaluation=True
+        )
+        clock: Clock = Clock(ClockMode.REALTIME, 1.0)
+        self.market_1.start(clock, clock.current_timestamp)
+        self.market_2.start(clock, clock.current_timestamp)
+        strategy.start(clock)
+        order_book = self.market_2.order_books[self.market_2_trading_pairs[0]]
+        order_book.apply_diffs([OrderBookRow(1.05, 1.0, 2)], [], 2)
+
+        before_update = time.time()
+        order_book.trigger_event(OrderBookEvent.UpdateEvent, OrderBookUpdateEvent(self.market_2_trading_pairs[0], 2))
+        asyncio.get_event_loop().run_until_complete(asyncio.sleep(0))
+
+        self.assertEqual(1, strategy.evaluations_run)
+        self.assertLess(clock.current_timestamp, before_update)
+        self.assertGreaterEqual(strategy.current_timestamp, before_update)
+        strategy.stop(clock)
+
+    def test_event_driven_evaluation_errors_are_logged(self):
+        strategy: ArbitrageStrategy = ArbitrageStrategy()
+        strategy.init_params(
+            [self.market_pair],
+            min_profitability=Decimal("0.03"),
+            logging_options=self.logging_options,
+            secondary_to_primary_quote_conversion_rate=Decimal("0.95"),
+            event_driven_evaluation=True
+        )
+        clock: Clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.end_timestamp)
+        clock.add_iterator(self.market_1)
+        clock.add_iterator(self.market_2)
+        clock.add_iterator(strategy)
+        order_book = self.market_2.order_books[self.market_2_trading_pairs[0]]
+        # No arbitrage opportunity, so that no order interferes with the evaluations
+        order_book.apply_diffs([OrderBookRow(1.05, 1.0, 2)], [], 2)
+        clock.backtest_til(self.start_timestamp + 1)
+
+        with patch.object(MarketTradingPairTuple, "get_price", side_effect=Exception("Test error")):
+            with self.assertLogs(ArbitrageStrategy.logger().name, level="ERROR") as logs:
+                order_book.trigger_event(OrderBookEvent.UpdateEvent,
+                                         OrderBookUpdateEvent(self.market_2_trading_pairs[0], 2))
+                asyncio.get_event_loop().run_until_complete(asyncio.sleep(0))
+
+        self.assertIn("Unexpected error evaluating the updated market pairs.", logs.output[0])
+        # the next updates are still evaluated
+        order_book.trigger_event(OrderBookEvent.UpdateEvent, OrderBookUpdateEvent(self.market_2_trading_pairs[0], 3))
+        asyncio.get_event_loop().run_until_complete(asyncio.sleep(0))
+        self.assertEqual(3, strategy.evaluations_run)
+
+    def test_clock_driven_evaluation(self):
+        self.market_2.order_books[self.market_2_trading_pairs[0]].apply_diffs([OrderBookRow(1.05, 1.0, 2)], [], 2)
+        self.clock.backtest_til(self.start_timestamp + 3)
+        self.assertEqual(3, self.strategy.evaluations_run)
+        self.assertEqual(0, self.strategy.evaluations_skipped)
@@ -48,3 +48,4 @@ class ArbitrageStartTest(unittest.TestCase):
         arbitrage_start.start(self)
         self.assertEqual(self.strategy.min_profitability, Decimal("10") / Decimal("100"))
         self.assertEqual(self.strategy.use_oracle_conversion_rate, False)
+        self.assertEqual(self.strategy.event_driven_evaluation, False)
@@ -0,0 +1,62 @@
+import random
+import unittest
+from decimal import Decimal
+from statistics import mean
+from typing import List
+
+from hummingbot.strategy.liquidity_mining.rolling_volatility import RollingVolatility
+
+
+def list_volatility(mid_prices: List[Decimal], volatility_interval: int, avg_volatility_period: int) -> Decimal:
+    """
+    The volatility as LiquidityMiningStrategy calculated it from the list of its last mid prices.
+    """
+    mid_prices = mid_prices[-1 * volatility_interval * avg_volatility_period:]
+    last_index = len(mid_prices) - 1
+    atr = []
+    first_index = last_index - (volatility_interval * avg_volatility_period)
+    first_index = max(first_index, 0)
+    for i in range(last_index, first_index, volatility_interval * -1):
+        prices = mid_prices[i - volatility_interval + 1: i + 1]
+        if not prices:
+            break
+        atr.append((max(prices) - min(prices)) / min(prices))
+    return mean(atr) if atr else Decimal("NaN")
+
+
+class RollingVolatilityTests(unittest.TestCase):
+
+    def assert_volatility_matches_list_volatility(self, volatility_interval: int, avg_volatility_period: int,
+                                                  mid_prices: List[Decimal]):
+        volatility = RollingVolatility(volatility_interval, avg_volatility_period)
+        for count, mid_price in enumerate(mid_prices, start=1):
+            volatility.add_price(mid_price)
+            expected = list_volatility(mid_prices[:count], volatility_interval, avg_volatility_period)
+            if expected.is_nan():
+                self.assertTrue(volatility.value.is_nan(), f"{count} mid prices")
+            else:
+                self.assertEqual(expected, volatility.value, f"{count} mid prices")
+
+    def test_no_volatility_before_two_mid_prices(self):
+        volatility = RollingVolatility(5, 3)
+        self.assertTrue(volatility.value.is_nan())
+
+        volatility.add_price(Decimal("100"))
+        self.assertTrue(volatility.value.is_nan())
+
+        volatility.add_price(Decimal("110"))
+        self.assertEqual(Decimal("0.1"), volatility.value)
+
+    def test_volatility_matches_list_volatility(self):
+        rng = random.Random(42)
+        mid_prices = []
+        price = Decimal("100")
+        for _ in range(200):
+            price += Decimal(rng.randint(-50, 50)) / 100
+            mid_prices.append(price)
+        # Repeated prices
+        mid_prices.extend([price] * 20)
+
+        for volatility_interval, avg_volatility_period in ((1, 1), (1, 5), (2, 2), (5, 3), (7, 10), (30, 2), (300, 10)):
+            with self.subTest(volatility_interval=volatility_interval, avg_volatility_period=avg_volatility_period):
+                self.assert_volatility_matches_list_volatility(volatility_interval, avg_volatility_period, mid_prices)
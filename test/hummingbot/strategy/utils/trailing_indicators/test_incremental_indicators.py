@@ -0,0 +1,157 @@
+import unittest
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.strategy.__utils__.ring_buffer import RingBuffer
+from hummingbot.strategy.__utils__.trailing_indicators.exponential_moving_average import (
+    ExponentialMovingAverageIndicator,
+)
+from hummingbot.strategy.__utils__.trailing_indicators.historical_volatility import HistoricalVolatilityIndicator
+from hummingbot.strategy.__utils__.trailing_indicators.instant_volatility import InstantVolatilityIndicator
+
+
+class FullWindowIndicator:
+    """
+    Computes the indicators over the whole sampling and processing buffers for every sample, as the indicators did
+    before keeping running sums.
+    """
+
+    def __init__(self, indicator_calculation, processing_calculation, sampling_length: int, processing_length: int):
+        self._indicator_calculation = indicator_calculation
+        self._processing_calculation = processing_calculation
+        self.sampling_buffer = RingBuffer(sampling_length)
+        self.processing_buffer = RingBuffer(processing_length)
+
+    def add_sample(self, value: float):
+        self.sampling_buffer.add_value(value)
+        self.processing_buffer.add_value(self._indicator_calculation(self.sampling_buffer))
+
+    @property
+    def current_value(self) -> float:
+        return self._processing_calculation(self.processing_buffer)
+
+
+def historical_volatility(sampling_buffer: RingBuffer) -> float:
+    prices = sampling_buffer.get_as_numpy_array()
+    return np.var(np.diff(np.log(prices)))
+
+
+def historical_volatility_processing(processing_buffer: RingBuffer) -> float:
+    return np.sqrt(np.mean(np.nan_to_num(processing_buffer.get_as_numpy_array())))
+
+
+def instant_volatility(sampling_buffer: RingBuffer) -> float:
+    np_sampling_buffer = sampling_buffer.get_as_numpy_array()
+    return np.sqrt(np.sum(np.square(np.diff(np_sampling_buffer))) / np_sampling_buffer.size)
+
+
+def exponential_moving_average(sampling_buffer: RingBuffer) -> float:
+    return pd.Series(sampling_buffer.get_as_numpy_array()).ewm(span=sampling_buffer.length, adjust=True).mean().iloc[-1]
+
+
+def last_value(processing_buffer: RingBuffer) -> float:
+    return processing_buffer.get_last_value()
+
+
+class IncrementalIndicatorsParityTest(unittest.TestCase):
+    INITIAL_RANDOM_SEED = 42
+
+    def setUp(self) -> None:
+        super().setUp()
+        warnings.simplefilter("ignore", RuntimeWarning)
+        self.addCleanup(warnings.resetwarnings)
+        rng = np.random.default_rng(self.INITIAL_RANDOM_SEED)
+        self.prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.002, 3000)))
+
+    def assert_same_values(self, indicator, reference, samples, rtol: float = 1e-6):
+        for sample in samples:
+            indicator.add_sample(sample)
+            reference.add_sample(sample)
+            expected = reference.current_value
+            actual = indicator.current_value
+            if np.isnan(expected):
+                self.assertTrue(np.isnan(actual))
+            else:
+                self.assertTrue(np.isclose(expected, actual, rtol=rtol, atol=0), (expected, actual))
+
+    def test_historical_volatility(self):
+        for sampling_length, processing_length in ((2, 1), (30, 15), (500, 20)):
+            self.assert_same_values(
+                HistoricalVolatilityIndicator(sampling_length, processing_length),
+                FullWindowIndicator(historical_volatility, historical_volatility_processing,
+                                    sampling_length, processing_length),
+                self.prices)
+
+    def test_instant_volatility(self):
+        for sampling_length, processing_length in ((1, 1), (30, 15), (1000, 1)):
+            self.assert_same_values(
+                InstantVolatilityIndicator(sampling_length, processing_length),
+                FullWindowIndicator(instant_volatility, last_value, sampling_length, processing_length),
+                self.prices)
+
+    def test_exponential_moving_average(self):
+        for sampling_length in (1, 30, 400):
+            self.assert_same_values(
+                ExponentialMovingAverageIndicator(sampling_length, 1),
+                FullWindowIndicator(exponential_moving_average, last_value, sampling_length, 1),
+                self.prices)
+
+    def test_changing_window_lengths(self):
+        indicator = HistoricalVolatilityIndicator(100, 10)
+        reference = FullWindowIndicator(historical_volatility, historical_volatility_processing, 100, 10)
+        self.assert_same_values(indicator, reference, self.prices[:700])
+
+        indicator.sampling_length = 40
+        indicator.processing_length = 25
+        reference.sampling_buffer.length = 40
+        reference.processing_buffer.length = 25
+        self.assert_same_values(indicator, reference, self.prices[700:1500])
+
+        indicator.sampling_length = 300
+        reference.sampling_buffer.length = 300
+        self.assert_same_values(indicator, reference, self.prices[1500:])
+
+    def test_processing_buffer_missing_values(self):
+        # The first historical volatility has no log return to compute, and counts as zero until it leaves the buffer.
+        indicator = HistoricalVolatilityIndicator(10, 5)
+        indicator.add_sample(100)
+        self.assertEqual(0, indicator.current_value)
+        for price in self.prices[:4]:
+            indicator.add_sample(price)
+        self.assertGreater(indicator.current_value, 0)
+
+
+class RingBufferSlicesTest(unittest.TestCase):
+
+    def test_slices_are_views_of_the_values_in_order(self):
+        buffer = RingBuffer(5)
+        older, newer = buffer.get_as_numpy_slices()
+        self.assertEqual(0, older.size + newer.size)
+
+        for value in range(3):
+            buffer.add_value(value)
+        older, newer = buffer.get_as_numpy_slices()
+        self.assertEqual([0, 1, 2], older.tolist())
+        self.assertEqual([], newer.tolist())
+
+        for value in range(3, 8):
+            buffer.add_value(value)
+        older, newer = buffer.get_as_numpy_slices()
+        self.assertEqual([3, 4], older.tolist())
+        self.assertEqual([5, 6, 7], newer.tolist())
+        self.assertFalse(older.flags.owndata)
+        self.assertEqual([3, 4, 5, 6, 7], buffer.get_as_numpy_array().tolist())
+        self.assertEqual(3, buffer.get_first_value())
+        self.assertEqual(5, len(buffer))
+
+    def test_long_buffer(self):
+        # Buffers longer than the int16 indexes used before
+        buffer = RingBuffer(40000)
+        for value in range(40010):
+            buffer.add_value(value)
+        values = buffer.get_as_numpy_array()
+        self.assertEqual(40000, values.size)
+        self.assertEqual(10, values[0])
+        self.assertEqual(40009, values[-1])
@@ -4,6 +4,7 @@ from decimal import Decimal
 
 import numpy as np
 import pandas as pd
+from scipy.optimize import curve_fit
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
@@ -18,6 +19,48 @@ from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.order_book_asset_price_delegate import OrderBookAssetPriceDelegate
 
 
+class ReferenceTradingIntensity:
+    """
+    Samples the trades and fits the trading intensity from the whole window on every calculation, as the indicator
+    did before keeping per price level volumes.
+    """
+
+    def __init__(self, sampling_length: int):
+        self.sampling_length = sampling_length
+        self.trade_samples = {}
+        self.last_quotes = []
+        self.alpha = 0
+        self.kappa = 0
+
+    def calculate(self, timestamp, price, trades):
+        self.last_quotes = [{"timestamp": timestamp, "price": price}] + self.last_quotes
+        for trade in trades:
+            for quote in self.last_quotes:
+                if quote["timestamp"] < trade.timestamp:
+                    self.trade_samples.setdefault(quote["timestamp"] + 1, []).append(
+                        (abs(trade.price - float(quote["price"])), trade.amount))
+                    break
+        for timestamp in sorted(self.trade_samples)[:-self.sampling_length]:
+            del self.trade_samples[timestamp]
+        if len(self.trade_samples) == self.sampling_length:
+            volumes = self.volume_by_price_level()
+            price_levels = sorted(volumes, reverse=True)
+            params = curve_fit(lambda t, a, b: a * np.exp(-b * t),
+                               price_levels,
+                               [volumes[price_level] for price_level in price_levels],
+                               p0=(self.alpha, self.kappa),
+                               method="dogbox",
+                               bounds=([0, 0], [np.inf, np.inf]))
+            self.alpha, self.kappa = params[0]
+
+    def volume_by_price_level(self):
+        volumes = {}
+        for sample in self.trade_samples.values():
+            for price_level, amount in sample:
+                volumes[price_level] = volumes.get(price_level, 0) + amount
+        return volumes
+
+
 class TradingIntensityTest(unittest.TestCase):
     INITIAL_RANDOM_SEED = 3141592653
     BUFFER_LENGTH = 50
@@ -259,3 +302,69 @@ class TradingIntensityTest(unittest.TestCase):
 
         self.assertAlmostEqual(a, alpha, 10)
         self.assertAlmostEqual(b, kappa, 10)
+
+    def simulate(self, indicator: TradingIntensityIndicator, reference: ReferenceTradingIntensity, samples: int):
+        bids_df, asks_df = TradingIntensityTest.make_order_books(
+            100, Decimal("1"), Decimal("1"), Decimal("0.005"), Decimal("0.01"), Decimal("0.01"), samples)
+        trades = TradingIntensityTest.make_trades(bids_df, asks_df)
+
+        timestamp = self.start_timestamp
+        for bid_df, ask_df, trades_tick in zip(bids_df, asks_df, trades):
+            mid = (bid_df["price"].iloc[0] + ask_df["price"].iloc[0]) / 2
+            for trade in trades_tick:
+                indicator.register_trade(trade)
+            indicator.calculate(timestamp)
+            indicator.last_quotes = [{"timestamp": timestamp, "price": mid}] + indicator.last_quotes
+            if reference is not None:
+                reference.calculate(timestamp, self.price_delegate.get_mid_price(), trades_tick)
+                reference.last_quotes = [{"timestamp": timestamp, "price": mid}] + reference.last_quotes
+                yield reference
+            timestamp += 1
+
+    def test_volume_by_price_level_follows_the_sampling_window(self):
+        reference = ReferenceTradingIntensity(self.BUFFER_LENGTH)
+        for reference in self.simulate(self.indicator, reference, 200):
+            expected = reference.volume_by_price_level()
+            actual = self.indicator.volume_by_price_level
+            self.assertEqual(set(expected), set(actual))
+            for price_level, volume in expected.items():
+                self.assertAlmostEqual(volume, actual[price_level], 9)
+
+    def test_estimates_match_fitting_the_whole_window(self):
+        reference = ReferenceTradingIntensity(self.BUFFER_LENGTH)
+        estimates = 0
+        for reference in self.simulate(self.indicator, reference, 200):
+            if self.indicator.is_sampling_buffer_full:
+                estimates += 1
+                if estimates == 1:
+                    # The first fit was started from (0, 0) rather than from the closed-form estimate
+                    continue
+                alpha, kappa = self.indicator.current_value
+                self.assertAlmostEqual(reference.alpha, alpha, 4)
+                self.assertAlmostEqual(reference.kappa, kappa, 4)
+        self.assertGreater(estimates, 100)
+
+    def test_refine_threshold_skips_immaterial_changes(self):
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1, refine_threshold=0.5)
+        indicator.last_quotes = [{"timestamp": self.start_timestamp, "price": 1}]
+        timestamp = self.start_timestamp + 1
+
+        def add_trades(amounts):
+            for price, amount in zip([2, 3, 4, 5], amounts):
+                indicator.register_trade(OrderBookTradeEvent(
+                    trading_pair="COINALPHAHBOT", timestamp=timestamp, price=price, amount=amount, type=TradeType.SELL))
+
+        add_trades([2 * np.exp(-0.1 * level) for level in [1, 2, 3, 4]])
+        indicator.calculate(timestamp)
+        fitted_value = indicator.current_value
+
+        # One more trade, adding a tenth of the volume of the window
+        indicator.last_quotes = [{"timestamp": self.start_timestamp, "price": 1}]
+        add_trades([0.6])
+        indicator.calculate(timestamp)
+        self.assertEqual(fitted_value, indicator.current_value)
+
+        indicator.last_quotes = [{"timestamp": self.start_timestamp, "price": 1}]
+        add_trades([5, 5, 5, 5])
+        indicator.calculate(timestamp)
+        self.assertNotEqual(fitted_value, indicator.current_value)